@@ -0,0 +1,229 @@
+"""Batch planning, simulation and plotting across many files on a process pool.
+
+Running ``fiberpath plan`` once per file pays interpreter start-up, the schema
+build and the machine-profile load for every file. :func:`plan_many`,
+:func:`simulate_many` and :func:`plot_many` instead start ``workers``
+processes once; each is initialized with the task's settings (the plan
+options and their profile, say) and then handles one file after another, so
+only the per-file work repeats. Results are yielded as files finish, in
+completion order (:attr:`BatchResult.index` is the input order), and a file
+that fails -- even one that brings its worker process down -- is reported as a
+failed result while the rest of the batch carries on.
+
+Each file's output goes next to it (``input.wind`` plans to ``input.gcode``),
+or into ``output_dir`` at its path below the inputs' common directory, so
+same-named inputs in different directories stay apart. Planning and plotting
+are CPU bound and share nothing between files, so throughput scales with the
+number of cores.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from fiberpath.config import MachineProfile, load_wind_definition
+from fiberpath.gcode import read_program, write_gcode
+from fiberpath.planning import PlanOptions, plan_wind
+from fiberpath.simulation import simulate_program
+from fiberpath.visualization import PlotConfig, render_plot
+
+__all__ = ["BATCH_TASKS", "BatchResult", "plan_many", "plot_many", "run_batch", "simulate_many"]
+
+# Task name -> suffix of the file it writes for each input (None: writes nothing).
+BATCH_TASKS: dict[str, str | None] = {"plan": ".gcode", "simulate": None, "plot": ".png"}
+
+
+@dataclass(slots=True)
+class BatchResult:
+    """The outcome of one file: its JSON-ready ``summary``, or the ``error`` it failed with."""
+
+    index: int
+    path: Path
+    output: Path | None = None
+    summary: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+    elapsed_s: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def to_json(self) -> dict[str, Any]:
+        payload: dict[str, Any] = {
+            "path": str(self.path),
+            "ok": self.ok,
+            "elapsedSeconds": self.elapsed_s,
+        }
+        if self.output is not None:
+            payload["output"] = str(self.output)
+        if self.ok:
+            payload.update(self.summary)
+        else:
+            payload["error"] = self.error
+        return payload
+
+
+def plan_many(
+    paths: Iterable[Path],
+    options: PlanOptions | None = None,
+    *,
+    workers: int | None = None,
+    output_dir: Path | None = None,
+) -> Iterator[BatchResult]:
+    """Plan every ``.wind`` file in ``paths`` to ``.gcode``; yields results as files finish."""
+    return run_batch(
+        "plan", paths, {"options": options or PlanOptions()}, workers=workers, output_dir=output_dir
+    )
+
+
+def simulate_many(
+    paths: Iterable[Path],
+    profile: MachineProfile | None = None,
+    *,
+    workers: int | None = None,
+) -> Iterator[BatchResult]:
+    """Simulate every G-code file in ``paths``; yields results as files finish."""
+    return run_batch("simulate", paths, {"profile": profile}, workers=workers)
+
+
+def plot_many(
+    paths: Iterable[Path],
+    scale: float = 1.0,
+    *,
+    workers: int | None = None,
+    output_dir: Path | None = None,
+) -> Iterator[BatchResult]:
+    """Render a PNG preview of every G-code file in ``paths``; yields results as files finish."""
+    return run_batch("plot", paths, {"scale": scale}, workers=workers, output_dir=output_dir)
+
+
+def run_batch(
+    task: str,
+    paths: Iterable[Path],
+    settings: dict[str, Any],
+    *,
+    workers: int | None = None,
+    output_dir: Path | None = None,
+) -> Iterator[BatchResult]:
+    """Run ``task`` (a :data:`BATCH_TASKS` name) over ``paths`` with ``workers`` processes.
+
+    ``workers`` defaults to the CPU count; with 1 the files are handled in this
+    process. Raises ValueError for an unknown task or fewer than one worker.
+    """
+    if task not in BATCH_TASKS:
+        raise ValueError(f"unknown batch task {task!r}; expected one of {', '.join(BATCH_TASKS)}")
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be at least 1")
+    files = list(dict.fromkeys(paths))  # a file matched twice runs once
+    outputs = _outputs(files, BATCH_TASKS[task], output_dir)
+    workers = min(workers or os.cpu_count() or 1, max(len(files), 1))
+    if workers == 1:
+        return _run_serial(task, settings, files, outputs)
+    return _run_pool(task, settings, files, outputs, workers)
+
+
+def _outputs(files: list[Path], suffix: str | None, output_dir: Path | None) -> list[Path | None]:
+    """Each file's output: beside it, or at its path below the inputs' common directory."""
+    if suffix is None:
+        return [None] * len(files)
+    if output_dir is None or not files:
+        return [path.with_suffix(suffix) for path in files]
+    root = Path(os.path.commonpath([path.resolve().parent for path in files]))
+    return [(output_dir / path.resolve().relative_to(root)).with_suffix(suffix) for path in files]
+
+
+def _run_serial(
+    task: str, settings: dict[str, Any], files: list[Path], outputs: list[Path | None]
+) -> Iterator[BatchResult]:
+    _init_worker(task, settings)
+    for index, (path, output) in enumerate(zip(files, outputs, strict=True)):
+        yield _run_file(index, path, output)
+
+
+def _run_pool(
+    task: str,
+    settings: dict[str, Any],
+    files: list[Path],
+    outputs: list[Path | None],
+    workers: int,
+) -> Iterator[BatchResult]:
+    pool = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(task, settings))
+    try:
+        futures: dict[Future[BatchResult], tuple[int, Path]] = {
+            pool.submit(_run_file, index, path, output): (index, path)
+            for index, (path, output) in enumerate(zip(files, outputs, strict=True))
+        }
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as exc:  # the worker died (e.g. BrokenProcessPool)
+                index, path = futures[future]
+                yield BatchResult(index, path, error=f"{type(exc).__name__}: {exc}")
+    finally:
+        pool.shutdown(cancel_futures=True)  # a consumer that stops early skips the rest
+
+
+# -- worker side -----------------------------------------------------------
+
+_worker: dict[str, Any] = {}
+
+
+def _init_worker(task: str, settings: dict[str, Any]) -> None:
+    """Load the task's settings once per worker (in the pool's initializer)."""
+    _worker.clear()
+    _worker.update(settings, run=_TASK_RUNNERS[task])
+
+
+def _run_file(index: int, path: Path, output: Path | None) -> BatchResult:
+    start = time.perf_counter()
+    result = BatchResult(index, path, output)
+    try:
+        result.summary = _worker["run"](path, output)
+    except Exception as exc:  # reported per file; the batch carries on
+        result.output = None
+        result.error = f"{type(exc).__name__}: {exc}"
+    result.elapsed_s = time.perf_counter() - start
+    return result
+
+
+def _plan_file(path: Path, output: Path | None) -> dict[str, Any]:
+    assert output is not None
+    result = plan_wind(load_wind_definition(path), _worker["options"])
+    write_gcode(result.commands, output)
+    return {
+        "commands": len(result.commands),
+        "timeSeconds": result.total_time_s,
+        "towMeters": result.total_tow_m,
+        "layers": len(result.layers),
+    }
+
+
+def _simulate_file(path: Path, output: Path | None) -> dict[str, Any]:
+    lines = path.read_text(encoding="utf-8").splitlines()
+    return asdict(simulate_program(read_program(lines), _worker["profile"]))
+
+
+def _plot_file(path: Path, output: Path | None) -> dict[str, Any]:
+    assert output is not None
+    lines = path.read_text(encoding="utf-8").splitlines()
+    result = render_plot(read_program(lines), PlotConfig(scale=_worker["scale"]))
+    output.parent.mkdir(parents=True, exist_ok=True)
+    result.image.save(output, format="PNG")
+    return {
+        "width": result.image.width,
+        "height": result.image.height,
+        "segments": result.segments_rendered,
+    }
+
+
+_TASK_RUNNERS: dict[str, Callable[[Path, Path | None], dict[str, Any]]] = {
+    "plan": _plan_file,
+    "simulate": _simulate_file,
+    "plot": _plot_file,
+}
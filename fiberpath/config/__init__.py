@@ -1,9 +1,12 @@
 """Configuration schemas and validators for FiberPath."""
 
 from .machine_profile import (
+    AxisLimits,
+    MachineKinematics,
     MachineProfile,
     MachineProfileError,
     ProfileAxisMapping,
+    TimeCalibration,
     default_machine_profile,
     load_machine_profile,
 )
@@ -18,13 +21,16 @@ from .schemas import (
 from .validator import WindFileError, load_wind_definition
 
 __all__ = [
+    "AxisLimits",
     "HelicalLayer",
     "HoopLayer",
+    "MachineKinematics",
     "MachineProfile",
     "MachineProfileError",
     "MandrelParameters",
     "ProfileAxisMapping",
     "SkipLayer",
+    "TimeCalibration",
     "TowParameters",
     "WindDefinition",
     "WindFileError",
@@ -65,6 +65,84 @@ class ProfileAxisMapping(BaseFiberPathModel):
         return self
 
 
+class AxisLimits(BaseFiberPathModel):
+    """Motion limits of one axis, in its own units (mm for the carriage, degrees otherwise)."""
+
+    model_config = ConfigDict(frozen=True)
+
+    max_velocity: float | None = Field(
+        default=None, alias="maxVelocity", gt=0.0, description="Units per second; None: unlimited."
+    )
+    max_acceleration: float | None = Field(
+        default=None,
+        alias="maxAcceleration",
+        gt=0.0,
+        description="Units per second squared; None: unlimited.",
+    )
+
+
+class MachineKinematics(BaseFiberPathModel):
+    """Planner limits of the controller, as Marlin configures them.
+
+    Velocities and accelerations are per axis (Marlin's ``DEFAULT_MAX_FEEDRATE``
+    / ``DEFAULT_MAX_ACCELERATION``); ``accelerationMmS2`` is the path acceleration
+    (``DEFAULT_ACCELERATION``, ``M204 P``) and ``junctionDeviationMm`` sets the
+    cornering speed (``JUNCTION_DEVIATION_MM``).
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    carriage: AxisLimits = Field(default_factory=AxisLimits)
+    mandrel: AxisLimits = Field(default_factory=AxisLimits)
+    delivery_head: AxisLimits = Field(default_factory=AxisLimits, alias="deliveryHead")
+    acceleration_mm_s2: float = Field(
+        default=3000.0,
+        alias="accelerationMmS2",
+        gt=0.0,
+        description="Path acceleration along the surface, mm/s^2.",
+    )
+    junction_deviation_mm: float = Field(
+        default=0.013,
+        alias="junctionDeviationMm",
+        ge=0.0,
+        description="Junction deviation; 0 stops at every corner.",
+    )
+
+
+class TimeCalibration(BaseFiberPathModel):
+    """Correction terms fitted to a winder's measured cycle times.
+
+    The calibrated time of a motion is ``max(distance / feed, |mandrel| /
+    mandrelSpeedLimit) + moveOverhead``, plus ``turnaroundPenalty`` when the
+    carriage reverses direction (see :func:`fiberpath.planning.metrics.calibrated_move_time_s`).
+    All-default terms reproduce the nominal distance/feed estimate.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    move_overhead_s: float = Field(
+        default=0.0,
+        alias="moveOverheadS",
+        ge=0.0,
+        description="Fixed time added to every motion (block setup, accel/decel of short moves).",
+    )
+    turnaround_penalty_s: float = Field(
+        default=0.0,
+        alias="turnaroundPenaltyS",
+        ge=0.0,
+        description="Extra time for each carriage reversal (deceleration to rest and back).",
+    )
+    mandrel_speed_limit_deg_per_s: float | None = Field(
+        default=None,
+        alias="mandrelSpeedLimitDegPerS",
+        gt=0.0,
+        description="Effective top mandrel speed; faster motions are slowed. None: unlimited.",
+    )
+    # Provenance of the fit, informational only.
+    sample_lines: int = Field(default=0, alias="sampleLines", ge=0)
+    rms_residual_s: float = Field(default=0.0, alias="rmsResidualS", ge=0.0)
+
+
 class MachineProfile(BaseFiberPathModel):
     """A versioned compatibility contract for a target winder/controller."""
 
@@ -107,6 +185,18 @@ class MachineProfile(BaseFiberPathModel):
         min_length=1,
         description="G-code opcodes the planner emits; a compatible controller must support all.",
     )
+    # Optional planner limits; with them simulate_program also reports an
+    # acceleration-aware estimate (fiberpath.simulation.kinematics).
+    kinematics: MachineKinematics | None = Field(
+        default=None, description="Axis velocity/acceleration and junction limits, if known."
+    )
+    # Absent until fitted from streaming timings (fiberpath.simulation.calibration);
+    # the planner and simulator then report calibrated times for this machine.
+    time_calibration: TimeCalibration | None = Field(
+        default=None,
+        alias="timeCalibration",
+        description="Fitted cycle-time correction for this machine, if calibrated.",
+    )
 
 
 def _validate(payload: object, source: str) -> MachineProfile:
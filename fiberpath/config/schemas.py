@@ -39,6 +39,9 @@ class TowParameters(BaseFiberPathModel):
 class HoopLayer(BaseFiberPathModel):
     wind_type: Literal["hoop"] = Field(alias="windType", default="hoop")
     terminal: bool = False
+    # Optional per-layer feed override in mm/min (schemaVersion 1.2+); absent
+    # runs the layer at the definition's defaultFeedRate. Same on every layer type.
+    feed_rate: PositiveFloat | None = Field(default=None, alias="feedRate")
 
 
 class HelicalLayer(BaseFiberPathModel):
@@ -50,11 +53,13 @@ class HelicalLayer(BaseFiberPathModel):
     lead_in_mm: PositiveFloat = Field(alias="leadInMM")
     lead_out_degrees: PositiveFloat = Field(alias="leadOutDegrees")
     skip_initial_near_lock: bool = Field(default=False, alias="skipInitialNearLock")
+    feed_rate: PositiveFloat | None = Field(default=None, alias="feedRate")
 
 
 class SkipLayer(BaseFiberPathModel):
     wind_type: Literal["skip"] = Field(alias="windType", default="skip")
     mandrel_rotation: float = Field(alias="mandrelRotation")
+    feed_rate: PositiveFloat | None = Field(default=None, alias="feedRate")
 
 
 LayerModel = Annotated[
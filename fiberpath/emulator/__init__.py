@@ -0,0 +1,16 @@
+"""A virtual Marlin controller for exercising streaming without hardware."""
+
+from .controller import EmulatorConfig, EmulatorStats, MarlinEmulator
+from .protocol_marlinemu import URL_SCHEME, emulator_url, get_emulator, register_url_handler
+from .pty import PtyEmulator
+
+__all__ = [
+    "EmulatorConfig",
+    "EmulatorStats",
+    "MarlinEmulator",
+    "PtyEmulator",
+    "URL_SCHEME",
+    "emulator_url",
+    "get_emulator",
+    "register_url_handler",
+]
@@ -0,0 +1,456 @@
+"""A virtual Marlin controller: the protocol state machine and its timing model.
+
+:class:`MarlinEmulator` answers host lines the way a Marlin board does, on an
+explicit clock: every reply carries the time it becomes readable, so the same
+core drives the pyserial URL handler, the pty server and clock-free unit tests.
+
+Timing model, per received line:
+
+* the line is parsed ``line_latency_s`` after it arrived (and after the previous
+  line's ``ok``: Marlin handles one command at a time);
+* a motion line takes a planner slot; with all ``buffer_depth`` slots holding
+  unfinished blocks, its ``ok`` waits until the oldest block finishes, with an
+  ``echo:busy: processing`` keepalive every ``keepalive_s`` meanwhile;
+* a block runs for ``distance / feed`` (scaled by ``time_scale``) after the
+  previous block; ``G4`` and ``M400`` wait for the planner to drain first;
+* replies cost their bytes at the link's baud rate.
+
+The emulator counts a *stall* whenever a block reaches an empty planner after
+motion started: the machine waited for the host.
+
+Faults are injected deterministically: ``resend_every`` fails every Nth framed
+line's checksum, ``busy_every`` precedes every Nth ``ok`` with a keepalive, and
+``halt_after`` kills the controller after that many accepted commands.
+
+The emulator has an SD card, held in memory. ``M28``/``M29`` write a file (every
+line in between is stored, not run, with ``\r\n`` endings as Marlin stores it),
+``M20`` lists the card, ``M23`` selects a file and reports its size, ``M30``
+deletes one. ``M24`` starts or resumes a print: the file's lines are read one
+after another, ``line_latency_s`` apiece, and run through the same planner as
+host moves, the reader waiting whenever the planner is full. ``M25`` pauses,
+``M524`` aborts, and ``M27`` reports the bytes read so far.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections import deque
+from dataclasses import dataclass, replace
+
+from marlin_host import checksum
+
+from fiberpath.planning.metrics import surface_distance_mm
+
+__all__ = ["EmulatorConfig", "EmulatorStats", "MarlinEmulator"]
+
+# 8N1: a start bit, eight data bits and a stop bit per byte.
+_BITS_PER_BYTE = 10
+# Marlin's power-on feed (mm/min) until a program sets one.
+_DEFAULT_FEED = 1500.0
+_AXES = "XYZABCE"
+_WORD = re.compile(r"([A-Z])\s*([-+]?(?:\d+\.?\d*|\.\d+))")
+_FRAMED = re.compile(r"N(-?\d+)\s*(.*?)\*(\d+)$")
+
+_FIRMWARE = (
+    "FIRMWARE_NAME:Marlin 2.1.2 (FiberPath emulator) SOURCE_CODE_URL:github.com/MarlinFirmware"
+    "/Marlin PROTOCOL_VERSION:1.0 MACHINE_TYPE:FiberPath Emulator EXTRUDER_COUNT:0"
+)
+_CAPS = ("Cap:EEPROM:0", "Cap:AUTOREPORT_TEMP:0", "Cap:EMERGENCY_PARSER:0")
+_BUSY = "echo:busy: processing"
+_KILLED = "Error:Printer halted. kill() called!"
+# Marlin stores every line it saves to the card with a CRLF ending.
+_SD_LINE_END = 2
+_SD_COMMANDS = ("M20", "M21", "M22", "M23", "M24", "M25", "M27", "M28", "M29", "M30", "M524")
+
+
+@dataclass(slots=True, frozen=True)
+class EmulatorConfig:
+    """Behaviour of a :class:`MarlinEmulator`; every field is a URL query option."""
+
+    # Parse and reply time per line, beyond its bytes on the wire.
+    line_latency_s: float = 0.0005
+    # Planner blocks the controller buffers (Marlin's BLOCK_BUFFER_SIZE).
+    buffer_depth: int = 16
+    # Multiplier on block execution time: 1 is real time, 0 finishes moves instantly.
+    time_scale: float = 1.0
+    # When set, moves are timed by FiberPath's surface metric (carriage X, mandrel A
+    # in degrees), as ``simulate`` times them; otherwise by the Cartesian length
+    # over every axis word, as stock Marlin sees it.
+    mandrel_diameter_mm: float | None = None
+    # Marlin's HOST_KEEPALIVE_INTERVAL.
+    keepalive_s: float = 2.0
+    # Fault injection; 0 disables each.
+    resend_every: int = 0
+    busy_every: int = 0
+    halt_after: int = 0
+
+    def __post_init__(self) -> None:
+        if self.line_latency_s < 0:
+            raise ValueError("line_latency_s must be non-negative")
+        if self.buffer_depth < 1:
+            raise ValueError("buffer_depth must be at least 1")
+        if self.time_scale < 0:
+            raise ValueError("time_scale must be non-negative")
+        if self.mandrel_diameter_mm is not None and self.mandrel_diameter_mm <= 0:
+            raise ValueError("mandrel_diameter_mm must be positive")
+        if self.keepalive_s <= 0:
+            raise ValueError("keepalive_s must be positive")
+        if self.resend_every == 1:
+            raise ValueError("resend_every=1 would reject every line; use 0 or at least 2")
+        if min(self.resend_every, self.busy_every, self.halt_after) < 0:
+            raise ValueError("fault injection counts must be non-negative")
+
+
+@dataclass(slots=True)
+class EmulatorStats:
+    lines_received: int = 0
+    # Commands accepted and executed (resent copies are counted once).
+    commands: int = 0
+    motion_blocks: int = 0
+    resends_requested: int = 0
+    busy_sent: int = 0
+    # Times a block reached an empty planner after motion started, and the total
+    # time the machine stood waiting for them.
+    stalls: int = 0
+    stall_s: float = 0.0
+    # Scaled execution time of every block.
+    machine_s: float = 0.0
+    halted: bool = False
+
+
+class MarlinEmulator:
+    """Marlin's host-facing behaviour on an explicit clock.
+
+    Feed host lines with :meth:`receive` and collect replies with
+    :meth:`pop_ready`; :meth:`next_ready_at` says when the next one is due. The
+    emulator is not thread-safe: transports serialise access to it.
+    """
+
+    def __init__(self, config: EmulatorConfig | None = None, *, baud_rate: int | None = None):
+        self.config = config or EmulatorConfig()
+        self._byte_s = _BITS_PER_BYTE / baud_rate if baud_rate else 0.0
+        self._stats = EmulatorStats()
+        self._outbox: deque[tuple[float, str]] = deque()
+        self._sd: dict[str, list[str]] = {}
+        self._reset_state()
+
+    @property
+    def stats(self) -> EmulatorStats:
+        """A snapshot of the counters since the emulator was created."""
+        return replace(self._stats)
+
+    def boot(self, at: float) -> None:
+        """Power-on or reset: clear all state and emit the boot banner.
+
+        The banner ends with one ``wait`` (Marlin's idle heartbeat), which lets a
+        host's connect treat the board as ready without waiting out its timeout.
+        """
+        self._reset_state()
+        self._outbox.clear()
+        self._tx_free = at
+        self._emit(at, "start")
+        self._emit(at, "echo:Marlin 2.1.2")
+        self._emit(at, "wait")
+
+    def receive(self, raw: str, at: float) -> None:
+        """Handle one line that finished arriving at ``at``."""
+        self._stats.lines_received += 1
+        if self._halted:
+            return
+        self._advance_sd(at)
+        line = raw.strip()
+        if not line:
+            return
+        t = max(at, self._free_at) + self.config.line_latency_s
+        command = line
+        if line.startswith("N"):
+            parsed = self._unframe(line, t)
+            if parsed is None:
+                return
+            command = parsed
+        command = command.split(";", 1)[0].strip()
+        if not command:
+            self._ack(t)
+            return
+        if self.config.halt_after and self._stats.commands >= self.config.halt_after:
+            self._halt(t)
+            return
+        self._stats.commands += 1
+        if self.config.busy_every and self._stats.commands % self.config.busy_every == 0:
+            self._stats.busy_sent += 1
+            self._emit(t, _BUSY)
+        self._dispatch(command, t)
+
+    def pop_ready(self, now: float) -> list[str]:
+        """Remove and return the replies readable at ``now``."""
+        self._advance_sd(now)
+        ready: list[str] = []
+        while self._outbox and self._outbox[0][0] <= now:
+            ready.append(self._outbox.popleft()[1])
+        return ready
+
+    def next_ready_at(self) -> float | None:
+        return self._outbox[0][0] if self._outbox else None
+
+    @property
+    def sd_files(self) -> dict[str, list[str]]:
+        """A copy of the card: file name to its stored lines."""
+        return {name: list(lines) for name, lines in self._sd.items()}
+
+    # -- protocol -----------------------------------------------------------
+
+    def _reset_state(self) -> None:
+        self._halted = False
+        self._last_line = 0
+        self._framed_seen = 0
+        self._free_at = 0.0
+        self._tx_free = 0.0
+        self._planner: deque[float] = deque()
+        self._last_finish = 0.0
+        self._moving = False
+        self._absolute = True
+        self._feed = _DEFAULT_FEED
+        self._position = dict.fromkeys(_AXES, 0.0)
+        # The card itself (``_sd``) survives a reset; what is open on it does not.
+        self._sd_writing: str | None = None
+        self._sd_selected: str | None = None
+        self._sd_printing = False
+        self._sd_line = 0
+        self._sd_byte = 0
+        self._sd_clock = 0.0
+
+    def _unframe(self, line: str, t: float) -> str | None:
+        # None: the line was rejected and a resend requested.
+        match = _FRAMED.match(line)
+        if match is None:
+            self._request_resend(t, "No Checksum with line number, Last Line: ")
+            return None
+        number, command = int(match.group(1)), match.group(2).strip()
+        self._framed_seen += 1
+        corrupt = self.config.resend_every and self._framed_seen % self.config.resend_every == 0
+        if corrupt or checksum(line[: match.start(3) - 1]) != int(match.group(3)):
+            self._request_resend(t, "checksum mismatch, Last Line: ")
+            return None
+        if command.startswith("M110"):
+            words = dict(_WORD.findall(command[4:]))
+            self._last_line = int(float(words.get("N", number)))
+            return command
+        if number != self._last_line + 1:
+            self._request_resend(t, "Line Number is not Last Line Number+1, Last Line: ")
+            return None
+        self._last_line = number
+        return command
+
+    def _request_resend(self, t: float, error: str) -> None:
+        self._stats.resends_requested += 1
+        self._emit(t, f"Error:{error}{self._last_line}")
+        self._emit(t, f"Resend: {self._last_line + 1}")
+        self._ack(t)
+
+    def _dispatch(self, command: str, t: float) -> None:
+        head, _, rest = command.partition(" ")
+        code = head.upper()
+        if self._sd_writing is not None and code != "M29":
+            self._sd[self._sd_writing].append(command)
+            self._ack(t)
+            return
+        words = {letter: float(value) for letter, value in _WORD.findall(rest.upper())}
+        executed = self._execute(code, words, t, keepalive=True)
+        if executed is not None:
+            t = executed
+        elif code in _SD_COMMANDS:
+            self._sd_command(code, rest.strip(), t)
+        elif code == "M110":
+            self._last_line = int(words.get("N", 0.0))
+        elif code == "M112":
+            self._halt(t)
+            return
+        elif code == "M115":
+            self._emit(t, _FIRMWARE)
+            for cap in _CAPS:
+                self._emit(t, cap)
+        elif code == "M105":
+            self._ack(t, " T:0.00 /0.00 B:0.00 /0.00 @:0 B@:0")
+            return
+        elif code == "M114":
+            position = " ".join(f"{axis}:{self._position[axis]:.2f}" for axis in _AXES[:-1])
+            self._emit(t, f"{position} E:{self._position['E']:.2f} Count X:0 Y:0 Z:0")
+        elif code not in ("G20", "G21", "G28", "G94", "M17", "M18", "M82", "M83", "M84"):
+            self._emit(t, f'echo:Unknown command: "{command}"')
+        self._ack(t)
+
+    def _execute(
+        self, code: str, words: dict[str, float], t: float, *, keepalive: bool
+    ) -> float | None:
+        """Run a motion or modal command from the host or the card.
+
+        Returns when the next line can be parsed, or None if ``code`` is not one.
+        """
+        if code in ("G0", "G1", "G00", "G01"):
+            return self._move(words, t, keepalive=keepalive)
+        if code == "G4":
+            dwell = (words.get("P", 0.0) / 1000.0 + words.get("S", 0.0)) * self.config.time_scale
+            t = self._drain(t, keepalive=keepalive) + dwell
+            self._last_finish = t
+            return t
+        if code == "M400":
+            return self._drain(t, keepalive=keepalive)
+        if code == "G92":
+            for axis in _AXES:
+                if axis in words:
+                    self._position[axis] = words[axis]
+            return t
+        if code in ("G90", "G91"):
+            self._absolute = code == "G90"
+            return t
+        return None
+
+    def _sd_command(self, code: str, name: str, t: float) -> None:
+        """Reply to an SD card command (the caller sends the ``ok``)."""
+        name = name.upper()
+        if code == "M20":
+            self._emit(t, "Begin file list")
+            for listed, lines in self._sd.items():
+                self._emit(t, f"{listed} {_sd_size(lines)}")
+            self._emit(t, "End file list")
+        elif code == "M21":
+            self._emit(t, "echo:SD card ok")
+        elif code == "M22":
+            self._sd_printing = False
+            self._sd_selected = None
+            self._emit(t, "echo:SD card released")
+        elif code == "M23":
+            if name not in self._sd:
+                self._emit(t, f"open failed, File: {name}.")
+                return
+            self._sd_printing = False
+            self._sd_selected = name
+            self._sd_line = self._sd_byte = 0
+            self._emit(t, f"File opened: {name} Size: {_sd_size(self._sd[name])}")
+            self._emit(t, "File selected")
+        elif code == "M24":
+            if self._sd_selected is not None and not self._sd_printing:
+                self._sd_printing = True
+                self._sd_clock = max(t, self._sd_clock)
+        elif code == "M25":
+            self._sd_printing = False
+        elif code == "M27":
+            if self._sd_printing:
+                size = _sd_size(self._sd[self._sd_selected or ""])
+                self._emit(t, f"SD printing byte {self._sd_byte}/{size}")
+            else:
+                self._emit(t, "Not SD printing")
+        elif code == "M28":
+            self._sd[name] = []
+            self._sd_writing = name
+            self._emit(t, f"Writing to file: {name}")
+        elif code == "M29":
+            self._sd_writing = None
+            self._emit(t, "Done saving file.")
+        elif code == "M30":
+            if self._sd.pop(name, None) is None:
+                self._emit(t, f"Deletion failed, File: {name}.")
+            else:
+                self._emit(t, f"File deleted:{name}")
+                if name == self._sd_selected:
+                    self._sd_selected = None
+                    self._sd_printing = False
+        elif code == "M524":
+            if self._sd_printing:
+                self._sd_printing = False
+                self._sd_selected = None
+                self._planner.clear()
+                self._last_finish = min(self._last_finish, t)
+                self._emit(t, "echo:Print aborted")
+
+    def _advance_sd(self, now: float) -> None:
+        """Read and run the printing file's lines due by ``now``."""
+        while self._sd_printing:
+            lines = self._sd[self._sd_selected or ""]
+            if self._sd_line >= len(lines):
+                self._sd_printing = False
+                self._emit(self._sd_clock, "Done printing file")
+                return
+            t = self._sd_clock + self.config.line_latency_s
+            if t > now:
+                return
+            line = lines[self._sd_line]
+            self._sd_line += 1
+            self._sd_byte += len(line) + _SD_LINE_END
+            command = line.split(";", 1)[0].strip()
+            if command:
+                head, _, rest = command.partition(" ")
+                words = {letter: float(value) for letter, value in _WORD.findall(rest.upper())}
+                executed = self._execute(head.upper(), words, t, keepalive=False)
+                t = executed if executed is not None else t
+            self._sd_clock = t
+
+    def _move(self, words: dict[str, float], t: float, *, keepalive: bool) -> float:
+        if "F" in words:
+            self._feed = words["F"]
+        deltas = dict.fromkeys(_AXES, 0.0)
+        for axis in _AXES:
+            if axis not in words:
+                continue
+            target = words[axis] if self._absolute else self._position[axis] + words[axis]
+            deltas[axis] = target - self._position[axis]
+            self._position[axis] = target
+        if self.config.mandrel_diameter_mm is not None:
+            circumference = math.pi * self.config.mandrel_diameter_mm
+            distance = surface_distance_mm(deltas["X"], deltas["A"], circumference)
+        else:
+            distance = math.hypot(*deltas.values())
+        if distance == 0.0 or self._feed <= 0:
+            return t
+        duration = distance / self._feed * 60.0 * self.config.time_scale
+
+        planner = self._planner
+        while planner and planner[0] <= t:
+            planner.popleft()
+        if len(planner) >= self.config.buffer_depth:
+            slot_at = planner.popleft()
+            if keepalive:
+                self._keepalive(t, slot_at)
+            t = slot_at
+        if self._moving and t > self._last_finish:
+            self._stats.stalls += 1
+            self._stats.stall_s += t - self._last_finish
+        self._last_finish = max(t, self._last_finish) + duration
+        planner.append(self._last_finish)
+        self._moving = True
+        self._stats.motion_blocks += 1
+        self._stats.machine_s += duration
+        return t
+
+    def _drain(self, t: float, *, keepalive: bool) -> float:
+        if keepalive:
+            self._keepalive(t, self._last_finish)
+        t = max(t, self._last_finish)
+        self._planner.clear()
+        self._moving = False
+        return t
+
+    def _keepalive(self, t: float, until: float) -> None:
+        """Emit Marlin's busy keepalives while a host command waits from ``t`` to ``until``."""
+        at = t + self.config.keepalive_s
+        while at < until:
+            self._emit(at, _BUSY)
+            at += self.config.keepalive_s
+
+    def _halt(self, t: float) -> None:
+        self._halted = True
+        self._stats.halted = True
+        self._emit(t, _KILLED)
+
+    def _ack(self, t: float, fields: str = "") -> None:
+        self._emit(t, "ok" + fields)
+        self._free_at = t
+
+    def _emit(self, t: float, text: str) -> None:
+        self._tx_free = max(t, self._tx_free) + (len(text) + 1) * self._byte_s
+        self._outbox.append((self._tx_free, text))
+
+
+def _sd_size(lines: list[str]) -> int:
+    return sum(len(line) + _SD_LINE_END for line in lines)
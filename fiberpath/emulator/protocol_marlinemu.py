@@ -0,0 +1,219 @@
+"""pyserial URL handler for ``marlinemu://`` ports.
+
+After :func:`register_url_handler`, ``serial.serial_for_url`` (and so
+:class:`marlin_host.SerialTransport`) opens ``marlinemu://<name>?<options>`` as
+an in-process :class:`~fiberpath.emulator.controller.MarlinEmulator`. The
+options are :class:`~fiberpath.emulator.controller.EmulatorConfig` fields, e.g.
+``marlinemu://bench?buffer_depth=8&line_latency_s=0.002``; the port's baud rate
+sets the reply byte time. Opening the port powers the emulator on and a DTR
+pulse resets it, as on a USB-serial board. The most recent emulator opened
+under a name stays reachable through :func:`get_emulator` for its statistics.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import threading
+import time
+import typing
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import serial  # type: ignore[import-untyped]
+from serial.serialutil import (  # type: ignore[import-untyped]
+    PortNotOpenError,
+    SerialBase,
+    SerialException,
+)
+
+from .controller import EmulatorConfig, MarlinEmulator
+
+__all__ = ["URL_SCHEME", "Serial", "emulator_url", "get_emulator", "register_url_handler"]
+
+URL_SCHEME = "marlinemu"
+_PACKAGE = __name__.rpartition(".")[0]
+
+_registry_lock = threading.Lock()
+_registry: dict[str, MarlinEmulator] = {}
+
+
+def register_url_handler() -> None:
+    """Make ``marlinemu://`` ports openable through pyserial (idempotent)."""
+    if _PACKAGE not in serial.protocol_handler_packages:
+        serial.protocol_handler_packages.append(_PACKAGE)
+
+
+def emulator_url(name: str = "default", config: EmulatorConfig | None = None) -> str:
+    """The port URL for an emulator called ``name``; only non-default options are spelled out."""
+    options = {
+        item.name: getattr(config, item.name)
+        for item in dataclasses.fields(EmulatorConfig)
+        if config is not None and getattr(config, item.name) != item.default
+    }
+    query = f"?{urlencode(options)}" if options else ""
+    return f"{URL_SCHEME}://{name}{query}"
+
+
+def get_emulator(name: str = "default") -> MarlinEmulator | None:
+    """The emulator most recently opened as ``marlinemu://<name>``, if any."""
+    with _registry_lock:
+        return _registry.get(name)
+
+
+def _parse_config(query: str) -> EmulatorConfig:
+    hints = typing.get_type_hints(EmulatorConfig)
+    values: dict[str, object] = {}
+    for key, raw in parse_qsl(query, keep_blank_values=True):
+        if key not in hints:
+            raise SerialException(f"unknown {URL_SCHEME}:// option: {key!r}")
+        kind = int if hints[key] is int else float
+        try:
+            values[key] = kind(raw)
+        except ValueError as exc:
+            raise SerialException(f"invalid {URL_SCHEME}:// option {key}={raw!r}") from exc
+    try:
+        return EmulatorConfig(**values)  # type: ignore[arg-type]
+    except ValueError as exc:
+        raise SerialException(f"invalid {URL_SCHEME}:// options: {exc}") from exc
+
+
+class Serial(SerialBase):  # type: ignore[misc]
+    """A serial port backed by a :class:`MarlinEmulator` in this process."""
+
+    is_open: bool
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        self._emulator: MarlinEmulator | None = None
+        self._ready = threading.Condition()
+        self._rx = bytearray()
+        self._tx = bytearray()
+        self._dtr_asserted = False
+        super().__init__(*args, **kwargs)
+
+    def open(self) -> None:
+        if self.is_open:
+            raise SerialException("Port is already open.")
+        if self._port is None:
+            raise SerialException("Port must be configured before it can be used.")
+        parts = urlsplit(self._port)
+        if parts.scheme != URL_SCHEME:
+            raise SerialException(f"expected a {URL_SCHEME}:// URL, got {self._port!r}")
+        name = parts.netloc or "default"
+        emulator = MarlinEmulator(_parse_config(parts.query), baud_rate=self._baudrate)
+        with _registry_lock:
+            _registry[name] = emulator
+        self._emulator = emulator
+        self._rx.clear()
+        self._tx.clear()
+        self._dtr_asserted = bool(self._dtr_state)
+        self.is_open = True
+        emulator.boot(time.monotonic())
+
+    def close(self) -> None:
+        with self._ready:
+            self.is_open = False
+            self._ready.notify_all()
+        super().close()
+
+    def _reconfigure_port(self) -> None:
+        pass
+
+    def _update_dtr_state(self) -> None:
+        # Releasing DTR after asserting it is the reset edge.
+        if self._dtr_state:
+            self._dtr_asserted = True
+        elif self._dtr_asserted:
+            self._dtr_asserted = False
+            with self._ready:
+                self._rx.clear()
+                self._require_emulator().boot(time.monotonic())
+                self._ready.notify_all()
+
+    def _update_rts_state(self) -> None:
+        pass
+
+    def _update_break_state(self) -> None:
+        pass
+
+    @property
+    def in_waiting(self) -> int:
+        with self._ready:
+            self._collect(time.monotonic())
+            return len(self._rx)
+
+    @property
+    def out_waiting(self) -> int:
+        return 0
+
+    @property
+    def cts(self) -> bool:
+        return True
+
+    @property
+    def dsr(self) -> bool:
+        return True
+
+    @property
+    def ri(self) -> bool:
+        return False
+
+    @property
+    def cd(self) -> bool:
+        return True
+
+    def reset_input_buffer(self) -> None:
+        with self._ready:
+            self._collect(time.monotonic())
+            self._rx.clear()
+
+    def reset_output_buffer(self) -> None:
+        pass
+
+    def write(self, data: bytes) -> int:
+        if not self.is_open:
+            raise PortNotOpenError()
+        emulator = self._require_emulator()
+        with self._ready:
+            now = time.monotonic()
+            self._tx.extend(data)
+            # A line has arrived once its bytes have crossed the link.
+            arrival = now + len(data) * 10 / self._baudrate
+            while (end := self._tx.find(b"\n")) >= 0:
+                line = self._tx[:end].decode("ascii", errors="replace")
+                del self._tx[: end + 1]
+                emulator.receive(line, arrival)
+            self._ready.notify_all()
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def read(self, size: int = 1) -> bytes:
+        if not self.is_open:
+            raise PortNotOpenError()
+        emulator = self._require_emulator()
+        deadline = None if self._timeout is None else time.monotonic() + self._timeout
+        with self._ready:
+            while self.is_open:
+                now = time.monotonic()
+                self._collect(now)
+                if len(self._rx) >= size:
+                    break
+                wake = emulator.next_ready_at()
+                if deadline is not None:
+                    if now >= deadline:
+                        break
+                    wake = deadline if wake is None else min(wake, deadline)
+                self._ready.wait(None if wake is None else max(wake - now, 0.0))
+            data = bytes(self._rx[:size])
+            del self._rx[:size]
+        return data
+
+    def _collect(self, now: float) -> None:
+        if self._emulator is not None:
+            for reply in self._emulator.pop_ready(now):
+                self._rx.extend(reply.encode("ascii") + b"\n")
+
+    def _require_emulator(self) -> MarlinEmulator:
+        if self._emulator is None:
+            raise PortNotOpenError()
+        return self._emulator
@@ -0,0 +1,106 @@
+"""Serve a :class:`~fiberpath.emulator.controller.MarlinEmulator` on a pseudo-terminal (POSIX).
+
+Any serial host in any process can open :attr:`PtyEmulator.path` like a real
+port. A pty has no modem lines, so hosts must attach without a DTR reset
+(``SerialTransport(path, reset_on_open=False)``); the emulator boots when the
+server starts.
+"""
+
+from __future__ import annotations
+
+import os
+import select
+import threading
+import time
+from types import TracebackType
+
+from .controller import EmulatorConfig, MarlinEmulator
+
+__all__ = ["PtyEmulator"]
+
+# Upper bound on how long the server sleeps with nothing due, so close() is prompt.
+_POLL_S = 0.05
+
+
+class PtyEmulator:
+    """A background thread bridging a pty to a :class:`MarlinEmulator`."""
+
+    def __init__(self, config: EmulatorConfig | None = None, *, baud_rate: int = 250_000):
+        self.emulator = MarlinEmulator(config, baud_rate=baud_rate)
+        self._baud_rate = baud_rate
+        self._master: int | None = None
+        self._slave: int | None = None
+        self._path: str | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def path(self) -> str:
+        """The device path hosts open, e.g. ``/dev/pts/3``."""
+        if self._path is None:
+            raise RuntimeError("the emulator is not serving; call start() first")
+        return self._path
+
+    def start(self) -> str:
+        """Open the pty, boot the emulator and serve it; return the device path."""
+        if self._thread is not None:
+            return self.path
+        import tty  # POSIX only
+
+        master, slave = os.openpty()
+        tty.setraw(slave)
+        self._master, self._slave = master, slave
+        self._path = os.ttyname(slave)
+        self.emulator.boot(time.monotonic())
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._serve, name="fiberpath-pty-emulator", daemon=True
+        )
+        self._thread.start()
+        return self._path
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        for fd in (self._master, self._slave):
+            if fd is not None:
+                os.close(fd)
+        self._master = self._slave = None
+
+    def __enter__(self) -> PtyEmulator:
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _serve(self) -> None:
+        assert self._master is not None
+        master = self._master
+        pending = bytearray()
+        while not self._stop.is_set():
+            now = time.monotonic()
+            for reply in self.emulator.pop_ready(now):
+                os.write(master, reply.encode("ascii") + b"\n")
+            due = self.emulator.next_ready_at()
+            wait = _POLL_S if due is None else min(max(due - now, 0.0), _POLL_S)
+            readable, _, _ = select.select([master], [], [], wait)
+            if not readable:
+                continue
+            try:
+                chunk = os.read(master, 4096)
+            except OSError:  # the slave side was closed
+                continue
+            arrival = time.monotonic() + len(chunk) * 10 / self._baud_rate
+            pending.extend(chunk)
+            while (end := pending.find(b"\n")) >= 0:
+                line = pending[:end].decode("ascii", errors="replace")
+                del pending[: end + 1]
+                self.emulator.receive(line, arrival)
@@ -2,13 +2,14 @@
 
 from .dialects import MarlinDialect
 from .generator import GCodeProgram, sanitize_program, write_gcode
-from .reader import ProgramReadError, read_program
+from .reader import ProgramReadError, read_line_moves, read_program
 
 __all__ = [
     "GCodeProgram",
     "sanitize_program",
     "write_gcode",
     "MarlinDialect",
+    "read_line_moves",
     "read_program",
     "ProgramReadError",
 ]
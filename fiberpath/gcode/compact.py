@@ -0,0 +1,182 @@
+"""Wire-compact serialization: fewer bytes per streamed line.
+
+At Marlin's 250000 baud every byte of ``G0 X123.456789 A98765.432101 B-34.5``
+costs link time. The canonical program repeats all three axes on every RAPID and
+prints six decimals of every coordinate. This opt-in profile rewrites a
+:class:`~fiberpath.planning.ir.Program` before it is serialized:
+
+* each coordinate is rounded to the fewest decimals that stay within half a
+  machine resolution step of the exact value (so ``98765.432101`` becomes
+  ``98765.432`` at 0.001 deg resolution), and
+* an axis whose rounded value equals the last value sent for it (G0 targets and
+  G92 resets are both modal) is omitted; a RAPID left with no axes and a feed
+  change to the current feed are dropped.
+
+Coordinates stay absolute, so rounding never accumulates. The output is still
+ordinary G-code that :func:`~fiberpath.gcode.read_program` parses, since partial
+``G0`` targets are read modally. Header and comments are kept: the reader needs
+the header, and the streamer never sends comment lines anyway.
+
+Layer metrics and per-layer command counts describe the canonical program.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import cast
+
+import numpy as np
+
+from fiberpath.planning.helpers import Axis
+from fiberpath.planning.ir import Move, MoveKind, Program
+
+from .dialects import MARLIN_XAB_STANDARD, MarlinDialect
+from .reader import read_program
+from .serializer import serialize
+
+__all__ = [
+    "DEFAULT_BAUD_RATE",
+    "CompactionStats",
+    "WireCompactOptions",
+    "compact_gcode",
+    "compact_program",
+    "wire_bytes",
+]
+
+# Marlin's default serial rate, used when a caller has no baud rate of its own.
+DEFAULT_BAUD_RATE = 250_000
+
+# 8N1 framing: a start bit, eight data bits and a stop bit per byte.
+_BITS_PER_BYTE = 10
+
+# The canonical formatter's precision; rounding never needs more.
+_MAX_DECIMALS = 6
+
+
+@dataclass(slots=True, frozen=True)
+class WireCompactOptions:
+    """Machine resolution per axis kind: the smallest step the controller can take."""
+
+    linear_resolution_mm: float = 0.001
+    rotary_resolution_deg: float = 0.001
+
+    def __post_init__(self) -> None:
+        if self.linear_resolution_mm <= 0 or self.rotary_resolution_deg <= 0:
+            raise ValueError("wire-compact resolutions must be positive")
+
+    def tolerance(self, axis: Axis) -> float:
+        """Largest rounding error allowed on ``axis``: half a resolution step."""
+        if axis is Axis.CARRIAGE:
+            return self.linear_resolution_mm / 2
+        return self.rotary_resolution_deg / 2
+
+
+@dataclass(slots=True)
+class CompactionStats:
+    """Streamed-line and byte counts of a program before and after compaction.
+
+    Bytes count the lines the streamer sends (comments excluded) plus their
+    newline, before any line-number/checksum framing the host adds per line.
+    """
+
+    lines_before: int
+    lines_after: int
+    bytes_before: int
+    bytes_after: int
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.bytes_before - self.bytes_after
+
+    def link_seconds(self, byte_count: int, baud_rate: int = DEFAULT_BAUD_RATE) -> float:
+        return byte_count * _BITS_PER_BYTE / baud_rate
+
+    def link_seconds_saved(self, baud_rate: int = DEFAULT_BAUD_RATE) -> float:
+        """Serial transfer time the compaction saves at ``baud_rate`` (8N1)."""
+        return self.link_seconds(self.bytes_saved, baud_rate)
+
+
+def wire_bytes(lines: Iterable[str]) -> tuple[int, int]:
+    """``(lines, bytes)`` the streamer would send for ``lines``."""
+    count = 0
+    size = 0
+    for line in lines:
+        if line and not line.startswith(";"):
+            count += 1
+            size += len(line.encode("utf-8")) + 1
+    return count, size
+
+
+def compact_program(program: Program, options: WireCompactOptions | None = None) -> Program:
+    """Rewrite ``program`` with rounded coordinates and unchanged modal axes omitted."""
+    options = options or WireCompactOptions()
+    tolerance = {axis: options.tolerance(axis) for axis in Axis}
+    positioned = [move for move in program.moves if move.targets]
+    values = [value for move in positioned for value in move.targets.values()]
+    tolerances = [tolerance[axis] for move in positioned for axis in move.targets]
+    rounded = iter(_shortest(values, tolerances))
+
+    sent: dict[Axis, float] = {}
+    feed: float | None = None
+    moves: list[Move] = []
+    for move in program.moves:
+        kind = move.kind
+        if kind is MoveKind.COMMENT:
+            moves.append(move)
+            continue
+        if kind is MoveKind.SET_FEED:
+            if move.feed != feed:
+                feed = move.feed
+                moves.append(move)
+            continue
+
+        targets: dict[Axis, float] = {}
+        for axis in move.targets:
+            value = next(rounded)
+            if kind is MoveKind.RAPID and sent.get(axis) == value:
+                continue
+            targets[axis] = value
+            sent[axis] = value
+        if targets or kind is MoveKind.SET_POSITION:
+            moves.append(Move(kind, targets=targets))
+    return Program(meta=program.meta, moves=moves)
+
+
+def compact_gcode(
+    lines: Sequence[str],
+    options: WireCompactOptions | None = None,
+    *,
+    dialect: MarlinDialect | None = None,
+) -> tuple[list[str], CompactionStats]:
+    """Compact a serialized program; returns the new lines and what it saved."""
+    dialect = dialect or MARLIN_XAB_STANDARD
+    program = read_program(lines, dialect=dialect)
+    compacted = serialize(compact_program(program, options), dialect)
+    lines_before, bytes_before = wire_bytes(lines)
+    lines_after, bytes_after = wire_bytes(compacted)
+    stats = CompactionStats(
+        lines_before=lines_before,
+        lines_after=lines_after,
+        bytes_before=bytes_before,
+        bytes_after=bytes_after,
+    )
+    return compacted, stats
+
+
+def _shortest(values: list[float], tolerances: list[float]) -> list[float]:
+    """Each value rounded to the fewest decimals whose error is within its tolerance."""
+    if not values:
+        return []
+    exact = np.asarray(values, dtype=np.float64)
+    limit = np.asarray(tolerances, dtype=np.float64)
+    result = exact.copy()
+    pending = np.ones(exact.shape, dtype=bool)
+    for decimals in range(_MAX_DECIMALS):
+        candidate = np.round(exact, decimals)
+        accept = pending & (np.abs(candidate - exact) <= limit)
+        result[accept] = candidate[accept]
+        pending &= ~accept
+        if not pending.any():
+            break
+    return cast(list[float], result.tolist())
@@ -41,6 +41,19 @@ class ProgramReadError(ValueError):
 
 def read_program(lines: Iterable[str], *, dialect: MarlinDialect | None = None) -> Program:
     """Parse G-code lines into a :class:`Program` (header metadata + Moves)."""
+    meta, line_moves = read_line_moves(lines, dialect=dialect)
+    return Program(meta=meta, moves=[move for moves in line_moves for move in moves])
+
+
+def read_line_moves(
+    lines: Iterable[str], *, dialect: MarlinDialect | None = None
+) -> tuple[ProgramMeta, list[list[Move]]]:
+    """Parse like :func:`read_program`, keeping the Moves of each input line apart.
+
+    The list has one entry per input line (empty for blank, modal and header
+    lines), so per-line measurements such as streaming acknowledgement times can
+    be matched to the Moves they executed.
+    """
     program_lines = list(lines)
     if dialect is None:
         dialect = _detect_dialect(program_lines)
@@ -48,19 +61,18 @@ def read_program(lines: Iterable[str], *, dialect: MarlinDialect | None = None)
     meta = _read_meta(program_lines)
     letter_to_axis = _invert_mapping(dialect.axis_mapping)
 
-    moves: list[Move] = []
+    line_moves: list[list[Move]] = []
     for raw_line in program_lines:
         line = raw_line.strip()
-        if not line:
-            continue
-        if line.startswith(";"):
-            if line.startswith(HEADER_PREFIX):
-                continue  # the header travels structurally in `meta`, not as a Move
-            moves.append(_read_comment(line))
-            continue
-        moves.extend(_read_motion(line, letter_to_axis))
-
-    return Program(meta=meta, moves=moves)
+        if not line or line.startswith(HEADER_PREFIX):
+            # the header travels structurally in `meta`, not as a Move
+            line_moves.append([])
+        elif line.startswith(";"):
+            line_moves.append([_read_comment(line)])
+        else:
+            line_moves.append(_read_motion(line, letter_to_axis))
+
+    return meta, line_moves
 
 
 def _read_meta(lines: Sequence[str]) -> ProgramMeta:
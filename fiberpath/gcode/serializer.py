@@ -12,15 +12,18 @@ byte-for-byte (gated by ``tests/planning/test_example_goldens.py``).
 from __future__ import annotations
 
 import json
-from typing import TYPE_CHECKING
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import TYPE_CHECKING, cast
 
+from fiberpath.gcode.dialects import AxisMapping
 from fiberpath.gcode.generator import sanitize_program
-from fiberpath.math_utils import strip_precision
-from fiberpath.planning.helpers import get_axis_letter
+from fiberpath.math_utils import format_numbers
+from fiberpath.planning.helpers import Axis
 from fiberpath.planning.ir import Move, MoveKind, Program, ProgramMeta
 
 if TYPE_CHECKING:
-    from fiberpath.gcode.dialects import AxisMapping, MarlinDialect
+    from fiberpath.gcode.dialects import MarlinDialect
 
 
 def _normalize(value: float) -> float | int:
@@ -46,18 +49,100 @@ def _render_header(meta: ProgramMeta) -> str:
     return f"; Parameters {json.dumps(payload, separators=(',', ':'))}"
 
 
+class MoveRenderer:
+    """Renders Moves to G-code lines for one axis mapping.
+
+    Built once per mapping (see :func:`compile_renderer`): axis letters are
+    resolved up front into a ``%``-format template per (kind, axis order), so a
+    move costs a template pick and a tuple extend. ``render`` formats every number
+    of a batch as one column with :func:`~fiberpath.math_utils.format_numbers`
+    (byte-identical to ``strip_precision``) and fills all templates with a
+    single ``%``.
+    """
+
+    __slots__ = ("_letters", "_rapid", "_templates")
+
+    def __init__(self, mapping: AxisMapping) -> None:
+        self._letters = {
+            Axis.CARRIAGE: _escape(mapping.carriage),
+            Axis.MANDREL: _escape(mapping.mandrel),
+            Axis.DELIVERY_HEAD: _escape(mapping.delivery_head),
+        }
+        self._templates: dict[tuple[MoveKind, tuple[Axis, ...]], str] = {}
+        self._rapid = self._template(_RAPID, _ALL_AXES)
+
+    def render(self, moves: Iterable[Move]) -> list[str]:
+        """Render ``moves`` in order, one line each."""
+        lines: list[str | None] = []
+        templates: list[str] = []
+        values: list[float] = []
+        cache = self._templates
+        rapid = self._rapid
+        for move in moves:
+            kind = move.kind
+            if kind is _COMMENT:
+                lines.append(f"; {move.text}")
+                continue
+            lines.append(None)
+            if kind is _SET_FEED:
+                assert move.feed is not None  # SET_FEED always carries a feed rate
+                templates.append(_FEED_TEMPLATE)
+                values.append(move.feed)
+                continue
+            targets = move.targets
+            axes = tuple(targets)
+            if kind is _RAPID and axes == _ALL_AXES:  # tuple == short-circuits on identity
+                templates.append(rapid)
+            else:
+                # Enum hashing is slow, so only the rare shapes go through the dict.
+                key = (kind, axes)
+                template = cache.get(key)
+                if template is None:
+                    template = cache[key] = self._template(kind, axes)
+                templates.append(template)
+            values.extend(targets.values())
+
+        if not templates:
+            return cast(list[str], lines)
+        numbers = tuple(format_numbers(values))
+        numeric = iter(("\n".join(templates) % numbers).split("\n"))
+        return [line if line is not None else next(numeric) for line in lines]
+
+    def _template(self, kind: MoveKind, axes: tuple[Axis, ...]) -> str:
+        opcode = "G92" if kind is MoveKind.SET_POSITION else "G0"
+        return "".join([opcode, *(f" {self._letters[axis]}%s" for axis in axes)])
+
+
+_FEED_TEMPLATE = "G0 F%s"
+# The shape of nearly every move: a RAPID over all axes in canonical order.
+_ALL_AXES = (Axis.CARRIAGE, Axis.MANDREL, Axis.DELIVERY_HEAD)
+_RAPID = MoveKind.RAPID
+_COMMENT = MoveKind.COMMENT
+_SET_FEED = MoveKind.SET_FEED
+
+
+def _escape(letter: str) -> str:
+    return letter.replace("%", "%%")
+
+
+@lru_cache(maxsize=16)
+def _compiled(carriage: str, mandrel: str, delivery_head: str) -> MoveRenderer:
+    return MoveRenderer(AxisMapping(carriage, mandrel, delivery_head))
+
+
+def compile_renderer(mapping: AxisMapping) -> MoveRenderer:
+    """The (shared) renderer for ``mapping``."""
+    return _compiled(mapping.carriage, mapping.mandrel, mapping.delivery_head)
+
+
 def render_move(move: Move, mapping: AxisMapping) -> str:
     """Render one Move to exactly one G-code line."""
-    if move.kind is MoveKind.COMMENT:
-        return f"; {move.text}"
-    if move.kind is MoveKind.SET_FEED:
-        assert move.feed is not None  # SET_FEED always carries a feed rate
-        return f"G0 F{strip_precision(move.feed)}"
-    opcode = "G92" if move.kind is MoveKind.SET_POSITION else "G0"
-    parts = [opcode]
-    for axis, value in move.targets.items():
-        parts.append(f"{get_axis_letter(axis, mapping)}{strip_precision(value)}")
-    return " ".join(parts)
+    return compile_renderer(mapping).render((move,))[0]
+
+
+def render_moves(moves: Iterable[Move], dialect: MarlinDialect) -> list[str]:
+    """Render Moves to their G-code lines (no header, preamble or sanitizing)."""
+    return compile_renderer(dialect.axis_mapping).render(moves)
 
 
 def serialize(program: Program, dialect: MarlinDialect) -> list[str]:
@@ -68,7 +153,16 @@ def serialize(program: Program, dialect: MarlinDialect) -> list[str]:
     Motion IR. ``read_program`` skips these modal lines, so the round-trip stays
     byte-exact (serialize regenerates them deterministically).
     """
-    mapping = dialect.axis_mapping
-    lines = [_render_header(program.meta), *dialect.prologue()]
-    lines.extend(render_move(move, mapping) for move in program.moves)
-    return sanitize_program(lines)
+    return serialize_rendered(program.meta, render_moves(program.moves, dialect), dialect)
+
+
+def serialize_rendered(
+    meta: ProgramMeta, rendered: Iterable[str], dialect: MarlinDialect
+) -> list[str]:
+    """Frame already-rendered move lines with the header and preamble.
+
+    Lets callers that cache rendered lines per block (incremental re-planning)
+    assemble a program without re-rendering it; ``serialize`` is this over
+    :func:`render_moves`.
+    """
+    return sanitize_program([_render_header(meta), *dialect.prologue(), *rendered])
@@ -3,6 +3,10 @@
 from __future__ import annotations
 
 import math
+from functools import lru_cache
+
+import numpy as np
+from numpy.typing import ArrayLike
 
 
 def deg_to_rad(degrees: float) -> float:
@@ -18,3 +22,90 @@ def strip_precision(value: float, digits: int = 6) -> str:
     if "." in text:
         text = text.rstrip("0").rstrip(".")
     return text or "0"
+
+
+def format_number(value: float, digits: int = 6) -> str:
+    """:func:`strip_precision` through an LRU memo, for hot repeated values.
+
+    Wound programs repeat a small set of numbers (the delivery-head lean, the
+    wind-length endpoints, zero) many times over.
+    """
+    if value == 0:
+        # 0.0 and -0.0 are equal dict keys but render differently ("0" / "-0").
+        return strip_precision(value, digits)
+    return _format_cached(value, digits)
+
+
+@lru_cache(maxsize=4096)
+def _format_cached(value: float, digits: int) -> str:
+    return strip_precision(value, digits)
+
+
+# Beyond this magnitude the integer part no longer fits the int32 digit loop;
+# such values (and non-finite ones) take the scalar path. Fractions wider than
+# _BULK_MAX_DIGITS would not fit it either.
+_BULK_LIMIT = 1e9
+_BULK_MAX_DIGITS = 9
+
+
+def format_numbers(values: ArrayLike, digits: int = 6) -> list[str]:
+    """Format a column of numbers exactly as :func:`strip_precision` would, in bulk.
+
+    Each value is scaled to an integer count of ``10**-digits`` units and its
+    digits are laid out in a byte matrix (sign, integer digits, point, fraction)
+    with NumPy; leading zeros, trailing fraction zeros and a bare point are
+    masked out and the survivors decoded in one go. ``%.6f`` rounds the exact
+    binary value half-to-even, so any value whose scaled form lies within
+    floating-point error of a rounding tie -- and any non-finite or huge value --
+    is formatted by :func:`format_number` instead.
+    """
+    column = np.asarray(values, dtype=np.float64).ravel()
+    count = column.size
+    if count == 0:
+        return []
+    if not 0 <= digits <= _BULK_MAX_DIGITS:
+        return [format_number(value, digits) for value in column.tolist()]
+    scale = 10**digits
+    # The scaled value must keep sub-unit resolution for the tie test to hold.
+    limit = min(_BULK_LIMIT, 2.0**52 / scale)
+    magnitude = np.abs(column)
+    with np.errstate(over="ignore", invalid="ignore"):
+        scaled = magnitude * scale
+        tie_distance = np.abs(scaled - np.floor(scaled) - 0.5)
+        exact = (magnitude < limit) & (tie_distance > 2 * np.spacing(scaled))
+    units = np.where(exact, np.rint(scaled), 0.0).astype(np.int64)
+    whole, fraction = np.divmod(units, scale)
+    whole = whole.astype(np.int32)
+    fraction = fraction.astype(np.int32)
+
+    int_width = len(str(int(whole.max())))
+    point = 1 + int_width
+    width = point + digits + 2  # sign, integer digits, point, fraction, newline
+    rows = np.empty((count, width), dtype=np.uint8)
+    keep = np.empty((count, width), dtype=bool)
+    rows[:, 0] = ord("-")
+    keep[:, 0] = np.signbit(column)
+    for col in range(point - 1, 0, -1):
+        whole, rows[:, col] = np.divmod(whole, 10)
+    integer = rows[:, 1:point]
+    leading = np.logical_and.accumulate(integer == 0, axis=1)
+    leading[:, -1] = False  # always keep the units digit
+    keep[:, 1:point] = ~leading
+    for col in range(point + digits, point, -1):
+        fraction, rows[:, col] = np.divmod(fraction, 10)
+    decimals = rows[:, point + 1 : point + 1 + digits]
+    significant = np.flip(np.logical_or.accumulate(np.flip(decimals != 0, axis=1), axis=1), axis=1)
+    keep[:, point + 1 : point + 1 + digits] = significant
+    rows[:, 1:point] += ord("0")
+    decimals += ord("0")
+    rows[:, point] = ord(".")
+    keep[:, point] = significant[:, 0] if digits else False
+    rows[:, -1] = ord("\n")
+    keep[:, -1] = True
+
+    text = rows[keep].tobytes().decode("ascii").split("\n")
+    text.pop()  # after the final newline
+    if not exact.all():
+        for index in np.flatnonzero(~exact).tolist():
+            text[index] = format_number(float(column[index]), digits)
+    return text
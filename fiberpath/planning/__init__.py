@@ -1,13 +1,38 @@
 """Planning orchestration module."""
 
-from .exceptions import LayerValidationError, PlanningError
-from .planner import LayerMetrics, PlanOptions, PlanResult, plan_wind
+from .cancellation import CancellationToken
+from .exceptions import LayerValidationError, PlanCancelledError, PlanningError
+from .incremental import IncrementalPlanner, ReplanStats
+from .planner import LayerMetrics, PlanOptions, PlanResult, plan_chunks, plan_wind
+from .solver import DEFAULT_MAX_LOCK_DEGREES, PatternSolution, solve_patterns
+from .sweep import (
+    SWEEP_FIELDS,
+    SWEEP_RANKS,
+    SweepPoint,
+    SweepResult,
+    parse_sweep_range,
+    sweep_layer,
+)
 
 __all__ = [
     "PlanOptions",
     "PlanResult",
     "LayerMetrics",
     "plan_wind",
+    "plan_chunks",
+    "IncrementalPlanner",
+    "ReplanStats",
+    "sweep_layer",
+    "parse_sweep_range",
+    "SweepPoint",
+    "SweepResult",
+    "SWEEP_FIELDS",
+    "SWEEP_RANKS",
+    "solve_patterns",
+    "PatternSolution",
+    "DEFAULT_MAX_LOCK_DEGREES",
     "PlanningError",
     "LayerValidationError",
+    "PlanCancelledError",
+    "CancellationToken",
 ]
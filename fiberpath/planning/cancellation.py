@@ -0,0 +1,55 @@
+"""Cooperative cancellation for in-flight plans.
+
+A :class:`CancellationToken` is handed to ``plan_wind`` via
+``PlanOptions.cancel_token``. The planner polls it at cheap, well-defined points
+-- between layers, and between circuits in the developed-path builders and the
+lowering -- and raises :class:`~fiberpath.planning.exceptions.PlanCancelledError`
+once it is set. Nothing is interrupted mid-move, so a cancelled plan leaves no
+partial state behind; the caller just gets the exception instead of a result.
+
+The token is thread-safe: the API sets it from the event loop (client
+disconnect, or a newer request for the same session) while the plan runs on a
+worker thread.
+"""
+
+from __future__ import annotations
+
+import threading
+
+from .exceptions import PlanCancelledError
+
+__all__ = ["CancellationToken", "check_cancelled"]
+
+
+class CancellationToken:
+    """A one-shot, thread-safe cancellation flag polled by the planner."""
+
+    __slots__ = ("_event", "_reason")
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+        self._reason = "plan cancelled"
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    @property
+    def reason(self) -> str:
+        return self._reason
+
+    def cancel(self, reason: str = "plan cancelled") -> None:
+        """Request cancellation. Idempotent; the first reason wins."""
+        if not self._event.is_set():
+            self._reason = reason
+            self._event.set()
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise PlanCancelledError(self._reason)
+
+
+def check_cancelled(token: CancellationToken | None) -> None:
+    """Raise :class:`PlanCancelledError` if ``token`` is set (no-op for ``None``)."""
+    if token is not None:
+        token.raise_if_cancelled()
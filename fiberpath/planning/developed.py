@@ -31,8 +31,9 @@ from .calculations import (
     cone_geodesic_theta_deg,
     cone_local_alpha_deg,
 )
+from .cancellation import CancellationToken, check_cancelled
 from .helpers import Axis
-from .machine import WinderMachine
+from .machine import MetricsMachine, WinderMachine
 from .pattern import PatternSpec
 from .surface import Cylinder
 
@@ -52,6 +53,8 @@ class Waypoint:
     axes this step actually writes (the others inherit their previous value, as
     :class:`WinderMachine` does). ``lay`` marks a fiber-laying segment endpoint.
     ``comment`` is emitted immediately before this step's move when set.
+    ``turnaround`` marks the first step after a pass turnaround, where the
+    carriage is at rest and the machine may re-zero the mandrel.
     """
 
     z: float
@@ -60,6 +63,7 @@ class Waypoint:
     lay: bool
     emit: frozenset[Axis]
     comment: str | None = None
+    turnaround: bool = False
 
 
 @dataclass(frozen=True, slots=True)
@@ -83,12 +87,15 @@ def build_helical_developed_path(
     spec: PatternSpec,
     kinematics: HelicalKinematics,
     mandrel: MandrelParameters,
+    *,
+    cancel_token: CancellationToken | None = None,
 ) -> DevelopedPath:
     """Build the developed-surface path for a helical layer.
 
     Reuses ``kinematics`` (the single motion-math source) verbatim and
     accumulates ``theta`` in the exact additive order of the legacy emitter, so
     the lowered output is byte-identical to the committed helical goldens.
+    ``cancel_token`` is polled once per circuit.
     """
     lead_out_degrees = spec.lead_out_degrees
     wind_lead_in_mm = spec.lead_in_mm
@@ -116,6 +123,7 @@ def build_helical_developed_path(
     patterns = int(number_of_patterns)
     for pattern_index in range(patterns):
         for in_pattern_index in range(pattern_number):
+            check_cancelled(cancel_token)
             comment = (
                 f"\tPattern: {pattern_index + 1}/{patterns} "
                 f"Circuit: {in_pattern_index + 1}/{pattern_number}"
@@ -130,6 +138,7 @@ def build_helical_developed_path(
                         lay=False,
                         emit=frozenset({Axis.MANDREL, Axis.DELIVERY_HEAD}),
                         comment=comment if pass_index == 0 else None,
+                        turnaround=True,
                     )
                 )
                 # (b) lift the delivery head to the pass-start lean.
@@ -207,6 +216,174 @@ def build_helical_developed_path(
     )
 
 
+def accrue_helical_metrics(
+    machine: MetricsMachine,
+    spec: PatternSpec,
+    kinematics: HelicalKinematics,
+    mandrel: MandrelParameters,
+    *,
+    cancel_token: CancellationToken | None = None,
+) -> None:
+    """Charge a cylinder helical layer to ``machine`` without building its path.
+
+    The metrics-only counterpart of :func:`build_helical_developed_path` +
+    :func:`lower_developed_path`; see :func:`_accrue_circuits`.
+    """
+    wind_length = mandrel.wind_length
+    lead_in_mm = spec.lead_in_mm
+    passes = (
+        (
+            (lead_in_mm - 0.0, kinematics.lead_in_degrees),
+            (wind_length - lead_in_mm, kinematics.main_pass_degrees),
+        ),
+        (
+            ((wind_length - lead_in_mm) - wind_length, kinematics.lead_in_degrees),
+            (0.0 - (wind_length - lead_in_mm), kinematics.main_pass_degrees),
+        ),
+    )
+    _accrue_circuits(
+        machine,
+        spec,
+        passes,
+        pass_rotation_degrees=kinematics.pass_rotation_degrees,
+        num_circuits=kinematics.num_circuits,
+        pattern_step_degrees=kinematics.pattern_step_degrees,
+        cancel_token=cancel_token,
+    )
+
+
+def accrue_cone_helical_metrics(
+    machine: MetricsMachine,
+    spec: PatternSpec,
+    kinematics: ConeHelicalKinematics,
+    *,
+    cancel_token: CancellationToken | None = None,
+) -> None:
+    """Charge a cone helical layer to ``machine`` without building its path.
+
+    The metrics-only counterpart of :func:`build_cone_helical_developed_path` +
+    :func:`lower_developed_path`: the geodesic is sampled once per pass direction
+    (every pass visits the same stations) rather than once per pass.
+    """
+    length = kinematics.length
+    passes = []
+    for z_start, z_end in ((0.0, length), (length, 0.0)):
+        steps = []
+        z_prev = z_start
+        theta_prev_abs = cone_geodesic_theta_deg(z_start, kinematics)
+        for z_sample in _cone_lay_stations(z_start, z_end):
+            theta_abs = cone_geodesic_theta_deg(z_sample, kinematics)
+            steps.append((z_sample - z_prev, abs(theta_abs - theta_prev_abs)))
+            z_prev = z_sample
+            theta_prev_abs = theta_abs
+        passes.append(tuple(steps))
+    _accrue_circuits(
+        machine,
+        spec,
+        (passes[0], passes[1]),
+        pass_rotation_degrees=cone_geodesic_theta_deg(length, kinematics),
+        num_circuits=kinematics.num_circuits,
+        pattern_step_degrees=kinematics.pattern_step_degrees,
+        cancel_token=cancel_token,
+    )
+
+
+def pass_start_rotations(
+    dwell_degrees: float,
+    start_position_increment: float,
+    pattern_step_degrees: float,
+    *,
+    circuits: int,
+    patterns: int,
+) -> list[tuple[float, int]]:
+    """The mandrel-only moves to each pass start after the first, as ``(degrees, count)``.
+
+    Every pass ends in the turnaround dwell; a circuit boundary adds the start
+    increment and a pattern boundary the pattern step. With the near-lock and
+    closing lock moves, these are the only motions of a helical layer that
+    depend on ``patternNumber``, ``skipIndex`` and ``lockDegrees``.
+    """
+    # Return pass, next circuit, next pattern.
+    return [
+        (dwell_degrees, circuits),
+        (dwell_degrees + start_position_increment, circuits - patterns),
+        (dwell_degrees + start_position_increment + pattern_step_degrees, patterns - 1),
+    ]
+
+
+def _accrue_circuits(
+    machine: MetricsMachine,
+    spec: PatternSpec,
+    passes: tuple[tuple[tuple[float, float], ...], tuple[tuple[float, float], ...]],
+    *,
+    pass_rotation_degrees: float,
+    num_circuits: int,
+    pattern_step_degrees: float,
+    cancel_token: CancellationToken | None,
+) -> None:
+    """Charge the helical pass / lead / lock / pattern structure in closed form.
+
+    ``passes`` holds the laying steps ``(carriage_delta, theta_delta)`` of the out
+    and return pass. Every pass repeats the same laying steps and lead-out; only
+    the pass-start settle differs (by the dwell, plus the start increment and
+    pattern step at circuit and pattern boundaries). Each motion class is charged
+    once, times its count. ``theta`` itself is still accumulated in the builders'
+    exact additive order: the final angle feeds the ``% 360`` in ``zero_axes``,
+    which is discontinuous at whole turns. Kept in lockstep with the builders by
+    the metrics-only equivalence test.
+    """
+    lead_out_degrees = spec.lead_out_degrees
+    lock_degrees = spec.lock_degrees
+    pattern_number = spec.pattern_number
+    start_position_increment = spec.skip_index * (360.0 / pattern_number)
+    dwell_degrees = lock_degrees - lead_out_degrees - (pass_rotation_degrees % 360.0)
+    out_thetas = [theta for _, theta in passes[0]]
+    return_thetas = [theta for _, theta in passes[1]]
+
+    if not spec.skip_initial_near_lock:
+        machine.travel(0.0, lock_degrees)
+        machine.set_position({Axis.MANDREL: 0.0})
+
+    patterns = int(num_circuits / pattern_number)
+    circuits = patterns * pattern_number
+    mandrel_position = 0.0
+    lead_out_end = 0.0
+    for _pattern_index in range(patterns):
+        for _in_pattern_index in range(pattern_number):
+            check_cancelled(cancel_token)
+            machine.insert_comment("")
+            for thetas in (out_thetas, return_thetas):
+                machine.turnaround(lead_out_end)
+                for theta in thetas:
+                    mandrel_position += theta
+                mandrel_position += lead_out_degrees
+                lead_out_end = mandrel_position
+                mandrel_position += dwell_degrees
+            mandrel_position += start_position_increment
+        mandrel_position += pattern_step_degrees
+
+    if circuits:
+        machine.travel(None, 0.0)  # first pass start
+        machine.charge(0.0, 0.0, 2 * circuits)  # lean-only lift at each pass start
+        for steps in passes:
+            for carriage_delta, theta in steps:
+                machine.charge(carriage_delta, theta, circuits)
+        machine.charge(0.0, lead_out_degrees, 2 * circuits)
+        for mandrel_delta, count in pass_start_rotations(
+            dwell_degrees,
+            start_position_increment,
+            pattern_step_degrees,
+            circuits=circuits,
+            patterns=patterns,
+        ):
+            machine.charge(0.0, mandrel_delta, count)
+        machine.reposition(0.0, lead_out_end)  # every return pass ends at z = 0
+
+    mandrel_position += lock_degrees
+    machine.travel(None, mandrel_position)
+    machine.zero_axes(mandrel_position)
+
+
 def _cone_lay_stations(z_from: float, z_to: float) -> list[float]:
     """Axial sample stations across a cone laying pass (curved in (z, theta)).
 
@@ -222,6 +399,8 @@ def _cone_lay_stations(z_from: float, z_to: float) -> list[float]:
 def build_cone_helical_developed_path(
     spec: PatternSpec,
     kinematics: ConeHelicalKinematics,
+    *,
+    cancel_token: CancellationToken | None = None,
 ) -> DevelopedPath:
     """Build the developed-surface path for a helical layer on a cone (frustum).
 
@@ -272,6 +451,7 @@ def build_cone_helical_developed_path(
     patterns = int(number_of_patterns)
     for pattern_index in range(patterns):
         for in_pattern_index in range(pattern_number):
+            check_cancelled(cancel_token)
             comment = (
                 f"\tPattern: {pattern_index + 1}/{patterns} "
                 f"Circuit: {in_pattern_index + 1}/{pattern_number}"
@@ -288,6 +468,7 @@ def build_cone_helical_developed_path(
                         lay=False,
                         emit=frozenset({Axis.MANDREL, Axis.DELIVERY_HEAD}),
                         comment=comment if pass_index == 0 else None,
+                        turnaround=True,
                     )
                 )
                 # (b) lift the delivery head to the pass-start lean.
@@ -421,6 +602,7 @@ def build_hoop_developed_path(
                 lean=delivery_head_lean,
                 lay=False,
                 emit=frozenset({Axis.DELIVERY_HEAD}),
+                turnaround=True,
             ),
             Waypoint(
                 z=0.0,
@@ -475,11 +657,18 @@ def _targets(waypoint: Waypoint) -> dict[Axis, float]:
     return {axis: value[axis] for axis in _AXIS_ORDER if axis in waypoint.emit}
 
 
-def lower_developed_path(machine: WinderMachine, path: DevelopedPath) -> None:
+def lower_developed_path(
+    machine: WinderMachine,
+    path: DevelopedPath,
+    *,
+    cancel_token: CancellationToken | None = None,
+) -> None:
     """Emit a developed-surface path to Motion IR via the machine.
 
     Endpoints only -- carriage segmentation, all-axis completion, and the
-    inherited-axis carryover stay in :class:`WinderMachine`.
+    inherited-axis carryover stay in :class:`WinderMachine`. ``cancel_token`` is
+    polled at each circuit boundary (the waypoints that carry a circuit comment),
+    which is where the segmentation cost accrues.
     """
     if path.emit_initial_near_lock:
         machine.move(
@@ -489,7 +678,10 @@ def lower_developed_path(machine: WinderMachine, path: DevelopedPath) -> None:
             machine.set_position({Axis.MANDREL: 0.0})
 
     for waypoint in path.waypoints:
+        if waypoint.turnaround:
+            machine.turnaround()
         if waypoint.comment is not None:
+            check_cancelled(cancel_token)
             machine.insert_comment(waypoint.comment)
         machine.move(_targets(waypoint))
 
@@ -12,3 +12,7 @@ class LayerValidationError(PlanningError):
 
     def __init__(self, layer_index: int, message: str) -> None:
         super().__init__(f"Layer {layer_index}: {message}")
+
+
+class PlanCancelledError(PlanningError):
+    """Raised when a plan is abandoned because its cancellation token was set."""
@@ -0,0 +1,109 @@
+"""Per-motion feed scheduling under a machine's axis velocity limits.
+
+A program normally runs every motion at one feed, which the user has to pick
+low enough for the worst motion: a mandrel-dominated hoop pass or turnaround
+would otherwise ask the mandrel for more than it can spin. Straight helical
+traverses then crawl. :func:`schedule_feeds` rewrites a layer's Moves so every
+surface motion runs at the highest feed its axes allow. That feed is the O1
+surface speed at which the first moving axis hits its ``maxVelocity`` (see
+:class:`~fiberpath.config.MachineKinematics`). Motions that move only unlimited
+axes keep the layer's feed. Delivery-head-only motions keep the feed in force:
+they have no surface path, and the controller holds the head to its own limit.
+
+Feeds are floored to three significant figures (at most 1% below the limit), so
+no axis is ever asked to exceed its limit. It also means the segments of a pass
+share a feed even where the path's angle drifts, as along a cone's geodesics. A
+``SET_FEED`` is emitted only where the feed changes. The positions and the order
+of every other Move are untouched.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+
+from fiberpath.config import MachineKinematics
+
+from .helpers import Axis
+from .ir import Move, MoveKind
+from .metrics import surface_distance_mm
+
+__all__ = ["max_feed_mmpm", "schedule_feeds"]
+
+FEED_SIGNIFICANT_DIGITS = 3
+
+
+def max_feed_mmpm(
+    carriage_mm: float,
+    mandrel_deg: float,
+    delivery_deg: float,
+    distance_mm: float,
+    kinematics: MachineKinematics,
+) -> float | None:
+    """Fastest O1 feed (mm/min) for a motion of ``distance_mm`` along the surface.
+
+    None when no axis that moves has a velocity limit.
+    """
+    limit: float | None = None
+    for delta, axis in (
+        (carriage_mm, kinematics.carriage),
+        (mandrel_deg, kinematics.mandrel),
+        (delivery_deg, kinematics.delivery_head),
+    ):
+        if delta == 0.0 or axis.max_velocity is None:
+            continue
+        # The axis covers |delta| while the path covers distance_mm.
+        feed = axis.max_velocity * distance_mm / abs(delta) * 60.0
+        limit = feed if limit is None else min(limit, feed)
+    return limit
+
+
+def schedule_feeds(
+    moves: Sequence[Move], mandrel_diameter: float, kinematics: MachineKinematics
+) -> list[Move]:
+    """``moves`` with each surface motion at its maximum feasible feed.
+
+    ``moves`` is a block lowered from the zeroed datum, as ``lower_layer`` records
+    it. Its ``SET_FEED`` s give the fallback feed for motions no limit applies to.
+    The result starts at the same datum. Its first ``SET_FEED`` precedes any
+    motion, so the block does not depend on the feed in force before it.
+    """
+    circumference = math.pi * mandrel_diameter
+    position = {Axis.CARRIAGE: 0.0, Axis.MANDREL: 0.0, Axis.DELIVERY_HEAD: 0.0}
+    fallback: float | None = None
+    emitted: float | None = None
+    scheduled: list[Move] = []
+    for move in moves:
+        if move.kind is MoveKind.SET_FEED:
+            fallback = move.feed
+            continue
+        if move.kind is MoveKind.COMMENT:
+            scheduled.append(move)
+            continue
+        if move.kind is MoveKind.SET_POSITION:
+            position.update(move.targets)
+            scheduled.append(move)
+            continue
+
+        deltas = [
+            move.targets.get(axis, position[axis]) - position[axis]
+            for axis in (Axis.CARRIAGE, Axis.MANDREL, Axis.DELIVERY_HEAD)
+        ]
+        position.update(move.targets)
+        distance = surface_distance_mm(deltas[0], deltas[1], circumference)
+        feed = fallback if emitted is None else emitted
+        if distance > 0.0:
+            feed = fallback
+            limit = max_feed_mmpm(deltas[0], deltas[1], deltas[2], distance, kinematics)
+            if limit is not None:
+                feed = _floor_significant(limit)
+        if feed is not None and feed != emitted:
+            scheduled.append(Move(MoveKind.SET_FEED, feed=feed))
+            emitted = feed
+        scheduled.append(move)
+    return scheduled
+
+
+def _floor_significant(feed_mmpm: float) -> float:
+    step = 10.0 ** (math.floor(math.log10(feed_mmpm)) + 1 - FEED_SIGNIFICANT_DIGITS)
+    return math.floor(feed_mmpm / step) * step
@@ -5,7 +5,7 @@ from __future__ import annotations
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from fiberpath.math_utils import strip_precision
+from fiberpath.math_utils import format_number
 
 if TYPE_CHECKING:
     from fiberpath.gcode.dialects import AxisMapping
@@ -31,7 +31,7 @@ def get_axis_letter(axis: Axis, mapping: AxisMapping) -> str:
 
 def serialize_coordinate(coordinate: Coordinate) -> str:
     serialized = " ".join(
-        f"{axis.value}:{strip_precision(value)}" for axis, value in coordinate.items()
+        f"{axis.value}:{format_number(value)}" for axis, value in coordinate.items()
     )
     return "{" + serialized + "}"
 
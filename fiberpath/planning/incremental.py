@@ -0,0 +1,152 @@
+"""Incremental re-planning: re-lower only the layers whose inputs changed.
+
+Every layer is lowered in isolation from the zeroed datum (see
+:class:`~fiberpath.planning.planner.LayerBlock`), so a program is the
+concatenation of independent per-layer blocks. :class:`IncrementalPlanner` keeps
+each block -- its Motion IR, O1 metrics and rendered G-code lines -- keyed by a
+content hash of the layer's inputs. ``replan(definition)`` re-validates and
+re-lowers only the layers whose hash is new, re-sums the cumulative metrics, and
+re-frames the cached lines; the result is identical to ``plan_wind`` with the
+same options.
+
+A planner is stateful and meant to live for one editing session (the API keeps
+one per ``X-FiberPath-Session`` key). It is safe to share between threads; calls
+are serialized.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from dataclasses import dataclass, replace
+
+from fiberpath.config import WindDefinition
+from fiberpath.config.schemas import LayerModel
+from fiberpath.gcode.dialects import dialect_from_profile
+from fiberpath.gcode.serializer import render_moves, serialize_rendered
+
+from .cancellation import CancellationToken, check_cancelled
+from .planner import (
+    LayerBlock,
+    PlanOptions,
+    PlanResult,
+    assemble_metrics,
+    feed_transition,
+    layer_summary_move,
+    lower_layer,
+    program_meta,
+    program_prefix,
+)
+from .validators import validate_layer_sequence
+
+__all__ = ["IncrementalPlanner", "ReplanStats"]
+
+
+@dataclass(slots=True)
+class ReplanStats:
+    """What the last ``replan`` did: layers re-lowered vs served from the cache."""
+
+    lowered: int = 0
+    reused: int = 0
+
+
+@dataclass(slots=True)
+class _CachedLayer:
+    block: LayerBlock
+    # Rendered G-code lines of ``block.moves`` (empty for metrics-only planners).
+    lines: list[str]
+
+
+class IncrementalPlanner:
+    """Plans successive edits of one definition, reusing unchanged layers.
+
+    ``options`` fixes the profile, verbosity and ``metrics_only`` for the
+    planner's lifetime (they are part of every cached block); a cancel token is
+    passed per call instead. The cache holds the blocks of the most recent
+    successful plan only, so memory stays proportional to one program.
+    """
+
+    def __init__(self, options: PlanOptions | None = None) -> None:
+        self._options = options or PlanOptions()
+        self._dialect = dialect_from_profile(self._options.profile)
+        self._cache: dict[str, _CachedLayer] = {}
+        self._lock = threading.Lock()
+        self.last_stats = ReplanStats()
+
+    def replan(
+        self,
+        definition: WindDefinition,
+        *,
+        cancel_token: CancellationToken | None = None,
+    ) -> PlanResult:
+        """Plan ``definition``, re-lowering only layers not seen in the last plan."""
+        with self._lock:
+            return self._replan(definition, cancel_token)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def _replan(
+        self, definition: WindDefinition, cancel_token: CancellationToken | None
+    ) -> PlanResult:
+        options = self._options
+        # Per-call copy so the planner's own options never hold a token.
+        call_options = replace(options, cancel_token=cancel_token)
+        context = self._context_key(definition)
+        stats = ReplanStats()
+        cache: dict[str, _CachedLayer] = {}
+        entries: list[_CachedLayer] = []
+        encountered_terminal = False
+        for index, layer in enumerate(definition.layers, start=1):
+            check_cancelled(cancel_token)
+            validate_layer_sequence(index, encountered_terminal)
+            encountered_terminal = bool(getattr(layer, "terminal", False))
+            key = _layer_key(context, layer)
+            entry = cache.get(key) or self._cache.get(key)
+            if entry is None:
+                block = lower_layer(index, layer, definition, call_options, self._dialect)
+                lines = [] if options.metrics_only else render_moves(block.moves, self._dialect)
+                entry = _CachedLayer(block=block, lines=lines)
+                stats.lowered += 1
+            else:
+                stats.reused += 1
+            cache[key] = entry
+            entries.append(entry)
+
+        check_cancelled(cancel_token)
+        result = assemble_metrics(definition, [entry.block for entry in entries], options)
+        if not options.metrics_only:
+            rendered = render_moves(program_prefix(definition), self._dialect)
+            feed_mmpm = definition.default_feed_rate
+            for index, entry in enumerate(entries, start=1):
+                joint = [layer_summary_move(index, definition)]
+                joint.extend(feed_transition(feed_mmpm, entry.block))
+                rendered.extend(render_moves(joint, self._dialect))
+                rendered.extend(entry.lines)
+                feed_mmpm = entry.block.exit_feed
+            result.commands = serialize_rendered(program_meta(definition), rendered, self._dialect)
+            if options.verbose:
+                result.commands.insert(0, "; Verbose output enabled")
+
+        self._cache = cache
+        self.last_stats = stats
+        return result
+
+    @staticmethod
+    def _context_key(definition: WindDefinition) -> str:
+        # Everything a layer's block depends on besides the layer itself.
+        return json.dumps(
+            {
+                "mandrel": definition.mandrel_parameters.model_dump(mode="json"),
+                "tow": definition.tow_parameters.model_dump(mode="json"),
+                "feed": definition.default_feed_rate,
+            },
+            sort_keys=True,
+        )
+
+
+def _layer_key(context: str, layer: LayerModel) -> str:
+    payload = context + json.dumps(layer.model_dump(mode="json"), sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import re
+
 from fiberpath.config.schemas import (
     HelicalLayer,
     HoopLayer,
@@ -17,17 +19,23 @@ from .calculations import (
     compute_cone_helical_kinematics,
     compute_helical_kinematics,
 )
+from .cancellation import CancellationToken
 from .developed import (
+    accrue_cone_helical_metrics,
+    accrue_helical_metrics,
     build_cone_helical_developed_path,
     build_helical_developed_path,
     build_hoop_developed_path,
     build_skip_developed_path,
     lower_developed_path,
 )
-from .machine import WinderMachine
+from .machine import MetricsMachine, WinderMachine
 from .pattern import pattern_spec
 from .surface import Cone, surface_from_mandrel
 
+# Matches the comment build_layer_summary writes ahead of each layer.
+LAYER_SUMMARY_PATTERN = re.compile(r"Layer (\d+) of \d+")
+
 
 def build_layer_summary(index: int, total: int, layer: LayerModel) -> str:
     return f"Layer {index} of {total}: {layer.wind_type}"
@@ -41,6 +49,7 @@ def dispatch_layer(
     *,
     helical_kinematics: HelicalKinematics | None = None,
     cone_kinematics: ConeHelicalKinematics | None = None,
+    cancel_token: CancellationToken | None = None,
 ) -> None:
     """Build the layer's developed-surface path and lower it to Motion IR.
 
@@ -48,7 +57,12 @@ def dispatch_layer(
     the per-type builders differ only in how they shape the developed path. The
     mandrel's surface (cylinder or cone) selects the helical builder; skip is
     surface-independent and hoop-on-cone is not supported (the validators reject
-    it before dispatch).
+    it before dispatch). ``cancel_token`` is threaded through to the builder and
+    the lowering so a long layer can be abandoned between circuits.
+
+    A :class:`MetricsMachine` (``PlanOptions.metrics_only``) skips the path for
+    helical layers and has them charged in closed form instead; hoop and skip
+    paths are a handful of waypoints and are lowered as usual.
     """
     spec = pattern_spec(layer)
     surface = surface_from_mandrel(mandrel_parameters)
@@ -57,7 +71,10 @@ def dispatch_layer(
             cone_kin = cone_kinematics or compute_cone_helical_kinematics(
                 layer, surface, tow_parameters
             )
-            path = build_cone_helical_developed_path(spec, cone_kin)
+            if isinstance(machine, MetricsMachine):
+                accrue_cone_helical_metrics(machine, spec, cone_kin, cancel_token=cancel_token)
+                return
+            path = build_cone_helical_developed_path(spec, cone_kin, cancel_token=cancel_token)
         elif isinstance(layer, SkipLayer):
             path = build_skip_developed_path(spec)
         else:
@@ -68,9 +85,16 @@ def dispatch_layer(
         cyl_kin = helical_kinematics or compute_helical_kinematics(
             layer, mandrel_parameters, tow_parameters
         )
-        path = build_helical_developed_path(spec, cyl_kin, mandrel_parameters)
+        if isinstance(machine, MetricsMachine):
+            accrue_helical_metrics(
+                machine, spec, cyl_kin, mandrel_parameters, cancel_token=cancel_token
+            )
+            return
+        path = build_helical_developed_path(
+            spec, cyl_kin, mandrel_parameters, cancel_token=cancel_token
+        )
     elif isinstance(layer, SkipLayer):
         path = build_skip_developed_path(spec)
     else:
         raise TypeError(f"Unsupported layer type: {layer}")
-    lower_developed_path(machine, path)
+    lower_developed_path(machine, path, cancel_token=cancel_token)
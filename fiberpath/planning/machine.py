@@ -7,6 +7,19 @@ strings. ``serialize(program, dialect)`` turns those into text. The carriage
 segmentation, all-axis completion, and the time/tow accumulation stay here so the
 IR is post-segmentation (one motion Move == one ``G0`` line) and motion math has
 a single home.
+
+:class:`MetricsMachine` is the metrics-only twin used by
+``PlanOptions(metrics_only=True)``: it accepts the same calls but records no
+Moves, charging each straight endpoint-to-endpoint motion to the O1 model in
+closed form instead of per segment.
+
+With ``rezero_mandrel`` the machine re-zeros the mandrel at pass turnarounds
+(:meth:`WinderMachine.turnaround`): a ``G92 A<angle mod 360>`` redefines the
+coordinate without moving the mandrel, and later mandrel targets are shifted by
+the whole turns dropped, so ``A`` words stay below a pass or two of rotation
+instead of growing across every circuit of a layer. Strategies keep working in
+their own accumulated frame; any ``set_position`` they make on the mandrel
+starts a fresh frame.
 """
 
 from __future__ import annotations
@@ -17,6 +30,7 @@ from typing import TYPE_CHECKING
 
 from .helpers import Axis, interpolate_coordinates, serialize_coordinate
 from .ir import Move, MoveKind
+from .metrics import NominalMetrics, surface_distance_mm
 
 if TYPE_CHECKING:
     from fiberpath.gcode.dialects import MarlinDialect
@@ -28,8 +42,13 @@ class WinderMachine:
         mandrel_diameter: float,
         verbose_output: bool = False,
         dialect: MarlinDialect | None = None,
+        rezero_mandrel: bool = False,
     ) -> None:
         self._verbose = verbose_output
+        self._rezero_mandrel = rezero_mandrel
+        # Whole turns dropped by turnaround re-zeroing since the strategy's last
+        # mandrel set_position; subtracted from every mandrel target.
+        self._mandrel_offset = 0.0
         self._moves: list[Move] = []
         self._feed_rate_mmpm = 0.0
         self._last_position: dict[Axis, float] = {
@@ -49,16 +68,20 @@ class WinderMachine:
     def get_moves(self) -> list[Move]:
         return self._moves.copy()
 
+    @property
+    def command_count(self) -> int:
+        """Number of Moves recorded so far (one per emitted line)."""
+        return len(self._moves)
+
     def get_gcode(self) -> list[str]:
         """Render the recorded moves to raw G-code lines (no header).
 
         Kept for the strategy-level layer fixtures; the full-program path goes
         through ``plan_wind`` -> ``serialize``.
         """
-        from fiberpath.gcode.serializer import render_move
+        from fiberpath.gcode.serializer import render_moves
 
-        mapping = self._dialect.axis_mapping
-        return [render_move(move, mapping) for move in self._moves]
+        return render_moves(self._moves, self._dialect)
 
     def insert_comment(self, text: str) -> None:
         self._moves.append(Move(MoveKind.COMMENT, text=text))
@@ -70,6 +93,8 @@ class WinderMachine:
     def move(self, position: Mapping[Axis, float]) -> None:
         complete_end = self._last_position.copy()
         complete_end.update(position)
+        if self._mandrel_offset and Axis.MANDREL in position:
+            complete_end[Axis.MANDREL] = position[Axis.MANDREL] - self._mandrel_offset
         do_segment_move = not math.isclose(
             self._last_position[Axis.CARRIAGE],
             complete_end[Axis.CARRIAGE],
@@ -104,8 +129,30 @@ class WinderMachine:
         for axis, value in position.items():
             targets[axis] = value
             self._last_position[axis] = value
+        if Axis.MANDREL in position:
+            self._mandrel_offset = 0.0
         self._moves.append(Move(MoveKind.SET_POSITION, targets=targets))
 
+    def turnaround(self) -> None:
+        """Mark a pass turnaround, where the mandrel may be re-zeroed.
+
+        The carriage is at rest between passes, so a ``G92`` there costs no
+        motion. A no-op unless ``rezero_mandrel`` is set and the mandrel is at
+        least a full turn from zero.
+        """
+        wrapped = self._rezero(self._last_position[Axis.MANDREL])
+        if wrapped is not None:
+            self._last_position[Axis.MANDREL] = wrapped
+            self._moves.append(Move(MoveKind.SET_POSITION, targets={Axis.MANDREL: wrapped}))
+
+    def _rezero(self, angle: float) -> float | None:
+        """The re-zeroed value of machine-frame ``angle``, or ``None`` to keep it."""
+        if not self._rezero_mandrel or abs(angle) < 360.0:
+            return None
+        wrapped = angle % 360.0
+        self._mandrel_offset += angle - wrapped
+        return wrapped
+
     def zero_axes(self, current_angle_degrees: float) -> None:
         self.set_position(
             {
@@ -131,3 +178,127 @@ class WinderMachine:
             targets[axis] = value
             self._last_position[axis] = value
         self._moves.append(Move(MoveKind.RAPID, targets=targets))
+
+
+class MetricsMachine(WinderMachine):
+    """Accrue nominal O1 metrics for the calls a WinderMachine would record.
+
+    Carriage segmentation splits a motion into collinear steps in (carriage,
+    mandrel) space, so the sum of the per-step surface distances equals the
+    distance of the whole motion; this charges that once per ``move`` and only
+    counts the Moves the full machine would have recorded (for
+    ``LayerMetrics.commands``). The result matches ``nominal_metrics`` over the
+    full machine's Moves to floating-point summation order.
+
+    Positions are tracked as plain floats (the delivery head carries no tow), and
+    :meth:`travel` is the dict-free entry point the closed-form layer walks use.
+    """
+
+    def __init__(
+        self,
+        mandrel_diameter: float,
+        verbose_output: bool = False,
+        dialect: MarlinDialect | None = None,
+        rezero_mandrel: bool = False,
+    ) -> None:
+        super().__init__(mandrel_diameter, verbose_output, dialect, rezero_mandrel)
+        self._circumference = math.pi * mandrel_diameter
+        self._carriage = 0.0
+        self._mandrel = 0.0
+        self._command_count = 0
+        self._time_s = 0.0
+        self._distance_mm = 0.0
+        self._move_count = 0
+
+    @property
+    def command_count(self) -> int:
+        return self._command_count
+
+    def get_moves(self) -> list[Move]:
+        raise RuntimeError("MetricsMachine records no moves; use metrics()")
+
+    def metrics(self) -> NominalMetrics:
+        """Cumulative O1 metrics of everything moved so far."""
+        return NominalMetrics(
+            time_s=self._time_s,
+            distance_mm=self._distance_mm,
+            move_count=self._move_count,
+        )
+
+    def insert_comment(self, text: str) -> None:
+        self._command_count += 1
+
+    def set_feed_rate(self, feed_rate_mmpm: float) -> None:
+        self._feed_rate_mmpm = feed_rate_mmpm
+        self._command_count += 1
+
+    def move(self, position: Mapping[Axis, float]) -> None:
+        self.travel(position.get(Axis.CARRIAGE), position.get(Axis.MANDREL))
+
+    def travel(self, carriage: float | None = None, mandrel: float | None = None) -> None:
+        """Account for one ``move``; ``None`` inherits the axis (e.g. a lean-only step)."""
+        if carriage is None:
+            carriage = self._carriage
+        if mandrel is None:
+            mandrel = self._mandrel
+        segmented = not math.isclose(self._carriage, carriage, abs_tol=1e-6)
+        self._charge(carriage - self._carriage, mandrel - self._mandrel, 1, segmented)
+        self._carriage = carriage
+        self._mandrel = mandrel
+
+    def charge(self, carriage_delta: float, mandrel_delta: float, count: int = 1) -> None:
+        """Account for ``count`` identical moves by the given deltas.
+
+        The tracked position is left alone: closed-form walks charge the repeated
+        motions of a layer in bulk and then :meth:`reposition` to where they end.
+        """
+        if count > 0:
+            self._charge(carriage_delta, mandrel_delta, count, abs(carriage_delta) > 1e-6)
+
+    def reposition(self, carriage: float, mandrel: float) -> None:
+        """Set the tracked position without accounting a move or a line."""
+        self._carriage = carriage
+        self._mandrel = mandrel
+
+    def _charge(
+        self, carriage_delta: float, mandrel_delta: float, count: int, segmented: bool
+    ) -> None:
+        if self._feed_rate_mmpm <= 0:
+            raise RuntimeError("Feed rate must be set before moving the machine")
+        if segmented:
+            # One Move per segment; interpolation's first step repeats the start
+            # (zero distance) once there is more than one.
+            lines = int(round(abs(carriage_delta))) + 1
+            moving = max(lines - 1, 1)
+        else:
+            lines = moving = 1
+        if self._verbose:
+            lines += 1
+        self._command_count += count * lines
+
+        distance = surface_distance_mm(carriage_delta, mandrel_delta, self._circumference)
+        if distance > 0.0:
+            self._time_s += count * (distance / self._feed_rate_mmpm * 60.0)
+            self._distance_mm += count * distance
+            self._move_count += count * moving
+
+    def set_position(self, position: Mapping[Axis, float]) -> None:
+        self._carriage = position.get(Axis.CARRIAGE, self._carriage)
+        self._mandrel = position.get(Axis.MANDREL, self._mandrel)
+        if Axis.MANDREL in position:
+            self._mandrel_offset = 0.0
+        self._command_count += 1
+
+    def turnaround(self, mandrel: float | None = None) -> None:
+        """Count a turnaround re-zero line, if the full machine would emit one.
+
+        Positions here stay in the strategy's frame (only deltas are charged), so
+        the re-zero decision is taken on ``mandrel`` -- the strategy-frame angle
+        at the turnaround, defaulting to the tracked one -- less the offset.
+        Closed-form walks pass it explicitly, since they do not track positions
+        pass by pass.
+        """
+        if mandrel is None:
+            mandrel = self._mandrel
+        if self._rezero(mandrel - self._mandrel_offset) is not None:
+            self._command_count += 1
@@ -6,21 +6,28 @@ nominal contribution is not modelled); ``time = distance / feed``. ``SET_POSITIO
 (G92) redefines the coordinate origin, so subsequent deltas are measured from the
 reset position.
 
+With a :class:`~fiberpath.config.TimeCalibration` (fitted per machine profile
+from streamed jobs, see :mod:`fiberpath.simulation.calibration`) the time of each
+motion is corrected by :func:`calibrated_move_time_s`; distance and tow stay O1.
+
 This is the one implementation consumed by the planner (``LayerMetrics``) and, from
 S3, the simulator — eliminating the historical planner/simulator divergence (the
-old planner summed raw *degrees* + delivery; the simulator ignored G92). Hardware
-calibration of the nominal estimate is tracked separately (#130).
+old planner summed raw *degrees* + delivery; the simulator ignored G92).
 """
 
 from __future__ import annotations
 
 import math
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from .helpers import Axis
 from .ir import Move, MoveKind
 
+if TYPE_CHECKING:
+    from fiberpath.config import TimeCalibration
+
 
 @dataclass(slots=True)
 class NominalMetrics:
@@ -33,38 +40,102 @@ class NominalMetrics:
     move_count: int = 0
 
 
-def nominal_metrics(moves: Iterable[Move], mandrel_diameter: float) -> NominalMetrics:
+def surface_distance_mm(
+    carriage_delta_mm: float, mandrel_delta_deg: float, circumference_mm: float
+) -> float:
+    """O1 surface-arc length of one straight (carriage, mandrel) motion."""
+    mandrel_arc_mm = mandrel_delta_deg / 360.0 * circumference_mm
+    return math.sqrt(carriage_delta_mm**2 + mandrel_arc_mm**2)
+
+
+@dataclass(slots=True)
+class MoveTiming:
+    """The inputs of the calibrated time model for one surface motion."""
+
+    distance_mm: float
+    nominal_s: float  # distance / feed
+    mandrel_deg: float  # absolute mandrel rotation
+    # The carriage moves against the direction of its previous motion. A
+    # SET_POSITION of the carriage starts afresh (every layer ends with one).
+    reversal: bool
+
+
+def move_timings(moves: Iterable[Move], mandrel_diameter: float) -> Iterator[MoveTiming | None]:
+    """One entry per Move: its :class:`MoveTiming`, or ``None`` if it moves no surface."""
     circumference = math.pi * mandrel_diameter
     feed_mmpm = 0.0
-    last = {Axis.CARRIAGE: 0.0, Axis.MANDREL: 0.0, Axis.DELIVERY_HEAD: 0.0}
-    time_s = 0.0
-    distance_mm = 0.0
-    move_count = 0
+    # Positions as plain floats: the delivery head moves no surface.
+    carriage = mandrel = 0.0
+    direction = 0.0
 
     for move in moves:
-        if move.kind is MoveKind.SET_FEED:
+        kind = move.kind
+        if kind is MoveKind.SET_FEED:
             assert move.feed is not None
             feed_mmpm = move.feed
+            yield None
             continue
-        if move.kind is MoveKind.SET_POSITION:
-            for axis, value in move.targets.items():
-                last[axis] = value
+        if kind is MoveKind.SET_POSITION:
+            if Axis.CARRIAGE in move.targets:
+                carriage = move.targets[Axis.CARRIAGE]
+                direction = 0.0
+            mandrel = move.targets.get(Axis.MANDREL, mandrel)
+            yield None
             continue
-        if move.kind is MoveKind.COMMENT:
+        if kind is MoveKind.COMMENT:
+            yield None
             continue
 
-        # RAPID: surface-arc distance, delivery head excluded.
-        carriage_delta = move.targets.get(Axis.CARRIAGE, last[Axis.CARRIAGE]) - last[Axis.CARRIAGE]
-        mandrel_delta_deg = move.targets.get(Axis.MANDREL, last[Axis.MANDREL]) - last[Axis.MANDREL]
-        mandrel_arc_mm = mandrel_delta_deg / 360.0 * circumference
-        distance = math.sqrt(carriage_delta**2 + mandrel_arc_mm**2)
-        if distance > 0.0:
-            if feed_mmpm <= 0:
-                raise ValueError("Feed rate must be set before moving the machine")
-            time_s += distance / feed_mmpm * 60.0
-            distance_mm += distance
-            move_count += 1
-        for axis, value in move.targets.items():
-            last[axis] = value
+        target_carriage = move.targets.get(Axis.CARRIAGE, carriage)
+        target_mandrel = move.targets.get(Axis.MANDREL, mandrel)
+        carriage_delta = target_carriage - carriage
+        mandrel_delta_deg = target_mandrel - mandrel
+        carriage, mandrel = target_carriage, target_mandrel
+        distance = surface_distance_mm(carriage_delta, mandrel_delta_deg, circumference)
+        if distance <= 0.0:
+            yield None
+            continue
+        if feed_mmpm <= 0:
+            raise ValueError("Feed rate must be set before moving the machine")
+        reversal = False
+        if carriage_delta != 0.0:
+            reversal = direction * carriage_delta < 0.0
+            direction = carriage_delta
+        yield MoveTiming(
+            distance_mm=distance,
+            nominal_s=distance / feed_mmpm * 60.0,
+            mandrel_deg=abs(mandrel_delta_deg),
+            reversal=reversal,
+        )
+
+
+def calibrated_move_time_s(timing: MoveTiming, calibration: TimeCalibration) -> float:
+    """Calibrated execution time of one motion (see :class:`~fiberpath.config.TimeCalibration`)."""
+    time_s = timing.nominal_s
+    limit = calibration.mandrel_speed_limit_deg_per_s
+    if limit is not None:
+        time_s = max(time_s, timing.mandrel_deg / limit)
+    time_s += calibration.move_overhead_s
+    if timing.reversal:
+        time_s += calibration.turnaround_penalty_s
+    return time_s
 
+
+def nominal_metrics(
+    moves: Iterable[Move],
+    mandrel_diameter: float,
+    calibration: TimeCalibration | None = None,
+) -> NominalMetrics:
+    time_s = 0.0
+    distance_mm = 0.0
+    move_count = 0
+    for timing in move_timings(moves, mandrel_diameter):
+        if timing is None:
+            continue
+        if calibration is None:
+            time_s += timing.nominal_s
+        else:
+            time_s += calibrated_move_time_s(timing, calibration)
+        distance_mm += timing.distance_mm
+        move_count += 1
     return NominalMetrics(time_s=time_s, distance_mm=distance_mm, move_count=move_count)
@@ -2,20 +2,24 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 
 from fiberpath.config import MachineProfile, WindDefinition, default_machine_profile
-from fiberpath.config.schemas import HelicalLayer, HoopLayer, MandrelParameters
-from fiberpath.gcode.dialects import dialect_from_profile
-from fiberpath.gcode.serializer import serialize
+from fiberpath.config.schemas import HelicalLayer, HoopLayer, LayerModel, MandrelParameters
+from fiberpath.gcode.dialects import MarlinDialect, dialect_from_profile
+from fiberpath.gcode.generator import sanitize_program
+from fiberpath.gcode.serializer import render_moves, serialize, serialize_rendered
 
 from .calculations import ConeHelicalKinematics, HelicalKinematics
-from .exceptions import LayerValidationError
+from .cancellation import CancellationToken, check_cancelled
+from .exceptions import LayerValidationError, PlanningError
+from .feed_schedule import schedule_feeds
 from .helpers import Axis
 from .ir import Move, MoveKind, Program, ProgramMeta
 from .layer_strategies import build_layer_summary, dispatch_layer
-from .machine import WinderMachine
-from .metrics import nominal_metrics
+from .machine import MetricsMachine, WinderMachine
+from .metrics import NominalMetrics, nominal_metrics
 from .surface import Cone, surface_from_mandrel
 from .validators import validate_cone_helical_layer, validate_layer, validate_layer_sequence
 
@@ -26,6 +30,24 @@ class PlanOptions:
     # The target machine profile (the compatibility contract); defaults to the
     # bundled Marlin X/A/B profile. The planner derives the G-code dialect from it.
     profile: MachineProfile = field(default_factory=default_machine_profile)
+    # Polled between layers and between circuits; when set, plan_wind raises
+    # PlanCancelledError instead of finishing a plan nobody will read.
+    cancel_token: CancellationToken | None = None
+    # Compute totals and per-layer metrics only: layers are lowered endpoint to
+    # endpoint through a MetricsMachine (no carriage segmentation, no Moves, no
+    # serialization) and the result carries no commands. Metrics are identical
+    # to a full plan's; this is the fast path for live editing. A profile with a
+    # time calibration is charged per motion, so its layers are lowered in full.
+    metrics_only: bool = False
+    # Re-zero the mandrel (G92 A<angle mod 360>) at pass turnarounds so A words
+    # stay short; the physical motion and the metrics are unchanged, but the
+    # program gains one line per re-zero.
+    rezero_mandrel: bool = False
+    # Run every motion at the highest feed the profile's kinematics allow
+    # (fiberpath.planning.feed_schedule) instead of the layer's feed. Needs a
+    # profile with kinematics; layers are then lowered in full even for
+    # metrics_only.
+    schedule_feeds: bool = False
 
 
 @dataclass(slots=True)
@@ -46,118 +68,293 @@ class PlanResult:
     total_time_s: float
     total_tow_m: float
     layers: list[LayerMetrics]
+    # With schedule_feeds: the total time at the layers' own feeds, for comparison.
+    unscheduled_time_s: float | None = None
+
+
+@dataclass(slots=True)
+class LayerBlock:
+    """One layer lowered in isolation.
+
+    Every layer starts from the zeroed datum the previous one left behind (its
+    closing ``zero_axes``, or a skip's G92) at its own feed rate, so a layer's
+    Moves and O1 metrics depend only on the layer and the shared definition
+    parameters -- never on the layers before it. The full program is the
+    concatenation of its blocks, joined by :func:`feed_transition`, which is what
+    lets :class:`~fiberpath.planning.incremental.IncrementalPlanner` reuse them.
+    """
+
+    # Empty for a metrics-only block.
+    moves: list[Move]
+    commands: int
+    metrics: NominalMetrics
+    # The feed ``moves`` assume on entry; None when they set it before moving
+    # (a scheduled block). And the feed in force after them.
+    entry_feed: float | None
+    exit_feed: float
+    # A scheduled block's time at the layer's own feed.
+    unscheduled_time_s: float | None = None
 
 
 def plan_wind(definition: WindDefinition, options: PlanOptions | None = None) -> PlanResult:
     options = options or PlanOptions()
     dialect = dialect_from_profile(options.profile)
-    machine = WinderMachine(
-        mandrel_diameter=definition.mandrel_parameters.diameter,
-        verbose_output=options.verbose,
-        dialect=dialect,
-    )
-
-    machine.set_feed_rate(definition.default_feed_rate)
+    blocks: list[LayerBlock] = []
     encountered_terminal = False
-    mandrel_diameter = definition.mandrel_parameters.diameter
+    for index, layer in enumerate(definition.layers, start=1):
+        check_cancelled(options.cancel_token)
+        validate_layer_sequence(index, encountered_terminal)
+        blocks.append(lower_layer(index, layer, definition, options, dialect))
+        encountered_terminal = bool(getattr(layer, "terminal", False))
+
+    check_cancelled(options.cancel_token)
+    result = assemble_metrics(definition, blocks, options)
+    if options.metrics_only:
+        return result
+
+    program = Program(meta=program_meta(definition), moves=program_moves(definition, blocks))
+    check_cancelled(options.cancel_token)
+    result.commands = serialize(program, dialect)
+    if options.verbose:
+        result.commands.insert(0, "; Verbose output enabled")
+    return result
 
-    # (index, wind_type, terminal, pre_count, post_count) per layer; metrics are
-    # computed from the recorded Moves after the loop via the single O1 model.
-    layer_records: list[tuple[int, str, bool, int, int]] = []
 
+def plan_chunks(
+    definition: WindDefinition, options: PlanOptions | None = None
+) -> Iterator[list[str]]:
+    """Plan ``definition`` a layer at a time, for streaming while it is planned.
+
+    Every layer is validated before this returns (raising like :func:`plan_wind`).
+    The iterator then yields the header, preamble and initial moves at once, and
+    each layer's G-code lines as soon as that layer is lowered; concatenated, the
+    chunks equal ``plan_wind(definition, options).commands``. ``metrics_only`` is
+    not supported: there are no lines to yield.
+    """
+    options = options or PlanOptions()
+    if options.metrics_only:
+        raise PlanningError("a metrics-only plan has no commands to stream")
+    validate_definition(definition, options)
+    return _iter_chunks(definition, options, dialect_from_profile(options.profile))
+
+
+def _iter_chunks(
+    definition: WindDefinition, options: PlanOptions, dialect: MarlinDialect
+) -> Iterator[list[str]]:
+    head = serialize_rendered(
+        program_meta(definition), render_moves(program_prefix(definition), dialect), dialect
+    )
+    if options.verbose:
+        head.insert(0, "; Verbose output enabled")
+    yield head
+    feed_mmpm = definition.default_feed_rate
     for index, layer in enumerate(definition.layers, start=1):
-        validate_layer_sequence(index, encountered_terminal)
+        check_cancelled(options.cancel_token)
+        block = lower_layer(index, layer, definition, options, dialect)
+        moves = [layer_summary_move(index, definition), *feed_transition(feed_mmpm, block)]
+        moves.extend(block.moves)
+        yield sanitize_program(render_moves(moves, dialect))
+        feed_mmpm = block.exit_feed
+
 
-        current_mandrel = MandrelParameters(
-            diameter=mandrel_diameter,
-            windLength=definition.mandrel_parameters.wind_length,
-            endDiameter=definition.mandrel_parameters.end_diameter,
+def validate_definition(definition: WindDefinition, options: PlanOptions) -> None:
+    """Check every layer the way lowering would, without lowering any (raises PlanningError)."""
+    encountered_terminal = False
+    for index, layer in enumerate(definition.layers, start=1):
+        validate_layer_sequence(index, encountered_terminal)
+        _validate_layer(index, layer, definition)
+        encountered_terminal = bool(getattr(layer, "terminal", False))
+    if options.schedule_feeds and options.profile.kinematics is None:
+        raise PlanningError(
+            f"feed scheduling needs axis limits: profile {options.profile.id!r} has no kinematics"
         )
 
-        # Validate over the declarative primitive, keyed on the mandrel surface.
-        # Cone helical returns cone kinematics; cylinder helical returns helical
-        # kinematics; hoop/skip return None. Both reused by dispatch.
-        surface = surface_from_mandrel(current_mandrel)
-        helical_kinematics: HelicalKinematics | None = None
-        cone_kinematics: ConeHelicalKinematics | None = None
-        if isinstance(surface, Cone):
-            if isinstance(layer, HoopLayer):
-                raise LayerValidationError(index, "hoop layers on a cone are not supported yet")
-            if isinstance(layer, HelicalLayer):
-                cone_kinematics = validate_cone_helical_layer(
-                    index, layer, surface, definition.tow_parameters
-                )
-        else:
-            helical_kinematics = validate_layer(
-                index, layer, current_mandrel, definition.tow_parameters
-            )
 
-        summary = build_layer_summary(index, len(definition.layers), layer)
-        machine.insert_comment(summary)
-
-        pre_count = len(machine.get_moves())
-        dispatch_layer(
-            machine,
-            layer,
-            current_mandrel,
-            definition.tow_parameters,
-            helical_kinematics=helical_kinematics,
-            cone_kinematics=cone_kinematics,
+def _layer_mandrel(definition: WindDefinition) -> MandrelParameters:
+    return MandrelParameters(
+        diameter=definition.mandrel_parameters.diameter,
+        windLength=definition.mandrel_parameters.wind_length,
+        endDiameter=definition.mandrel_parameters.end_diameter,
+    )
+
+
+def _validate_layer(
+    index: int, layer: LayerModel, definition: WindDefinition
+) -> tuple[HelicalKinematics | None, ConeHelicalKinematics | None]:
+    """Validate ``layer`` over the mandrel surface; returns the kinematics dispatch reuses.
+
+    Cone helical returns cone kinematics; cylinder helical returns helical
+    kinematics; hoop/skip return neither.
+    """
+    surface = surface_from_mandrel(_layer_mandrel(definition))
+    if isinstance(surface, Cone):
+        if isinstance(layer, HoopLayer):
+            raise LayerValidationError(index, "hoop layers on a cone are not supported yet")
+        if isinstance(layer, HelicalLayer):
+            cone = validate_cone_helical_layer(index, layer, surface, definition.tow_parameters)
+            return None, cone
+        return None, None
+    helical = validate_layer(index, layer, _layer_mandrel(definition), definition.tow_parameters)
+    return helical, None
+
+
+def lower_layer(
+    index: int,
+    layer: LayerModel,
+    definition: WindDefinition,
+    options: PlanOptions,
+    dialect: MarlinDialect,
+) -> LayerBlock:
+    """Validate and lower one layer from the zeroed datum (see :class:`LayerBlock`)."""
+    current_mandrel = _layer_mandrel(definition)
+    helical_kinematics, cone_kinematics = _validate_layer(index, layer, definition)
+
+    kinematics = options.profile.kinematics
+    if options.schedule_feeds and kinematics is None:
+        raise PlanningError(
+            f"feed scheduling needs axis limits: profile {options.profile.id!r} has no kinematics"
+        )
+    calibration = options.profile.time_calibration
+    closed_form = options.metrics_only and calibration is None and not options.schedule_feeds
+    feed_rate = layer_feed_rate(layer, definition)
+    machine_type = MetricsMachine if closed_form else WinderMachine
+    machine = machine_type(
+        mandrel_diameter=definition.mandrel_parameters.diameter,
+        verbose_output=options.verbose,
+        dialect=dialect,
+        rezero_mandrel=options.rezero_mandrel,
+    )
+    machine.set_feed_rate(feed_rate)
+    dispatch_layer(
+        machine,
+        layer,
+        current_mandrel,
+        definition.tow_parameters,
+        helical_kinematics=helical_kinematics,
+        cone_kinematics=cone_kinematics,
+        cancel_token=options.cancel_token,
+    )
+    # The leading SET_FEED only primes the isolated machine; the program sets
+    # the feed between layers, where it changes (feed_transition).
+    if isinstance(machine, MetricsMachine):
+        return LayerBlock(
+            moves=[],
+            commands=machine.command_count - 1,
+            metrics=machine.metrics(),
+            entry_feed=feed_rate,
+            exit_feed=feed_rate,
         )
-        terminal = bool(getattr(layer, "terminal", False))
-        layer_records.append(
-            (index, layer.wind_type, terminal, pre_count, len(machine.get_moves()))
+    moves = machine.get_moves()
+    diameter = definition.mandrel_parameters.diameter
+    if options.schedule_feeds:
+        assert kinematics is not None
+        scheduled = schedule_feeds(moves, diameter, kinematics)
+        feeds = [move.feed for move in scheduled if move.kind is MoveKind.SET_FEED]
+        return LayerBlock(
+            moves=[] if options.metrics_only else scheduled,
+            commands=len(scheduled),
+            metrics=nominal_metrics(scheduled, diameter, calibration),
+            entry_feed=None,
+            exit_feed=feeds[-1] if feeds and feeds[-1] is not None else feed_rate,
+            unscheduled_time_s=nominal_metrics(moves, diameter, calibration).time_s,
         )
-        if terminal:
-            encountered_terminal = True
+    return LayerBlock(
+        moves=[] if options.metrics_only else moves[1:],
+        commands=len(moves) - 1,
+        metrics=nominal_metrics(moves, diameter, calibration),
+        entry_feed=feed_rate,
+        exit_feed=feed_rate,
+    )
+
+
+def layer_feed_rate(layer: LayerModel, definition: WindDefinition) -> float:
+    """The feed a layer runs at: its own ``feedRate`` or the definition's default."""
+    return layer.feed_rate if layer.feed_rate is not None else definition.default_feed_rate
+
+
+def feed_transition(feed_mmpm: float, block: LayerBlock) -> list[Move]:
+    """The SET_FEED (if any) that ``block`` needs after a program at ``feed_mmpm``."""
+    if block.entry_feed is None or block.entry_feed == feed_mmpm:
+        return []
+    return [Move(MoveKind.SET_FEED, feed=block.entry_feed)]
 
-    moves = machine.get_moves()
 
-    # Per-layer metrics: cumulative O1 metrics at each layer boundary, differenced.
-    # (Between layers only a summary comment is recorded, which accrues no
-    # time/tow, so cumulative-at-pre equals cumulative-at-previous-post.)
+def assemble_metrics(
+    definition: WindDefinition, blocks: list[LayerBlock], options: PlanOptions
+) -> PlanResult:
+    """Per-layer and total metrics of a program made of ``blocks`` (no commands yet).
+
+    Block metrics are independent of the prefix, so the cumulative figures are
+    running sums of the per-layer ones.
+    """
     layer_metrics: list[LayerMetrics] = []
-    prev_time = 0.0
-    prev_dist = 0.0
-    for index, wind_type, terminal, pre_count, post_count in layer_records:
-        cumulative = nominal_metrics(moves[:post_count], mandrel_diameter)
+    cumulative_time = 0.0
+    cumulative_dist = 0.0
+    for index, (layer, block) in enumerate(zip(definition.layers, blocks, strict=True), start=1):
+        cumulative_time += block.metrics.time_s
+        cumulative_dist += block.metrics.distance_mm
         layer_metrics.append(
             LayerMetrics(
                 index=index,
-                wind_type=wind_type,
-                commands=post_count - pre_count,
-                time_s=cumulative.time_s - prev_time,
-                cumulative_time_s=cumulative.time_s,
-                tow_m=(cumulative.distance_mm - prev_dist) / 1000.0,
-                cumulative_tow_m=cumulative.distance_mm / 1000.0,
-                terminal=terminal,
+                wind_type=layer.wind_type,
+                commands=block.commands,
+                time_s=block.metrics.time_s,
+                cumulative_time_s=cumulative_time,
+                tow_m=block.metrics.distance_mm / 1000.0,
+                cumulative_tow_m=cumulative_dist / 1000.0,
+                terminal=bool(getattr(layer, "terminal", False)),
             )
         )
-        prev_time = cumulative.time_s
-        prev_dist = cumulative.distance_mm
+    unscheduled_time_s = None
+    if options.schedule_feeds:
+        unscheduled_time_s = sum(
+            block.metrics.time_s if block.unscheduled_time_s is None else block.unscheduled_time_s
+            for block in blocks
+        )
+    return PlanResult(
+        commands=[],
+        total_time_s=cumulative_time,
+        total_tow_m=cumulative_dist / 1000.0,
+        layers=layer_metrics,
+        unscheduled_time_s=unscheduled_time_s,
+    )
 
-    total = nominal_metrics(moves, mandrel_diameter)
 
-    # The init move (all-zero rapid) is the program's first line; the header is
-    # carried structurally in ProgramMeta and rendered by serialize().
-    init_move = Move(
-        MoveKind.RAPID,
-        targets={Axis.CARRIAGE: 0.0, Axis.MANDREL: 0.0, Axis.DELIVERY_HEAD: 0.0},
-    )
-    meta = ProgramMeta(
+def program_meta(definition: WindDefinition) -> ProgramMeta:
+    return ProgramMeta(
         mandrel_diameter=definition.mandrel_parameters.diameter,
         wind_length=definition.mandrel_parameters.wind_length,
         tow_width=definition.tow_parameters.width,
         tow_thickness=definition.tow_parameters.thickness,
     )
-    program = Program(meta=meta, moves=[init_move, *moves])
-    commands = serialize(program, dialect)
-    if options.verbose:
-        commands.insert(0, "; Verbose output enabled")
 
-    return PlanResult(
-        commands=commands,
-        total_time_s=total.time_s,
-        total_tow_m=total.distance_mm / 1000.0,
-        layers=layer_metrics,
-    )
+
+def program_prefix(definition: WindDefinition) -> list[Move]:
+    """The Moves ahead of the first layer: the all-zero init move and the feed rate.
+
+    The init move is the program's first line; the header is carried structurally
+    in ProgramMeta and rendered by serialize().
+    """
+    return [
+        Move(
+            MoveKind.RAPID,
+            targets={Axis.CARRIAGE: 0.0, Axis.MANDREL: 0.0, Axis.DELIVERY_HEAD: 0.0},
+        ),
+        Move(MoveKind.SET_FEED, feed=definition.default_feed_rate),
+    ]
+
+
+def layer_summary_move(index: int, definition: WindDefinition) -> Move:
+    layer = definition.layers[index - 1]
+    return Move(MoveKind.COMMENT, text=build_layer_summary(index, len(definition.layers), layer))
+
+
+def program_moves(definition: WindDefinition, blocks: list[LayerBlock]) -> list[Move]:
+    moves = program_prefix(definition)
+    feed_mmpm = definition.default_feed_rate
+    for index, block in enumerate(blocks, start=1):
+        moves.append(layer_summary_move(index, definition))
+        moves.extend(feed_transition(feed_mmpm, block))
+        moves.extend(block.moves)
+        feed_mmpm = block.exit_feed
+    return moves
@@ -0,0 +1,197 @@
+"""Closed-form solver for the valid helical coverage patterns of a layer.
+
+For a given mandrel, tow and wind angle the circuit count ``N`` is fixed, and
+the coverage conditions of :func:`~fiberpath.planning.validators.validate_layer`
+reduce to arithmetic on ``(patternNumber P, skipIndex d, lockDegrees L)``:
+
+* ``P`` divides ``N``, and ``P >= 2``: ``skipIndex`` is a positive integer
+  below ``patternNumber``, so ``P = 1`` has no valid skip index;
+* ``1 <= d < P`` and ``gcd(d, P) == 1``;
+* ``L = k * 180 / P`` for a whole ``k >= 1`` (divisibility: ``2L mod 360`` is a
+  whole number of ``360 / P`` slots), and the slot stride
+  ``j = (k + d) mod P`` is coprime with ``P`` (non-aliasing).
+
+:func:`solve_patterns` enumerates those triples directly instead of validating
+candidates. The number of lock values is unbounded, so ``max_lock_degrees``
+caps ``L``.
+
+Each triple also gets its layer's predicted time and tow, also in closed form.
+A helical layer's motions depend on the triple only through a few mandrel-only
+rotations: the near-lock, the pass-start moves
+(:func:`~fiberpath.planning.developed.pass_start_rotations`) and the closing
+lock. One reference triple is lowered metrics-only, and every other triple's
+figures are the reference's, corrected by the difference in those rotations.
+The figures are nominal: a profile's time calibration is not applied.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from math import gcd
+
+from fiberpath.config import WindDefinition
+from fiberpath.config.schemas import HelicalLayer, MandrelParameters, TowParameters
+from fiberpath.gcode.dialects import dialect_from_profile
+
+from .calculations import (
+    compute_cone_helical_kinematics,
+    compute_helical_kinematics,
+    cone_geodesic_theta_deg,
+)
+from .developed import pass_start_rotations
+from .metrics import surface_distance_mm
+from .planner import PlanOptions, _validate_layer, lower_layer
+from .surface import Cone, surface_from_mandrel
+from .validators import valid_lock_steps, validate_layer_numeric_bounds
+
+__all__ = ["DEFAULT_MAX_LOCK_DEGREES", "PatternSolution", "solve_patterns"]
+
+DEFAULT_MAX_LOCK_DEGREES = 720.0
+
+
+@dataclass(slots=True)
+class PatternSolution:
+    """One valid coverage pattern and its layer's predicted metrics."""
+
+    pattern_number: int
+    skip_index: int
+    lock_degrees: float
+    circuits: int
+    # Repeats of the pattern: circuits / pattern_number.
+    patterns: int
+    time_s: float
+    tow_m: float
+
+
+def solve_patterns(
+    layer: HelicalLayer,
+    mandrel: MandrelParameters,
+    tow: TowParameters,
+    *,
+    feed_rate: float,
+    max_lock_degrees: float = DEFAULT_MAX_LOCK_DEGREES,
+) -> list[PatternSolution]:
+    """Every valid ``(patternNumber, skipIndex, lockDegrees)`` for ``layer``, fastest first.
+
+    ``layer`` supplies the wind angle, leads and feed (its own pattern fields are
+    ignored); ``feed_rate`` is the definition's default, used when the layer has
+    none. Raises LayerValidationError when no pattern can make the layer valid
+    (a wind angle out of range, a lead-in past the mandrel, an unreachable cone,
+    a single circuit) and ValueError for a non-positive ``max_lock_degrees``.
+    """
+    if max_lock_degrees <= 0:
+        raise ValueError("max_lock_degrees must be positive")
+    validate_layer_numeric_bounds(1, layer)
+    definition = WindDefinition(
+        layers=[layer],
+        mandrel_parameters=mandrel,
+        tow_parameters=tow,
+        defaultFeedRate=feed_rate,
+    )
+    circuits = _circuit_count(layer, mandrel, tow)
+    # P = circuits, d = 1 (k = P, say) is valid whenever any pattern is, so
+    # validating it checks everything but the pattern.
+    template = layer.model_copy(
+        update={"pattern_number": max(circuits, 2), "skip_index": 1, "lock_degrees": 180.0}
+    )
+    helical, cone = _validate_layer(1, template, definition)
+    if helical is not None:
+        pass_rotation = helical.pass_rotation_degrees
+        pattern_step = helical.pattern_step_degrees
+    else:
+        assert cone is not None
+        pass_rotation = cone_geodesic_theta_deg(cone.length, cone)
+        pattern_step = cone.pattern_step_degrees
+    feed = layer.feed_rate if layer.feed_rate is not None else feed_rate
+    circumference = math.pi * mandrel.diameter
+    options = PlanOptions(metrics_only=True)
+    dialect = dialect_from_profile(options.profile)
+
+    def rotation_degrees(pattern_number: int, skip_index: int, k: int) -> float | None:
+        """The layer's pattern-dependent mandrel rotation, or None if it is not closed-form.
+
+        The layer ends ``180 (k + 2) / P`` past a whole turn (every circuit's
+        own advance is whole turns), and ``zero_axes`` turns on to the next one.
+        When that lands exactly on a whole turn, whether the planner turns 0° or
+        360° is down to its floating-point summation order.
+        """
+        closing_slots = (k + 2) % (2 * pattern_number)
+        if closing_slots == 0:
+            return None
+        lock_degrees = 180.0 * k / pattern_number
+        dwell = lock_degrees - layer.lead_out_degrees - pass_rotation % 360.0
+        moves = pass_start_rotations(
+            dwell,
+            skip_index * (360.0 / pattern_number),
+            pattern_step,
+            circuits=circuits,
+            patterns=circuits // pattern_number,
+        )
+        # The closing lock turns on from the last pass start.
+        degrees = abs(moves[-1][0] + lock_degrees) + 360.0 - 180.0 * closing_slots / pattern_number
+        degrees += sum(abs(delta) * count for delta, count in moves)
+        if not layer.skip_initial_near_lock:
+            degrees += lock_degrees
+        return degrees
+
+    def lowered(pattern_number: int, skip_index: int, k: int) -> tuple[float, float]:
+        candidate = template.model_copy(
+            update={
+                "pattern_number": pattern_number,
+                "skip_index": skip_index,
+                "lock_degrees": 180.0 * k / pattern_number,
+            }
+        )
+        metrics = lower_layer(1, candidate, definition, options, dialect).metrics
+        return metrics.time_s, metrics.distance_mm
+
+    # Lower one closed-form triple; every other differs from it only in the
+    # rotations above, so its metrics are the reference's plus the difference.
+    p = template.pattern_number
+    k, reference_degrees = next(
+        (k, degrees)
+        for k in valid_lock_steps(p, 1, 4 * p)
+        if (degrees := rotation_degrees(p, 1, k)) is not None
+    )
+    reference_time, reference_mm = lowered(p, 1, k)
+    fixed_mm = reference_mm - surface_distance_mm(0.0, reference_degrees, circumference)
+
+    solutions = []
+    for pattern_number in range(2, circuits + 1):
+        if circuits % pattern_number:
+            continue
+        max_steps = int(max_lock_degrees * pattern_number / 180.0 + 1e-9)
+        for skip_index in range(1, pattern_number):
+            if gcd(skip_index, pattern_number) != 1:
+                continue
+            for k in valid_lock_steps(pattern_number, skip_index, max_steps):
+                degrees = rotation_degrees(pattern_number, skip_index, k)
+                if degrees is None:
+                    time_s, distance_mm = lowered(pattern_number, skip_index, k)
+                else:
+                    distance_mm = fixed_mm + surface_distance_mm(0.0, degrees, circumference)
+                    time_s = reference_time + (distance_mm - reference_mm) / feed * 60.0
+                solutions.append(
+                    PatternSolution(
+                        pattern_number=pattern_number,
+                        skip_index=skip_index,
+                        lock_degrees=180.0 * k / pattern_number,
+                        circuits=circuits,
+                        patterns=circuits // pattern_number,
+                        time_s=time_s,
+                        tow_m=distance_mm / 1000.0,
+                    )
+                )
+    solutions.sort(key=lambda s: (s.time_s, s.pattern_number, s.skip_index, s.lock_degrees))
+    return solutions
+
+
+def _circuit_count(layer: HelicalLayer, mandrel: MandrelParameters, tow: TowParameters) -> int:
+    surface = surface_from_mandrel(mandrel)
+    if not isinstance(surface, Cone):
+        return compute_helical_kinematics(layer, mandrel, tow).num_circuits
+    try:
+        return compute_cone_helical_kinematics(layer, surface, tow).num_circuits
+    except ValueError:  # a cone the layer cannot wind; validation reports why
+        return 2
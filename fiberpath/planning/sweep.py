@@ -0,0 +1,344 @@
+"""Parameter sweeps: evaluate every combination of helical-layer settings.
+
+Choosing ``windAngle``, ``patternNumber``, ``skipIndex`` and ``lockDegrees`` by
+hand means planning a definition, reading the result and trying again.
+:func:`sweep_layer` takes a list of values for each swept field of one helical
+layer and evaluates the whole grid:
+
+* every combination is first checked with the layer validators (bounds,
+  coverage, skip/pattern coprimality, the lockDegrees slot math) -- arithmetic
+  only, no lowering -- and the invalid ones are pruned;
+* each survivor's layer is lowered metrics-only (the planner's closed-form fast
+  path) and added to the metrics of the other layers, which are lowered once. A
+  layer's metrics do not depend on the layers around it (see
+  :class:`~fiberpath.planning.planner.LayerBlock`), so the totals equal a
+  ``plan_wind`` of the candidate definition;
+* with ``workers`` above 1 the survivors are evaluated in chunks on a process
+  pool.
+
+The result ranks the survivors by total time, tow or circuit count and writes
+them as CSV (:meth:`SweepResult.write_csv`) or JSON.
+"""
+
+from __future__ import annotations
+
+import csv
+import itertools
+import os
+import time
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Any, TextIO
+
+from pydantic import ValidationError
+
+from fiberpath.config import WindDefinition
+from fiberpath.config.schemas import HelicalLayer
+from fiberpath.gcode.dialects import dialect_from_profile
+
+from .exceptions import PlanningError
+from .planner import PlanOptions, _validate_layer, lower_layer
+from .validators import validate_layer_numeric_bounds, validate_layer_sequence
+
+__all__ = [
+    "SWEEP_FIELDS",
+    "SWEEP_RANKS",
+    "SweepPoint",
+    "SweepResult",
+    "parse_sweep_range",
+    "sweep_layer",
+]
+
+# The helical-layer fields a sweep can vary, by their .wind names.
+SWEEP_FIELDS = (
+    "windAngle",
+    "patternNumber",
+    "skipIndex",
+    "lockDegrees",
+    "leadInMM",
+    "leadOutDegrees",
+    "feedRate",
+)
+_INTEGER_FIELDS = frozenset({"patternNumber", "skipIndex"})
+
+# Ranking keys; ties fall back to time, then tow.
+SWEEP_RANKS = ("time", "tow", "circuits")
+
+# Survivors per pool task: large enough that pickling is noise next to lowering.
+_CHUNK_POINTS = 256
+
+
+@dataclass(slots=True)
+class SweepPoint:
+    """One valid combination and the totals of the definition it produces."""
+
+    values: dict[str, float]
+    circuits: int
+    time_s: float
+    tow_m: float
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            **self.values,
+            "circuits": self.circuits,
+            "timeSeconds": self.time_s,
+            "towMeters": self.tow_m,
+        }
+
+
+@dataclass(slots=True)
+class SweepResult:
+    """The ranked survivors of a sweep over layer ``layer_index`` (1-based)."""
+
+    layer_index: int
+    fields: list[str]
+    rank_by: str
+    points: list[SweepPoint]
+    candidates: int
+    pruned: int
+    elapsed_s: float
+
+    @property
+    def candidates_per_s(self) -> float:
+        return self.candidates / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    def write_csv(self, file: TextIO, limit: int | None = None) -> None:
+        """Write the ranked points (the best ``limit``) as CSV with a header row."""
+        writer = csv.writer(file, lineterminator="\n")
+        writer.writerow(["rank", *self.fields, "circuits", "timeSeconds", "towMeters"])
+        for rank, point in enumerate(self.points[:limit], start=1):
+            writer.writerow(
+                [
+                    rank,
+                    *(point.values[name] for name in self.fields),
+                    point.circuits,
+                    f"{point.time_s:.3f}",
+                    f"{point.tow_m:.4f}",
+                ]
+            )
+
+    def to_json(self, limit: int | None = None) -> dict[str, Any]:
+        return {
+            "layer": self.layer_index,
+            "rankBy": self.rank_by,
+            "candidates": self.candidates,
+            "pruned": self.pruned,
+            "evaluated": len(self.points),
+            "elapsedSeconds": self.elapsed_s,
+            "candidatesPerSecond": self.candidates_per_s,
+            "points": [point.to_json() for point in self.points[:limit]],
+        }
+
+
+def parse_sweep_range(text: str) -> list[float]:
+    """Parse ``start:stop:step`` (inclusive of ``stop``), ``start:stop`` or ``a,b,c``.
+
+    A step defaults to 1. Raises ValueError for malformed text or a non-positive step.
+    """
+    text = text.strip()
+    if ":" not in text:
+        return [float(value) for value in text.split(",") if value.strip()]
+    parts = [float(part) for part in text.split(":")]
+    if len(parts) not in (2, 3):
+        raise ValueError(f"expected start:stop[:step], got {text!r}")
+    start, stop = parts[0], parts[1]
+    step = parts[2] if len(parts) == 3 else 1.0
+    if step <= 0:
+        raise ValueError(f"step must be positive in {text!r}")
+    # Count the steps rather than accumulate them, so 20:60:0.1 ends on 60.
+    count = int((stop - start) / step + 1e-9) + 1
+    return [round(start + i * step, 9) for i in range(max(count, 0))]
+
+
+def sweep_layer(
+    definition: WindDefinition,
+    ranges: Mapping[str, Iterable[float]],
+    *,
+    layer_index: int | None = None,
+    options: PlanOptions | None = None,
+    rank_by: str = "time",
+    workers: int | None = None,
+) -> SweepResult:
+    """Evaluate every combination of ``ranges`` for one helical layer of ``definition``.
+
+    ``ranges`` maps :data:`SWEEP_FIELDS` names to their values; unswept fields
+    keep the layer's own. ``layer_index`` (1-based) defaults to the first
+    helical layer. ``workers`` defaults to the CPU count (small sweeps run in
+    this process). Raises ValueError
+    for a bad field, rank or layer index, and PlanningError when another layer
+    of the definition does not validate.
+    """
+    start = time.perf_counter()
+    if rank_by not in SWEEP_RANKS:
+        raise ValueError(f"unknown rank {rank_by!r}; expected one of {', '.join(SWEEP_RANKS)}")
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be at least 1")
+    unknown = [name for name in ranges if name not in SWEEP_FIELDS]
+    if unknown:
+        raise ValueError(
+            f"cannot sweep {', '.join(unknown)}; sweepable fields: {', '.join(SWEEP_FIELDS)}"
+        )
+    fields = list(ranges)
+    grid = [_values(name, ranges[name]) for name in fields]
+    index = _helical_index(definition, layer_index)
+    options = replace(options or PlanOptions(), metrics_only=True, cancel_token=None)
+    base = _base_totals(definition, index, options)
+
+    layer = definition.layers[index - 1].model_dump(by_alias=True)
+    survivors = []
+    candidates = 0
+    for combination in itertools.product(*grid):
+        candidates += 1
+        try:
+            candidate = _candidate(layer, fields, combination)
+        except ValidationError:  # e.g. a non-positive value
+            continue
+        circuits = _prune(definition, index, candidate)
+        if circuits is not None:
+            survivors.append((combination, circuits))
+
+    settings = (definition, index, fields, options, base)
+    workers = min(workers or os.cpu_count() or 1, max(len(survivors) // _CHUNK_POINTS, 1))
+    if workers == 1:
+        _init_worker(*settings)
+        points = _evaluate(survivors)
+    else:
+        points = _evaluate_pool(settings, survivors, workers)
+
+    points.sort(key=_rank_key(rank_by))
+    return SweepResult(
+        layer_index=index,
+        fields=fields,
+        rank_by=rank_by,
+        points=points,
+        candidates=candidates,
+        pruned=candidates - len(points),
+        elapsed_s=time.perf_counter() - start,
+    )
+
+
+def _values(name: str, values: Iterable[float]) -> list[float]:
+    values = list(dict.fromkeys(values))
+    if not values:
+        raise ValueError(f"no values to sweep for {name}")
+    if name in _INTEGER_FIELDS:
+        if any(value != int(value) for value in values):
+            raise ValueError(f"{name} takes whole numbers")
+        return [int(value) for value in values]
+    return values
+
+
+def _helical_index(definition: WindDefinition, layer_index: int | None) -> int:
+    if layer_index is None:
+        for index, layer in enumerate(definition.layers, start=1):
+            if isinstance(layer, HelicalLayer):
+                return index
+        raise ValueError("the definition has no helical layer to sweep")
+    if not 1 <= layer_index <= len(definition.layers):
+        raise ValueError(f"layer {layer_index} is out of range 1..{len(definition.layers)}")
+    if not isinstance(definition.layers[layer_index - 1], HelicalLayer):
+        raise ValueError(f"layer {layer_index} is not a helical layer")
+    return layer_index
+
+
+def _base_totals(
+    definition: WindDefinition, index: int, options: PlanOptions
+) -> tuple[float, float]:
+    """Time and tow of every layer but the swept one, lowered once."""
+    dialect = dialect_from_profile(options.profile)
+    time_s = distance_mm = 0.0
+    encountered_terminal = False
+    for layer_index, layer in enumerate(definition.layers, start=1):
+        validate_layer_sequence(layer_index, encountered_terminal)
+        encountered_terminal = bool(getattr(layer, "terminal", False))
+        if layer_index == index:
+            continue
+        block = lower_layer(layer_index, layer, definition, options, dialect)
+        time_s += block.metrics.time_s
+        distance_mm += block.metrics.distance_mm
+    return time_s, distance_mm
+
+
+def _candidate(
+    base: dict[str, Any], fields: Sequence[str], values: Sequence[float]
+) -> HelicalLayer:
+    """The swept layer (``base``, its .wind fields) with ``fields`` set to ``values``."""
+    return HelicalLayer.model_validate({**base, **dict(zip(fields, values, strict=True))})
+
+
+def _prune(definition: WindDefinition, index: int, layer: HelicalLayer) -> int | None:
+    """The candidate's circuit count, or None when the validators reject it."""
+    try:
+        validate_layer_numeric_bounds(index, layer)
+        helical, cone = _validate_layer(index, layer, definition)
+    except PlanningError:
+        return None
+    kinematics = helical or cone
+    assert kinematics is not None
+    return kinematics.num_circuits
+
+
+def _rank_key(rank_by: str) -> Any:
+    if rank_by == "tow":
+        return lambda point: (point.tow_m, point.time_s)
+    if rank_by == "circuits":
+        return lambda point: (point.circuits, point.time_s, point.tow_m)
+    return lambda point: (point.time_s, point.tow_m)
+
+
+def _chunks(items: list[Any], size: int) -> Iterator[list[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _evaluate_pool(
+    settings: tuple[Any, ...], survivors: list[tuple[tuple[float, ...], int]], workers: int
+) -> list[SweepPoint]:
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=settings) as pool:
+        results = pool.map(_evaluate, _chunks(survivors, _CHUNK_POINTS))
+        return [point for chunk in results for point in chunk]
+
+
+# -- worker side -----------------------------------------------------------
+
+_worker: dict[str, Any] = {}
+
+
+def _init_worker(
+    definition: WindDefinition,
+    index: int,
+    fields: list[str],
+    options: PlanOptions,
+    base: tuple[float, float],
+) -> None:
+    _worker.clear()
+    _worker.update(
+        definition=definition,
+        layer=definition.layers[index - 1].model_dump(by_alias=True),
+        index=index,
+        fields=fields,
+        options=options,
+        dialect=dialect_from_profile(options.profile),
+        base=base,
+    )
+
+
+def _evaluate(survivors: list[tuple[tuple[float, ...], int]]) -> list[SweepPoint]:
+    definition: WindDefinition = _worker["definition"]
+    index: int = _worker["index"]
+    fields: list[str] = _worker["fields"]
+    base_time, base_distance = _worker["base"]
+    points = []
+    for values, circuits in survivors:
+        layer = _candidate(_worker["layer"], fields, values)
+        block = lower_layer(index, layer, definition, _worker["options"], _worker["dialect"])
+        points.append(
+            SweepPoint(
+                values=dict(zip(fields, values, strict=True)),
+                circuits=circuits,
+                time_s=base_time + block.metrics.time_s,
+                tow_m=(base_distance + block.metrics.distance_mm) / 1000.0,
+            )
+        )
+    return points
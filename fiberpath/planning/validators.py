@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from math import asin, degrees, gcd, radians, sin
 
 from fiberpath.config.schemas import (
@@ -25,28 +26,31 @@ MIN_WIND_ANGLE = 1.0
 MAX_WIND_ANGLE = 89.0
 
 
-def _nearest_valid_lock_degrees(
-    lock_degrees: float, pattern_step_deg: float, skip_index: int
-) -> str:
-    """Return up to three nearby lockDegrees values that satisfy both coverage conditions."""
-    half_step = pattern_step_deg / 2.0
-    P = round(360.0 / pattern_step_deg)
+def valid_lock_steps(pattern_number: int, skip_index: int, max_steps: int) -> Iterator[int]:
+    """The ``k`` in ``1..max_steps`` for which ``lockDegrees = k * 180 / patternNumber`` is valid.
+
+    The two lockDegrees conditions of :func:`_validate_coverage` in whole
+    numbers: a multiple ``k`` of half a slot always divides evenly, and its
+    slot stride is ``(k + skipIndex) mod patternNumber``. Assumes ``skip_index``
+    is itself valid for ``pattern_number`` (coprime and below it).
+    """
+    for k in range(1, max_steps + 1):
+        if gcd((k + skip_index) % pattern_number, pattern_number) == 1:
+            yield k
+
+
+def _nearest_valid_lock_degrees(lock_degrees: float, pattern_number: int, skip_index: int) -> str:
+    """Return the three valid lockDegrees values nearest to ``lock_degrees``."""
+    half_step = 180.0 / pattern_number
+    # One in every patternNumber consecutive k has stride 1, so this window
+    # holds at least three valid values on each side of the requested one.
     centre = round(lock_degrees / half_step)
-    candidates: list[float] = []
-    for delta in range(-16, 17):
-        v = (centre + delta) * half_step
-        if v <= 0:
-            continue
-        pcm = (2.0 * v) % 360.0
-        if round(pcm % pattern_step_deg, 6) != 0:
-            continue
-        ss = (pcm + skip_index * pattern_step_deg) % 360.0
-        j = round(ss / pattern_step_deg) % P
-        if gcd(j, P) == 1:
-            candidates.append(v)
-        if len(candidates) >= 3:
-            break
-    return ", ".join(f"{v:.6g}°" for v in candidates) or "multiples of 180°"
+    window = centre + 4 * pattern_number
+    candidates = sorted(
+        (k * half_step for k in valid_lock_steps(pattern_number, skip_index, window)),
+        key=lambda v: abs(v - lock_degrees),
+    )[:3]
+    return ", ".join(f"{v:.6g}°" for v in sorted(candidates))
 
 
 def validate_layer_sequence(layer_index: int, encountered_terminal: bool) -> None:
@@ -152,9 +156,12 @@ def _validate_coverage(
         pattern_step_deg = 360.0 / spec.pattern_number
         per_circuit_mod = (2.0 * spec.lock_degrees) % 360.0
 
-        if round(per_circuit_mod % pattern_step_deg, 6) != 0:
+        # A remainder a hair under a whole slot is floating-point error too
+        # (lockDegrees = 180k/patternNumber rarely divides exactly).
+        remainder = per_circuit_mod % pattern_step_deg
+        if min(round(remainder, 6), round(pattern_step_deg - remainder, 6)) != 0:
             suggestions = _nearest_valid_lock_degrees(
-                spec.lock_degrees, pattern_step_deg, spec.skip_index
+                spec.lock_degrees, spec.pattern_number, spec.skip_index
             )
             raise LayerValidationError(
                 layer_index,
@@ -173,7 +180,7 @@ def _validate_coverage(
         j = round(slot_step / pattern_step_deg) % spec.pattern_number
         if gcd(j, spec.pattern_number) != 1:
             suggestions = _nearest_valid_lock_degrees(
-                spec.lock_degrees, pattern_step_deg, spec.skip_index
+                spec.lock_degrees, spec.pattern_number, spec.skip_index
             )
             raise LayerValidationError(
                 layer_index,
@@ -1,5 +1,29 @@
 """Simulation entry points."""
 
+from .calibration import CalibrationError, TimingRecord, fit_time_calibration
+from .kinematics import KinematicEstimate, LayerKinematics, simulate_kinematics
 from .simulator import SimulationError, SimulationResult, simulate_program
+from .stream_analysis import (
+    LayerLinkUsage,
+    LinkModel,
+    StallWindow,
+    StreamAnalysis,
+    analyze_stream,
+)
 
-__all__ = ["SimulationResult", "SimulationError", "simulate_program"]
+__all__ = [
+    "SimulationResult",
+    "SimulationError",
+    "simulate_program",
+    "LinkModel",
+    "StreamAnalysis",
+    "StallWindow",
+    "LayerLinkUsage",
+    "analyze_stream",
+    "CalibrationError",
+    "TimingRecord",
+    "fit_time_calibration",
+    "KinematicEstimate",
+    "LayerKinematics",
+    "simulate_kinematics",
+]
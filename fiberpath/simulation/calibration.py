@@ -0,0 +1,266 @@
+"""Fit a machine's time calibration from the acknowledgement times of streamed jobs.
+
+The nominal model charges ``distance / feed`` per motion. Real winders spend
+more: a fixed cost per planner block, a deceleration to rest and back at each
+carriage reversal, and a mandrel that cannot spin as fast as a short, steep move
+asks. :func:`fit_time_calibration` estimates those three terms (see
+:class:`~fiberpath.config.TimeCalibration`) from :class:`TimingRecord` s: the
+lines a host streamed and when each one's ``ok`` came back.
+
+Marlin acknowledges a motion line once it is queued. With the planner buffer
+full, a slot frees only when a block finishes, so the acks track execution,
+lagging it by about the buffer's depth in lines. The fit skips ``warmup_lines``
+while the buffer fills, cuts the rest into windows, and regresses the time
+between the acks that close consecutive windows on the moves that ran in
+between. Those are the window's lines shifted back by the lag, which is scanned
+for the best fit. The two additive terms are solved by non-negative least
+squares, and the mandrel limit is scanned over the moves' own nominal mandrel
+speeds. A link
+too slow to keep the buffer full makes the acks track the link instead, and the
+fit then describes the cycle time that link achieves.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+
+from fiberpath.config import TimeCalibration
+from fiberpath.gcode import ProgramReadError, read_line_moves
+from fiberpath.planning.metrics import move_timings
+
+from .simulator import SimulationError
+
+__all__ = ["CalibrationError", "TimingRecord", "fit_time_calibration"]
+
+DEFAULT_WINDOW_LINES = 50
+DEFAULT_WARMUP_LINES = 32
+
+# Mandrel limits tried: a log-spaced grid from this fraction of the slowest
+# recorded nominal mandrel speed up to the fastest, refined around the best.
+_LIMIT_FLOOR = 0.05
+_LIMIT_GRID = 64
+_LIMIT_REFINE_STEPS = 40
+# Rounds of (scan the lag, fit the limit).
+_ALTERNATIONS = 3
+# A mandrel limit must cut the squared residual by this fraction to be kept.
+_LIMIT_MIN_GAIN = 0.01
+
+FloatArray = npt.NDArray[np.float64]
+
+
+class CalibrationError(SimulationError):
+    """Raised when the recorded timings cannot support a fit."""
+
+
+@dataclass(slots=True)
+class TimingRecord:
+    """One streamed program and when each of its lines was acknowledged."""
+
+    # The program's "; Parameters" header line (it carries the mandrel diameter).
+    header: str
+    # The streamed lines, in order, comments and blanks excluded.
+    commands: list[str]
+    # Seconds (any origin) of each command's ok; one per command.
+    ack_times_s: list[float]
+
+
+@dataclass(slots=True)
+class _Samples:
+    duration_s: FloatArray  # measured, per window
+    # Window of each streamed line (-1 outside the windows), all records end to end.
+    line_window: npt.NDArray[np.intp]
+    # Per move: its line's position in ``line_window`` and the lines left in its record.
+    line: npt.NDArray[np.intp]
+    remaining: npt.NDArray[np.intp]
+    nominal_s: FloatArray
+    mandrel_deg: FloatArray
+    reversal: FloatArray
+    lines: int
+
+
+@dataclass(slots=True)
+class _Fit:
+    overhead_s: float
+    penalty_s: float
+    sse: float
+    limit: float | None = None
+
+
+def fit_time_calibration(
+    records: Sequence[TimingRecord],
+    *,
+    window_lines: int = DEFAULT_WINDOW_LINES,
+    warmup_lines: int = DEFAULT_WARMUP_LINES,
+) -> TimeCalibration:
+    """Fit move overhead, turnaround penalty and mandrel speed limit to ``records``.
+
+    The ack lag (in lines) is not known up front: every lag up to
+    ``warmup_lines`` is tried and the best-fitting one kept.
+    """
+    if window_lines < 1:
+        raise ValueError("window_lines must be at least 1")
+    if warmup_lines < 0:
+        raise ValueError("warmup_lines must be non-negative")
+    samples = _samples(records, window_lines, warmup_lines)
+    count = len(samples.duration_s)
+    if count < 3:
+        raise CalibrationError(
+            f"need at least 3 windows of {window_lines} lines after the first {warmup_lines} "
+            f"of a job; the records hold {count}"
+        )
+
+    # The lag and the limit interact (a wrong lag blurs reversals into a limit),
+    # so alternate between them.
+    windows = [_move_windows(samples, lag) for lag in range(warmup_lines + 1)]
+    limit: float | None = None
+    for _ in range(_ALTERNATIONS):
+        fits = [_solve(samples, window, limit) for window in windows]
+        lag = min(range(len(fits)), key=lambda index: fits[index].sse)
+        unlimited = _solve(samples, windows[lag], None)
+        best = unlimited
+        limited = _fit_limit(samples, windows[lag])
+        if limited is not None and limited.sse < unlimited.sse * (1.0 - _LIMIT_MIN_GAIN):
+            best = limited
+        limit = best.limit
+
+    return TimeCalibration(
+        moveOverheadS=best.overhead_s,
+        turnaroundPenaltyS=best.penalty_s,
+        mandrelSpeedLimitDegPerS=best.limit,
+        sampleLines=samples.lines,
+        rmsResidualS=float((best.sse / count) ** 0.5),
+    )
+
+
+def _samples(records: Sequence[TimingRecord], window_lines: int, warmup_lines: int) -> _Samples:
+    durations: list[float] = []
+    line_window: list[int] = []
+    line: list[int] = []
+    remaining: list[int] = []
+    nominal: list[float] = []
+    mandrel: list[float] = []
+    reversal: list[float] = []
+    lines = 0
+    for record in records:
+        acks = record.ack_times_s
+        if len(acks) != len(record.commands):
+            raise CalibrationError(f"{len(acks)} ack times for {len(record.commands)} commands")
+        try:
+            meta, line_moves = read_line_moves([record.header, *record.commands])
+            timings = move_timings(
+                (move for moves in line_moves for move in moves), meta.mandrel_diameter
+            )
+            # Align the per-move timings with the lines that produced them.
+            per_line = [[next(timings) for _ in moves] for moves in line_moves[1:]]
+        except (ProgramReadError, ValueError, KeyError) as exc:
+            raise CalibrationError(f"cannot read the recorded program: {exc}") from exc
+
+        offset = len(line_window)
+        windows = [-1] * len(acks)
+        # A window runs from the ack before its first line to its last line's ack.
+        for start in range(max(warmup_lines, 1), len(acks) - window_lines + 1, window_lines):
+            end = start + window_lines
+            windows[start:end] = [len(durations)] * window_lines
+            durations.append(acks[end - 1] - acks[start - 1])
+            lines += window_lines
+        line_window.extend(windows)
+
+        for index, line_timings in enumerate(per_line):
+            for timing in line_timings:
+                if timing is None:
+                    continue
+                line.append(offset + index)
+                remaining.append(len(acks) - index)
+                nominal.append(timing.nominal_s)
+                mandrel.append(timing.mandrel_deg)
+                reversal.append(1.0 if timing.reversal else 0.0)
+    return _Samples(
+        duration_s=np.asarray(durations, dtype=np.float64),
+        line_window=np.asarray(line_window, dtype=np.intp),
+        line=np.asarray(line, dtype=np.intp),
+        remaining=np.asarray(remaining, dtype=np.intp),
+        nominal_s=np.asarray(nominal, dtype=np.float64),
+        mandrel_deg=np.asarray(mandrel, dtype=np.float64),
+        reversal=np.asarray(reversal, dtype=np.float64),
+        lines=lines,
+    )
+
+
+def _move_windows(samples: _Samples, lag: int) -> npt.NDArray[np.intp]:
+    """The window each move ran in when acks trail execution by ``lag`` lines.
+
+    The ack of line ``i`` arrives as line ``i - lag`` finishes, so a move runs in
+    the window that holds line ``i + lag``; -1 past the end of its record.
+    """
+    window = np.full(samples.line.shape, -1, dtype=np.intp)
+    inside = samples.remaining > lag
+    window[inside] = samples.line_window[samples.line[inside] + lag]
+    return window
+
+
+def _solve(samples: _Samples, window: npt.NDArray[np.intp], limit: float | None) -> _Fit:
+    """Least squares for the additive terms, both >= 0, given the mandrel limit.
+
+    Two unknowns: try every active set and keep the best feasible solution.
+    """
+    count = len(samples.duration_s)
+    inside = window >= 0
+    window = window[inside]
+    per_move = samples.nominal_s[inside]
+    if limit is not None:
+        per_move = np.maximum(per_move, samples.mandrel_deg[inside] / limit)
+    target = samples.duration_s - np.bincount(window, weights=per_move, minlength=count)
+    design = np.column_stack(
+        (
+            np.bincount(window, minlength=count).astype(np.float64),
+            np.bincount(window, weights=samples.reversal[inside], minlength=count),
+        )
+    )
+
+    best = _Fit(0.0, 0.0, float(target @ target), limit)
+    for columns in ((0,), (1,), (0, 1)):
+        sub = design[:, columns]
+        if not sub.any():
+            continue
+        coefficients = np.linalg.lstsq(sub, target, rcond=None)[0]
+        if (coefficients < 0.0).any():
+            continue
+        residual = target - sub @ coefficients
+        sse = float(residual @ residual)
+        if sse < best.sse:
+            terms = [0.0, 0.0]
+            for column, value in zip(columns, coefficients, strict=True):
+                terms[column] = float(value)
+            best = _Fit(terms[0], terms[1], sse, limit)
+    return best
+
+
+def _fit_limit(samples: _Samples, window: npt.NDArray[np.intp]) -> _Fit | None:
+    """The best-fitting finite mandrel limit: a grid scan, then golden section."""
+    turning = (samples.mandrel_deg > 0.0) & (samples.nominal_s > 0.0)
+    if not turning.any():
+        return None
+    speeds = samples.mandrel_deg[turning] / samples.nominal_s[turning]
+    low, high = np.log(float(speeds.min()) * _LIMIT_FLOOR), np.log(float(speeds.max()))
+    grid = np.linspace(low, high, _LIMIT_GRID)
+    fits = [_solve(samples, window, float(np.exp(point))) for point in grid]
+    best = min(range(len(fits)), key=lambda index: fits[index].sse)
+
+    # SSE is continuous in the limit; narrow the bracket around the grid minimum.
+    a, b = grid[max(best - 1, 0)], grid[min(best + 1, len(grid) - 1)]
+    ratio = (5**0.5 - 1) / 2
+    for _ in range(_LIMIT_REFINE_STEPS):
+        c, d = b - ratio * (b - a), a + ratio * (b - a)
+        if (
+            _solve(samples, window, float(np.exp(c))).sse
+            < _solve(samples, window, float(np.exp(d))).sse
+        ):
+            b = d
+        else:
+            a = c
+    refined = _solve(samples, window, float(np.exp((a + b) / 2)))
+    return refined if refined.sse < fits[best].sse else fits[best]
@@ -0,0 +1,275 @@
+"""Acceleration-aware cycle time: a Marlin-style trapezoidal planner over a whole program.
+
+The nominal model charges every motion its full feed from the first millimetre.
+A controller cannot: each block accelerates from its entry speed, cruises at the
+commanded feed if it gets there, and decelerates into the next junction. A 1 mm
+segment at 6000 mm/min never reaches 100 mm/s at 3000 mm/s^2. A mandrel limited
+to a few hundred degrees per second caps the surface speed of steep moves.
+:func:`simulate_kinematics` replays a :class:`~fiberpath.planning.ir.Program`
+under a profile's :class:`~fiberpath.config.MachineKinematics`:
+
+* a motion's speed along the surface (the O1 path) is its feed, capped so no axis
+  exceeds its ``maxVelocity``; its acceleration is ``accelerationMmS2``, capped
+  the same way by each axis's ``maxAcceleration``;
+* a junction between motions is limited by junction deviation, as in Marlin: a
+  reversal stops, a straight continuation keeps speed. ``G92`` synchronizes the
+  planner (a full stop), as do the program's start and end;
+* the lookahead is the usual backward (deceleration) and forward (acceleration)
+  pass over the junction speeds. Both passes are min-plus recurrences on squared
+  speed, so each reduces to a running minimum that NumPy evaluates in one sweep
+  (``np.minimum.accumulate``) instead of a Python loop over the blocks;
+* each motion then runs a trapezoid, or a triangle when it is too short to cruise.
+
+Motions of the delivery head alone have no surface path. They run as
+rest-to-rest moves on that axis, in degrees, at the feed and the axis limits.
+Unlike the nominal model, they therefore cost time.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+
+import numpy as np
+import numpy.typing as npt
+
+from fiberpath.config import MachineKinematics
+from fiberpath.planning.helpers import Axis
+from fiberpath.planning.ir import MoveKind, Program
+from fiberpath.planning.layer_strategies import LAYER_SUMMARY_PATTERN
+from fiberpath.planning.metrics import surface_distance_mm
+
+from .simulator import SimulationError
+
+__all__ = ["KinematicEstimate", "LayerKinematics", "simulate_kinematics"]
+
+FloatArray = npt.NDArray[np.float64]
+
+# Marlin's thresholds on the junction cosine for a reversal and a straight line.
+_REVERSAL_COS = 0.999999
+_STRAIGHT_COS = -0.999999
+# Relative slack before a motion counts as not reaching its feed.
+_FEED_TOLERANCE = 1e-9
+
+
+@dataclass(slots=True)
+class LayerKinematics:
+    index: int
+    moves: int
+    nominal_time_s: float
+    time_s: float
+
+
+@dataclass(slots=True)
+class KinematicEstimate:
+    time_s: float
+    # The O1 distance/feed time of the same program, for comparison.
+    nominal_time_s: float
+    moves: int
+    # Motions whose peak speed stays below their commanded feed: too short to
+    # reach it, or capped by an axis limit.
+    moves_below_feed: int
+    # Layers in program order; moves ahead of the first layer are not listed.
+    layers: list[LayerKinematics] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class _Motions:
+    carriage: FloatArray  # mm
+    mandrel: FloatArray  # degrees
+    delivery: FloatArray  # degrees
+    distance: FloatArray  # O1 surface mm; 0 for delivery-only motions
+    feed: FloatArray  # mm/min
+    layer: npt.NDArray[np.intp]
+    # A full stop (program start, G92) precedes the motion.
+    stop_before: npt.NDArray[np.bool_]
+    circumference: float
+
+
+def simulate_kinematics(program: Program, kinematics: MachineKinematics) -> KinematicEstimate:
+    """Estimate ``program``'s cycle time under ``kinematics`` (see the module docstring)."""
+    motions = _motions(program)
+    count = len(motions.distance)
+    if count == 0:
+        return KinematicEstimate(time_s=0.0, nominal_time_s=0.0, moves=0, moves_below_feed=0)
+
+    surface = motions.distance > 0.0
+    length = np.where(surface, motions.distance, np.abs(motions.delivery))
+    cruise = motions.feed / 60.0
+    accel = np.full(count, kinematics.acceleration_mm_s2)
+    safe_distance = np.where(surface, motions.distance, 1.0)
+    # Axis units per unit of path: per surface mm, or per degree of a delivery-only move.
+    ratios = (
+        (np.where(surface, np.abs(motions.carriage) / safe_distance, 0.0), kinematics.carriage),
+        (np.where(surface, np.abs(motions.mandrel) / safe_distance, 0.0), kinematics.mandrel),
+        (
+            np.where(surface, np.abs(motions.delivery) / safe_distance, 1.0),
+            kinematics.delivery_head,
+        ),
+    )
+    for ratio, limits in ratios:
+        cruise = _cap(cruise, ratio, limits.max_velocity)
+        accel = _cap(accel, ratio, limits.max_acceleration)
+
+    # Squared speed allowed at each of the count + 1 block boundaries.
+    boundary = np.zeros(count + 1)
+    boundary[1:-1] = np.minimum(
+        _junction_sq(motions, surface, accel, kinematics.junction_deviation_mm),
+        np.minimum(cruise[:-1], cruise[1:]) ** 2,
+    )
+    boundary[:-1][motions.stop_before] = 0.0
+
+    # Backward pass: entry^2 <= exit^2 + 2 a L. With S the running sum of 2 a L,
+    # E_i + S_i = min(C_i + S_i, E_{i+1} + S_{i+1}): a suffix minimum.
+    reach = 2.0 * accel * length
+    prefix = np.concatenate(([0.0], np.cumsum(reach)))
+    backward = np.minimum.accumulate((boundary + prefix)[::-1])[::-1] - prefix
+    # Forward pass: exit^2 <= entry^2 + 2 a L, so F_i - S_i is a prefix minimum.
+    speed_sq = np.maximum(np.minimum.accumulate(backward - prefix) + prefix, 0.0)
+
+    entry = np.sqrt(speed_sq[:-1])
+    exit_ = np.sqrt(speed_sq[1:])
+    time, peak = _block_times(entry, exit_, cruise, accel, length)
+
+    nominal = np.where(surface, motions.distance / motions.feed * 60.0, 0.0)
+    below_feed = peak < motions.feed / 60.0 * (1.0 - _FEED_TOLERANCE)
+    return KinematicEstimate(
+        time_s=float(time.sum()),
+        nominal_time_s=float(nominal.sum()),
+        moves=count,
+        moves_below_feed=int(below_feed.sum()),
+        layers=_layers(motions.layer, time, nominal),
+    )
+
+
+def _cap(values: FloatArray, ratio: FloatArray, limit: float | None) -> FloatArray:
+    """Cap a path rate so the axis moving ``ratio`` units per path unit stays within ``limit``."""
+    if limit is None:
+        return values
+    moving = ratio > 0.0
+    return np.where(moving, np.minimum(values, limit / np.where(moving, ratio, 1.0)), values)
+
+
+def _junction_sq(
+    motions: _Motions, surface: npt.NDArray[np.bool_], accel: FloatArray, deviation_mm: float
+) -> FloatArray:
+    """Marlin's junction-deviation speed^2 between consecutive motions."""
+    safe_distance = np.where(surface, motions.distance, 1.0)
+    arc = motions.mandrel / 360.0 * motions.circumference
+    unit_x = np.where(surface, motions.carriage / safe_distance, 0.0)
+    unit_y = np.where(surface, arc / safe_distance, 0.0)
+    cos_theta = -(unit_x[:-1] * unit_x[1:] + unit_y[:-1] * unit_y[1:])
+    sin_half = np.sqrt(np.clip(0.5 * (1.0 - cos_theta), 0.0, 1.0))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        junction = accel[1:] * deviation_mm * sin_half / (1.0 - sin_half)
+    junction = np.where(cos_theta < _STRAIGHT_COS, np.inf, junction)
+    junction = np.where(cos_theta > _REVERSAL_COS, 0.0, junction)
+    # A delivery-only motion starts and ends at rest.
+    return np.where(surface[:-1] & surface[1:], junction, 0.0)
+
+
+def _block_times(
+    entry: FloatArray, exit_: FloatArray, cruise: FloatArray, accel: FloatArray, length: FloatArray
+) -> tuple[FloatArray, FloatArray]:
+    """Per-block time and peak speed of a trapezoid (or triangle) profile."""
+    accelerate = (cruise**2 - entry**2) / (2.0 * accel)
+    decelerate = (cruise**2 - exit_**2) / (2.0 * accel)
+    cruising = accelerate + decelerate <= length
+    peak = np.where(
+        cruising,
+        cruise,
+        np.sqrt(np.maximum((2.0 * accel * length + entry**2 + exit_**2) / 2.0, 0.0)),
+    )
+    ramps = (2.0 * peak - entry - exit_) / accel
+    coast = np.where(cruising, (length - accelerate - decelerate) / cruise, 0.0)
+    return ramps + coast, peak
+
+
+def _layers(
+    layer: npt.NDArray[np.intp], time: FloatArray, nominal: FloatArray
+) -> list[LayerKinematics]:
+    if not len(layer) or layer.max() == 0:
+        return []
+    size = int(layer.max()) + 1
+    moves = np.bincount(layer, minlength=size)
+    times = np.bincount(layer, weights=time, minlength=size)
+    nominals = np.bincount(layer, weights=nominal, minlength=size)
+    return [
+        LayerKinematics(
+            index=index,
+            moves=int(moves[index]),
+            nominal_time_s=float(nominals[index]),
+            time_s=float(times[index]),
+        )
+        for index in range(1, size)
+        if moves[index]
+    ]
+
+
+def _motions(program: Program) -> _Motions:
+    circumference = math.pi * program.meta.mandrel_diameter
+    carriage_at = mandrel_at = delivery_at = 0.0
+    feed_mmpm = 0.0
+    layer = 0
+    stop = True
+    carriage: list[float] = []
+    mandrel: list[float] = []
+    delivery: list[float] = []
+    distance: list[float] = []
+    feed: list[float] = []
+    layers: list[int] = []
+    stops: list[bool] = []
+    for move in program.moves:
+        kind = move.kind
+        if kind is MoveKind.SET_FEED:
+            assert move.feed is not None
+            feed_mmpm = move.feed
+            continue
+        if kind is MoveKind.COMMENT:
+            match = LAYER_SUMMARY_PATTERN.match(move.text or "")
+            if match:
+                layer = int(match.group(1))
+            continue
+
+        # Identity dispatch on the axis: this loop is the hot part of the estimate,
+        # and hashing the Axis enum for dict lookups would dominate it.
+        carriage_to, mandrel_to, delivery_to = carriage_at, mandrel_at, delivery_at
+        for axis, value in move.targets.items():
+            if axis is Axis.CARRIAGE:
+                carriage_to = value
+            elif axis is Axis.MANDREL:
+                mandrel_to = value
+            else:
+                delivery_to = value
+        if kind is MoveKind.SET_POSITION:
+            carriage_at, mandrel_at, delivery_at = carriage_to, mandrel_to, delivery_to
+            stop = True  # G92 synchronizes the planner
+            continue
+
+        carriage_delta = carriage_to - carriage_at
+        mandrel_delta = mandrel_to - mandrel_at
+        delivery_delta = delivery_to - delivery_at
+        carriage_at, mandrel_at, delivery_at = carriage_to, mandrel_to, delivery_to
+        surface_mm = surface_distance_mm(carriage_delta, mandrel_delta, circumference)
+        if surface_mm <= 0.0 and delivery_delta == 0.0:
+            continue  # Marlin drops empty blocks
+        if feed_mmpm <= 0:
+            raise SimulationError("Feed rate must be set before moving the machine")
+        carriage.append(carriage_delta)
+        mandrel.append(mandrel_delta)
+        delivery.append(delivery_delta)
+        distance.append(surface_mm)
+        feed.append(feed_mmpm)
+        layers.append(layer)
+        stops.append(stop)
+        stop = False
+    return _Motions(
+        carriage=np.asarray(carriage, dtype=np.float64),
+        mandrel=np.asarray(mandrel, dtype=np.float64),
+        delivery=np.asarray(delivery, dtype=np.float64),
+        distance=np.asarray(distance, dtype=np.float64),
+        feed=np.asarray(feed, dtype=np.float64),
+        layer=np.asarray(layers, dtype=np.intp),
+        stop_before=np.asarray(stops, dtype=bool),
+        circumference=circumference,
+    )
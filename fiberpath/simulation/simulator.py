@@ -6,16 +6,25 @@ and derives its time/tow estimate from the **single** O1 motion model,
 :func:`~fiberpath.planning.metrics.nominal_metrics` — the same implementation the
 planner uses. There is no motion math here: the simulator only counts commands
 and reports the shared metrics, so the planner's and simulator's reported time
-agree by construction (the historical divergence is closed).
+agree by construction (the historical divergence is closed). Given a machine
+profile with a fitted :class:`~fiberpath.config.TimeCalibration`, both report the
+calibrated time. Given one with :class:`~fiberpath.config.MachineKinematics`, the
+result also carries the acceleration-aware estimate of
+:mod:`fiberpath.simulation.kinematics` next to the nominal one.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
+from fiberpath.config import MachineProfile
 from fiberpath.planning.ir import Program
 from fiberpath.planning.metrics import nominal_metrics
 
+if TYPE_CHECKING:
+    from .kinematics import KinematicEstimate
+
 
 class SimulationError(RuntimeError):
     """Raised when a program cannot be simulated."""
@@ -29,15 +38,22 @@ class SimulationResult:
     total_distance_mm: float
     tow_length_mm: float
     average_feed_rate_mmpm: float
+    # Present when the profile sets kinematics; estimated_time_s stays nominal.
+    kinematics: KinematicEstimate | None = None
+
 
+def simulate_program(program: Program, profile: MachineProfile | None = None) -> SimulationResult:
+    """Estimate execution time/tow usage for a Motion IR program.
 
-def simulate_program(program: Program) -> SimulationResult:
-    """Estimate execution time/tow usage for a Motion IR program."""
+    ``profile`` supplies the machine's time calibration and planner limits, when
+    it has them.
+    """
     if not program.moves:
         raise SimulationError("Program is empty")
 
+    calibration = profile.time_calibration if profile is not None else None
     try:
-        metrics = nominal_metrics(program.moves, program.meta.mandrel_diameter)
+        metrics = nominal_metrics(program.moves, program.meta.mandrel_diameter, calibration)
     except ValueError as exc:
         raise SimulationError(str(exc)) from exc
 
@@ -45,10 +61,17 @@ def simulate_program(program: Program) -> SimulationResult:
     # pre-IR per-line count for generated programs).
     commands_executed = 1 + len(program.moves)
 
-    # Degenerate once the model is unified: with a single feed it just recovers the
-    # feed rate; it stays for output-shape compatibility (calibration is #130).
+    # Degenerate for the nominal model: with a single feed it just recovers the
+    # feed rate. A calibrated estimate reports the effective feed.
     average_feed_rate = metrics.distance_mm / metrics.time_s * 60.0 if metrics.time_s > 0 else 0.0
 
+    estimate = None
+    if profile is not None and profile.kinematics is not None:
+        # Deferred: the kinematics module imports SimulationError from here.
+        from .kinematics import simulate_kinematics
+
+        estimate = simulate_kinematics(program, profile.kinematics)
+
     return SimulationResult(
         commands_executed=commands_executed,
         moves=metrics.move_count,
@@ -56,4 +79,5 @@ def simulate_program(program: Program) -> SimulationResult:
         total_distance_mm=metrics.distance_mm,
         tow_length_mm=metrics.distance_mm,
         average_feed_rate_mmpm=average_feed_rate,
+        kinematics=estimate,
     )
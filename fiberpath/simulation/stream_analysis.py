@@ -0,0 +1,278 @@
+"""Serial-link starvation analysis: can a program be streamed fast enough?
+
+A Marlin host streams one line at a time and waits for its ``ok``, so each line
+costs a *link cycle*: its framed bytes at the baud rate plus the ack round trip.
+The controller acknowledges a motion line once it is queued in its planner
+buffer, and the buffer drains as moves execute. When moves are shorter (in O1
+time) than the link cycles that deliver them, the buffer empties and the machine
+waits for data mid-path: a stall, felt as stutter and blobbed tow.
+
+:func:`analyze_stream` replays a program through that model:
+
+* ``send`` of line *n* is the ack of line *n - 1*; it arrives after its bytes;
+* a motion line is queued once a planner slot is free (the buffer holds
+  ``buffer_depth`` blocks) and its ``ok`` follows after ``ack_latency_s``;
+* each block runs for its O1 time (``surface_distance_mm / feed``) after the
+  previous one; lines that change no axis (feed changes, ``G92``, repeated
+  positions) take no slot and no time.
+
+A stall is any gap between one block finishing and the next arriving, once the
+machine has started. Delivery-head-only moves have zero O1 time, so the model is
+conservative around them.
+"""
+
+from __future__ import annotations
+
+import math
+import statistics
+from collections import deque
+from dataclasses import dataclass, field
+
+from fiberpath.gcode.dialects import MARLIN_XAB_STANDARD, MarlinDialect
+from fiberpath.gcode.serializer import render_moves
+from fiberpath.planning.helpers import Axis
+from fiberpath.planning.ir import MoveKind, Program
+from fiberpath.planning.layer_strategies import LAYER_SUMMARY_PATTERN
+from fiberpath.planning.metrics import surface_distance_mm
+
+from .simulator import SimulationError
+
+__all__ = [
+    "LayerLinkUsage",
+    "LinkModel",
+    "StallWindow",
+    "StreamAnalysis",
+    "analyze_stream",
+]
+
+# 8N1: a start bit, eight data bits and a stop bit per byte.
+_BITS_PER_BYTE = 10
+
+# Reliable framing wraps a line as "N<line> <gcode>*<checksum>"; the checksum
+# (0-255) is counted at its three-digit maximum.
+_FRAME_OVERHEAD = len("N *") + 3
+
+# Stalls shorter than this are float noise, not starvation.
+_STALL_EPSILON_S = 1e-9
+
+
+@dataclass(slots=True, frozen=True)
+class LinkModel:
+    """The serial link and controller buffer a program is streamed through."""
+
+    baud_rate: int = 250_000
+    # Per-line round trip beyond the line's own bytes: USB/serial latency, the
+    # controller's parse and its "ok" reply, and the host's turnaround.
+    ack_latency_s: float = 0.002
+    # Planner blocks the controller buffers (Marlin's BLOCK_BUFFER_SIZE).
+    buffer_depth: int = 16
+    # Line-number + checksum framing, as the CLI and sidecar stream.
+    framed: bool = True
+
+    def __post_init__(self) -> None:
+        if self.baud_rate <= 0:
+            raise ValueError("baud_rate must be positive")
+        if self.ack_latency_s < 0:
+            raise ValueError("ack_latency_s must be non-negative")
+        if self.buffer_depth < 1:
+            raise ValueError("buffer_depth must be at least 1")
+
+
+@dataclass(slots=True)
+class StallWindow:
+    """A run of stalls: the buffer kept running dry between these lines.
+
+    Lines are 1-based indices of streamed lines (comments are not streamed).
+    Stalls less than a buffer's worth of lines apart share a window.
+    """
+
+    first_line: int
+    last_line: int
+    # The layer of ``first_line`` (0 before the first layer).
+    layer: int
+    # Predicted wall-clock time of the first stall since the stream started.
+    start_s: float
+    stall_s: float
+    stalls: int
+
+
+@dataclass(slots=True)
+class LayerLinkUsage:
+    index: int
+    lines: int
+    bytes: int
+    # O1 execution time of the layer's moves.
+    machine_time_s: float
+    # Time the link spends delivering the layer's lines (bytes plus acks).
+    link_time_s: float
+    stall_s: float
+
+    @property
+    def utilization(self) -> float | None:
+        """Link time over machine time; above 1 the link cannot keep the buffer fed."""
+        if self.machine_time_s <= 0:
+            return None
+        return self.link_time_s / self.machine_time_s
+
+
+@dataclass(slots=True)
+class StreamAnalysis:
+    link: LinkModel
+    lines: int
+    bytes: int
+    machine_time_s: float
+    # Predicted wall-clock time of the whole stream, stalls included.
+    stream_time_s: float
+    stall_time_s: float
+    stall_windows: list[StallWindow] = field(default_factory=list)
+    # Shortest segment whose O1 time covers one average motion-line link cycle at
+    # the program's highest feed: shorter segments, sustained, drain the buffer.
+    min_sustainable_segment_mm: float = 0.0
+    median_segment_mm: float = 0.0
+    layers: list[LayerLinkUsage] = field(default_factory=list)
+
+
+def analyze_stream(
+    program: Program,
+    link: LinkModel | None = None,
+    *,
+    dialect: MarlinDialect | None = None,
+) -> StreamAnalysis:
+    """Replay ``program`` through ``link`` and report where the buffer starves.
+
+    Raises :class:`SimulationError` when the program moves before setting a feed.
+    """
+    link = link or LinkModel()
+    dialect = dialect or MARLIN_XAB_STANDARD
+    byte_s = _BITS_PER_BYTE / link.baud_rate
+    ack_s = link.ack_latency_s
+    depth = link.buffer_depth
+    circumference = math.pi * program.meta.mandrel_diameter
+
+    layers: list[LayerLinkUsage] = []
+    current = LayerLinkUsage(0, 0, 0, 0.0, 0.0, 0.0)
+    windows: list[StallWindow] = []
+    segments: list[float] = []
+    motion_link_s = 0.0
+    motion_lines = 0
+    max_feed = 0.0
+
+    line_number = 0
+    total_bytes = 0
+    send = 0.0  # when the host may send the next line (the previous ack)
+    finish = 0.0  # when the last queued block finishes executing
+    started = False
+    queued: deque[float] = deque()  # finish times of the blocks in the buffer
+
+    def stream_line(text: str, duration: float | None) -> None:
+        # ``duration`` None: the line takes no planner slot.
+        nonlocal line_number, total_bytes, send, finish, started
+        nonlocal motion_link_s, motion_lines
+        line_number += 1
+        size = len(text) + 1
+        if link.framed:
+            size += _FRAME_OVERHEAD + len(str(line_number))
+        total_bytes += size
+        current.lines += 1
+        current.bytes += size
+        tx_s = size * byte_s
+        current.link_time_s += tx_s + ack_s
+        queue_at = send + tx_s
+        if duration is not None:
+            motion_link_s += tx_s
+            motion_lines += 1
+            while queued and queued[0] <= queue_at:
+                queued.popleft()
+            if len(queued) >= depth:
+                queue_at = queued.popleft()
+            gap = queue_at - finish
+            if started and gap > _STALL_EPSILON_S:
+                _record_stall(windows, line_number, current.index, finish, gap, depth)
+                current.stall_s += gap
+            finish = max(queue_at, finish) + duration
+            queued.append(finish)
+            started = True
+            current.machine_time_s += duration
+        send = queue_at + ack_s
+
+    for text in dialect.prologue():
+        stream_line(text, None)
+
+    rendered = render_moves(program.moves, dialect)
+    feed = 0.0
+    last = {Axis.CARRIAGE: 0.0, Axis.MANDREL: 0.0, Axis.DELIVERY_HEAD: 0.0}
+    for move, text in zip(program.moves, rendered, strict=True):
+        kind = move.kind
+        if kind is MoveKind.COMMENT:
+            match = LAYER_SUMMARY_PATTERN.match(move.text or "")
+            if match is not None:
+                if current.lines or current.index:
+                    layers.append(current)
+                current = LayerLinkUsage(int(match.group(1)), 0, 0, 0.0, 0.0, 0.0)
+            continue
+        if kind is MoveKind.SET_FEED:
+            assert move.feed is not None
+            feed = move.feed
+            stream_line(text, None)
+            continue
+        if kind is MoveKind.SET_POSITION:
+            last.update(move.targets)
+            stream_line(text, None)
+            continue
+
+        moved = any(value != last[axis] for axis, value in move.targets.items())
+        distance = surface_distance_mm(
+            move.targets.get(Axis.CARRIAGE, last[Axis.CARRIAGE]) - last[Axis.CARRIAGE],
+            move.targets.get(Axis.MANDREL, last[Axis.MANDREL]) - last[Axis.MANDREL],
+            circumference,
+        )
+        last.update(move.targets)
+        if not moved:
+            stream_line(text, None)
+            continue
+        duration = 0.0
+        if distance > 0.0:
+            if feed <= 0:
+                raise SimulationError("Feed rate must be set before moving the machine")
+            duration = distance / feed * 60.0
+            segments.append(distance)
+            max_feed = max(max_feed, feed)
+        stream_line(text, duration)
+
+    if current.lines or current.index:
+        layers.append(current)
+
+    mean_cycle_s = (motion_link_s / motion_lines + ack_s) if motion_lines else 0.0
+    return StreamAnalysis(
+        link=link,
+        lines=line_number,
+        bytes=total_bytes,
+        machine_time_s=sum(layer.machine_time_s for layer in layers),
+        stream_time_s=max(finish, send),
+        stall_time_s=sum((window.stall_s for window in windows), 0.0),
+        stall_windows=windows,
+        min_sustainable_segment_mm=mean_cycle_s * max_feed / 60.0,
+        median_segment_mm=statistics.median(segments) if segments else 0.0,
+        layers=[layer for layer in layers if layer.index > 0],
+    )
+
+
+def _record_stall(
+    windows: list[StallWindow], line: int, layer: int, at_s: float, stall_s: float, depth: int
+) -> None:
+    if windows and line - windows[-1].last_line <= depth:
+        window = windows[-1]
+        window.last_line = line
+        window.stall_s += stall_s
+        window.stalls += 1
+        return
+    windows.append(
+        StallWindow(
+            first_line=line,
+            last_line=line,
+            layer=layer,
+            start_s=at_s,
+            stall_s=stall_s,
+            stalls=1,
+        )
+    )
@@ -0,0 +1,43 @@
+"""Host-side streaming support shared by the CLI and the API sidecar."""
+
+from .pipeline import DEFAULT_BUFFERED_LINES, PlanStream, slice_commands, stream_slices
+from .sd import (
+    SD_LINE_END,
+    SdError,
+    SdOffload,
+    SdOptions,
+    SdProgress,
+    sd_file_size,
+    split_sd_files,
+)
+from .source import STDIN, GcodeSource, iter_commands, iter_lines
+from .telemetry import (
+    LATENCY_BUCKETS_MS,
+    LatencySummary,
+    StreamMetrics,
+    StreamTelemetry,
+    TelemetryTransport,
+)
+
+__all__ = [
+    "DEFAULT_BUFFERED_LINES",
+    "LATENCY_BUCKETS_MS",
+    "SD_LINE_END",
+    "STDIN",
+    "GcodeSource",
+    "LatencySummary",
+    "PlanStream",
+    "SdError",
+    "SdOffload",
+    "SdOptions",
+    "SdProgress",
+    "StreamMetrics",
+    "StreamTelemetry",
+    "TelemetryTransport",
+    "iter_commands",
+    "iter_lines",
+    "sd_file_size",
+    "slice_commands",
+    "split_sd_files",
+    "stream_slices",
+]
@@ -0,0 +1,201 @@
+"""Pipelined plan-to-stream: send the first layers while the later ones are planned.
+
+Planning a large definition takes a while, and a job that starts only once the
+whole program exists leaves the machine idle for that time. :class:`PlanStream`
+validates the definition up front, then plans it a layer at a time
+(:func:`~fiberpath.planning.plan_chunks`) on a background thread into a bounded
+buffer, which the stream consumes:
+
+* the header, preamble and initial moves are buffered before any layer is
+  lowered, so the first line goes out as soon as validation finishes;
+* the buffer holds at most ``max_buffered_lines`` commands. The planner waits
+  while it is full, so memory stays within the buffer plus the layer being
+  lowered however large the program is;
+* a planning error after validation reaches the stream at the point where the
+  lines stop, and stopping the stream cancels the planner.
+
+``MarlinHost.stream`` reads its whole program before the first send, so the
+buffer is handed to it in slices of at most ``slice_lines`` commands
+(:func:`stream_slices`, which :class:`~fiberpath.streaming.GcodeSource` uses
+too). Each :class:`~marlin_host.StreamProgress` is renumbered over the whole
+program; its ``total_commands`` is the number planned so far, final once
+:attr:`planning` is False.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import replace
+from itertools import islice
+
+from marlin_host import MarlinHost, StreamProgress
+
+from fiberpath.config import WindDefinition
+from fiberpath.gcode.reader import HEADER_PREFIX
+from fiberpath.planning import CancellationToken, PlanCancelledError, PlanOptions, plan_chunks
+
+__all__ = ["DEFAULT_BUFFERED_LINES", "PlanStream", "slice_commands", "stream_slices"]
+
+DEFAULT_BUFFERED_LINES = 20_000
+_SLICE_LINES = 256
+
+
+def stream_slices(
+    host: MarlinHost,
+    slices: Iterable[list[str]],
+    total: Callable[[], int],
+    stopped: Callable[[], bool] = lambda: False,
+) -> Iterator[StreamProgress]:
+    """Stream each slice of commands to ``host`` in turn, as one program.
+
+    Progress is numbered over the whole program, with ``total()`` as its total.
+    ``host.stop()`` ends the slice being sent; because the next
+    ``host.stream`` call would clear it, a stop that lands between slices is
+    seen through ``stopped()``.
+    """
+    sent = 0
+    for commands in slices:
+        streamed = 0
+        for progress in host.stream(commands):
+            streamed = progress.commands_sent
+            yield StreamProgress(sent + streamed, total(), progress.command, progress.response)
+        sent += streamed
+        if streamed < len(commands) or stopped():
+            return
+
+
+def slice_commands(commands: Iterable[str], size: int = _SLICE_LINES) -> Iterator[list[str]]:
+    """``commands`` in lists of at most ``size``, read lazily."""
+    iterator = iter(commands)
+    while piece := list(islice(iterator, size)):
+        yield piece
+
+
+class PlanStream:
+    """Plan ``definition`` on a background thread while :meth:`stream` sends it.
+
+    Raises PlanningError (from the constructor) when the definition does not
+    validate. :meth:`stop` may be called from another thread.
+    """
+
+    def __init__(
+        self,
+        definition: WindDefinition,
+        options: PlanOptions | None = None,
+        *,
+        max_buffered_lines: int = DEFAULT_BUFFERED_LINES,
+        slice_lines: int = _SLICE_LINES,
+    ) -> None:
+        if max_buffered_lines < 1 or slice_lines < 1:
+            raise ValueError("max_buffered_lines and slice_lines must be at least 1")
+        options = options or PlanOptions()
+        self._token = options.cancel_token or CancellationToken()
+        self._chunks = plan_chunks(definition, replace(options, cancel_token=self._token))
+        self.max_buffered_lines = max_buffered_lines
+        self.slice_lines = min(slice_lines, max_buffered_lines)
+        self._buffer: deque[list[str]] = deque()
+        self._buffered = 0
+        self._planned = 0
+        self._done = False
+        self._error: BaseException | None = None
+        self._stopped = False
+        self._ready = threading.Condition()
+        self._thread: threading.Thread | None = None
+        # The program's "; Parameters" header line, once planned.
+        self.header: str | None = None
+
+    @property
+    def planned(self) -> int:
+        """Commands planned so far (the program's total once planning is done)."""
+        return self._planned
+
+    @property
+    def planning(self) -> bool:
+        return not self._done
+
+    @property
+    def buffered(self) -> int:
+        """Commands planned but not yet handed to the stream."""
+        return self._buffered
+
+    def start(self) -> None:
+        """Start planning; :meth:`stream` starts it too. Idempotent."""
+        with self._ready:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._produce, name="plan-stream", daemon=True)
+            self._thread.start()
+
+    def stream(self, host: MarlinHost) -> Iterator[StreamProgress]:
+        """Stream the program to ``host`` as it is planned; yields progress per command.
+
+        Re-raises a planning error once the lines planned before it are sent.
+        """
+        try:
+            yield from stream_slices(
+                host, self.lines(), lambda: self._planned, lambda: self._stopped
+            )
+        finally:
+            self.close()
+
+    def lines(self) -> Iterator[list[str]]:
+        """The planned commands (no comments), in slices of at most ``slice_lines``."""
+        self.start()
+        while True:
+            with self._ready:
+                while not self._buffer and not self._done:
+                    self._ready.wait()
+                if not self._buffer:
+                    if self._error is not None:
+                        raise self._error
+                    return
+                commands = self._buffer.popleft()
+                self._buffered -= len(commands)
+                self._ready.notify_all()
+            yield commands
+
+    def stop(self) -> None:
+        """End :meth:`stream` before its next slice (``MarlinHost.stop`` ends the current one)."""
+        self._stopped = True
+
+    def close(self) -> None:
+        """Cancel planning and drop whatever is buffered."""
+        self._token.cancel()
+        with self._ready:
+            self._buffer.clear()
+            self._buffered = 0
+            self._ready.notify_all()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def _produce(self) -> None:
+        try:
+            for chunk in self._chunks:
+                if self.header is None:
+                    self.header = next((ln for ln in chunk if ln.startswith(HEADER_PREFIX)), None)
+                commands = [line for line in chunk if not line.startswith(";")]
+                for start in range(0, len(commands), self.slice_lines):
+                    piece = commands[start : start + self.slice_lines]
+                    with self._ready:
+                        while (
+                            self._buffered + len(piece) > self.max_buffered_lines
+                            and not self._token.cancelled
+                        ):
+                            self._ready.wait()
+                        if self._token.cancelled:
+                            return
+                        self._buffer.append(piece)
+                        self._buffered += len(piece)
+                        self._planned += len(piece)
+                        self._ready.notify_all()
+        except PlanCancelledError:
+            pass
+        except Exception as exc:  # surfaced to the consumer by lines()
+            self._error = exc
+        finally:
+            with self._ready:
+                self._done = True
+                self._ready.notify_all()
@@ -0,0 +1,308 @@
+"""SD-card offload: upload a program to the controller's card, then print it from there.
+
+Streaming keeps the host on the critical path of every line: a stalled link, a
+busy laptop or a dropped USB cable stops the machine. For long winds,
+:class:`SdOffload` instead writes the program to the controller's SD card and
+lets the firmware read it back:
+
+* **upload** — each part of the program is written between ``M28 <name>`` and
+  ``M29``, every line framed and checksummed like a streamed one. ``M23`` then
+  reports the size the card holds, which must equal the bytes sent (Marlin
+  stores each line with a ``\\r\\n`` ending); a part that does not match is
+  written again, up to ``retries`` times;
+* **print** — the parts are selected (``M23``) and started (``M24``) in turn,
+  and ``M27`` is polled every ``poll_interval_s`` for the bytes read so far.
+  ``M25`` pauses, ``M24`` resumes and ``M524`` aborts. A final ``M400`` waits
+  for the last buffered moves to finish.
+
+``chunk_lines`` splits a program into several files, so a failed verification
+costs one part rather than the whole upload. The host starts the next part once
+the card reports the previous one done, so the machine may come to rest for up
+to a poll interval between parts.
+
+The card prints a file on its own, so a print outlives the host that started
+it. :meth:`SdOffload.attach` picks one up from its :attr:`~SdOffload.layout`
+and :meth:`~SdOffload.follow` watches it to the end. The parts after it wait
+for a host, though: with ``chunk_lines`` the machine stops at the end of the
+file that was printing until one attaches.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from bisect import bisect_right
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from itertools import accumulate
+
+from marlin_host import HostError, MarlinHost
+
+__all__ = [
+    "SD_LINE_END",
+    "SdError",
+    "SdOffload",
+    "SdOptions",
+    "SdProgress",
+    "sd_file_size",
+    "split_sd_files",
+]
+
+# Bytes Marlin adds to each line it stores on the card (CRLF).
+SD_LINE_END = 2
+# 8.3 names; the stem is upper case letters, digits and underscores.
+_STEM = re.compile(r"[A-Z0-9_]{1,8}")
+_EXTENSION = ".GCO"
+_OPENED = re.compile(r"File opened:\s*(\S+)\s+Size:\s*(\d+)")
+_PRINTING = re.compile(r"SD printing byte (\d+)/(\d+)")
+# How often a paused upload checks whether it was resumed or stopped.
+_PAUSE_POLL_S = 0.05
+
+
+class SdError(HostError):
+    """The SD card rejected the program or could not hold it verbatim."""
+
+
+def sd_file_size(commands: Sequence[str]) -> int:
+    """Bytes ``commands`` occupy once written to the card."""
+    return sum(len(command) + SD_LINE_END for command in commands)
+
+
+@dataclass(slots=True, frozen=True)
+class SdOptions:
+    """How :class:`SdOffload` names, splits, verifies and watches the program."""
+
+    # File name stem; the card holds ``<name>.GCO``, or numbered parts when chunked.
+    name: str = "FIBERPTH"
+    # Lines per file; None uploads the program as one file.
+    chunk_lines: int | None = None
+    # Re-uploads of a part whose size does not verify.
+    retries: int = 2
+    poll_interval_s: float = 1.0
+
+    def __post_init__(self) -> None:
+        if not _STEM.fullmatch(self.name):
+            raise ValueError("name must be 1-8 upper case letters, digits or underscores")
+        if self.chunk_lines is not None and self.chunk_lines < 1:
+            raise ValueError("chunk_lines must be at least 1")
+        if self.retries < 0:
+            raise ValueError("retries must be non-negative")
+        if self.poll_interval_s < 0:
+            raise ValueError("poll_interval_s must be non-negative")
+
+
+def split_sd_files(commands: Sequence[str], options: SdOptions) -> list[tuple[str, list[str]]]:
+    """The card's files for ``commands``: ``(name, lines)`` in print order.
+
+    Raises ValueError when there is nothing to upload or too many parts to name.
+    """
+    if not commands:
+        raise ValueError("nothing to upload")
+    step = options.chunk_lines or len(commands)
+    chunks = [list(commands[start : start + step]) for start in range(0, len(commands), step)]
+    if len(chunks) == 1:
+        return [(f"{options.name}{_EXTENSION}", chunks[0])]
+    if len(chunks) > 999:
+        raise ValueError(f"{len(chunks)} parts; at most 999 fit an 8.3 name")
+    stem = options.name[:5]
+    return [(f"{stem}{index:03d}{_EXTENSION}", chunk) for index, chunk in enumerate(chunks, 1)]
+
+
+@dataclass(slots=True)
+class SdProgress:
+    phase: str  # "upload" | "print"
+    # Lines uploaded, or read back by the controller, over the whole program.
+    lines: int
+    total_lines: int
+    # The file being written or printed, 1-based.
+    part: int
+    parts: int
+
+
+class SdOffload:
+    """Upload ``commands`` to ``host``'s SD card and print them (see the module docstring).
+
+    ``commands`` are streamable lines: no blanks or comments. :meth:`pause`,
+    :meth:`resume` and :meth:`stop` may be called from another thread while
+    :meth:`run` is iterated; the iterating thread sends the matching commands.
+    """
+
+    def __init__(
+        self, host: MarlinHost, commands: Sequence[str], options: SdOptions | None = None
+    ) -> None:
+        self.options = options or SdOptions()
+        self._host = host
+        self._parts = split_sd_files(commands, self.options)
+        self._layout = [(name, len(chunk), sd_file_size(chunk)) for name, chunk in self._parts]
+        self._total = len(commands)
+        self._paused = False
+        self._stopped = False
+
+    @classmethod
+    def attach(
+        cls,
+        host: MarlinHost,
+        layout: Sequence[tuple[str, int, int]],
+        options: SdOptions | None = None,
+    ) -> SdOffload:
+        """An offload of a program already on ``host``'s card, laid out as ``layout``.
+
+        Its lines are not known, so progress within a file is estimated from the
+        bytes read (lines are taken to be of equal length).
+        """
+        offload = cls.__new__(cls)
+        offload.options = options or SdOptions()
+        offload._host = host
+        offload._parts = [(name, []) for name, _, _ in layout]
+        offload._layout = [(str(name), int(lines), int(size)) for name, lines, size in layout]
+        offload._total = sum(lines for _, lines, _ in offload._layout)
+        offload._paused = False
+        offload._stopped = False
+        return offload
+
+    @property
+    def files(self) -> list[str]:
+        """The card's file names, in print order."""
+        return [name for name, _, _ in self._layout]
+
+    @property
+    def layout(self) -> list[tuple[str, int, int]]:
+        """Each file's name, lines and bytes on the card, in print order (see :meth:`attach`)."""
+        return list(self._layout)
+
+    @property
+    def size(self) -> int:
+        """Bytes the program occupies on the card."""
+        return sum(size for _, _, size in self._layout)
+
+    @property
+    def stopped(self) -> bool:
+        return self._stopped
+
+    def pause(self) -> None:
+        """Pause before the next uploaded line, or pause the print (``M25``)."""
+        self._paused = True
+
+    def resume(self) -> None:
+        self._paused = False
+
+    def stop(self) -> None:
+        """End the upload, or abort the print (``M524``)."""
+        self._stopped = True
+
+    def run(self) -> Iterator[SdProgress]:
+        """Upload, then print; yields progress throughout."""
+        yield from self.upload()
+        if not self._stopped:
+            yield from self.print_files()
+
+    def upload(self) -> Iterator[SdProgress]:
+        """Write and verify every part; yields after each line."""
+        self._init_card()
+        done = 0
+        for part, (name, chunk) in enumerate(self._parts, start=1):
+            for attempt in range(self.options.retries + 1):
+                self._host.send(f"M28 {name}")
+                try:
+                    for index, command in enumerate(chunk, start=1):
+                        self._wait_while_paused()
+                        if self._stopped:
+                            break
+                        self._host.send(command)
+                        yield SdProgress(
+                            "upload", done + index, self._total, part, len(self._parts)
+                        )
+                finally:
+                    self._host.send("M29")
+                if self._stopped:
+                    self._host.send(f"M30 {name}")  # don't leave half a program on the card
+                    return
+                stored = self._stored_size(name)
+                expected = sd_file_size(chunk)
+                if stored == expected:
+                    break
+                if attempt == self.options.retries:
+                    raise SdError(
+                        f"{name}: the card holds {stored} bytes, expected {expected} "
+                        f"(after {attempt + 1} uploads)"
+                    )
+            done += len(chunk)
+
+    def print_files(self) -> Iterator[SdProgress]:
+        """Print the uploaded parts in turn; yields after each ``M27`` poll."""
+        return self._print(1, printing=False)
+
+    def follow(self, part: int) -> Iterator[SdProgress]:
+        """Follow the print of file ``part`` (1-based) another host started, then print the rest.
+
+        Nothing is selected until that file is done: ``M23`` would start it over.
+        """
+        if not 1 <= part <= len(self._layout):
+            raise ValueError(f"part must be between 1 and {len(self._layout)}")
+        return self._print(part, printing=True)
+
+    def printing(self) -> bool:
+        """Whether the card is printing a file now (``M27``)."""
+        return self._printed_bytes() is not None
+
+    def _print(self, first: int, *, printing: bool) -> Iterator[SdProgress]:
+        done = sum(lines for _, lines, _ in self._layout[: first - 1])
+        parts = len(self._layout)
+        for part in range(first, parts + 1):
+            name, lines, _ = self._layout[part - 1]
+            offsets = self._offsets(part)
+            if not (printing and part == first):
+                if self._stored_size(name) is None:
+                    raise SdError(f"{name} is not on the card; upload it first")
+                self._host.send("M24")
+            paused = False
+            while True:
+                if self._stopped:
+                    self._host.send("M524")
+                    return
+                if self._paused != paused:
+                    paused = self._paused
+                    self._host.send("M25" if paused else "M24")
+                printed = self._printed_bytes()
+                if printed is None and not paused:
+                    break
+                if printed is not None:
+                    read = done + bisect_right(offsets, printed)
+                    yield SdProgress("print", read, self._total, part, parts)
+                time.sleep(self.options.poll_interval_s)
+            done += lines
+            yield SdProgress("print", done, self._total, part, parts)
+        self._host.send("M400")  # the card is read; wait for the buffered moves
+
+    def _offsets(self, part: int) -> list[int]:
+        """Bytes on the card through each line of file ``part`` (estimated if attached)."""
+        _, chunk = self._parts[part - 1]
+        if chunk:
+            return list(accumulate(len(command) + SD_LINE_END for command in chunk))
+        _, lines, size = self._layout[part - 1]
+        return [size * line // lines for line in range(1, lines + 1)]
+
+    def _init_card(self) -> None:
+        replies = [response.raw for response in self._host.query("M21")]
+        if any("fail" in reply.lower() for reply in replies):
+            raise SdError(f"no usable SD card: {'; '.join(replies)}")
+
+    def _stored_size(self, name: str) -> int | None:
+        """Select ``name`` and return the size the card reports (None if missing)."""
+        for response in self._host.query(f"M23 {name}"):
+            match = _OPENED.search(response.raw)
+            if match is not None:
+                return int(match.group(2))
+        return None
+
+    def _printed_bytes(self) -> int | None:
+        """Bytes the card has read, or None when it is not printing."""
+        for response in self._host.query("M27"):
+            match = _PRINTING.search(response.raw)
+            if match is not None:
+                return int(match.group(1))
+        return None
+
+    def _wait_while_paused(self) -> None:
+        while self._paused and not self._stopped:
+            time.sleep(_PAUSE_POLL_S)
@@ -0,0 +1,144 @@
+"""Lazy G-code sources: stream a file or stdin without holding the program in memory.
+
+A program read into a list costs memory in proportion to its length, several
+times over once it is split into lines and filtered. :class:`GcodeSource`
+instead reads its file a line at a time whenever the program is needed:
+
+* a cheap pre-scan on construction counts the streamable commands, so progress
+  can be reported against the program's total before the first line is sent;
+* :meth:`GcodeSource.commands` filters blank lines and ``;`` comments as it
+  reads (:func:`iter_commands`), and :meth:`GcodeSource.stream` hands them to
+  ``MarlinHost.stream`` a slice at a time (:func:`stream_slices`);
+* ``-`` reads stdin, which can be read only once: the pre-scan copies it to an
+  anonymous temporary file as it counts, so ``fiberpath plan ... -o - |
+  fiberpath stream - ...`` works with memory that stays flat whatever the
+  program's size.
+"""
+
+from __future__ import annotations
+
+import io
+import sys
+import tempfile
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import BinaryIO, TextIO
+
+from marlin_host import MarlinHost, StreamProgress
+
+from .pipeline import _SLICE_LINES, slice_commands, stream_slices
+
+__all__ = ["STDIN", "GcodeSource", "iter_commands", "iter_lines"]
+
+# The path that reads stdin.
+STDIN = "-"
+
+
+def iter_lines(text: str) -> Iterator[str]:
+    """The ``\\n``-separated lines of ``text``, sliced out one at a time.
+
+    Unlike ``text.splitlines()`` or ``io.StringIO(text)`` this makes no copy of
+    the whole program; a ``\\r`` before the ``\\n`` is left for the caller to strip.
+    """
+    start = 0
+    while (end := text.find("\n", start)) >= 0:
+        yield text[start:end]
+        start = end + 1
+    if start < len(text):
+        yield text[start:]
+
+
+def iter_commands(lines: Iterable[str]) -> Iterator[str]:
+    """The streamable commands of ``lines``, stripped, with blanks and ``;`` comments dropped.
+
+    The same filter ``MarlinHost.stream`` applies, done lazily.
+    """
+    for line in lines:
+        stripped = line.strip()
+        if stripped and not stripped.startswith(";"):
+            yield stripped
+
+
+class GcodeSource:
+    """A G-code program read lazily from ``path``, or from stdin when it is ``-``.
+
+    Raises OSError when the file cannot be read and UnicodeDecodeError when it
+    is not UTF-8. Use as a context manager, or :meth:`close` it, to remove the
+    copy of stdin.
+    """
+
+    def __init__(self, path: Path | str, *, slice_lines: int = _SLICE_LINES) -> None:
+        if slice_lines < 1:
+            raise ValueError("slice_lines must be at least 1")
+        self.path = Path(path)
+        self.slice_lines = slice_lines
+        self._spool: TextIO | None = None
+        self._stopped = False
+        if str(path) == STDIN:
+            spool = tempfile.TemporaryFile()
+            try:
+                self.total = self._count(sys.stdin.buffer, copy=spool)
+            except BaseException:
+                spool.close()
+                raise
+            self._spool = io.TextIOWrapper(spool, encoding="utf-8")
+        else:
+            with self.path.open("rb") as file:
+                self.total = self._count(file)
+
+    @property
+    def name(self) -> str:
+        return "<stdin>" if self._spool is not None else self.path.name
+
+    def lines(self) -> Iterator[str]:
+        """The program's lines as read, comments included, without line endings."""
+        if self._spool is not None:
+            self._spool.seek(0)
+            yield from self._strip_endings(self._spool)
+            return
+        with self.path.open(encoding="utf-8") as file:
+            yield from self._strip_endings(file)
+
+    def commands(self) -> Iterator[str]:
+        """The streamable commands, read as they are needed."""
+        return iter_commands(self.lines())
+
+    def stream(self, host: MarlinHost) -> Iterator[StreamProgress]:
+        """Stream the program to ``host``, a slice at a time; yields progress per command."""
+        self._stopped = False
+        yield from stream_slices(
+            host,
+            slice_commands(self.commands(), self.slice_lines),
+            lambda: self.total,
+            lambda: self._stopped,
+        )
+
+    def stop(self) -> None:
+        """End :meth:`stream` before its next slice (``MarlinHost.stop`` ends the current one)."""
+        self._stopped = True
+
+    def close(self) -> None:
+        if self._spool is not None:
+            self._spool.close()
+
+    def __enter__(self) -> GcodeSource:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @staticmethod
+    def _count(file: BinaryIO, copy: BinaryIO | None = None) -> int:
+        total = 0
+        for line in file:
+            if copy is not None:
+                copy.write(line)
+            stripped = line.strip()
+            if stripped and not stripped.startswith(b";"):
+                total += 1
+        return total
+
+    @staticmethod
+    def _strip_endings(file: TextIO) -> Iterator[str]:
+        for line in file:
+            yield line.rstrip("\n")
@@ -0,0 +1,255 @@
+"""Host-side streaming telemetry: what the link did while a program streamed.
+
+:class:`TelemetryTransport` decorates a :class:`marlin_host.Transport` (like
+:class:`marlin_host.TracingTransport`) and feeds a :class:`StreamTelemetry`
+collector. The collector records:
+
+* per-line send-to-``ok`` latency, as a fixed-bucket histogram;
+* rolling throughput (lines/s and bytes/s over the last ``window_s``);
+* time paused, reported by the caller through :meth:`StreamTelemetry.pause` /
+  :meth:`StreamTelemetry.resume`;
+* time spent waiting for a caller's lock (:meth:`StreamTelemetry.acquire`);
+* host stalls: gaps longer than ``stall_threshold_s`` between an ``ok`` and the
+  next send, while not paused, when nothing was in flight on the link.
+
+A resend is timed from its retransmission. The ``ok`` Marlin sends to
+acknowledge the resend request closes the line early, so a recovered line
+reads slightly fast.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
+from dataclasses import dataclass, field
+
+from marlin_host import Transport, parse_response
+
+__all__ = [
+    "LATENCY_BUCKETS_MS",
+    "LatencySummary",
+    "StreamMetrics",
+    "StreamTelemetry",
+    "TelemetryTransport",
+]
+
+# Upper bounds (ms) of the latency histogram buckets; a final bucket holds the rest.
+LATENCY_BUCKETS_MS: tuple[float, ...] = (
+    0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 50.0, 100.0, 200.0, 500.0, 1000.0, 2000.0, 5000.0,
+)  # fmt: skip
+DEFAULT_WINDOW_S = 5.0
+DEFAULT_STALL_THRESHOLD_S = 0.005
+
+
+@dataclass(slots=True)
+class LatencySummary:
+    count: int = 0
+    mean_ms: float = 0.0
+    # Percentiles are the upper bound of the bucket they fall in (max_ms for the
+    # overflow bucket).
+    p50_ms: float = 0.0
+    p90_ms: float = 0.0
+    p99_ms: float = 0.0
+    max_ms: float = 0.0
+    # One count per LATENCY_BUCKETS_MS bound, plus the overflow bucket.
+    buckets: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+
+
+@dataclass(slots=True)
+class StreamMetrics:
+    lines_sent: int = 0
+    lines_acked: int = 0
+    bytes_sent: int = 0
+    elapsed_s: float = 0.0
+    paused_s: float = 0.0
+    lock_wait_s: float = 0.0
+    lock_wait_max_s: float = 0.0
+    # Over the rolling window.
+    lines_per_s: float = 0.0
+    bytes_per_s: float = 0.0
+    # Acked lines over the unpaused elapsed time.
+    mean_lines_per_s: float = 0.0
+    stalls: int = 0
+    stall_s: float = 0.0
+    longest_stall_s: float = 0.0
+    latency: LatencySummary = field(default_factory=LatencySummary)
+
+
+class StreamTelemetry:
+    """Thread-safe collector of streaming figures (see the module docstring)."""
+
+    def __init__(
+        self,
+        *,
+        window_s: float = DEFAULT_WINDOW_S,
+        stall_threshold_s: float = DEFAULT_STALL_THRESHOLD_S,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._window_s = window_s
+        self._stall_threshold_s = stall_threshold_s
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._started = clock()
+        self._metrics = StreamMetrics()
+        self._latency_sum_ms = 0.0
+        # (ack time, bytes) of the lines acked within the window.
+        self._recent: deque[tuple[float, int]] = deque()
+        self._in_flight: tuple[float, int] | None = None  # (sent at, bytes)
+        self._idle_since: float | None = None  # last ok (or resume) with nothing in flight
+        self._paused_at: float | None = None
+        self._finished_at: float | None = None
+
+    # -- transport events ---------------------------------------------------
+
+    def sent(self, size: int) -> None:
+        with self._lock:
+            now = self._clock()
+            metrics = self._metrics
+            metrics.lines_sent += 1
+            metrics.bytes_sent += size
+            if self._idle_since is not None and self._paused_at is None:
+                gap = now - self._idle_since
+                if gap > self._stall_threshold_s:
+                    metrics.stalls += 1
+                    metrics.stall_s += gap
+                    metrics.longest_stall_s = max(metrics.longest_stall_s, gap)
+            self._idle_since = None
+            self._in_flight = (now, size)
+
+    def acked(self) -> None:
+        with self._lock:
+            if self._in_flight is None:
+                return
+            now = self._clock()
+            sent_at, size = self._in_flight
+            self._in_flight = None
+            self._idle_since = now
+            self._metrics.lines_acked += 1
+            self._observe_latency((now - sent_at) * 1000.0)
+            self._recent.append((now, size))
+
+    # -- caller events --------------------------------------------------------
+
+    def pause(self) -> None:
+        with self._lock:
+            if self._paused_at is None:
+                self._paused_at = self._clock()
+
+    def resume(self) -> None:
+        with self._lock:
+            if self._paused_at is None:
+                return
+            now = self._clock()
+            self._metrics.paused_s += now - self._paused_at
+            self._paused_at = None
+            if self._idle_since is not None:
+                self._idle_since = now
+
+    def finish(self) -> None:
+        """Freeze the clock: later snapshots report the stream as it ended."""
+        with self._lock:
+            if self._finished_at is None:
+                self._finished_at = self._clock()
+
+    @contextmanager
+    def acquire(self, lock: AbstractContextManager[object]) -> Iterator[None]:
+        """Enter ``lock``, charging the wait to the lock-blocked figures."""
+        start = self._clock()
+        with lock:
+            waited = self._clock() - start
+            with self._lock:
+                self._metrics.lock_wait_s += waited
+                self._metrics.lock_wait_max_s = max(self._metrics.lock_wait_max_s, waited)
+            yield
+
+    # -- reporting ------------------------------------------------------------
+
+    def snapshot(self) -> StreamMetrics:
+        with self._lock:
+            now = self._finished_at if self._finished_at is not None else self._clock()
+            metrics = self._metrics
+            paused_s = metrics.paused_s
+            if self._paused_at is not None:
+                paused_s += now - self._paused_at
+            while self._recent and self._recent[0][0] < now - self._window_s:
+                self._recent.popleft()
+            elapsed_s = now - self._started
+            window_s = min(self._window_s, elapsed_s)
+            active_s = elapsed_s - paused_s
+            latency = metrics.latency
+            return StreamMetrics(
+                lines_sent=metrics.lines_sent,
+                lines_acked=metrics.lines_acked,
+                bytes_sent=metrics.bytes_sent,
+                elapsed_s=elapsed_s,
+                paused_s=paused_s,
+                lock_wait_s=metrics.lock_wait_s,
+                lock_wait_max_s=metrics.lock_wait_max_s,
+                lines_per_s=len(self._recent) / window_s if window_s > 0 else 0.0,
+                bytes_per_s=(
+                    sum(size for _, size in self._recent) / window_s if window_s > 0 else 0.0
+                ),
+                mean_lines_per_s=metrics.lines_acked / active_s if active_s > 0 else 0.0,
+                stalls=metrics.stalls,
+                stall_s=metrics.stall_s,
+                longest_stall_s=metrics.longest_stall_s,
+                latency=LatencySummary(
+                    count=latency.count,
+                    mean_ms=self._latency_sum_ms / latency.count if latency.count else 0.0,
+                    p50_ms=self._percentile(0.50),
+                    p90_ms=self._percentile(0.90),
+                    p99_ms=self._percentile(0.99),
+                    max_ms=latency.max_ms,
+                    buckets=list(latency.buckets),
+                ),
+            )
+
+    def _observe_latency(self, latency_ms: float) -> None:
+        latency = self._metrics.latency
+        latency.count += 1
+        latency.max_ms = max(latency.max_ms, latency_ms)
+        self._latency_sum_ms += latency_ms
+        for index, bound in enumerate(LATENCY_BUCKETS_MS):
+            if latency_ms <= bound:
+                latency.buckets[index] += 1
+                return
+        latency.buckets[-1] += 1
+
+    def _percentile(self, q: float) -> float:
+        latency = self._metrics.latency
+        if latency.count == 0:
+            return 0.0
+        rank = q * latency.count
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS_MS, latency.buckets, strict=False):
+            seen += count
+            if seen >= rank:
+                return min(bound, latency.max_ms)
+        return latency.max_ms
+
+
+class TelemetryTransport:
+    """Decorate a :class:`~marlin_host.Transport`, timing every line into ``telemetry``.
+
+    ``telemetry`` may be swapped between jobs on a long-lived connection.
+    """
+
+    def __init__(self, inner: Transport, telemetry: StreamTelemetry | None = None) -> None:
+        self._inner = inner
+        self.telemetry = telemetry or StreamTelemetry()
+
+    def write_line(self, line: str) -> None:
+        self.telemetry.sent(len(line) + 1)
+        self._inner.write_line(line)
+
+    def read_line(self, timeout: float | None = None) -> str | None:
+        line = self._inner.read_line(timeout)
+        if line is not None and parse_response(line).is_ack:
+            self.telemetry.acked()
+        return line
+
+    def close(self) -> None:
+        self._inner.close()
@@ -20,8 +20,8 @@ from typing import TYPE_CHECKING, Literal
 from pydantic import BaseModel
 
 if TYPE_CHECKING:
-    from fiberpath.planning import PlanResult
-    from fiberpath.simulation import SimulationResult
+    from fiberpath.planning import PatternSolution, PlanResult
+    from fiberpath.simulation import KinematicEstimate, SimulationResult, StreamAnalysis
 
 # The wire format version. Pinned as a Literal so it surfaces as a required
 # const in the OpenAPI/JSON schema: the generated client can rely on it always
@@ -42,34 +42,166 @@ class PlanLayerOut(BaseModel):
     terminal: bool
 
 
+class PlanEditOut(BaseModel):
+    """Replace ``deleteCount`` lines of the base program from ``start`` with ``lines``."""
+
+    start: int
+    deleteCount: int
+    lines: list[str]
+    # The layer the replaced range belongs to (0 for the header/preamble).
+    layerIndex: int
+
+
+class PlanDeltaOut(BaseModel):
+    """The program as edits against a program the client already holds.
+
+    ``edits`` are ascending and non-overlapping in the base program's line
+    numbers; apply them last-to-first. Every range starts and ends on a layer
+    boundary.
+    """
+
+    baseArtifactId: str
+    edits: list[PlanEditOut]
+
+
 class PlanResultOut(BaseModel):
     schemaVersion: SchemaVersion
     commandCount: int
+    # The full program; empty when ``delta`` carries it instead.
     gcode: str
     timeSeconds: float
     towMeters: float
     layers: list[PlanLayerOut]
+    # Content-derived id of this program, usable as a later delta base.
+    artifactId: str | None = None
+    delta: PlanDeltaOut | None = None
 
     @classmethod
-    def from_result(cls, result: PlanResult) -> PlanResultOut:
+    def from_result(
+        cls,
+        result: PlanResult,
+        *,
+        artifact_id: str | None = None,
+        delta: PlanDeltaOut | None = None,
+    ) -> PlanResultOut:
         return cls(
             schemaVersion=OUTPUT_SCHEMA_VERSION,
             commandCount=len(result.commands),
-            gcode="\n".join(result.commands),
+            gcode="" if delta is not None else "\n".join(result.commands),
             timeSeconds=result.total_time_s,
             towMeters=result.total_tow_m,
+            layers=_layers_out(result),
+            artifactId=artifact_id,
+            delta=delta,
+        )
+
+
+class PlanMetricsOut(BaseModel):
+    """Totals and per-layer breakdown of a plan, without the program itself."""
+
+    schemaVersion: SchemaVersion
+    timeSeconds: float
+    towMeters: float
+    layers: list[PlanLayerOut]
+
+    @classmethod
+    def from_result(cls, result: PlanResult) -> PlanMetricsOut:
+        return cls(
+            schemaVersion=OUTPUT_SCHEMA_VERSION,
+            timeSeconds=result.total_time_s,
+            towMeters=result.total_tow_m,
+            layers=_layers_out(result),
+        )
+
+
+def _layers_out(result: PlanResult) -> list[PlanLayerOut]:
+    return [
+        PlanLayerOut(
+            index=metric.index,
+            windType=metric.wind_type,
+            commandCount=metric.commands,
+            timeSeconds=metric.time_s,
+            cumulativeTimeSeconds=metric.cumulative_time_s,
+            towMeters=metric.tow_m,
+            cumulativeTowMeters=metric.cumulative_tow_m,
+            terminal=metric.terminal,
+        )
+        for metric in result.layers
+    ]
+
+
+class PatternSolutionOut(BaseModel):
+    patternNumber: int
+    skipIndex: int
+    lockDegrees: float
+    circuits: int
+    patterns: int
+    # The layer's nominal time and tow with this pattern.
+    timeSeconds: float
+    towMeters: float
+
+
+class PatternSolutionsOut(BaseModel):
+    """The valid coverage patterns of a helical layer, fastest first."""
+
+    schemaVersion: SchemaVersion
+    # Every valid pattern up to the lock cap; ``solutions`` may hold fewer.
+    total: int
+    solutions: list[PatternSolutionOut]
+
+    @classmethod
+    def from_result(
+        cls, solutions: list[PatternSolution], limit: int | None = None
+    ) -> PatternSolutionsOut:
+        return cls(
+            schemaVersion=OUTPUT_SCHEMA_VERSION,
+            total=len(solutions),
+            solutions=[
+                PatternSolutionOut(
+                    patternNumber=solution.pattern_number,
+                    skipIndex=solution.skip_index,
+                    lockDegrees=solution.lock_degrees,
+                    circuits=solution.circuits,
+                    patterns=solution.patterns,
+                    timeSeconds=solution.time_s,
+                    towMeters=solution.tow_m,
+                )
+                for solution in solutions[:limit]
+            ],
+        )
+
+
+class LayerKinematicsOut(BaseModel):
+    index: int
+    moves: int
+    nominalTimeSeconds: float
+    timeSeconds: float
+
+
+class KinematicEstimateOut(BaseModel):
+    """Cycle time under the profile's axis limits, acceleration and junction deviation."""
+
+    timeSeconds: float
+    nominalTimeSeconds: float
+    moves: int
+    movesBelowFeed: int
+    layers: list[LayerKinematicsOut]
+
+    @classmethod
+    def from_result(cls, result: KinematicEstimate) -> KinematicEstimateOut:
+        return cls(
+            timeSeconds=result.time_s,
+            nominalTimeSeconds=result.nominal_time_s,
+            moves=result.moves,
+            movesBelowFeed=result.moves_below_feed,
             layers=[
-                PlanLayerOut(
-                    index=metric.index,
-                    windType=metric.wind_type,
-                    commandCount=metric.commands,
-                    timeSeconds=metric.time_s,
-                    cumulativeTimeSeconds=metric.cumulative_time_s,
-                    towMeters=metric.tow_m,
-                    cumulativeTowMeters=metric.cumulative_tow_m,
-                    terminal=metric.terminal,
+                LayerKinematicsOut(
+                    index=layer.index,
+                    moves=layer.moves,
+                    nominalTimeSeconds=layer.nominal_time_s,
+                    timeSeconds=layer.time_s,
                 )
-                for metric in result.layers
+                for layer in result.layers
             ],
         )
 
@@ -82,6 +214,8 @@ class SimulationResultOut(BaseModel):
     totalDistanceMm: float
     towLengthMm: float
     averageFeedRateMmpm: float
+    # Only when the request's machine profile sets kinematics.
+    kinematics: KinematicEstimateOut | None = None
 
     @classmethod
     def from_result(cls, result: SimulationResult) -> SimulationResultOut:
@@ -93,4 +227,80 @@ class SimulationResultOut(BaseModel):
             totalDistanceMm=result.total_distance_mm,
             towLengthMm=result.tow_length_mm,
             averageFeedRateMmpm=result.average_feed_rate_mmpm,
+            kinematics=(
+                KinematicEstimateOut.from_result(result.kinematics)
+                if result.kinematics is not None
+                else None
+            ),
+        )
+
+
+class StallWindowOut(BaseModel):
+    """Streamed lines (1-based, comments excluded) over which the buffer ran dry."""
+
+    firstLine: int
+    lastLine: int
+    layer: int
+    startSeconds: float
+    stallSeconds: float
+    stalls: int
+
+
+class LayerLinkUsageOut(BaseModel):
+    index: int
+    lines: int
+    bytes: int
+    machineTimeSeconds: float
+    linkTimeSeconds: float
+    # Link time over machine time; above 1 the link cannot keep the buffer fed.
+    utilization: float | None
+    stallSeconds: float
+
+
+class StreamAnalysisOut(BaseModel):
+    schemaVersion: SchemaVersion
+    lines: int
+    bytes: int
+    machineTimeSeconds: float
+    streamTimeSeconds: float
+    stallTimeSeconds: float
+    stallWindows: list[StallWindowOut]
+    minSustainableSegmentMm: float
+    medianSegmentMm: float
+    layers: list[LayerLinkUsageOut]
+
+    @classmethod
+    def from_result(cls, result: StreamAnalysis) -> StreamAnalysisOut:
+        return cls(
+            schemaVersion=OUTPUT_SCHEMA_VERSION,
+            lines=result.lines,
+            bytes=result.bytes,
+            machineTimeSeconds=result.machine_time_s,
+            streamTimeSeconds=result.stream_time_s,
+            stallTimeSeconds=result.stall_time_s,
+            stallWindows=[
+                StallWindowOut(
+                    firstLine=window.first_line,
+                    lastLine=window.last_line,
+                    layer=window.layer,
+                    startSeconds=window.start_s,
+                    stallSeconds=window.stall_s,
+                    stalls=window.stalls,
+                )
+                for window in result.stall_windows
+            ],
+            minSustainableSegmentMm=result.min_sustainable_segment_mm,
+            medianSegmentMm=result.median_segment_mm,
+            layers=[
+                LayerLinkUsageOut(
+                    index=layer.index,
+                    lines=layer.lines,
+                    bytes=layer.bytes,
+                    machineTimeSeconds=layer.machine_time_s,
+                    linkTimeSeconds=layer.link_time_s,
+                    utilization=layer.utilization,
+                    stallSeconds=layer.stall_s,
+                )
+                for layer in result.layers
+            ],
         )
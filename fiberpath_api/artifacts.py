@@ -0,0 +1,130 @@
+"""Recently planned programs, addressable by a content-derived artifact id.
+
+Every ``/plan`` response carries an ``artifactId``. A client that keeps the
+program it received can send that id back as ``baseArtifactId`` on its next
+request; if the sidecar still holds the base, the response carries only the
+line ranges that changed (:func:`diff_artifacts`) instead of the whole program.
+
+A program is split into chunks at layer boundaries -- the prefix (header,
+preamble, init and feed lines), then each layer's summary comment and its
+lowered block -- and each chunk is hashed once. The artifact id hashes the
+chunk hashes, and the diff is a sequence alignment over chunk hashes, so both
+cost O(program) hashing plus O(layers) matching. Edits therefore always start
+and end on a layer boundary.
+"""
+
+from __future__ import annotations
+
+import difflib
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from fiberpath.planning import PlanResult
+
+__all__ = [
+    "PlanArtifact",
+    "PlanArtifactStore",
+    "PlanEdit",
+    "build_artifact",
+    "diff_artifacts",
+    "plan_artifacts",
+]
+
+# Programs kept for delta responses. Each holds a full program's lines.
+_MAX_ARTIFACTS = 4
+
+
+@dataclass(slots=True)
+class PlanArtifact:
+    artifact_id: str
+    commands: list[str]
+    chunk_keys: list[str]
+    # Line offset of each chunk, plus a final entry for the program length.
+    chunk_starts: list[int]
+    # Layer index of each chunk (0 for the program prefix).
+    chunk_layers: list[int]
+
+
+@dataclass(slots=True)
+class PlanEdit:
+    """Replace ``delete_count`` base lines from ``start`` with ``lines``."""
+
+    start: int
+    delete_count: int
+    lines: list[str]
+    layer_index: int
+
+
+def build_artifact(result: PlanResult) -> PlanArtifact:
+    commands = result.commands
+    sizes = [1 + layer.commands for layer in result.layers]
+    prefix = len(commands) - sum(sizes)
+    if prefix < 0:  # not a planner-shaped program; treat it as one chunk
+        spans = [(0, len(commands), 0)]
+    else:
+        spans = [(0, prefix, 0)]
+        start = prefix
+        for layer, size in zip(result.layers, sizes, strict=True):
+            spans.append((start, start + 1, layer.index))  # summary comment
+            spans.append((start + 1, start + size, layer.index))
+            start += size
+
+    keys = [
+        hashlib.sha256("\n".join(commands[begin:end]).encode("utf-8")).hexdigest()
+        for begin, end, _ in spans
+    ]
+    artifact_id = hashlib.sha256("".join(keys).encode("ascii")).hexdigest()
+    return PlanArtifact(
+        artifact_id=artifact_id,
+        commands=commands,
+        chunk_keys=keys,
+        chunk_starts=[begin for begin, _, _ in spans] + [len(commands)],
+        chunk_layers=[layer for _, _, layer in spans],
+    )
+
+
+def diff_artifacts(base: PlanArtifact, new: PlanArtifact) -> list[PlanEdit]:
+    """Edits that turn ``base`` into ``new``, ascending and non-overlapping in base lines."""
+    matcher = difflib.SequenceMatcher(None, base.chunk_keys, new.chunk_keys, autojunk=False)
+    edits: list[PlanEdit] = []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            continue
+        start = base.chunk_starts[i1]
+        edits.append(
+            PlanEdit(
+                start=start,
+                delete_count=base.chunk_starts[i2] - start,
+                lines=new.commands[new.chunk_starts[j1] : new.chunk_starts[j2]],
+                layer_index=new.chunk_layers[j1] if j1 < j2 else base.chunk_layers[i1],
+            )
+        )
+    return edits
+
+
+class PlanArtifactStore:
+    """A small LRU of recently planned programs, keyed by artifact id."""
+
+    def __init__(self, max_entries: int = _MAX_ARTIFACTS) -> None:
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, PlanArtifact] = OrderedDict()
+        self._max_entries = max_entries
+
+    def put(self, artifact: PlanArtifact) -> None:
+        with self._lock:
+            self._entries[artifact.artifact_id] = artifact
+            self._entries.move_to_end(artifact.artifact_id)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, artifact_id: str) -> PlanArtifact | None:
+        with self._lock:
+            artifact = self._entries.get(artifact_id)
+            if artifact is not None:
+                self._entries.move_to_end(artifact_id)
+            return artifact
+
+
+plan_artifacts = PlanArtifactStore()
@@ -0,0 +1,254 @@
+"""Single-flight coalescing and a bounded result LRU for the compute routes.
+
+Several GUI panels can ask for the same plan, simulation or preview at nearly
+the same time. Each compute request is keyed by a canonical hash of its body
+(:func:`cache_key`); :class:`ResultCache` then
+
+* serves a recent result from a bounded LRU (weighed in approximate bytes), or
+* joins an identical computation already in flight (single-flight), or
+* runs the computation itself and publishes the result to any joiners.
+
+Compute routes are pure functions of their request body and the package
+version, so the key doubles as a strong ``ETag``: a request whose
+``If-None-Match`` carries it is answered ``304`` without computing anything.
+
+A joiner never inherits the leader's cancellation. If the leader's plan is
+cancelled (its session was superseded or its client went away), joiners retry
+and the first of them becomes the new leader. A joiner stops waiting with
+:class:`~fiberpath.planning.PlanCancelledError` when its own token is cancelled.
+Other errors are shared with joiners (the same body fails the same way) but are
+never cached.
+
+The cache is used from the event loop only and needs no locking.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from importlib.metadata import version
+from typing import Any, TypeVar, cast
+
+from fastapi import Response
+from fiberpath.planning import CancellationToken, PlanCancelledError
+
+__all__ = [
+    "CacheNamespaceStats",
+    "ResultCache",
+    "cache_key",
+    "canonical_json",
+    "etag_matches",
+    "not_modified",
+    "quote_etag",
+    "result_cache",
+]
+
+T = TypeVar("T")
+
+# Default LRU budget: a few full programs plus their previews.
+_MAX_ENTRIES = 64
+_MAX_BYTES = 64 * 1024 * 1024
+
+# How often (seconds) a joiner checks its own cancellation token while waiting.
+_JOIN_POLL_S = 0.05
+
+# Results depend on the engine, so a new release never matches an old ETag.
+_ENGINE_VERSION = version("fiberpath")
+
+
+def canonical_json(payload: Any) -> str:
+    """Key-sorted, whitespace-free JSON: equal bodies hash equally."""
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def cache_key(namespace: str, body: str) -> str:
+    """``<namespace>-<sha256>`` of the engine version and a canonical request body."""
+    digest = hashlib.sha256()
+    digest.update(f"{_ENGINE_VERSION}\0{namespace}\0".encode())
+    digest.update(body.encode("utf-8"))
+    return f"{namespace}-{digest.hexdigest()}"
+
+
+def quote_etag(key: str) -> str:
+    return f'"{key}"'
+
+
+def etag_matches(if_none_match: str | None, key: str) -> bool:
+    """Whether an ``If-None-Match`` header value covers the strong ETag for ``key``."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        candidate = candidate.removeprefix("W/")
+        if candidate == quote_etag(key):
+            return True
+    return False
+
+
+def not_modified(key: str) -> Response:
+    return Response(status_code=304, headers={"ETag": quote_etag(key)})
+
+
+@dataclass(slots=True)
+class CacheNamespaceStats:
+    """Counters for one route's results (``plan``, ``simulate``, ...)."""
+
+    hits: int = 0
+    coalesced: int = 0
+    misses: int = 0
+    not_modified: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Requests answered without computing, out of all lookups."""
+        served = self.hits + self.coalesced
+        total = served + self.misses
+        return served / total if total else 0.0
+
+
+@dataclass(slots=True)
+class _Entry:
+    value: Any
+    weight: int
+
+
+@dataclass(slots=True)
+class _Stats:
+    namespaces: dict[str, CacheNamespaceStats] = field(default_factory=dict)
+    evictions: int = 0
+
+    def of(self, key: str) -> CacheNamespaceStats:
+        namespace = key.partition("-")[0]
+        stats = self.namespaces.get(namespace)
+        if stats is None:
+            stats = self.namespaces[namespace] = CacheNamespaceStats()
+        return stats
+
+
+class ResultCache:
+    """A bounded LRU of compute results with single-flight misses."""
+
+    def __init__(self, max_entries: int = _MAX_ENTRIES, max_bytes: int = _MAX_BYTES) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._bytes = 0
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+        self._stats = _Stats()
+
+    @property
+    def entries(self) -> int:
+        return len(self._entries)
+
+    @property
+    def bytes(self) -> int:
+        return self._bytes
+
+    @property
+    def evictions(self) -> int:
+        return self._stats.evictions
+
+    def stats(self) -> dict[str, CacheNamespaceStats]:
+        return dict(self._stats.namespaces)
+
+    def peek(self, key: str) -> Any:
+        """The cached result for ``key`` (None if absent), without touching the LRU or the stats."""
+        entry = self._entries.get(key)
+        return entry.value if entry is not None else None
+
+    def record_not_modified(self, key: str) -> None:
+        self._stats.of(key).not_modified += 1
+
+    def clear(self) -> None:
+        """Drop every cached result and reset the counters (in-flight work is unaffected)."""
+        self._entries.clear()
+        self._bytes = 0
+        self._stats = _Stats()
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[T]],
+        *,
+        weight: Callable[[T], int],
+        cancel_token: CancellationToken | None = None,
+    ) -> T:
+        """The cached result for ``key``, or the result of one shared ``compute()``.
+
+        ``weight(result)`` is the result's approximate size in bytes for the LRU
+        budget; a result heavier than the whole budget is returned but not kept.
+        """
+        stats = self._stats.of(key)
+        while True:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                stats.hits += 1
+                return cast(T, entry.value)
+
+            future = self._inflight.get(key)
+            if future is None:
+                stats.misses += 1
+                return await self._lead(key, compute, weight)
+
+            stats.coalesced += 1
+            if await self._join(future, cancel_token):
+                return cast(T, future.result())
+            # The leader was cancelled; take over (or join whoever already did).
+            stats.coalesced -= 1
+
+    async def _lead(
+        self, key: str, compute: Callable[[], Awaitable[T]], weight: Callable[[T], int]
+    ) -> T:
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        # Nobody may be waiting; mark the outcome retrieved so asyncio doesn't log it.
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = future
+        try:
+            value = await compute()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            self._store(key, value, weight(value))
+            future.set_result(value)
+            return value
+        finally:
+            del self._inflight[key]
+
+    async def _join(
+        self, future: asyncio.Future[Any], cancel_token: CancellationToken | None
+    ) -> bool:
+        """Wait for a leader; ``False`` if it was cancelled and the caller should retry."""
+        while not future.done():
+            await asyncio.wait({future}, timeout=_JOIN_POLL_S)
+            if cancel_token is not None and not future.done():
+                cancel_token.raise_if_cancelled()
+        if future.cancelled() or isinstance(future.exception(), PlanCancelledError):
+            return False
+        return True
+
+    def _store(self, key: str, value: Any, weight: int) -> None:
+        if weight > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= previous.weight
+        self._entries[key] = _Entry(value=value, weight=weight)
+        self._bytes += weight
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.weight
+            self._stats.evictions += 1
+
+
+result_cache = ResultCache()
@@ -0,0 +1,169 @@
+"""Append-only recovery journal of the active machine job.
+
+Every record is a JSON object framed by a 4-byte big-endian payload length and
+the payload's CRC-32. A record is a partial update of the job's state: the
+``start`` record carries the whole of it (id, port, total, ``sent`` 0, state),
+each acknowledged line appends ``{"sent": n}``, and pause, resume and the
+terminal transition append ``{"state": ...}``. :func:`replay` folds the records
+in order, so the recovered state is exact to the last line whose record reached
+the file, and a torn or corrupt tail (a crash mid-write) is ignored.
+
+Records are written straight to the file, so a crash of the sidecar process
+loses none of them. ``fsync`` guards against a power cut as well; it is group
+committed, at most once per ``sync_interval_s`` while lines stream, and at once
+for the start, pause, resume and terminal records. A long job's journal is
+compacted into a single record every ``compact_records`` appends, and a job's
+journal is removed once its terminal record is written.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+import time
+import zlib
+from collections.abc import Iterator
+from pathlib import Path
+
+__all__ = ["JobJournal", "replay"]
+
+_FRAME = struct.Struct(">II")  # payload length, CRC-32 of the payload
+# Larger than any state record; a bigger length means a corrupt frame.
+_MAX_RECORD = 1 << 16
+
+
+def _encode(record: dict[str, object]) -> bytes:
+    payload = json.dumps(record, separators=(",", ":")).encode()
+    return _FRAME.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def _records(data: bytes) -> Iterator[dict[str, object]]:
+    offset = 0
+    while offset + _FRAME.size <= len(data):
+        length, checksum = _FRAME.unpack_from(data, offset)
+        start = offset + _FRAME.size
+        payload = data[start : start + length]
+        if length > _MAX_RECORD or len(payload) < length or zlib.crc32(payload) != checksum:
+            return  # torn or corrupt tail: nothing after it can be trusted
+        try:
+            record = json.loads(payload)
+        except ValueError:
+            return
+        if not isinstance(record, dict):
+            return
+        yield record
+        offset = start + length
+
+
+def replay(path: Path) -> dict[str, object] | None:
+    """The job state ``path`` records, or None when it holds no readable record.
+
+    Raises OSError when the file cannot be read.
+    """
+    state: dict[str, object] | None = None
+    for record in _records(path.read_bytes()):
+        state = record if state is None else {**state, **record}
+    return state
+
+
+class JobJournal:
+    """Writes one job's journal at ``path`` (see the module docstring).
+
+    Best-effort like the snapshot it replaces: I/O errors are swallowed, since
+    a journal write must never break a live stream. Not thread-safe; the
+    machine service calls it under its lock.
+    """
+
+    def __init__(
+        self, path: Path, sync_interval_s: float = 0.5, compact_records: int = 65536
+    ) -> None:
+        if sync_interval_s < 0:
+            raise ValueError("sync_interval_s must be non-negative")
+        if compact_records < 1:
+            raise ValueError("compact_records must be at least 1")
+        self.path = path
+        self.sync_interval_s = sync_interval_s
+        self.compact_records = compact_records
+        self._fd: int | None = None
+        self._state: dict[str, object] = {}
+        self._records = 0
+        self._dirty = False
+        self._last_sync = 0.0
+
+    def start(self, state: dict[str, object]) -> None:
+        """Begin a job's journal with its full ``state``, replacing any previous one."""
+        self._close()
+        self._state = dict(state)
+        self._rewrite()
+
+    def append(self, update: dict[str, object], *, sync: bool = False) -> None:
+        """Record ``update``; ``sync`` forces it to disk now instead of at the next group commit."""
+        if self._fd is None:
+            return
+        self._state.update(update)
+        self._records += 1
+        if self._records >= self.compact_records:
+            self._rewrite()
+            return
+        try:
+            os.write(self._fd, _encode(update))
+        except OSError:
+            return
+        self._dirty = True
+        if sync or time.monotonic() - self._last_sync >= self.sync_interval_s:
+            self._sync()
+
+    def finish(self, state: str) -> None:
+        """Record the terminal ``state`` and drop the journal: nothing is left to recover."""
+        self.append({"state": state}, sync=True)
+        self.clear()
+
+    def clear(self) -> None:
+        """Close and remove the journal."""
+        self._close()
+        self._state = {}
+        try:
+            self.path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+    def _rewrite(self) -> None:
+        """Compact the journal into one record of the current state (atomic swap)."""
+        self._close()
+        tmp = self.path.with_suffix(".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, _encode(self._state))
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp, self.path)
+            self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND)
+        except OSError:
+            return
+        self._records = 0
+        self._dirty = False
+        self._last_sync = time.monotonic()
+
+    def _sync(self) -> None:
+        if self._fd is None or not self._dirty:
+            return
+        try:
+            os.fsync(self._fd)
+        except OSError:
+            pass
+        self._dirty = False
+        self._last_sync = time.monotonic()
+
+    def _close(self) -> None:
+        if self._fd is None:
+            return
+        self._sync()
+        try:
+            os.close(self._fd)
+        except OSError:
+            pass
+        self._fd = None
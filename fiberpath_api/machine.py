@@ -16,6 +16,48 @@ Concurrency model:
   streaming (not paused), so two threads never drive the transport at once.
 * ``emergency_stop`` is the safety path (issue #196): it writes M112 out-of-band
   via :meth:`MarlinHost.emergency_stop` and never waits on the lock.
+
+Every job gets a :class:`~fiberpath.streaming.StreamTelemetry` fed by the
+connection's :class:`~fiberpath.streaming.TelemetryTransport`; its figures are
+served by :meth:`MachineService.metrics` and attached to the terminal event.
+
+A job started with :class:`~fiberpath.streaming.SdOptions` runs in SD mode: the
+worker drives a :class:`~fiberpath.streaming.SdOffload`, which uploads the
+program to the controller's SD card and prints it from there. Its progress
+events carry a ``phase`` (``upload`` or ``print``), and pause/resume/cancel go
+through the offload, which sends ``M25``/``M24``/``M524`` once printing. The
+card prints on its own, so a sidecar crash does not stop the print: connecting
+with ``reset=False`` re-attaches the orphaned job and follows it through ``M27``.
+
+A job started from a :class:`~fiberpath.config.WindDefinition` is planned while
+it streams: a :class:`~fiberpath.streaming.PlanStream` validates it, then plans
+it layer by layer into a bounded buffer that the worker drains, so the first
+line goes out without waiting for the whole plan. Its ``total`` grows as layers
+are planned and is final once ``planning`` turns False. (Queued and SD jobs
+need the whole program, so their definitions are planned in full up front.)
+
+Any other program started at once is streamed from where it already is: the
+file on this host, the request's text or a plan artifact's lines. It is
+validated a slice at a time, which also counts its ``total``, and the worker
+reads it again to stream it through :func:`~fiberpath.streaming.stream_slices`,
+so no list of its commands is built (as ``fiberpath stream`` does with a
+:class:`~fiberpath.streaming.GcodeSource`).
+
+Jobs can also be queued (:meth:`MachineService.enqueue_job`). A queued job is
+compiled and validated when it is queued (against a machine profile, if given),
+outside ``_lock``, so the worker starts the next one as soon as the previous job
+completes and queueing never stalls a live stream. The queue is ordered by
+priority, first in first out within a priority, and is persisted next to the
+recovery snapshot: each program is spooled to its own file once, when it is
+queued, and only the queue's small index is rewritten under the lock. A job
+queued with ``hold`` waits at the head of the queue until it is started
+explicitly. So does the head after a job that did not complete, and every job
+restored at startup.
+
+Each job of up to ``_TIMING_MAX_LINES`` lines also records when every line's
+``ok`` arrived. Streamed jobs that complete without a pause are kept (the last few, per port) as
+:class:`~fiberpath.simulation.TimingRecord` s, and :meth:`MachineService.calibrate`
+fits a machine profile's time calibration to them.
 """
 
 from __future__ import annotations
@@ -25,9 +67,34 @@ import os
 import tempfile
 import threading
 import time
-from dataclasses import dataclass, field
+from bisect import bisect_right
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import asdict, dataclass, field
+from functools import partial
+from itertools import accumulate
 from pathlib import Path
 
+from fiberpath.config import MachineProfile, WindDefinition, default_machine_profile
+from fiberpath.emulator import register_url_handler
+from fiberpath.gcode import ProgramReadError, read_program
+from fiberpath.gcode.dialects import dialect_from_profile
+from fiberpath.gcode.reader import HEADER_PREFIX
+from fiberpath.planning import PlanningError, PlanOptions, PlanResult, plan_wind
+from fiberpath.simulation import CalibrationError, TimingRecord, fit_time_calibration
+from fiberpath.streaming import (
+    PlanStream,
+    SdOffload,
+    SdOptions,
+    SdProgress,
+    StreamTelemetry,
+    TelemetryTransport,
+    iter_commands,
+    iter_lines,
+    slice_commands,
+    split_sd_files,
+    stream_slices,
+)
 from marlin_host import (
     HaltError,
     HostError,
@@ -40,7 +107,10 @@ from marlin_host import (
     list_ports,
 )
 
+from .journal import JobJournal, replay
+
 __all__ = [
+    "GCODE_SUFFIXES",
     "MachineService",
     "MachineError",
     "MachineBusyError",
@@ -51,8 +121,17 @@ __all__ = [
 
 # Job states that mean a job still owns the serial port.
 _ACTIVE_JOB_STATES = ("streaming", "paused")
-# How often (seconds) to refresh the on-disk recovery snapshot while streaming.
-_PERSIST_THROTTLE_S = 1.0
+# Group-commit interval (seconds) of the recovery journal's fsync while streaming.
+_JOURNAL_SYNC_S = 0.5
+# Completed jobs kept for time calibration.
+_TIMING_RECORDS = 8
+# Longest job whose lines and ack times are kept for calibration; a longer one
+# would hold its whole program in memory until it ends.
+_TIMING_MAX_LINES = 50_000
+# Finished jobs that stay pollable after the next one starts.
+_JOB_HISTORY = 16
+# The only files a job may be started from by path.
+GCODE_SUFFIXES = (".gcode", ".gco", ".g", ".nc")
 
 
 def _default_state_path() -> Path:
@@ -65,6 +144,21 @@ def _default_state_path() -> Path:
     return Path(tempfile.gettempdir()) / "fiberpath-api" / "machine-job.json"
 
 
+def _journal_path(state_path: Path) -> Path:
+    """The active job's recovery journal, beside the recovery snapshot."""
+    return state_path.with_suffix(".journal")
+
+
+def _queue_path(state_path: Path) -> Path:
+    """The persisted job queue, beside the recovery snapshot."""
+    return state_path.with_name("machine-queue.json")
+
+
+def _spool_dir(state_path: Path) -> Path:
+    """The queued jobs' programs, one file each, beside the persisted queue."""
+    return state_path.with_name("machine-queue.d")
+
+
 def _job_number(job_id: str) -> int:
     """Parse the counter out of a ``job-N`` id (0 if it doesn't match)."""
     try:
@@ -89,6 +183,35 @@ class MachineConflictError(MachineError):
     """The request conflicts with current state, e.g. already connected (HTTP 409)."""
 
 
+def _file_lines(path: Path) -> Iterator[str]:
+    with path.open(encoding="utf-8") as file:
+        yield from file
+
+
+class _ProgramSource:
+    """A validated program that the worker streams a slice at a time.
+
+    ``lines`` reads the program again on each call, from wherever it already is.
+    """
+
+    def __init__(self, lines: Callable[[], Iterable[str]], total: int) -> None:
+        self._lines = lines
+        self.total = total
+        self._stopped = False
+
+    def stream(self, host: MarlinHost) -> Iterator[StreamProgress]:
+        return stream_slices(
+            host,
+            slice_commands(iter_commands(self._lines())),
+            lambda: self.total,
+            lambda: self._stopped,
+        )
+
+    def stop(self) -> None:
+        """End :meth:`stream` before its next slice (``MarlinHost.stop`` ends the current one)."""
+        self._stopped = True
+
+
 @dataclass
 class JobEvent:
     """One entry in a job's monotonic event log."""
@@ -100,18 +223,49 @@ class JobEvent:
     command: str | None = None
     action: str | None = None
     message: str | None = None
+    # The job's telemetry, on its terminal event.
+    metrics: dict[str, object] | None = None
+    # SD-mode progress: "upload" or "print".
+    phase: str | None = None
 
 
 @dataclass
 class Job:
-    """A single streaming job. Only one exists at a time."""
+    """A streaming job: queued, running (only one at a time) or finished."""
 
     id: str
     total: int
     sent: int = 0
-    state: str = "streaming"  # streaming|paused|completed|cancelled|error|orphaned
+    state: str = "streaming"  # queued|streaming|paused|completed|cancelled|error|orphaned
     error: str | None = None
+    priority: int = 0
+    # Wait at the head of the queue until started explicitly.
+    hold: bool = False
+    # The compiled program, kept until the job starts.
+    commands: list[str] = field(default_factory=list, repr=False)
+    # A queued job's program on disk (see ``_spool``), written once when it is queued.
+    spool: Path | None = field(default=None, repr=False)
+    sd: SdOptions | None = field(default=None, repr=False)
+    mode: str = "stream"  # stream|sd
+    # SD mode: the phase of the latest progress event.
+    phase: str | None = None
+    # SD mode: each file's name, lines and bytes on the card (SdOffload.layout).
+    sd_layout: list[tuple[str, int, int]] | None = field(default=None, repr=False)
+    # Re-attached after a crash: the file the card was printing (SdOffload.follow).
+    follow_part: int | None = None
+    offload: SdOffload | None = field(default=None, repr=False)
+    # A job started from a definition: planned while it streams.
+    plan: PlanStream | None = field(default=None, repr=False)
+    # A job started at once: its program, read as it streams (dropped once it ends).
+    source: _ProgramSource | None = field(default=None, repr=False)
     events: list[JobEvent] = field(default_factory=list)
+    telemetry: StreamTelemetry = field(default_factory=StreamTelemetry, repr=False)
+    # The program's "; Parameters" header, if it had one (calibration needs it).
+    header: str | None = field(default=None, repr=False)
+    # Each line and the monotonic time of its ok, in stream order, for calibration;
+    # both None once the job runs past _TIMING_MAX_LINES.
+    timed: list[str] | None = field(default_factory=list, repr=False)
+    ack_times: list[float] | None = field(default_factory=list, repr=False)
     # seq is 1-based so the default poll cursor (since=0) returns every event.
     _next_seq: int = 1
 
@@ -130,9 +284,12 @@ class Job:
 class MachineService:
     """Owns the serial port and the background streaming job."""
 
-    def __init__(self, state_path: Path | None = None) -> None:
+    def __init__(
+        self, state_path: Path | None = None, journal_sync_s: float = _JOURNAL_SYNC_S
+    ) -> None:
         self._lock = threading.RLock()
         self._host: MarlinHost | None = None
+        self._transport: TelemetryTransport | None = None
         self._port: str | None = None
         self._baud_rate: int | None = None
         self._state = "disconnected"
@@ -140,8 +297,15 @@ class MachineService:
         self._thread: threading.Thread | None = None
         self._job_counter = 0
         self._state_path = state_path if state_path is not None else _default_state_path()
-        self._last_persist = 0.0
+        self._journal = JobJournal(_journal_path(self._state_path), journal_sync_s)
+        # Timings of recent clean jobs on ``_timing_port``, for calibrate().
+        self._timings: deque[TimingRecord] = deque(maxlen=_TIMING_RECORDS)
+        self._timing_port: str | None = None
+        # Waiting jobs, in start order, and recently finished ones.
+        self._queue: list[Job] = []
+        self._history: deque[Job] = deque(maxlen=_JOB_HISTORY)
         self._recover_orphaned()
+        self._recover_queue()
 
     # -- introspection -----------------------------------------------------
 
@@ -149,17 +313,45 @@ class MachineService:
     def state(self) -> str:
         return self._state
 
+    @property
+    def port(self) -> str | None:
+        """The connected port, if any."""
+        return self._port
+
+    def summary(self) -> dict[str, object]:
+        """Connection state and the current (or last) job, at a glance."""
+        with self._lock:
+            job = self._job
+            return {
+                "port": self._port,
+                "state": self._state,
+                "job_id": job.id if job is not None else None,
+                "job_state": job.state if job is not None else None,
+                "queued": len(self._queue),
+            }
+
     def list_serial_ports(self) -> list[PortInfo]:
         ports: list[PortInfo] = list_ports()
         return ports
 
     # -- connection lifecycle ---------------------------------------------
 
-    def connect(self, port: str, baud_rate: int, timeout: float) -> dict[str, object]:
+    def connect(
+        self, port: str, baud_rate: int, timeout: float, *, reset: bool = True
+    ) -> dict[str, object]:
+        """Open ``port``; ``reset=False`` leaves the controller running (no DTR pulse).
+
+        Without a reset, an orphaned SD job whose card is still printing is
+        re-attached and followed to the end.
+        """
         with self._lock:
             if self._host is not None and self._host.is_connected:
                 raise MachineConflictError("already connected; disconnect first")
-            transport = SerialTransport(port, baud_rate, timeout=timeout)
+            # ``marlinemu://`` ports open the bundled controller emulator.
+            register_url_handler()
+            transport = TelemetryTransport(
+                SerialTransport(port, baud_rate, timeout=timeout, reset_on_open=reset)
+            )
             host = MarlinHost(
                 transport,
                 reliable=True,
@@ -168,12 +360,20 @@ class MachineService:
             )
             host.connect()
             self._host = host
+            self._transport = transport
+            if port != self._timing_port:
+                self._timings.clear()  # another machine: its timings don't apply
+                self._timing_port = port
             self._port = port
             self._baud_rate = baud_rate
             self._state = "connected"
             profile = host.profile
             firmware = profile.firmware if profile is not None else ""
             capabilities = dict(profile.caps) if profile is not None else {}
+            if not reset:
+                self._reattach(host)
+            # A job queued while disconnected starts now, unless it is held.
+            self._advance_queue()
             return {
                 "state": self._state,
                 "port": port,
@@ -190,6 +390,7 @@ class MachineService:
             if self._host is not None:
                 self._host.close()
             self._host = None
+            self._transport = None
             self._port = None
             self._baud_rate = None
             self._state = "disconnected"
@@ -202,11 +403,9 @@ class MachineService:
             host = self._host
             job = self._job
             active = job is not None and job.state in _ACTIVE_JOB_STATES
-            if active and host is not None:
-                host.resume()  # unblock a paused stream so stop() takes effect
-                host.stop()
-                if job is not None:
-                    job.state = "cancelled"
+            if active and host is not None and job is not None:
+                self._stop(host, job)
+                job.state = "cancelled"
         if thread is not None and thread.is_alive():
             thread.join(timeout=10.0)
 
@@ -215,63 +414,450 @@ class MachineService:
     def send_command(self, gcode: str) -> list[str]:
         with self._lock:
             host = self._require_host()
-            if self._job is not None and self._job.state == "streaming":
+            job = self._job
+            if job is not None and job.state == "streaming":
                 raise MachineBusyError("a job is streaming; pause it before sending commands")
+            if (
+                job is not None
+                and job.state == "paused"
+                and job.mode == "sd"
+                and job.phase != "print"
+            ):
+                # M28 is still open: the card would store the command, not run it.
+                raise MachineBusyError("the program is being written to the SD card")
             result = host.query(gcode)
             return [str(r.raw) for r in result]
 
     # -- jobs --------------------------------------------------------------
 
-    def start_job(self, gcode: str) -> dict[str, object]:
+    def start_job(
+        self,
+        gcode: str | Path | Iterable[str] | WindDefinition,
+        sd: SdOptions | None = None,
+        profile: MachineProfile | None = None,
+    ) -> dict[str, object]:
+        """Stream ``gcode`` on a background worker, or offload it to the SD card with ``sd``.
+
+        ``gcode`` is a program, its lines (read once, as they are filtered, e.g.
+        from a :class:`~fiberpath.streaming.GcodeSource`) or the path of a G-code
+        file on this host, which is read the same way. With ``profile``,
+        the program must read under its axis mapping and use only its
+        ``requiredGcodes``. A definition is planned for ``profile`` (the
+        bundled one by default) and streamed while it is planned; ``total`` is
+        then the number of lines planned so far.
+        """
+        with self._lock:
+            self._require_host()
+            if self._active():
+                raise MachineConflictError("a job is already active")
+        # Plan, compile and validate without the lock (see enqueue_job): planning
+        # a definition in full, for SD, can take seconds.
+        plan: PlanStream | None = None
+        source: _ProgramSource | None = None
+        if sd is not None:
+            commands, header = self._prepare(gcode, sd=sd, profile=profile)
+        elif isinstance(gcode, WindDefinition):
+            plan = self._prepare_planned(gcode, profile)
+        else:
+            source, header = self._prepare_source(gcode, profile)
+        with self._lock:
+            try:
+                host = self._require_host()
+                if self._active():  # another request started one meanwhile
+                    raise MachineConflictError("a job is already active")
+            except MachineError:
+                if plan is not None:
+                    plan.close()
+                raise
+            if plan is not None:
+                plan.start()
+                self._job_counter += 1
+                job = Job(id=f"job-{self._job_counter}", total=plan.planned, plan=plan)
+            elif source is not None:
+                self._job_counter += 1
+                job = Job(
+                    id=f"job-{self._job_counter}",
+                    total=source.total,
+                    header=header,
+                    source=source,
+                )
+            else:
+                job = self._new_job(commands, header, sd=sd)
+            self._launch(host, job)
+            return {"job_id": job.id, "total": job.total}
+
+    def enqueue_job(
+        self,
+        gcode: str | Path | Iterable[str] | WindDefinition,
+        *,
+        priority: int = 0,
+        hold: bool = False,
+        sd: SdOptions | None = None,
+        profile: MachineProfile | None = None,
+    ) -> dict[str, object]:
+        """Validate and compile ``gcode`` now, and run it when its turn comes.
+
+        Higher ``priority`` runs first. The job starts at once if the machine is
+        connected and idle, unless it is held.
+        """
+        # Planning, compiling and validating take a while on a large program, and
+        # the worker takes the lock on every acked line: do them without it.
+        commands, header = self._prepare(gcode, sd=sd, profile=profile)
+        spool = self._spool(commands)
+        with self._lock:
+            job = self._new_job(commands, header, sd=sd, priority=priority, hold=hold)
+            job.spool = spool
+            # After every job of the same or higher priority: FIFO within a priority.
+            position = next(
+                (index for index, queued in enumerate(self._queue) if queued.priority < priority),
+                len(self._queue),
+            )
+            self._queue.insert(position, job)
+            self._persist_queue()
+            self._advance_queue()
+            return self._queue_entry(job)
+
+    def start_queued(self, job_id: str) -> dict[str, object]:
+        """Start a queued job now (it may be held, or behind others)."""
         with self._lock:
             host = self._require_host()
-            if self._job is not None and self._job.state in _ACTIVE_JOB_STATES:
+            if self._active():
                 raise MachineConflictError("a job is already active")
-            commands = self._compile(gcode)
-            self._job_counter += 1
-            job = Job(id=f"job-{self._job_counter}", total=len(commands))
-            self._job = job
-            self._state = "streaming"
-            self._last_persist = time.monotonic()
-            self._persist_job()
-            thread = threading.Thread(
-                target=self._run_job,
-                args=(host, job, commands),
-                name=f"machine-{job.id}",
-                daemon=True,
+            job = self._lookup(job_id)
+            if job not in self._queue:
+                raise MachineConflictError(f"{job_id} is not queued")
+            self._queue.remove(job)
+            self._persist_queue()
+            self._launch(host, job)
+        return self.get_job(job_id)
+
+    def queue(self) -> dict[str, object]:
+        """The running job's id (if any) and the waiting jobs, in start order."""
+        with self._lock:
+            active = self._job.id if self._active() and self._job is not None else None
+            return {"active": active, "jobs": [self._queue_entry(job) for job in self._queue]}
+
+    def _queue_entry(self, job: Job) -> dict[str, object]:
+        position = self._queue.index(job) + 1 if job in self._queue else 0
+        return {
+            "job_id": job.id,
+            "state": job.state,
+            "total": job.total,
+            "mode": job.mode,
+            "priority": job.priority,
+            "hold": job.hold,
+            "position": position,
+        }
+
+    def _active(self) -> bool:
+        return self._job is not None and self._job.state in _ACTIVE_JOB_STATES
+
+    def _prepare(
+        self,
+        gcode: str | Path | Iterable[str] | WindDefinition,
+        *,
+        sd: SdOptions | None,
+        profile: MachineProfile | None,
+    ) -> tuple[list[str], str | None]:
+        """Plan, compile and validate a program; needs no lock (it touches no state)."""
+        if isinstance(gcode, WindDefinition):
+            gcode = self._plan(gcode, profile).commands
+        if isinstance(gcode, Path):
+            commands, header = self._compile_file(gcode)
+        else:
+            commands, header = self._compile(gcode)
+        self._validate(commands, header, profile)
+        if sd is not None:
+            try:
+                split_sd_files(commands, sd)
+            except ValueError as exc:
+                raise MachineError(f"cannot offload to SD: {exc}") from exc
+        return commands, header
+
+    def _prepare_source(
+        self, gcode: str | Path | Iterable[str], profile: MachineProfile | None
+    ) -> tuple[_ProgramSource, str | None]:
+        """Validate a program to stream at once, reading it a slice at a time (no lock needed).
+
+        The source reads the program from the file, the text or the list of
+        lines it came as. Lines that can be read only once are compiled first.
+        """
+        lines: Callable[[], Iterable[str]]
+        if isinstance(gcode, Path):
+            self._check_file(gcode)
+            lines = partial(_file_lines, gcode)
+        elif isinstance(gcode, str):
+            lines = partial(iter_lines, gcode)
+        elif isinstance(gcode, Sequence):
+            lines = partial(iter, gcode)
+        else:
+            commands, header = self._compile(gcode)
+            total = self._validate(commands, header, profile)
+            return _ProgramSource(partial(iter, commands), total), header
+        try:
+            header = self._header(lines())
+            total = self._validate(iter_commands(lines()), header, profile)
+        except (OSError, UnicodeDecodeError) as exc:
+            raise MachineError(f"cannot read {gcode}: {exc}") from exc
+        return _ProgramSource(lines, total), header
+
+    def _new_job(
+        self,
+        commands: list[str],
+        header: str | None,
+        *,
+        sd: SdOptions | None,
+        priority: int = 0,
+        hold: bool = False,
+    ) -> Job:
+        """A queued :class:`Job` for a prepared program, with the next id (call under ``_lock``)."""
+        self._job_counter += 1
+        return Job(
+            id=f"job-{self._job_counter}",
+            total=len(commands),
+            state="queued",
+            header=header,
+            mode="stream" if sd is None else "sd",
+            priority=priority,
+            hold=hold,
+            commands=commands,
+            sd=sd,
+        )
+
+    @staticmethod
+    def _prepare_planned(definition: WindDefinition, profile: MachineProfile | None) -> PlanStream:
+        """Validate ``definition`` into a plan to stream as it is planned (no lock needed)."""
+        options = PlanOptions(profile=profile or default_machine_profile())
+        try:
+            return PlanStream(definition, options)
+        except PlanningError as exc:
+            raise MachineError(f"invalid definition: {exc}") from exc
+
+    @staticmethod
+    def _plan(definition: WindDefinition, profile: MachineProfile | None) -> PlanResult:
+        options = PlanOptions(profile=profile or default_machine_profile())
+        try:
+            return plan_wind(definition, options)
+        except PlanningError as exc:
+            raise MachineError(f"invalid definition: {exc}") from exc
+
+    @staticmethod
+    def _validate(
+        commands: Iterable[str], header: str | None, profile: MachineProfile | None
+    ) -> int:
+        """Check the program reads and uses only ``profile``'s G-codes; its number of commands.
+
+        Read a slice at a time (each line reads on its own), so ``commands`` may
+        be lazy and no whole program of moves is built.
+        """
+        dialect = dialect_from_profile(profile) if profile is not None else None
+        opcodes: set[str] = set()
+        total = 0
+        for piece in slice_commands(commands):
+            if header is not None:
+                try:
+                    read_program([header, *piece], dialect=dialect)
+                except (ProgramReadError, ValueError, KeyError) as exc:
+                    raise MachineError(f"invalid program: {exc}") from exc
+            opcodes.update(command.split(None, 1)[0].upper() for command in piece)
+            total += len(piece)
+        if profile is None:
+            return total
+        unsupported = sorted(opcodes - set(profile.required_gcodes))
+        if unsupported:
+            raise MachineError(
+                f"program uses {', '.join(unsupported)}, which profile {profile.id!r} "
+                "does not list in requiredGcodes"
             )
-            self._thread = thread
-            thread.start()
-            return {"job_id": job.id, "total": job.total}
+        return total
+
+    def _launch(self, host: MarlinHost, job: Job) -> None:
+        """Start ``job`` on a new worker thread (call under ``_lock``)."""
+        if self._job is not None and self._job is not job:
+            self._history.append(self._job)
+        commands, job.commands = job.commands, []
+        self._drop_spool(job)
+        if job.sd is not None and job.offload is None:  # (a re-attached job has one)
+            job.offload = SdOffload(host, commands, job.sd)
+            job.sd_layout = job.offload.layout
+        if self._transport is not None:
+            self._transport.telemetry = job.telemetry
+        job.state = "streaming"
+        self._job = job
+        self._state = "streaming"
+        self._persist_job()
+        thread = threading.Thread(
+            target=self._run_job,
+            args=(host, job, commands),
+            name=f"machine-{job.id}",
+            daemon=True,
+        )
+        self._thread = thread
+        thread.start()
+
+    def _advance_queue(self) -> None:
+        """Start the queue's head if the machine is idle and it is not held (under ``_lock``)."""
+        if not self._queue or self._active() or self._queue[0].hold:
+            return
+        if self._host is None or not self._host.is_connected or self._state == "error":
+            return
+        job = self._queue.pop(0)
+        self._persist_queue()
+        self._launch(self._host, job)
+
+    def _hold_queue(self) -> None:
+        """Stop the queue after a job that did not complete (call under ``_lock``)."""
+        if self._queue and not self._queue[0].hold:
+            self._queue[0].hold = True
+            self._persist_queue()
+
+    @classmethod
+    def _compile_file(cls, path: Path) -> tuple[list[str], str | None]:
+        """:meth:`_compile` a G-code file on this host, reading it a line at a time.
+
+        Only regular files with a :data:`GCODE_SUFFIXES` suffix: a FIFO or device
+        would block or never end, and any other file is not a program to send
+        to the controller (its lines come back in the job's events).
+        """
+        cls._check_file(path)
+        try:
+            with path.open(encoding="utf-8") as file:
+                return cls._compile(file)
+        except (OSError, UnicodeDecodeError) as exc:
+            raise MachineError(f"cannot read {path}: {exc}") from exc
+
+    @staticmethod
+    def _check_file(path: Path) -> None:
+        """Refuse a path that is not a regular G-code file (see :meth:`_compile_file`)."""
+        if path.suffix.lower() not in GCODE_SUFFIXES:
+            raise MachineError(
+                f"cannot read {path}: not a G-code file ({', '.join(GCODE_SUFFIXES)})"
+            )
+        if not path.is_file():
+            raise MachineError(f"cannot read {path}: not a regular file")
 
     @staticmethod
-    def _compile(gcode: str) -> list[str]:
-        """Filter to streamable lines, matching MarlinHost.stream's own filter."""
-        lines = [stripped for line in gcode.splitlines() if (stripped := line.strip())]
-        return [line for line in lines if not line.startswith(";")]
+    def _header(lines: Iterable[str]) -> str | None:
+        """The program's ``; Parameters`` header: a comment before its first command."""
+        for line in lines:
+            stripped = line.strip()
+            if stripped.startswith(HEADER_PREFIX):
+                return stripped
+            if stripped and not stripped.startswith(";"):
+                return None
+        return None
+
+    @staticmethod
+    def _compile(gcode: str | Iterable[str]) -> tuple[list[str], str | None]:
+        """Filter to streamable lines (MarlinHost.stream's own filter) and find the header.
+
+        One lazy pass over the program or its lines, so no copy of the raw
+        lines is made alongside the commands.
+        """
+        lines = iter_lines(gcode) if isinstance(gcode, str) else gcode
+        commands: list[str] = []
+        header: str | None = None
+        for line in lines:
+            stripped = line.strip()
+            if not stripped.startswith(";"):
+                if stripped:
+                    commands.append(stripped)
+            elif not commands and header is None and stripped.startswith(HEADER_PREFIX):
+                header = stripped  # the header leads the program
+        return commands, header
 
     def _run_job(self, host: MarlinHost, job: Job, commands: list[str]) -> None:
         try:
-            for progress in host.stream(commands):
-                self._on_progress(progress)
-        except (HostError, HaltError, ProtocolError) as exc:
+            if job.offload is not None:
+                offload = job.offload
+                runs = offload.run() if job.follow_part is None else offload.follow(job.follow_part)
+                for sd_progress in runs:
+                    self._on_sd_progress(sd_progress)
+            elif job.plan is not None:
+                for progress in job.plan.stream(host):
+                    self._on_progress(progress)
+                job.header = job.plan.header
+            elif job.source is not None:
+                try:
+                    for progress in job.source.stream(host):
+                        self._on_progress(progress)
+                finally:
+                    job.source = None  # the job stays in the history; its program need not
+            else:
+                for progress in host.stream(commands):
+                    self._on_progress(progress)
+        except (
+            HostError,
+            HaltError,
+            ProtocolError,
+            PlanningError,
+            OSError,  # the file being streamed became unreadable
+            UnicodeDecodeError,
+        ) as exc:
+            self._detach_telemetry(job)
             with self._lock:
                 job.error = str(exc)
                 job.state = "error"
-                job.append("error", message=str(exc))
+                job.append("error", message=str(exc), metrics=asdict(job.telemetry.snapshot()))
                 self._state = "error"
                 self._clear_persisted()
+                self._hold_queue()
         else:
+            self._detach_telemetry(job)
             with self._lock:
                 if job.state not in ("cancelled", "error"):
                     job.state = "completed"
-                    job.append("complete")
+                    metrics = job.telemetry.snapshot()
+                    job.append("complete", metrics=asdict(metrics))
+                    if job.mode == "stream":
+                        self._keep_timing(job, paused=metrics.paused_s > 0.0)
                 if self._state != "error":
                     self._state = "connected"
                 self._clear_persisted()
+                if job.state == "completed":
+                    self._advance_queue()
+                else:
+                    self._hold_queue()
+
+    def _detach_telemetry(self, job: Job) -> None:
+        """Freeze ``job``'s telemetry and stop the connection timing into it.
+
+        Manual commands sent after the job would otherwise count as its lines,
+        and the idle gap before them as a stall.
+        """
+        with self._lock:  # a manual command may be sent once the job is cancelled
+            transport = self._transport
+            if transport is not None and transport.telemetry is job.telemetry:
+                transport.telemetry = StreamTelemetry()
+        job.telemetry.finish()
+
+    def _keep_timing(self, job: Job, *, paused: bool) -> None:
+        """Keep a completed job's ack times for calibration (call under ``_lock``).
+
+        A pause stretches the ack gaps it falls in, so paused jobs are dropped,
+        and so are jobs too long to have been timed (see :meth:`_time_line`).
+        """
+        if paused or job.header is None or job.timed is None or job.ack_times is None:
+            return
+        self._timings.append(TimingRecord(job.header, job.timed, job.ack_times))
+
+    @staticmethod
+    def _time_line(job: Job, command: str) -> None:
+        """Record ``command``'s ack time, until the job outgrows :data:`_TIMING_MAX_LINES`."""
+        if job.timed is None or job.ack_times is None:
+            return
+        if len(job.timed) >= _TIMING_MAX_LINES:
+            job.timed = job.ack_times = None
+            return
+        job.ack_times.append(time.monotonic())
+        job.timed.append(command)
 
     def _on_progress(self, progress: StreamProgress) -> None:
-        with self._lock:
+        job = self._job
+        if job is None:
+            return
+        self._time_line(job, progress.command)
+        with job.telemetry.acquire(self._lock):
             if self._job is not None:
                 self._job.sent = progress.commands_sent
                 self._job.append(
@@ -280,12 +866,32 @@ class MachineService:
                     total=progress.total_commands,
                     command=progress.command,
                 )
-                # Refresh the recovery snapshot's progress, throttled to keep a
-                # long job from rewriting the file on every line.
-                now = time.monotonic()
-                if now - self._last_persist >= _PERSIST_THROTTLE_S:
-                    self._last_persist = now
-                    self._persist_job()
+                if self._job.total != progress.total_commands:  # a job still being planned
+                    self._job.total = progress.total_commands
+                    self._journal.append(
+                        {"sent": progress.commands_sent, "total": progress.total_commands}
+                    )
+                else:
+                    self._journal.append({"sent": progress.commands_sent})
+
+    def _on_sd_progress(self, progress: SdProgress) -> None:
+        job = self._job
+        if job is None:
+            return
+        with job.telemetry.acquire(self._lock):
+            if self._job is not None:
+                self._job.sent = progress.lines
+                if self._job.phase != progress.phase:
+                    self._job.phase = progress.phase
+                    self._journal.append({"sent": progress.lines, "phase": progress.phase})
+                else:
+                    self._journal.append({"sent": progress.lines})
+                self._job.append(
+                    "progress",
+                    sent=progress.lines,
+                    total=progress.total_lines,
+                    phase=progress.phase,
+                )
 
     def _record_action(self, response: MarlinResponse) -> None:
         with self._lock:
@@ -304,6 +910,8 @@ class MachineService:
                     "command": e.command,
                     "action": e.action,
                     "message": e.message,
+                    "metrics": e.metrics,
+                    "phase": e.phase,
                 }
                 for e in job.events
                 if e.seq > since
@@ -314,44 +922,98 @@ class MachineService:
                 "sent": job.sent,
                 "total": job.total,
                 "error": job.error,
+                "mode": job.mode,
+                "phase": job.phase,
+                "priority": job.priority,
+                "hold": job.hold,
+                "planning": job.plan is not None and job.plan.planning,
                 "cursor": job.cursor,
                 "events": events,
             }
 
     def pause_job(self, job_id: str) -> dict[str, object]:
         with self._lock:
-            job = self._lookup(job_id)
+            job = self._lookup_active(job_id)
             host = self._require_host()
-            host.pause()
+            if job.offload is not None:
+                job.offload.pause()
+            else:
+                host.pause()
+            job.telemetry.pause()
             if job.state == "streaming":
                 job.state = "paused"
             self._state = "paused"
-            self._persist_job()
+            self._journal.append({"state": job.state}, sync=True)
         return self.get_job(job_id)
 
     def resume_job(self, job_id: str) -> dict[str, object]:
         with self._lock:
-            job = self._lookup(job_id)
+            job = self._lookup_active(job_id)
             host = self._require_host()
-            host.resume()
+            if job.offload is not None:
+                job.offload.resume()
+            else:
+                host.resume()
+            job.telemetry.resume()
             if job.state == "paused":
                 job.state = "streaming"
             self._state = "streaming"
-            self._persist_job()
+            self._journal.append({"state": job.state}, sync=True)
         return self.get_job(job_id)
 
     def cancel_job(self, job_id: str) -> dict[str, object]:
         with self._lock:
             job = self._lookup(job_id)
-            host = self._require_host()
-            host.resume()  # unblock a paused stream so stop() ends it
-            host.stop()
-            if job.state in _ACTIVE_JOB_STATES:
+            if job in self._queue:
+                # Never started: drop it from the queue.
+                self._queue.remove(job)
+                self._persist_queue()
                 job.state = "cancelled"
+                job.commands = []
+                self._drop_spool(job)
+                self._history.append(job)
+                return self.get_job(job_id)
+            job = self._lookup_active(job_id)
+            host = self._require_host()
+            self._stop(host, job)
+            job.telemetry.resume()
+            job.state = "cancelled"
             self._clear_persisted()
             # Stay connected; the worker returns from stream() and settles state.
         return self.get_job(job_id)
 
+    def metrics(self) -> dict[str, object]:
+        """Telemetry of the current job, or of the last one once it ended."""
+        with self._lock:
+            job = self._job
+            if job is None:
+                return {"job_id": None, "job_state": None, "metrics": None}
+            return {
+                "job_id": job.id,
+                "job_state": job.state,
+                "metrics": asdict(job.telemetry.snapshot()),
+            }
+
+    def calibrate(self, profile: MachineProfile | None = None) -> dict[str, object]:
+        """Fit ``profile``'s time calibration to the recent clean jobs on this port.
+
+        ``profile`` defaults to the bundled one; the result is a copy carrying the
+        fitted :class:`~fiberpath.config.TimeCalibration`.
+        """
+        with self._lock:
+            records = list(self._timings)
+        if not records:
+            raise MachineError("no completed job to calibrate from; stream a program first")
+        try:
+            calibration = fit_time_calibration(records)
+        except CalibrationError as exc:
+            raise MachineError(f"cannot calibrate: {exc}") from exc
+        base = profile if profile is not None else default_machine_profile()
+        update: dict[str, object] = {"time_calibration": calibration}
+        if base.profile_version == "1.0":
+            update["profile_version"] = "1.1"  # timeCalibration arrived in 1.1
+        return {"jobs": len(records), "profile": base.model_copy(update=update)}
+
     # -- safety ------------------------------------------------------------
 
     def emergency_stop(self) -> None:
@@ -366,89 +1028,289 @@ class MachineService:
 
     # -- helpers -----------------------------------------------------------
 
+    @staticmethod
+    def _stop(host: MarlinHost, job: Job) -> None:
+        """Ask the worker to end ``job`` before its next line (or SD poll)."""
+        if job.offload is not None:
+            job.offload.stop()  # the worker sends M524 if the card is printing
+        else:
+            if job.plan is not None:
+                job.plan.stop()  # between slices, where host.stop() would be reset
+            if (source := job.source) is not None:  # (the worker drops it when it ends)
+                source.stop()
+            host.resume()  # unblock a paused stream so stop() ends it
+            host.stop()
+
     def _require_host(self) -> MarlinHost:
         if self._host is None or not self._host.is_connected:
             raise MachineError("not connected")
         return self._host
 
     def _lookup(self, job_id: str) -> Job:
-        if self._job is None or self._job.id != job_id:
-            raise MachineNotFoundError(f"unknown job: {job_id}")
-        return self._job
+        if self._job is not None and self._job.id == job_id:
+            return self._job
+        for job in (*self._queue, *self._history):
+            if job.id == job_id:
+                return job
+        raise MachineNotFoundError(f"unknown job: {job_id}")
+
+    def _lookup_active(self, job_id: str) -> Job:
+        """The job ``job_id`` if it is the one on the machine now; else 409 (404 if unknown).
+
+        Pausing, resuming or stopping acts on the shared host, so a queued or
+        finished job's id must never reach it.
+        """
+        job = self._lookup(job_id)
+        if job is not self._job or job.state not in _ACTIVE_JOB_STATES:
+            raise MachineConflictError(f"job {job_id} is {job.state}, not running")
+        return job
 
     # -- crash recovery ----------------------------------------------------
 
     def _persist_job(self) -> None:
-        """Write a recovery snapshot of the active job (call under ``_lock``).
+        """Start the recovery journal of the job just launched (call under ``_lock``).
 
-        Best-effort: a snapshot write must never break a live stream, so all
-        I/O errors are swallowed. The file exists only while a job is active.
+        Its progress, pause/resume and terminal state are appended as they happen
+        (see :mod:`fiberpath_api.journal`). The journal exists only while a job
+        is active.
         """
         job = self._job
         if job is None:
             return
-        snapshot = {
+        state: dict[str, object] = {
             "id": job.id,
             "port": self._port,
             "baud_rate": self._baud_rate,
             "total": job.total,
             "sent": job.sent,
             "state": job.state,
+            "mode": job.mode,
         }
+        if job.sd is not None:
+            # What re-attaching to the card's print needs (see _reattach).
+            state.update(phase=job.phase, sd=asdict(job.sd), sd_layout=job.sd_layout)
+        self._journal.start(state)
+
+    def _clear_persisted(self) -> None:
+        """Record the job's terminal state and drop the journal (call under ``_lock``)."""
+        job = self._job
+        self._journal.finish(job.state if job is not None else "cancelled")
+
+    def _spool(self, commands: list[str]) -> Path | None:
+        """Write a program about to be queued to its own file (no lock needed).
+
+        Each program is written once, here, so persisting the queue under the
+        lock only rewrites its small index. Best-effort: None if it cannot be
+        written, and the job is then not restored after a restart.
+        """
+        directory = _spool_dir(self._state_path)
         try:
-            path = self._state_path
+            directory.mkdir(parents=True, exist_ok=True)
+            fd, name = tempfile.mkstemp(suffix=".json", dir=directory)
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(commands, file)
+        except OSError:
+            return None
+        return Path(name)
+
+    @staticmethod
+    def _drop_spool(job: Job) -> None:
+        """Delete a job's spooled program once it has left the queue."""
+        if job.spool is None:
+            return
+        try:
+            job.spool.unlink(missing_ok=True)
+        except OSError:
+            pass
+        job.spool = None
+
+    def _persist_queue(self) -> None:
+        """Write the queue's index to disk (call under ``_lock``); best-effort, like the snapshot.
+
+        The programs themselves are in the jobs' spool files.
+        """
+        entries = [
+            {
+                "id": job.id,
+                "priority": job.priority,
+                "hold": job.hold,
+                "header": job.header,
+                "spool": job.spool.name,
+                "sd": asdict(job.sd) if job.sd is not None else None,
+            }
+            for job in self._queue
+            if job.spool is not None
+        ]
+        path = _queue_path(self._state_path)
+        try:
+            if not entries:
+                path.unlink(missing_ok=True)
+                return
             path.parent.mkdir(parents=True, exist_ok=True)
             tmp = path.with_suffix(".tmp")
-            tmp.write_text(json.dumps(snapshot))
-            os.replace(tmp, path)  # atomic swap so a reader never sees a half file
+            tmp.write_text(json.dumps({"jobs": entries}))
+            os.replace(tmp, path)
         except OSError:
             pass
 
-    def _clear_persisted(self) -> None:
-        """Drop the recovery snapshot (call under ``_lock``)."""
-        self._last_persist = 0.0
+    def _recover_queue(self) -> None:
+        """Reload the jobs a previous sidecar left queued, all held.
+
+        Nothing restored starts on its own: the operator confirms the machine is
+        ready for it (:meth:`start_queued`) first.
+        """
+        restored: list[Job] = []
+        spools = _spool_dir(self._state_path)
         try:
-            self._state_path.unlink(missing_ok=True)
+            raw = _queue_path(self._state_path).read_text()
+            for entry in json.loads(raw)["jobs"]:
+                spool = spools / Path(str(entry["spool"])).name
+                try:
+                    program = json.loads(spool.read_text(encoding="utf-8"))
+                except OSError:
+                    continue  # its program was lost; nothing to restore
+                commands = [str(command) for command in program]
+                sd = entry.get("sd")
+                restored.append(
+                    Job(
+                        id=str(entry["id"]),
+                        total=len(commands),
+                        state="queued",
+                        header=entry.get("header"),
+                        mode="stream" if sd is None else "sd",
+                        priority=int(entry.get("priority") or 0),
+                        hold=True,
+                        commands=commands,
+                        spool=spool,
+                        sd=SdOptions(**sd) if sd is not None else None,
+                    )
+                )
+        except (OSError, ValueError, KeyError, TypeError):
+            restored = []  # no queue, or one this version cannot read: start empty
+        self._prune_spools(restored)
+        if not restored:
+            return
+        self._queue = restored
+        for job in restored:
+            self._job_counter = max(self._job_counter, _job_number(job.id))
+
+    def _prune_spools(self, restored: list[Job]) -> None:
+        """Delete spooled programs no restored job refers to (e.g. left by a crash)."""
+        kept = {job.spool for job in restored}
+        try:
+            for path in _spool_dir(self._state_path).glob("*.json"):
+                if path not in kept:
+                    path.unlink(missing_ok=True)
         except OSError:
             pass
 
+    def _reattach(self, host: MarlinHost) -> None:
+        """Follow the SD print an orphaned job left running (call under ``_lock``).
+
+        Only after a connect without reset, and only while ``M27`` reports the
+        card printing: the job resumes from the file it was printing, and the
+        files after it are started as before.
+        """
+        job = self._job
+        if job is None or job.state != "orphaned" or job.phase != "print":
+            return
+        if job.sd is None or not job.sd_layout:
+            return
+        offload = SdOffload.attach(host, job.sd_layout, job.sd)
+        if not offload.printing():
+            return
+        ends = list(accumulate(lines for _, lines, _ in job.sd_layout))
+        job.follow_part = min(bisect_right(ends, job.sent) + 1, len(ends))
+        job.offload = offload
+        job.error = None
+        job.telemetry = StreamTelemetry()
+        job.append(
+            "action", action=f"re-attached to the SD print of {offload.files[job.follow_part - 1]}"
+        )
+        self._launch(host, job)
+
     def _recover_orphaned(self) -> None:
         """Surface a job a previous (crashed) sidecar left mid-stream.
 
-        The snapshot file is deleted on every clean terminal transition and on
-        disconnect, so finding one with an active state at startup means a prior
-        process died mid-job. Reconstruct it as an ``orphaned`` tombstone — so a
-        re-attaching client polling that job id gets ``orphaned`` instead of a
-        404 — but do **not** reopen the port: a blind re-open would DTR-reset a
-        controller that may still be moving. Recovery is an explicit reconnect.
+        The journal is deleted on every clean terminal transition and on
+        disconnect, so finding one whose replayed state is active at startup
+        means a prior process died mid-job. Its ``sent`` is the last line the
+        controller acknowledged. (A sidecar from before the journal left a JSON
+        snapshot at ``state_path`` instead; that is read the same way.)
+
+        Reconstruct it as an ``orphaned`` tombstone — so a re-attaching client
+        polling that job id gets ``orphaned`` instead of a 404 — but do **not**
+        reopen the port: a blind re-open would DTR-reset a controller that may
+        still be moving. Recovery is an explicit reconnect.
         """
+        snap: object = None
         try:
-            raw = self._state_path.read_text()
+            snap = replay(self._journal.path)
         except OSError:
-            return
+            try:
+                snap = json.loads(self._state_path.read_text())
+            except OSError:
+                return
+            except ValueError:
+                pass
+        # Consumed into memory (or unreadable): either way, not to re-trigger.
+        self._journal.clear()
         try:
-            snap = json.loads(raw)
-        except ValueError:
-            self._clear_persisted()
-            return
+            self._state_path.unlink(missing_ok=True)
+        except OSError:
+            pass
         if not isinstance(snap, dict) or snap.get("state") not in _ACTIVE_JOB_STATES:
-            self._clear_persisted()
             return
         job = Job(
             id=str(snap.get("id", "job-0")),
             total=int(snap.get("total") or 0),
             sent=int(snap.get("sent") or 0),
             state="orphaned",
+            mode=str(snap.get("mode") or "stream"),
         )
         port = snap.get("port")
-        job.error = "The streaming backend restarted mid-job; the controller was reset. " + (
-            f"Reconnect to {port} to continue." if port else "Reconnect to continue."
-        )
+        to = f" to {port}" if port else ""
+        if job.mode == "sd":
+            self._recover_sd(job, snap)
+        if job.mode == "sd" and job.phase == "print":
+            job.error = (
+                "The streaming backend restarted mid-job. The controller may still be "
+                f"printing it from its SD card ({job.sent} of {job.total} lines read "
+                f"when it last reported). Reconnect{to} without a reset to follow the "
+                "print; a reconnect that resets the controller ends it."
+            )
+            if job.sd_layout is not None and len(job.sd_layout) > 1:
+                job.error += " Until then the card stops at the end of the file it is printing."
+        elif job.mode == "sd":
+            job.error = (
+                "The streaming backend restarted while the program was being written to "
+                f"the SD card ({job.sent} of {job.total} lines). Reconnect{to} and start "
+                "the job again."
+            )
+        else:
+            job.error = (
+                "The streaming backend restarted mid-job; the controller was reset. "
+                f"It had acknowledged {job.sent} of {job.total} lines. Reconnect{to} to continue."
+            )
         job.append("error", message=job.error)
+        job.telemetry.finish()
         self._job = job
         # Keep the counter ahead of the recovered id so the next job won't reuse it.
         self._job_counter = _job_number(job.id)
-        self._clear_persisted()  # consumed into memory
+
+    @staticmethod
+    def _recover_sd(job: Job, snap: dict[str, object]) -> None:
+        """Restore what an orphaned SD job needs to be re-attached (see ``_reattach``)."""
+        phase = snap.get("phase")
+        job.phase = str(phase) if phase is not None else None
+        try:
+            job.sd = SdOptions(**snap["sd"])  # type: ignore[arg-type]
+            job.sd_layout = [
+                (str(name), int(lines), int(size))
+                for name, lines, size in snap["sd_layout"]  # type: ignore[attr-defined]
+            ]
+        except (KeyError, TypeError, ValueError):
+            job.sd = job.sd_layout = None  # an older or damaged journal: not re-attachable
 
 
 machine = MachineService()
@@ -12,8 +12,10 @@ from fiberpath.simulation import SimulationError
 from fiberpath.visualization import PlotError
 from marlin_host import HostError
 
+from .cache import result_cache
 from .machine import MachineError
-from .routes import machine, plan, plot, simulate, validate
+from .routes import machine, machines, plan, plot, simulate, validate
+from .schemas import CacheNamespaceStatsOut, CacheStatsOut
 
 
 def _bad_request(request: Request, exc: Exception) -> JSONResponse:
@@ -41,11 +43,33 @@ def create_app() -> FastAPI:
         """Liveness probe the sidecar supervisor polls for readiness."""
         return {"status": "ok"}
 
+    @application.get("/cache", tags=["meta"], response_model=CacheStatsOut)
+    def cache_stats() -> CacheStatsOut:
+        """Occupancy and per-route hit rates of the compute-result cache, for tuning."""
+        return CacheStatsOut(
+            entries=result_cache.entries,
+            bytes=result_cache.bytes,
+            max_entries=result_cache.max_entries,
+            max_bytes=result_cache.max_bytes,
+            evictions=result_cache.evictions,
+            namespaces={
+                namespace: CacheNamespaceStatsOut(
+                    hits=stats.hits,
+                    coalesced=stats.coalesced,
+                    misses=stats.misses,
+                    not_modified=stats.not_modified,
+                    hit_rate=stats.hit_rate,
+                )
+                for namespace, stats in result_cache.stats().items()
+            },
+        )
+
     application.include_router(plan.router, prefix="/plan", tags=["planning"])
     application.include_router(simulate.router, prefix="/simulate", tags=["simulation"])
     application.include_router(validate.router, prefix="/validate", tags=["validation"])
     application.include_router(plot.router, prefix="/plot", tags=["plot"])
     application.include_router(machine.router, prefix="/machine", tags=["machine"])
+    application.include_router(machines.router, prefix="/machines", tags=["machine"])
 
     # Map core-engine input errors to 4xx instead of letting them surface as 500s.
     # PlanningError covers its subclass LayerValidationError via isinstance dispatch.
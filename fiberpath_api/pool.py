@@ -0,0 +1,171 @@
+"""Several winders behind one sidecar: a :class:`MachineService` per serial port.
+
+The :data:`fiberpath_api.machine.machine` singleton drives one controller. A cell
+of winders registers each port with the :data:`pool` instead and addresses it by
+machine id (``/machines/{machine_id}/...``). Members share nothing but the pool's
+registry lock, which only guards adding and removing members and reserving their
+ports. Every member has
+its own connection, streaming thread, lock, event log, job queue and recovery
+snapshot (under ``<root>/<machine_id>/``), so one winder's stream never waits on
+another's.
+
+A member whose directory holds an orphaned job or a queue when the sidecar starts
+is restored, disconnected, under its old id; registering a port under that id
+reconnects it.
+"""
+
+from __future__ import annotations
+
+import re
+import tempfile
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from .machine import (
+    MachineConflictError,
+    MachineError,
+    MachineNotFoundError,
+    MachineService,
+    machine,
+)
+
+__all__ = ["DEFAULT_MACHINE", "MachinePool", "machine_id_for_port", "pool"]
+
+# Who holds a port opened by the ``/machine`` singleton (no member id has spaces).
+DEFAULT_MACHINE = "the default machine"
+
+_MACHINE_ID = re.compile(r"[A-Za-z0-9_-]{1,64}")
+_UNSAFE = re.compile(r"[^A-Za-z0-9_-]+")
+_STATE_FILE = "machine-job.json"
+
+
+def _default_root() -> Path:
+    """Runtime directory of the members' snapshots (see ``_default_state_path``)."""
+    return Path(tempfile.gettempdir()) / "fiberpath-api" / "machines"
+
+
+def machine_id_for_port(port: str) -> str:
+    """A URL-safe id for ``port``: ``/dev/ttyACM0`` -> ``ttyACM0``, ``marlinemu://w1`` -> ``w1``."""
+    parts = urlsplit(port)
+    name = parts.netloc if parts.scheme and parts.netloc else port.rstrip("/").rsplit("/", 1)[-1]
+    slug = _UNSAFE.sub("-", name).strip("-")[:64]
+    return slug or "machine"
+
+
+class MachinePool:
+    """The sidecar's machines, one :class:`MachineService` per port."""
+
+    def __init__(self, root: Path | None = None, default: MachineService = machine) -> None:
+        self._root = root if root is not None else _default_root()
+        # The ``/machine`` singleton: the pool never opens the port it holds.
+        self._default = default
+        self._lock = threading.Lock()
+        self._members: dict[str, MachineService] = {}
+        # Ports being opened, by the id opening them; held until connect() returns.
+        self._reserved: dict[str, str] = {}
+        self._recover()
+
+    def connect(
+        self,
+        port: str,
+        baud_rate: int,
+        timeout: float,
+        machine_id: str | None = None,
+        *,
+        reset: bool = True,
+    ) -> dict[str, object]:
+        """Register ``port`` (as ``machine_id``, or an id derived from the port) and connect it.
+
+        Reconnects a disconnected member with that id. A port is served by one
+        member at a time.
+        """
+        machine_id = machine_id if machine_id is not None else machine_id_for_port(port)
+        if not _MACHINE_ID.fullmatch(machine_id):
+            raise MachineError(f"invalid machine id: {machine_id!r}")
+        with self.reserve(port, machine_id):
+            with self._lock:
+                member = self._members.get(machine_id)
+                added = member is None
+                if member is None:
+                    member = MachineService(state_path=self._root / machine_id / _STATE_FILE)
+                    self._members[machine_id] = member
+            # Connecting waits on the controller; do it outside the registry lock.
+            try:
+                info = member.connect(port, baud_rate, timeout, reset=reset)
+            except Exception:
+                if added:
+                    with self._lock:
+                        self._members.pop(machine_id, None)
+                raise
+        return {"machine_id": machine_id, **info}
+
+    @contextmanager
+    def reserve(self, port: str, owner: str) -> Iterator[None]:
+        """Keep ``port`` for ``owner`` (a member id or :data:`DEFAULT_MACHINE`) while it connects.
+
+        Raises :class:`MachineConflictError` if another member, the default
+        machine or another connect in flight holds the port. The reservation is
+        released on exit; a connected port stays taken through its service's
+        ``port``.
+        """
+        with self._lock:
+            holder = self._reserved.get(port)
+            if holder is None and self._default.port == port:
+                holder = DEFAULT_MACHINE
+            if holder is None:
+                holder = next(
+                    (other_id for other_id, other in self._members.items() if other.port == port),
+                    None,
+                )
+            if holder is not None and holder != owner:
+                raise MachineConflictError(f"{port} is already connected as {holder}")
+            self._reserved[port] = owner
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._reserved.pop(port, None)
+
+    def get(self, machine_id: str) -> MachineService:
+        with self._lock:
+            member = self._members.get(machine_id)
+        if member is None:
+            raise MachineNotFoundError(f"unknown machine: {machine_id}")
+        return member
+
+    def remove(self, machine_id: str) -> None:
+        """Cancel the member's job, close its port and forget it."""
+        member = self.get(machine_id)
+        member.disconnect()
+        with self._lock:
+            self._members.pop(machine_id, None)
+
+    def members(self) -> list[dict[str, object]]:
+        with self._lock:
+            members = sorted(self._members.items())
+        return [{"machine_id": machine_id, **member.summary()} for machine_id, member in members]
+
+    def close(self) -> None:
+        """Disconnect every member (they stay registered)."""
+        with self._lock:
+            members = list(self._members.values())
+        for member in members:
+            member.disconnect()
+
+    def _recover(self) -> None:
+        try:
+            directories = sorted(path for path in self._root.iterdir() if path.is_dir())
+        except OSError:
+            return
+        for directory in directories:
+            if not _MACHINE_ID.fullmatch(directory.name):
+                continue
+            member = MachineService(state_path=directory / _STATE_FILE)
+            if member.summary()["job_id"] is not None or member.queue()["jobs"]:
+                self._members[directory.name] = member
+
+
+pool = MachinePool()
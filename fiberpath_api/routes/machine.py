@@ -1,41 +1,54 @@
 """Machine-control endpoints (serial connection, manual commands, streaming jobs).
 
 The sidecar owns the serial port via the :data:`fiberpath_api.machine.machine`
-singleton. These handlers are thin: they translate request/response shapes and
-map machine errors to HTTP status codes. ``MachineBusyError`` /
-``MachineConflictError`` -> 409 and ``MachineNotFoundError`` -> 404 are mapped
-here (not at app level) because the app-wide ``MachineError`` handler only knows
-the 400 case.
+singleton, served under ``/machine``. :func:`machine_router` builds the same
+routes for any :class:`MachineService`; ``/machines/{machine_id}`` mounts them
+once more for the members of the machine pool. These handlers are thin: they
+translate request/response shapes and map machine errors to HTTP status codes.
+``MachineBusyError`` / ``MachineConflictError`` -> 409 and
+``MachineNotFoundError`` -> 404 are mapped here (not at app level) because the
+app-wide ``MachineError`` handler only knows the 400 case.
 """
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from pathlib import Path
 from typing import NoReturn
 
-from fastapi import APIRouter, HTTPException, Response
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fiberpath.config import WindDefinition
+from fiberpath.streaming import SdOptions
 from marlin_host import HostError
 
+from ..artifacts import plan_artifacts
 from ..machine import (
     MachineBusyError,
     MachineConflictError,
     MachineError,
     MachineNotFoundError,
+    MachineService,
     machine,
 )
+from ..pool import DEFAULT_MACHINE, pool
 from ..schemas import (
     BAD_REQUEST_RESPONSE,
+    CalibrationOut,
+    CalibrationRequest,
     CommandRequest,
     CommandResponse,
     ConnectionInfoOut,
     ConnectRequest,
     JobStatusOut,
+    MachineMetricsOut,
     PortInfoOut,
+    QueuedJobOut,
+    QueueJobRequest,
+    QueueOut,
     StartJobRequest,
     StartJobResponse,
 )
 
-router = APIRouter()
-
 
 def _raise_http(exc: MachineError | HostError) -> NoReturn:
     """Translate a machine/host error into the matching HTTPException."""
@@ -46,97 +59,193 @@ def _raise_http(exc: MachineError | HostError) -> NoReturn:
     raise HTTPException(status_code=400, detail=str(exc))
 
 
-@router.get("/ports", response_model=list[PortInfoOut])
-def list_ports() -> list[PortInfoOut]:
-    """Enumerate the serial ports available on the host."""
-    return [
-        PortInfoOut(port=p.port, description=p.description, hwid=p.hwid)
-        for p in machine.list_serial_ports()
-    ]
-
-
-@router.post("/connection", response_model=ConnectionInfoOut, responses=BAD_REQUEST_RESPONSE)
-def connect(body: ConnectRequest) -> ConnectionInfoOut:
-    """Open the serial port and return the controller's connection banner."""
-    try:
-        info = machine.connect(body.port, body.baud_rate, body.timeout)
-    except (MachineError, HostError) as exc:
-        _raise_http(exc)
-    return ConnectionInfoOut(**info)  # type: ignore[arg-type]
-
-
-@router.delete("/connection", status_code=204)
-def disconnect() -> Response:
-    """Cancel any active job and close the serial port."""
-    machine.disconnect()
-    return Response(status_code=204)
-
-
-@router.post("/commands", response_model=CommandResponse, responses=BAD_REQUEST_RESPONSE)
-def send_command(body: CommandRequest) -> CommandResponse:
-    """Run a single manual G-code command (rejected 409 while a job streams)."""
-    try:
-        responses = machine.send_command(body.gcode)
-    except (MachineError, HostError) as exc:
-        _raise_http(exc)
-    return CommandResponse(responses=responses)
-
-
-@router.post("/jobs", response_model=StartJobResponse, responses=BAD_REQUEST_RESPONSE)
-def start_job(body: StartJobRequest) -> StartJobResponse:
-    """Start streaming a G-code program on a background worker."""
-    try:
-        info = machine.start_job(body.gcode)
-    except (MachineError, HostError) as exc:
-        _raise_http(exc)
-    return StartJobResponse(**info)  # type: ignore[arg-type]
-
-
-@router.get("/jobs/{job_id}", response_model=JobStatusOut, responses=BAD_REQUEST_RESPONSE)
-def get_job(job_id: str, since: int = 0) -> JobStatusOut:
-    """Poll a job's status and the event log entries with ``seq > since``."""
-    try:
-        status = machine.get_job(job_id, since)
-    except (MachineError, HostError) as exc:
-        _raise_http(exc)
-    return JobStatusOut(**status)  # type: ignore[arg-type]
-
-
-@router.post("/jobs/{job_id}/pause", response_model=JobStatusOut, responses=BAD_REQUEST_RESPONSE)
-def pause_job(job_id: str) -> JobStatusOut:
-    """Pause a streaming job before its next line (host-side)."""
-    try:
-        status = machine.pause_job(job_id)
-    except (MachineError, HostError) as exc:
-        _raise_http(exc)
-    return JobStatusOut(**status)  # type: ignore[arg-type]
-
-
-@router.post("/jobs/{job_id}/resume", response_model=JobStatusOut, responses=BAD_REQUEST_RESPONSE)
-def resume_job(job_id: str) -> JobStatusOut:
-    """Resume a paused job."""
-    try:
-        status = machine.resume_job(job_id)
-    except (MachineError, HostError) as exc:
-        _raise_http(exc)
-    return JobStatusOut(**status)  # type: ignore[arg-type]
-
-
-@router.post("/jobs/{job_id}/cancel", response_model=JobStatusOut, responses=BAD_REQUEST_RESPONSE)
-def cancel_job(job_id: str) -> JobStatusOut:
-    """Stop a job gracefully; the connection stays open."""
-    try:
-        status = machine.cancel_job(job_id)
-    except (MachineError, HostError) as exc:
-        _raise_http(exc)
-    return JobStatusOut(**status)  # type: ignore[arg-type]
-
-
-@router.post("/estop", status_code=204)
-def emergency_stop() -> Response:
-    """Issue #196 safety stop: write M112 out-of-band, bypassing the lock."""
-    try:
-        machine.emergency_stop()
-    except (MachineError, HostError) as exc:
-        _raise_http(exc)
-    return Response(status_code=204)
+def machine_router(resolve: Callable[..., MachineService], *, connection: bool = True) -> APIRouter:
+    """The machine-control routes, acting on the service ``resolve`` returns.
+
+    ``resolve`` is a FastAPI dependency, so it may take path parameters (a pool
+    member's ``machine_id``). ``connection=False`` leaves out ``/ports`` and
+    ``/connection``; the pool registers and removes its members itself.
+    """
+    router = APIRouter()
+    service_dependency = Depends(resolve)
+
+    if connection:
+
+        @router.get("/ports", response_model=list[PortInfoOut])
+        def list_ports(service: MachineService = service_dependency) -> list[PortInfoOut]:
+            """Enumerate the serial ports available on the host."""
+            return [
+                PortInfoOut(port=p.port, description=p.description, hwid=p.hwid)
+                for p in service.list_serial_ports()
+            ]
+
+        @router.post(
+            "/connection", response_model=ConnectionInfoOut, responses=BAD_REQUEST_RESPONSE
+        )
+        def connect(
+            body: ConnectRequest, service: MachineService = service_dependency
+        ) -> ConnectionInfoOut:
+            """Open the serial port and return the controller's connection banner."""
+            try:
+                # The pool's members and this connection share the host's ports.
+                with pool.reserve(body.port, DEFAULT_MACHINE):
+                    info = service.connect(
+                        body.port, body.baud_rate, body.timeout, reset=body.reset
+                    )
+            except (MachineError, HostError) as exc:
+                _raise_http(exc)
+            return ConnectionInfoOut(**info)  # type: ignore[arg-type]
+
+        @router.delete("/connection", status_code=204)
+        def disconnect(service: MachineService = service_dependency) -> Response:
+            """Cancel any active job and close the serial port."""
+            service.disconnect()
+            return Response(status_code=204)
+
+    @router.post("/commands", response_model=CommandResponse, responses=BAD_REQUEST_RESPONSE)
+    def send_command(
+        body: CommandRequest, service: MachineService = service_dependency
+    ) -> CommandResponse:
+        """Run a single manual G-code command (rejected 409 while a job streams)."""
+        try:
+            responses = service.send_command(body.gcode)
+        except (MachineError, HostError) as exc:
+            _raise_http(exc)
+        return CommandResponse(responses=responses)
+
+    @router.post("/jobs", response_model=StartJobResponse, responses=BAD_REQUEST_RESPONSE)
+    def start_job(
+        body: StartJobRequest, service: MachineService = service_dependency
+    ) -> StartJobResponse:
+        """Start streaming a G-code program (or offloading it to the SD card) on a worker."""
+        try:
+            info = service.start_job(_program(body), _sd_options(body), body.profile)
+        except (MachineError, HostError) as exc:
+            _raise_http(exc)
+        return StartJobResponse(**info)  # type: ignore[arg-type]
+
+    @router.get("/queue", response_model=QueueOut)
+    def get_queue(service: MachineService = service_dependency) -> QueueOut:
+        """The running job and the queued jobs, in the order they will start."""
+        return QueueOut.model_validate(service.queue())
+
+    @router.post("/queue", response_model=QueuedJobOut, responses=BAD_REQUEST_RESPONSE)
+    def enqueue_job(
+        body: QueueJobRequest, service: MachineService = service_dependency
+    ) -> QueuedJobOut:
+        """Validate and compile a program now and start it when its turn comes.
+
+        It starts at once when the machine is connected and idle (unless held), and
+        otherwise as soon as the jobs ahead of it complete. Cancel a queued job
+        through ``/jobs/{job_id}/cancel``.
+        """
+        try:
+            entry = service.enqueue_job(
+                _program(body),
+                priority=body.priority,
+                hold=body.hold,
+                sd=_sd_options(body),
+                profile=body.profile,
+            )
+        except MachineError as exc:
+            _raise_http(exc)
+        return QueuedJobOut.model_validate(entry)
+
+    @router.post(
+        "/queue/{job_id}/start", response_model=JobStatusOut, responses=BAD_REQUEST_RESPONSE
+    )
+    def start_queued_job(job_id: str, service: MachineService = service_dependency) -> JobStatusOut:
+        """Start a queued job now: release a held job, or run one out of turn."""
+        try:
+            status = service.start_queued(job_id)
+        except (MachineError, HostError) as exc:
+            _raise_http(exc)
+        return JobStatusOut(**status)  # type: ignore[arg-type]
+
+    @router.get("/jobs/{job_id}", response_model=JobStatusOut, responses=BAD_REQUEST_RESPONSE)
+    def get_job(
+        job_id: str, since: int = 0, service: MachineService = service_dependency
+    ) -> JobStatusOut:
+        """Poll a job's status and the event log entries with ``seq > since``."""
+        try:
+            status = service.get_job(job_id, since)
+        except (MachineError, HostError) as exc:
+            _raise_http(exc)
+        return JobStatusOut(**status)  # type: ignore[arg-type]
+
+    @router.post(
+        "/jobs/{job_id}/pause", response_model=JobStatusOut, responses=BAD_REQUEST_RESPONSE
+    )
+    def pause_job(job_id: str, service: MachineService = service_dependency) -> JobStatusOut:
+        """Pause a streaming job before its next line (host-side)."""
+        try:
+            status = service.pause_job(job_id)
+        except (MachineError, HostError) as exc:
+            _raise_http(exc)
+        return JobStatusOut(**status)  # type: ignore[arg-type]
+
+    @router.post(
+        "/jobs/{job_id}/resume", response_model=JobStatusOut, responses=BAD_REQUEST_RESPONSE
+    )
+    def resume_job(job_id: str, service: MachineService = service_dependency) -> JobStatusOut:
+        """Resume a paused job."""
+        try:
+            status = service.resume_job(job_id)
+        except (MachineError, HostError) as exc:
+            _raise_http(exc)
+        return JobStatusOut(**status)  # type: ignore[arg-type]
+
+    @router.post(
+        "/jobs/{job_id}/cancel", response_model=JobStatusOut, responses=BAD_REQUEST_RESPONSE
+    )
+    def cancel_job(job_id: str, service: MachineService = service_dependency) -> JobStatusOut:
+        """Stop a job gracefully; the connection stays open."""
+        try:
+            status = service.cancel_job(job_id)
+        except (MachineError, HostError) as exc:
+            _raise_http(exc)
+        return JobStatusOut(**status)  # type: ignore[arg-type]
+
+    @router.get("/metrics", response_model=MachineMetricsOut)
+    def metrics(service: MachineService = service_dependency) -> MachineMetricsOut:
+        """Streaming telemetry of the current job (or the last one, once it ended)."""
+        return MachineMetricsOut.model_validate(service.metrics())
+
+    @router.post("/calibration", response_model=CalibrationOut, responses=BAD_REQUEST_RESPONSE)
+    def calibrate(
+        body: CalibrationRequest, service: MachineService = service_dependency
+    ) -> CalibrationOut:
+        """Fit a profile's time calibration to the recent jobs streamed on this port."""
+        try:
+            result = service.calibrate(body.profile)
+        except MachineError as exc:
+            _raise_http(exc)
+        return CalibrationOut.model_validate(result)
+
+    @router.post("/estop", status_code=204)
+    def emergency_stop(service: MachineService = service_dependency) -> Response:
+        """Issue #196 safety stop: write M112 out-of-band, bypassing the lock."""
+        try:
+            service.emergency_stop()
+        except (MachineError, HostError) as exc:
+            _raise_http(exc)
+        return Response(status_code=204)
+
+    return router
+
+
+def _sd_options(body: StartJobRequest) -> SdOptions | None:
+    return SdOptions(**body.sd.model_dump()) if body.sd is not None else None
+
+
+def _program(body: StartJobRequest) -> str | Path | list[str] | WindDefinition:
+    """The request's program; an ``artifact_id`` resolves to the planned program's lines."""
+    if body.artifact_id is None:
+        return body.program
+    artifact = plan_artifacts.get(body.artifact_id)
+    if artifact is None:
+        raise MachineNotFoundError(f"unknown artifact: {body.artifact_id} (plan it again)")
+    return artifact.commands
+
+
+router = machine_router(lambda: machine)
@@ -0,0 +1,56 @@
+"""Endpoints of the machine pool: several winders behind one sidecar.
+
+``/machines`` registers, lists and removes the members of
+:data:`fiberpath_api.pool.pool`. Each member then serves the ``/machine``
+routes, minus ``/ports`` and ``/connection``, under ``/machines/{machine_id}``.
+"""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Response
+from marlin_host import HostError
+
+from ..machine import MachineError, MachineService
+from ..pool import pool
+from ..schemas import BAD_REQUEST_RESPONSE, PoolConnectionOut, PoolConnectRequest, PoolMemberOut
+from .machine import _raise_http, machine_router
+
+router = APIRouter()
+
+
+def _member(machine_id: str) -> MachineService:
+    try:
+        return pool.get(machine_id)
+    except MachineError as exc:
+        _raise_http(exc)
+
+
+@router.get("", response_model=list[PoolMemberOut])
+def list_machines() -> list[PoolMemberOut]:
+    """Every registered machine with its connection and job state."""
+    return [PoolMemberOut.model_validate(member) for member in pool.members()]
+
+
+@router.post("", response_model=PoolConnectionOut, responses=BAD_REQUEST_RESPONSE)
+def connect_machine(body: PoolConnectRequest) -> PoolConnectionOut:
+    """Open a port as a pool member (409 when another member holds it)."""
+    try:
+        info = pool.connect(
+            body.port, body.baud_rate, body.timeout, body.machine_id, reset=body.reset
+        )
+    except (MachineError, HostError) as exc:
+        _raise_http(exc)
+    return PoolConnectionOut(**info)  # type: ignore[arg-type]
+
+
+@router.delete("/{machine_id}", status_code=204, responses=BAD_REQUEST_RESPONSE)
+def remove_machine(machine_id: str) -> Response:
+    """Cancel the member's job, close its port and drop it from the pool."""
+    try:
+        pool.remove(machine_id)
+    except MachineError as exc:
+        _raise_http(exc)
+    return Response(status_code=204)
+
+
+router.include_router(machine_router(_member, connection=False), prefix="/{machine_id}")
@@ -1,18 +1,258 @@
-"""Planning endpoint."""
+"""Planning endpoints."""
 
 from __future__ import annotations
 
-from fastapi import APIRouter
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import partial
+from typing import TypeVar
+
+from fastapi import APIRouter, Header, HTTPException, Query, Request, Response
 from fiberpath.config import WindDefinition
-from fiberpath.planning import plan_wind
-from fiberpath.wire import PlanResultOut
+from fiberpath.planning import (
+    PlanCancelledError,
+    PlanOptions,
+    PlanResult,
+    plan_wind,
+    solve_patterns,
+)
+from fiberpath.wire import (
+    PatternSolutionsOut,
+    PlanDeltaOut,
+    PlanEditOut,
+    PlanMetricsOut,
+    PlanResultOut,
+)
+from starlette.concurrency import run_in_threadpool
 
-from ..schemas import BAD_REQUEST_RESPONSE
+from ..artifacts import PlanArtifact, build_artifact, diff_artifacts, plan_artifacts
+from ..cache import (
+    cache_key,
+    canonical_json,
+    etag_matches,
+    not_modified,
+    quote_etag,
+    result_cache,
+)
+from ..schemas import (
+    BAD_REQUEST_RESPONSE,
+    IF_NONE_MATCH_HEADER,
+    NOT_MODIFIED_RESPONSE,
+    SUPERSEDED_RESPONSE,
+    PatternSolveRequest,
+)
+from ..sessions import plan_sessions, run_cancellable
 
 router = APIRouter()
 
+T = TypeVar("T")
+
+SESSION_HEADER = Header(
+    default=None,
+    description=(
+        "Optional editor session key. A newer request to the same endpoint with the same "
+        "key cancels this one (it then returns 409)."
+    ),
+)
+
+BASE_ARTIFACT_QUERY = Query(
+    default=None,
+    alias="baseArtifactId",
+    description=(
+        "artifactId of a program the client already holds. If the server still has it, "
+        "the response carries `delta` (edits against that program) and an empty `gcode`."
+    ),
+)
+
+
+@dataclass(slots=True, frozen=True)
+class _Planned:
+    """A cached ``/plan`` response with its artifact.
+
+    The artifact store keeps far fewer programs than the result cache, so the
+    artifact travels with the cached response and is put back on every hit:
+    the ``artifactId`` a response carries must stay resolvable.
+    """
+
+    out: PlanResultOut
+    artifact: PlanArtifact
 
-@router.post("", response_model=PlanResultOut, responses=BAD_REQUEST_RESPONSE)
-def plan(definition: WindDefinition) -> PlanResultOut:
+
+@router.post(
+    "",
+    response_model=PlanResultOut,
+    responses={**BAD_REQUEST_RESPONSE, **SUPERSEDED_RESPONSE, **NOT_MODIFIED_RESPONSE},
+)
+async def plan(
+    definition: WindDefinition,
+    request: Request,
+    response: Response,
+    x_fiberpath_session: str | None = SESSION_HEADER,
+    base_artifact_id: str | None = BASE_ARTIFACT_QUERY,
+    if_none_match: str | None = IF_NONE_MATCH_HEADER,
+) -> PlanResultOut | Response:
     """Plan a wind from an in-memory definition and return the G-code program."""
-    return PlanResultOut.from_result(plan_wind(definition))
+    key = cache_key("plan", canonical_json(definition.model_dump(mode="json")))
+    if etag_matches(if_none_match, key):
+        result_cache.record_not_modified(key)
+        cached = result_cache.peek(key)
+        if isinstance(cached, _Planned):  # the client still holds its artifactId
+            plan_artifacts.put(cached.artifact)
+        return not_modified(key)
+    planned = await _plan(
+        definition,
+        request,
+        x_fiberpath_session,
+        key=key,
+        metrics_only=False,
+        build=_planned,
+        # The program text, and its lines again in the artifact.
+        weight=lambda planned: 2 * len(planned.out.gcode),
+    )
+    plan_artifacts.put(planned.artifact)
+    out = planned.out
+    response.headers["ETag"] = quote_etag(key)
+    if base_artifact_id is None:
+        return out
+    return await run_in_threadpool(_with_delta, out, base_artifact_id)
+
+
+@router.post(
+    "/metrics",
+    response_model=PlanMetricsOut,
+    responses={**BAD_REQUEST_RESPONSE, **SUPERSEDED_RESPONSE, **NOT_MODIFIED_RESPONSE},
+)
+async def plan_metrics(
+    definition: WindDefinition,
+    request: Request,
+    response: Response,
+    x_fiberpath_session: str | None = SESSION_HEADER,
+    if_none_match: str | None = IF_NONE_MATCH_HEADER,
+) -> PlanMetricsOut | Response:
+    """Compute a wind's time, tow and per-layer breakdown without generating G-code.
+
+    Same validation and metrics as ``/plan`` (to floating-point summation order),
+    at a small fraction of the cost; meant for live editing.
+    """
+    key = cache_key("metrics", canonical_json(definition.model_dump(mode="json")))
+    if etag_matches(if_none_match, key):
+        result_cache.record_not_modified(key)
+        return not_modified(key)
+    out = await _plan(
+        definition,
+        request,
+        x_fiberpath_session,
+        key=key,
+        metrics_only=True,
+        build=PlanMetricsOut.from_result,
+        weight=lambda out: 256 * (1 + len(out.layers)),
+    )
+    response.headers["ETag"] = quote_etag(key)
+    return out
+
+
+@router.post(
+    "/patterns",
+    response_model=PatternSolutionsOut,
+    responses={**BAD_REQUEST_RESPONSE, **NOT_MODIFIED_RESPONSE},
+)
+async def plan_patterns(
+    payload: PatternSolveRequest,
+    response: Response,
+    if_none_match: str | None = IF_NONE_MATCH_HEADER,
+) -> PatternSolutionsOut | Response:
+    """List the valid patternNumber/skipIndex/lockDegrees of a helical layer, fastest first.
+
+    Solved from the coverage arithmetic rather than by planning candidates, so it
+    answers in milliseconds; meant for the layer editor's suggestions.
+    """
+    key = cache_key("patterns", canonical_json(payload.model_dump(mode="json", by_alias=True)))
+    if etag_matches(if_none_match, key):
+        result_cache.record_not_modified(key)
+        return not_modified(key)
+
+    async def compute() -> PatternSolutionsOut:
+        return await run_in_threadpool(_solve_patterns, payload)
+
+    out = await result_cache.get_or_compute(
+        key, compute, weight=lambda out: 128 * (1 + len(out.solutions))
+    )
+    response.headers["ETag"] = quote_etag(key)
+    return out
+
+
+async def _plan(
+    definition: WindDefinition,
+    request: Request,
+    session: str | None,
+    *,
+    key: str,
+    metrics_only: bool,
+    build: Callable[[PlanResult], T],
+    weight: Callable[[T], int],
+) -> T:
+    # Full plans and metrics-only plans are separate consumers in the editor, so
+    # one never supersedes the other.
+    session_key = None if session is None else f"{'metrics' if metrics_only else 'plan'}:{session}"
+    token = plan_sessions.begin(session_key)
+    plan_run: Callable[[], PlanResult]
+    if session_key is None:
+        options = PlanOptions(cancel_token=token, metrics_only=metrics_only)
+        plan_run = partial(plan_wind, definition, options)
+    else:
+        # A session re-lowers only the layers its previous request did not have.
+        planner = plan_sessions.planner(session_key, metrics_only=metrics_only)
+        plan_run = partial(planner.replan, definition, cancel_token=token)
+
+    async def compute() -> T:
+        return await run_cancellable(request, token, lambda: build(plan_run()))
+
+    try:
+        # Identical concurrent requests share one plan; recent ones are served
+        # from the result cache.
+        return await result_cache.get_or_compute(key, compute, weight=weight, cancel_token=token)
+    except PlanCancelledError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+    finally:
+        plan_sessions.end(session_key, token)
+
+
+def _planned(result: PlanResult) -> _Planned:
+    artifact = build_artifact(result)
+    return _Planned(PlanResultOut.from_result(result, artifact_id=artifact.artifact_id), artifact)
+
+
+def _solve_patterns(payload: PatternSolveRequest) -> PatternSolutionsOut:
+    solutions = solve_patterns(
+        payload.layer,
+        payload.mandrel,
+        payload.tow,
+        feed_rate=payload.default_feed_rate,
+        max_lock_degrees=payload.max_lock_degrees,
+    )
+    return PatternSolutionsOut.from_result(solutions, payload.limit)
+
+
+def _with_delta(out: PlanResultOut, base_artifact_id: str) -> PlanResultOut:
+    base = plan_artifacts.get(base_artifact_id)
+    artifact = plan_artifacts.get(out.artifactId) if out.artifactId else None
+    if base is None or artifact is None:
+        return out
+    edits = diff_artifacts(base, artifact)
+    if sum(len(edit.lines) for edit in edits) > out.commandCount // 2:
+        # Most of the program changed; the full text is no larger and simpler.
+        return out
+    delta = PlanDeltaOut(
+        baseArtifactId=base.artifact_id,
+        edits=[
+            PlanEditOut(
+                start=edit.start,
+                deleteCount=edit.delete_count,
+                lines=edit.lines,
+                layerIndex=edit.layer_index,
+            )
+            for edit in edits
+        ],
+    )
+    # The cached response is shared; never mutate it.
+    return out.model_copy(update={"gcode": "", "delta": delta})
@@ -5,21 +5,47 @@ from __future__ import annotations
 from fastapi import APIRouter, HTTPException, Response
 from fiberpath.gcode import ProgramReadError, read_program
 from fiberpath.visualization import render_plot
+from starlette.concurrency import run_in_threadpool
 
-from ..schemas import BAD_REQUEST_RESPONSE, GcodeRequest
+from ..cache import cache_key, etag_matches, not_modified, quote_etag, result_cache
+from ..schemas import (
+    BAD_REQUEST_RESPONSE,
+    IF_NONE_MATCH_HEADER,
+    NOT_MODIFIED_RESPONSE,
+    GcodeRequest,
+)
 
 router = APIRouter()
 
 
-@router.post("", responses={200: {"content": {"image/png": {}}}, **BAD_REQUEST_RESPONSE})
-def plot(payload: GcodeRequest) -> Response:
+@router.post(
+    "",
+    responses={
+        200: {"content": {"image/png": {}}},
+        **BAD_REQUEST_RESPONSE,
+        **NOT_MODIFIED_RESPONSE,
+    },
+)
+async def plot(payload: GcodeRequest, if_none_match: str | None = IF_NONE_MATCH_HEADER) -> Response:
     """Render an unwrapped 2D preview of a G-code program as a PNG."""
-    lines = payload.gcode.splitlines()
+    key = cache_key("plot", payload.gcode)
+    if etag_matches(if_none_match, key):
+        result_cache.record_not_modified(key)
+        return not_modified(key)
+
+    async def compute() -> bytes:
+        return await run_in_threadpool(_render, payload.gcode)
+
+    png = await result_cache.get_or_compute(key, compute, weight=len)
+    return Response(content=png, media_type="image/png", headers={"ETag": quote_etag(key)})
+
+
+def _render(gcode: str) -> bytes:
+    lines = gcode.splitlines()
     if not any(line.strip() for line in lines):
         raise HTTPException(status_code=400, detail="gcode contained no commands")
     try:
         program = read_program(lines)
     except ProgramReadError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-    png = render_plot(program).to_png_bytes()
-    return Response(content=png, media_type="image/png")
+    return render_plot(program).to_png_bytes()
@@ -2,23 +2,99 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from fiberpath.gcode import ProgramReadError, read_program
-from fiberpath.simulation import simulate_program
-from fiberpath.wire import SimulationResultOut
+from fiberpath.planning.ir import Program
+from fiberpath.simulation import LinkModel, analyze_stream, simulate_program
+from fiberpath.wire import SimulationResultOut, StreamAnalysisOut
+from starlette.concurrency import run_in_threadpool
 
-from ..schemas import BAD_REQUEST_RESPONSE, GcodeRequest
+from ..cache import cache_key, canonical_json, etag_matches, not_modified, quote_etag, result_cache
+from ..schemas import (
+    BAD_REQUEST_RESPONSE,
+    IF_NONE_MATCH_HEADER,
+    NOT_MODIFIED_RESPONSE,
+    SimulateRequest,
+    StreamAnalysisRequest,
+)
 
 router = APIRouter()
 
+# Cache weight of a simulation result: a handful of numbers.
+_RESULT_WEIGHT = 512
 
-@router.post("", response_model=SimulationResultOut, responses=BAD_REQUEST_RESPONSE)
-def simulate(payload: GcodeRequest) -> SimulationResultOut:
-    commands = payload.gcode.splitlines()
+
+@router.post(
+    "",
+    response_model=SimulationResultOut,
+    responses={**BAD_REQUEST_RESPONSE, **NOT_MODIFIED_RESPONSE},
+)
+async def simulate(
+    payload: SimulateRequest,
+    response: Response,
+    if_none_match: str | None = IF_NONE_MATCH_HEADER,
+) -> SimulationResultOut | Response:
+    if payload.profile is None:
+        key = cache_key("simulate", payload.gcode)
+    else:
+        key = cache_key("simulate", canonical_json(payload.model_dump(by_alias=True)))
+    if etag_matches(if_none_match, key):
+        result_cache.record_not_modified(key)
+        return not_modified(key)
+
+    async def compute() -> SimulationResultOut:
+        return await run_in_threadpool(_simulate, payload)
+
+    result = await result_cache.get_or_compute(key, compute, weight=lambda _: _RESULT_WEIGHT)
+    response.headers["ETag"] = quote_etag(key)
+    return result
+
+
+@router.post(
+    "/stream",
+    response_model=StreamAnalysisOut,
+    responses={**BAD_REQUEST_RESPONSE, **NOT_MODIFIED_RESPONSE},
+)
+async def analyze_stream_route(
+    payload: StreamAnalysisRequest,
+    response: Response,
+    if_none_match: str | None = IF_NONE_MATCH_HEADER,
+) -> StreamAnalysisOut | Response:
+    """Predict where streaming the program over the given link starves the controller."""
+    key = cache_key("stream", canonical_json(payload.model_dump()))
+    if etag_matches(if_none_match, key):
+        result_cache.record_not_modified(key)
+        return not_modified(key)
+
+    async def compute() -> StreamAnalysisOut:
+        return await run_in_threadpool(_analyze, payload)
+
+    result = await result_cache.get_or_compute(
+        key, compute, weight=lambda out: _RESULT_WEIGHT * (1 + len(out.stallWindows))
+    )
+    response.headers["ETag"] = quote_etag(key)
+    return result
+
+
+def _simulate(payload: SimulateRequest) -> SimulationResultOut:
+    return SimulationResultOut.from_result(simulate_program(_read(payload.gcode), payload.profile))
+
+
+def _analyze(payload: StreamAnalysisRequest) -> StreamAnalysisOut:
+    link = LinkModel(
+        baud_rate=payload.baud_rate,
+        ack_latency_s=payload.ack_latency_s,
+        buffer_depth=payload.buffer_depth,
+        framed=payload.framed,
+    )
+    return StreamAnalysisOut.from_result(analyze_stream(_read(payload.gcode), link))
+
+
+def _read(gcode: str) -> Program:
+    commands = gcode.splitlines()
     if not any(line.strip() for line in commands):
         raise HTTPException(status_code=400, detail="gcode contained no commands")
     try:
-        program = read_program(commands)
+        return read_program(commands)
     except ProgramReadError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-    return SimulationResultOut.from_result(simulate_program(program))
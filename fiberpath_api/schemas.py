@@ -7,9 +7,19 @@ validation status response.
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, Field
+from fastapi import Header
+from fiberpath.config import (
+    HelicalLayer,
+    MachineProfile,
+    MandrelParameters,
+    TowParameters,
+    WindDefinition,
+)
+from fiberpath.planning import DEFAULT_MAX_LOCK_DEGREES
+from pydantic import BaseModel, Field, model_validator
 
 
 class GcodeRequest(BaseModel):
@@ -20,6 +30,37 @@ class GcodeRequest(BaseModel):
     )
 
 
+class SimulateRequest(GcodeRequest):
+    profile: MachineProfile | None = Field(
+        None,
+        description="Machine profile; its timeCalibration and kinematics refine the estimate.",
+    )
+
+
+class StreamAnalysisRequest(GcodeRequest):
+    """A program plus the serial link and controller buffer it will be streamed through."""
+
+    baud_rate: int = Field(250000, gt=0)
+    ack_latency_s: float = Field(
+        0.002, ge=0, description="Per-line ack round trip beyond the line's own bytes."
+    )
+    buffer_depth: int = Field(16, ge=1, description="Planner blocks the controller buffers.")
+    framed: bool = Field(True, description="Line-number + checksum framing.")
+
+
+class PatternSolveRequest(BaseModel):
+    """A helical layer and the mandrel and tow it is wound with, as in a .wind file."""
+
+    mandrel: MandrelParameters
+    tow: TowParameters
+    layer: HelicalLayer = Field(
+        ..., description="Supplies the wind angle, leads and feed; its pattern fields are ignored."
+    )
+    default_feed_rate: float = Field(..., gt=0, description="Used when the layer has no feedRate.")
+    max_lock_degrees: float = Field(DEFAULT_MAX_LOCK_DEGREES, gt=0, le=3600)
+    limit: int = Field(100, ge=1, le=10_000, description="Return the fastest N solutions.")
+
+
 class ValidateResponse(BaseModel):
     valid: bool
 
@@ -38,6 +79,44 @@ BAD_REQUEST_RESPONSE: dict[int | str, dict[str, Any]] = {
     400: {"model": ApiError, "description": "Input rejected by the compute engine."}
 }
 
+# A plan abandoned because a newer request for the same session superseded it
+# (or the client went away). The GUI drops these; they are not errors to show.
+SUPERSEDED_RESPONSE: dict[int | str, dict[str, Any]] = {
+    409: {"model": ApiError, "description": "Plan cancelled: superseded or disconnected."}
+}
+
+# Compute results are pure functions of the request body, so each carries a
+# strong ETag; a request that presents it in If-None-Match gets a bodyless 304.
+NOT_MODIFIED_RESPONSE: dict[int | str, dict[str, Any]] = {
+    304: {"description": "The client already holds this result (If-None-Match matched)."}
+}
+
+IF_NONE_MATCH_HEADER = Header(
+    default=None,
+    description="ETag of a result the client already holds; a match returns 304.",
+)
+
+
+class CacheNamespaceStatsOut(BaseModel):
+    """Result-cache counters for one compute route."""
+
+    hits: int
+    coalesced: int
+    misses: int
+    not_modified: int
+    hit_rate: float
+
+
+class CacheStatsOut(BaseModel):
+    """Occupancy and hit rates of the sidecar's compute-result cache."""
+
+    entries: int
+    bytes: int
+    max_entries: int
+    max_bytes: int
+    evictions: int
+    namespaces: dict[str, CacheNamespaceStatsOut]
+
 
 # -- machine-control surface ----------------------------------------------------
 
@@ -54,6 +133,13 @@ class ConnectRequest(BaseModel):
     port: str
     baud_rate: int = 250000
     timeout: float = 10.0
+    reset: bool = Field(
+        True,
+        description=(
+            "Reset the controller on open (DTR). False attaches to a running controller, "
+            "and follows an SD print that outlived a sidecar crash."
+        ),
+    )
 
 
 class ConnectionInfoOut(BaseModel):
@@ -74,12 +160,78 @@ class CommandResponse(BaseModel):
     responses: list[str]
 
 
+class SdOptionsIn(BaseModel):
+    """SD-card offload: upload the program to the controller's card, then print it."""
+
+    name: str = Field(
+        "FIBERPTH",
+        pattern=r"^[A-Z0-9_]{1,8}$",
+        description="8.3 file name stem; numbered parts use its first five characters.",
+    )
+    chunk_lines: int | None = Field(
+        None, ge=1, description="Lines per file; omit to upload one file."
+    )
+    retries: int = Field(2, ge=0, description="Re-uploads of a part whose size does not verify.")
+    poll_interval_s: float = Field(1.0, ge=0.0, description="Seconds between M27 polls.")
+
+
 class StartJobRequest(BaseModel):
-    gcode: str = Field(
-        ...,
+    """A program to run: ``gcode``, a file ``path``, a plan ``artifact_id`` or a ``definition``."""
+
+    gcode: str | None = Field(
+        None,
         max_length=10_000_000,
         description="G-code program to stream, newline separated.",
     )
+    path: str | None = Field(
+        None,
+        description=(
+            "Absolute path of a G-code file (.gcode, .gco, .g or .nc) on the sidecar's host. "
+            "The sidecar reads it itself, so the program does not travel in the request."
+        ),
+    )
+    artifact_id: str | None = Field(
+        None,
+        description=(
+            "artifactId of a program POST /plan returned recently. Returns 404 once the sidecar "
+            "no longer holds it."
+        ),
+    )
+    definition: WindDefinition | None = Field(
+        None,
+        description=(
+            "Wind definition to plan and stream instead of gcode. A streamed job starts while "
+            "it is still being planned; its total grows until planning finishes."
+        ),
+    )
+    sd: SdOptionsIn | None = Field(
+        None, description="Offload the program to the SD card instead of streaming it."
+    )
+    profile: MachineProfile | None = Field(
+        None,
+        description=(
+            "Validate the program against this profile: it must read under the profile's axis "
+            "mapping and use only its requiredGcodes. A definition is planned for it."
+        ),
+    )
+
+    @model_validator(mode="after")
+    def _one_program(self) -> StartJobRequest:
+        given = [self.gcode, self.path, self.artifact_id, self.definition]
+        if sum(program is not None for program in given) != 1:
+            raise ValueError("give exactly one of gcode, path, artifact_id and definition")
+        if self.path is not None and not Path(self.path).is_absolute():
+            raise ValueError("path must be absolute")
+        return self
+
+    @property
+    def program(self) -> str | Path | WindDefinition:
+        """The ``gcode``, ``path`` or ``definition`` given (the route resolves ``artifact_id``)."""
+        if self.definition is not None:
+            return self.definition
+        if self.path is not None:
+            return Path(self.path)
+        return self.gcode or ""
 
 
 class StartJobResponse(BaseModel):
@@ -87,6 +239,97 @@ class StartJobResponse(BaseModel):
     total: int
 
 
+class QueueJobRequest(StartJobRequest):
+    priority: int = Field(0, description="Higher runs first; equal priorities run in queue order.")
+    hold: bool = Field(False, description="Wait at the head of the queue until started explicitly.")
+
+
+class QueuedJobOut(BaseModel):
+    job_id: str
+    state: str
+    total: int
+    mode: str
+    priority: int
+    hold: bool
+    position: int = Field(..., description="1-based place in the queue; 0 once it has left it.")
+
+
+class QueueOut(BaseModel):
+    active: str | None = Field(None, description="The running job's id, if any.")
+    jobs: list[QueuedJobOut] = Field(..., description="Waiting jobs, in start order.")
+
+
+class PoolConnectRequest(ConnectRequest):
+    machine_id: str | None = Field(
+        None,
+        pattern=r"^[A-Za-z0-9_-]{1,64}$",
+        description="Id to address the machine by; derived from the port when omitted.",
+    )
+
+
+class PoolConnectionOut(ConnectionInfoOut):
+    machine_id: str
+
+
+class PoolMemberOut(BaseModel):
+    machine_id: str
+    port: str | None = Field(None, description="None while the machine is disconnected.")
+    state: str
+    job_id: str | None = Field(None, description="The current (or last) job, if any.")
+    job_state: str | None = None
+    queued: int = Field(..., description="Jobs waiting in the machine's queue.")
+
+
+class LatencySummaryOut(BaseModel):
+    """Send-to-``ok`` latency; percentiles are histogram bucket upper bounds."""
+
+    count: int
+    mean_ms: float
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+    max_ms: float
+    buckets: list[int] = Field(
+        ..., description="Counts per LATENCY_BUCKETS_MS upper bound, then the overflow bucket."
+    )
+
+
+class StreamMetricsOut(BaseModel):
+    """Streaming telemetry for one job (see ``fiberpath.streaming.telemetry``)."""
+
+    lines_sent: int
+    lines_acked: int
+    bytes_sent: int
+    elapsed_s: float
+    paused_s: float
+    lock_wait_s: float
+    lock_wait_max_s: float
+    lines_per_s: float = Field(..., description="Acked lines per second over the rolling window.")
+    bytes_per_s: float = Field(..., description="Acked bytes per second over the rolling window.")
+    mean_lines_per_s: float
+    stalls: int = Field(..., description="Host gaps with nothing in flight, outside pauses.")
+    stall_s: float
+    longest_stall_s: float
+    latency: LatencySummaryOut
+
+
+class MachineMetricsOut(BaseModel):
+    job_id: str | None = None
+    job_state: str | None = None
+    metrics: StreamMetricsOut | None = None
+
+
+class CalibrationRequest(BaseModel):
+    profile: MachineProfile | None = Field(
+        None, description="Profile to calibrate; the bundled marlin-xab profile by default."
+    )
+
+
+class CalibrationOut(BaseModel):
+    jobs: int = Field(..., description="Completed jobs the fit used.")
+    profile: MachineProfile = Field(..., description="The profile with its timeCalibration.")
+
+
 class JobEventOut(BaseModel):
     """One entry from a job's monotonic event log."""
 
@@ -97,6 +340,10 @@ class JobEventOut(BaseModel):
     command: str | None = None
     action: str | None = None
     message: str | None = None
+    metrics: StreamMetricsOut | None = Field(
+        None, description="The job's telemetry, on its terminal event."
+    )
+    phase: str | None = Field(None, description="SD mode: 'upload' or 'print'.")
 
 
 class JobStatusOut(BaseModel):
@@ -105,5 +352,10 @@ class JobStatusOut(BaseModel):
     sent: int
     total: int
     error: str | None = None
+    mode: str = Field("stream", description="'stream', or 'sd' for an SD-card offload.")
+    phase: str | None = Field(None, description="SD mode: the phase of the latest progress.")
+    priority: int = 0
+    hold: bool = False
+    planning: bool = Field(False, description="The job's definition is still being planned.")
     cursor: int
     events: list[JobEventOut]
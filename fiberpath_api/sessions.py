@@ -0,0 +1,109 @@
+"""Per-session bookkeeping for GUI-driven compute requests.
+
+The desktop editor re-plans on (debounced) edits, so a ``/plan`` request is
+routinely superseded before it finishes. Each request may carry a session key
+(the ``X-FiberPath-Session`` header); :class:`PlanSessions` remembers the
+:class:`~fiberpath.planning.CancellationToken` of the newest in-flight plan per
+key and cancels the previous one when a newer request arrives, so a stale
+full-program plan never competes with the current one for the sidecar's CPU.
+
+:func:`run_cancellable` runs the blocking planner on the threadpool while the
+event loop watches for the client going away, cancelling the token on
+disconnect. Requests without a session key are still cancelled on disconnect.
+
+A session also owns an :class:`~fiberpath.planning.IncrementalPlanner`, so an
+edit to one layer of a long definition re-lowers only that layer. Planners are
+kept for the most recently used sessions only (each caches a whole program).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import TypeVar
+
+from fastapi import Request
+from fiberpath.planning import CancellationToken, IncrementalPlanner, PlanOptions
+from starlette.concurrency import run_in_threadpool
+
+__all__ = ["PlanSessions", "plan_sessions", "run_cancellable"]
+
+T = TypeVar("T")
+
+# How often (seconds) the event loop checks for a disconnected client while a
+# plan runs. Bounded by the planner's own cancellation granularity (one circuit).
+_DISCONNECT_POLL_S = 0.05
+
+# Sessions whose incremental planner (and its cached program) is kept alive.
+_MAX_SESSION_PLANNERS = 4
+
+SUPERSEDED_REASON = "plan superseded by a newer request for the same session"
+DISCONNECTED_REASON = "client disconnected before the plan finished"
+
+
+class PlanSessions:
+    """Tracks the newest in-flight plan per session key."""
+
+    def __init__(self, max_planners: int = _MAX_SESSION_PLANNERS) -> None:
+        self._lock = threading.Lock()
+        self._active: dict[str, CancellationToken] = {}
+        self._planners: OrderedDict[str, IncrementalPlanner] = OrderedDict()
+        self._max_planners = max_planners
+
+    def begin(self, key: str | None) -> CancellationToken:
+        """Register a new plan for ``key``, cancelling the one it supersedes."""
+        token = CancellationToken()
+        if key is None:
+            return token
+        with self._lock:
+            previous = self._active.get(key)
+            self._active[key] = token
+        if previous is not None:
+            previous.cancel(SUPERSEDED_REASON)
+        return token
+
+    def end(self, key: str | None, token: CancellationToken) -> None:
+        """Forget ``token`` if it is still the newest plan for ``key``."""
+        if key is None:
+            return
+        with self._lock:
+            if self._active.get(key) is token:
+                del self._active[key]
+
+    def active(self, key: str) -> CancellationToken | None:
+        with self._lock:
+            return self._active.get(key)
+
+    def planner(self, key: str, *, metrics_only: bool = False) -> IncrementalPlanner:
+        """The incremental planner of session ``key``, created on first use."""
+        with self._lock:
+            planner = self._planners.get(key)
+            if planner is None:
+                planner = IncrementalPlanner(PlanOptions(metrics_only=metrics_only))
+                self._planners[key] = planner
+                while len(self._planners) > self._max_planners:
+                    self._planners.popitem(last=False)
+            else:
+                self._planners.move_to_end(key)
+            return planner
+
+
+async def run_cancellable(request: Request, token: CancellationToken, fn: Callable[[], T]) -> T:
+    """Run ``fn`` on the threadpool, cancelling ``token`` if the client disconnects.
+
+    ``fn`` must poll ``token`` itself (``plan_wind`` does, via
+    ``PlanOptions.cancel_token``); this only sets it. The call still waits for
+    ``fn`` to return or raise, so the worker thread is never abandoned.
+    """
+    task = asyncio.ensure_future(run_in_threadpool(fn))
+    while True:
+        done, _ = await asyncio.wait({task}, timeout=_DISCONNECT_POLL_S)
+        if done:
+            return task.result()
+        if not token.cancelled and await request.is_disconnected():
+            token.cancel(DISCONNECTED_REASON)
+
+
+plan_sessions = PlanSessions()
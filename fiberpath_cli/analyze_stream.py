@@ -0,0 +1,83 @@
+"""CLI analyze-stream command."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from pathlib import Path
+
+import typer
+from fiberpath.gcode import ProgramReadError, read_program
+from fiberpath.simulation import LinkModel, SimulationError, analyze_stream
+
+from .output import echo_json
+
+GCODE_ARGUMENT = typer.Argument(..., exists=True, readable=True, file_okay=True, dir_okay=False)
+JSON_OPTION = typer.Option(False, "--json", help="Emit machine-readable JSON summary")
+# Stall windows listed in the human-readable summary (worst first).
+TOP_WINDOWS = 10
+
+
+def analyze_stream_command(
+    gcode_file: Path = GCODE_ARGUMENT,
+    baud_rate: int = typer.Option(250_000, "--baud-rate", "-b", min=1, help="Serial baud rate."),
+    ack_latency_ms: float = typer.Option(
+        2.0,
+        "--ack-latency",
+        min=0.0,
+        help="Per-line ack round trip in milliseconds, beyond the line's own bytes.",
+    ),
+    buffer_depth: int = typer.Option(
+        16, "--buffer-depth", min=1, help="Planner blocks the controller buffers."
+    ),
+    unframed: bool = typer.Option(
+        False, "--unframed", help="Model lines sent without line numbers and checksums."
+    ),
+    json_output: bool = JSON_OPTION,
+) -> None:
+    """Predict whether a program can be streamed without starving the controller."""
+    commands = gcode_file.read_text(encoding="utf-8").splitlines()
+    link = LinkModel(
+        baud_rate=baud_rate,
+        ack_latency_s=ack_latency_ms / 1000.0,
+        buffer_depth=buffer_depth,
+        framed=not unframed,
+    )
+    try:
+        result = analyze_stream(read_program(commands), link)
+    except (SimulationError, ProgramReadError) as exc:
+        typer.echo(f"Analysis failed: {exc}", err=True)
+        raise typer.Exit(code=1) from exc
+
+    if json_output:
+        payload = asdict(result)
+        for layer, usage in zip(payload["layers"], result.layers, strict=True):
+            layer["utilization"] = usage.utilization
+        echo_json(payload)
+        return
+
+    typer.echo(
+        f"{result.lines} lines / {result.bytes} bytes at {baud_rate} baud: "
+        f"{result.stream_time_s:.2f}s streamed vs {result.machine_time_s:.2f}s of motion"
+    )
+    typer.echo(
+        f"  min sustainable segment: {result.min_sustainable_segment_mm:.3f} mm"
+        f"  (median segment {result.median_segment_mm:.3f} mm)"
+    )
+    for usage in result.layers:
+        utilization = "-" if usage.utilization is None else f"{usage.utilization:.0%}"
+        typer.echo(
+            f"  layer {usage.index}: link {utilization}"
+            f"  stalls {usage.stall_s:.2f}s over {usage.lines} lines"
+        )
+    if not result.stall_windows:
+        typer.echo("No stalls predicted.")
+        return
+    typer.echo(
+        f"{len(result.stall_windows)} stall windows, {result.stall_time_s:.2f}s stalled; worst:"
+    )
+    worst = sorted(result.stall_windows, key=lambda window: window.stall_s, reverse=True)
+    for window in worst[:TOP_WINDOWS]:
+        typer.echo(
+            f"  lines {window.first_line}-{window.last_line} (layer {window.layer}) "
+            f"at {window.start_s:.1f}s: {window.stall_s:.3f}s over {window.stalls} stalls"
+        )
@@ -0,0 +1,149 @@
+"""CLI batch commands: plan, simulate or plot many files on a process pool."""
+
+from __future__ import annotations
+
+import glob
+import json
+import os
+import time
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+import typer
+from fiberpath.batch import BatchResult, plan_many, plot_many, simulate_many
+from fiberpath.config import (
+    MachineProfile,
+    MachineProfileError,
+    default_machine_profile,
+    load_machine_profile,
+)
+from fiberpath.planning import PlanOptions
+
+batch_app = typer.Typer(
+    help=(
+        "Run plan, simulate or plot over many files on a pool of warm worker processes. "
+        "Prints one JSON line per file as it finishes."
+    ),
+    no_args_is_help=True,
+)
+
+PATTERNS_ARGUMENT = typer.Argument(
+    ..., help="Files or glob patterns; quote patterns so the shell leaves them (** recurses)."
+)
+WORKERS_OPTION = typer.Option(
+    None, "--workers", "-j", min=1, help="Worker processes (default: the CPU count)."
+)
+OUT_DIR_OPTION = typer.Option(
+    None,
+    "--out-dir",
+    file_okay=False,
+    help="Write outputs here, at each input's path below their common directory "
+    "(default: beside each input).",
+)
+SUMMARY_OPTION = typer.Option(
+    None, "--summary", dir_okay=False, help="Also write the batch summary JSON to this file."
+)
+PROFILE_OPTION = typer.Option(
+    None, "--profile", exists=True, dir_okay=False, help="Machine profile JSON."
+)
+SCALE_OPTION = typer.Option(
+    1.0, "--scale", help="Pixels per millimeter along carriage axis", min=0.1, max=5.0
+)
+
+
+@batch_app.command("plan")
+def batch_plan_command(
+    patterns: list[str] = PATTERNS_ARGUMENT,
+    workers: int | None = WORKERS_OPTION,
+    out_dir: Path | None = OUT_DIR_OPTION,
+    profile_file: Path | None = PROFILE_OPTION,
+    summary_file: Path | None = SUMMARY_OPTION,
+) -> None:
+    """Plan every matching .wind file to .gcode."""
+    options = PlanOptions(profile=_profile(profile_file) or default_machine_profile())
+    files = _expand(patterns)
+    results = plan_many(files, options, workers=workers, output_dir=out_dir)
+    _report("plan", files, results, workers, summary_file)
+
+
+@batch_app.command("simulate")
+def batch_simulate_command(
+    patterns: list[str] = PATTERNS_ARGUMENT,
+    workers: int | None = WORKERS_OPTION,
+    profile_file: Path | None = PROFILE_OPTION,
+    summary_file: Path | None = SUMMARY_OPTION,
+) -> None:
+    """Simulate every matching G-code file."""
+    profile = _profile(profile_file)
+    files = _expand(patterns)
+    _report(
+        "simulate", files, simulate_many(files, profile, workers=workers), workers, summary_file
+    )
+
+
+@batch_app.command("plot")
+def batch_plot_command(
+    patterns: list[str] = PATTERNS_ARGUMENT,
+    workers: int | None = WORKERS_OPTION,
+    out_dir: Path | None = OUT_DIR_OPTION,
+    scale: float = SCALE_OPTION,
+    summary_file: Path | None = SUMMARY_OPTION,
+) -> None:
+    """Render a PNG preview of every matching G-code file."""
+    files = _expand(patterns)
+    results = plot_many(files, scale, workers=workers, output_dir=out_dir)
+    _report("plot", files, results, workers, summary_file)
+
+
+def _profile(profile_file: Path | None) -> MachineProfile | None:
+    try:
+        return load_machine_profile(profile_file) if profile_file else None
+    except MachineProfileError as exc:
+        raise typer.BadParameter(str(exc), param_hint="--profile") from exc
+
+
+def _expand(patterns: Iterable[str]) -> list[Path]:
+    files: dict[Path, None] = {}
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True))
+        files.update((Path(match), None) for match in matches if Path(match).is_file())
+    if not files:
+        raise typer.BadParameter(f"no files match {' '.join(patterns)}", param_hint="PATTERNS")
+    return list(files)
+
+
+def _report(
+    task: str,
+    files: list[Path],
+    results: Iterator[BatchResult],
+    workers: int | None,
+    summary_file: Path | None,
+) -> None:
+    start = time.perf_counter()
+    failures: list[dict[str, object]] = []
+    for result in results:
+        typer.echo(json.dumps(result.to_json()))
+        if not result.ok:
+            failures.append({"path": str(result.path), "error": result.error})
+    elapsed = time.perf_counter() - start
+
+    summary = {
+        "task": task,
+        "files": len(files),
+        "succeeded": len(files) - len(failures),
+        "failed": len(failures),
+        "workers": min(workers or os.cpu_count() or 1, len(files)),
+        "elapsedSeconds": elapsed,
+        "filesPerSecond": len(files) / elapsed if elapsed > 0 else None,
+        "failures": failures,
+    }
+    if summary_file is not None:
+        summary_file.parent.mkdir(parents=True, exist_ok=True)
+        summary_file.write_text(json.dumps(summary, indent=2) + "\n", encoding="utf-8")
+    typer.echo(
+        f"batch {task}: {summary['succeeded']}/{len(files)} files in {elapsed:.2f}s "
+        f"with {summary['workers']} worker(s) ({len(failures)} failed)",
+        err=True,
+    )
+    if failures:
+        raise typer.Exit(code=1)
@@ -4,10 +4,13 @@ from __future__ import annotations
 
 import typer
 
+from .analyze_stream import analyze_stream_command
+from .batch import batch_app
 from .plan import plan_command
 from .plot import plot_command
 from .simulate import simulate_command
 from .stream import stream_command
+from .sweep import sweep_command
 from .validate import validate_command
 
 app = typer.Typer(
@@ -21,6 +24,9 @@ app.command("plot")(plot_command)
 app.command("simulate")(simulate_command)
 app.command("validate")(validate_command)
 app.command("stream")(stream_command)
+app.command("analyze-stream")(analyze_stream_command)
+app.command("sweep")(sweep_command)
+app.add_typer(batch_app, name="batch")
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -6,9 +6,56 @@ import json
 from typing import Any
 
 import typer
+from fiberpath.gcode.compact import DEFAULT_BAUD_RATE, CompactionStats
+from fiberpath.streaming import StreamMetrics
 
 
-def echo_json(payload: Any) -> None:
-    """Pretty-print payload as JSON."""
+def echo_json(payload: Any, *, err: bool = False) -> None:
+    """Pretty-print payload as JSON (to stderr with ``err``)."""
 
-    typer.echo(json.dumps(payload, indent=2))
+    typer.echo(json.dumps(payload, indent=2), err=err)
+
+
+def compaction_summary(
+    stats: CompactionStats, baud_rate: int = DEFAULT_BAUD_RATE
+) -> dict[str, int | float]:
+    """JSON fields describing a ``--wire-compact`` rewrite."""
+
+    return {
+        "linesBefore": stats.lines_before,
+        "linesAfter": stats.lines_after,
+        "bytesBefore": stats.bytes_before,
+        "bytesAfter": stats.bytes_after,
+        "bytesSaved": stats.bytes_saved,
+        "baudRate": baud_rate,
+        "linkSecondsSaved": stats.link_seconds_saved(baud_rate),
+    }
+
+
+def telemetry_summary(metrics: StreamMetrics) -> dict[str, object]:
+    """JSON fields describing a live stream's telemetry."""
+
+    latency = metrics.latency
+    return {
+        "linesSent": metrics.lines_sent,
+        "linesAcked": metrics.lines_acked,
+        "bytesSent": metrics.bytes_sent,
+        "elapsedSeconds": metrics.elapsed_s,
+        "pausedSeconds": metrics.paused_s,
+        "lockWaitSeconds": metrics.lock_wait_s,
+        "linesPerSecond": metrics.lines_per_s,
+        "bytesPerSecond": metrics.bytes_per_s,
+        "meanLinesPerSecond": metrics.mean_lines_per_s,
+        "stalls": metrics.stalls,
+        "stallSeconds": metrics.stall_s,
+        "longestStallSeconds": metrics.longest_stall_s,
+        "latencyMs": {
+            "count": latency.count,
+            "mean": latency.mean_ms,
+            "p50": latency.p50_ms,
+            "p90": latency.p90_ms,
+            "p99": latency.p99_ms,
+            "max": latency.max_ms,
+            "buckets": latency.buckets,
+        },
+    }
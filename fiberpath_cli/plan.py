@@ -6,19 +6,32 @@ from dataclasses import asdict
 from pathlib import Path
 
 import typer
-from fiberpath.config import WindFileError, load_wind_definition
+from fiberpath.config import (
+    MachineProfileError,
+    WindFileError,
+    default_machine_profile,
+    load_machine_profile,
+    load_wind_definition,
+)
 from fiberpath.gcode import write_gcode
+from fiberpath.gcode.compact import (
+    DEFAULT_BAUD_RATE,
+    CompactionStats,
+    WireCompactOptions,
+    compact_gcode,
+)
 from fiberpath.planning import PlanOptions, plan_wind
 from rich.console import Console
 from rich.table import Table
 
-from .output import echo_json
+from .output import compaction_summary, echo_json
 
-console = Console()
+# The output path that writes the program to stdout.
+STDOUT = "-"
 
 WIND_FILE_ARGUMENT = typer.Argument(..., exists=True, readable=True, help="Input .wind file")
 OUTPUT_OPTION = typer.Option(
-    Path("output.gcode"), "--output", "-o", help="Destination for generated G-code"
+    Path("output.gcode"), "--output", "-o", help="Destination for generated G-code ('-': stdout)"
 )
 VERBOSE_OPTION = typer.Option(False, "--verbose", "-v", help="Emit verbose planner output")
 JSON_OPTION = typer.Option(
@@ -26,6 +39,35 @@ JSON_OPTION = typer.Option(
     "--json",
     help="Emit machine-readable JSON instead of human-readable text.",
 )
+REZERO_MANDREL_OPTION = typer.Option(
+    False,
+    "--rezero-mandrel",
+    help="Re-zero the mandrel axis (G92 A<angle mod 360>) at pass turnarounds.",
+)
+SCHEDULE_FEEDS_OPTION = typer.Option(
+    False,
+    "--schedule-feeds",
+    help="Run each move at the fastest feed the --profile kinematics allow.",
+)
+WIRE_COMPACT_OPTION = typer.Option(
+    False,
+    "--wire-compact",
+    help="Omit unchanged modal axes and round coordinates to the machine resolution.",
+)
+WIRE_RESOLUTION_OPTION = typer.Option(
+    0.001,
+    "--wire-resolution",
+    min=1e-6,
+    help="Machine resolution for --wire-compact (mm on the carriage, degrees on rotary axes).",
+)
+
+PROFILE_OPTION = typer.Option(
+    None,
+    "--profile",
+    exists=True,
+    dir_okay=False,
+    help="Machine profile JSON; its timeCalibration, if fitted, calibrates the reported times.",
+)
 
 
 def plan_command(
@@ -33,33 +75,78 @@ def plan_command(
     output: Path = OUTPUT_OPTION,
     verbose: bool = VERBOSE_OPTION,
     json_output: bool = JSON_OPTION,
+    rezero_mandrel: bool = REZERO_MANDREL_OPTION,
+    wire_compact: bool = WIRE_COMPACT_OPTION,
+    wire_resolution: float = WIRE_RESOLUTION_OPTION,
+    profile_file: Path | None = PROFILE_OPTION,
+    schedule_feeds: bool = SCHEDULE_FEEDS_OPTION,
 ) -> None:
     try:
         wind_definition = load_wind_definition(wind_file)
     except WindFileError as exc:  # pragma: no cover - CLI glue
         raise typer.BadParameter(str(exc)) from exc
+    try:
+        profile = load_machine_profile(profile_file) if profile_file else default_machine_profile()
+    except MachineProfileError as exc:
+        raise typer.BadParameter(str(exc)) from exc
 
     try:
-        result = plan_wind(wind_definition, PlanOptions(verbose=verbose))
+        result = plan_wind(
+            wind_definition,
+            PlanOptions(
+                verbose=verbose,
+                profile=profile,
+                rezero_mandrel=rezero_mandrel,
+                schedule_feeds=schedule_feeds,
+            ),
+        )
     except Exception as exc:  # pragma: no cover - defensive guard
         typer.echo(f"Planning failed: {exc}", err=True)
         raise typer.Exit(code=1) from exc
 
-    destination = write_gcode(result.commands, output)
+    commands = result.commands
+    compaction: CompactionStats | None = None
+    if wire_compact:
+        options = WireCompactOptions(
+            linear_resolution_mm=wire_resolution, rotary_resolution_deg=wire_resolution
+        )
+        commands, compaction = compact_gcode(commands, options)
+
+    # With "-o -" the program goes to stdout, so the summary goes to stderr.
+    to_stdout = str(output) == STDOUT
+    if to_stdout:
+        typer.echo("\n".join(commands))
+    destination = output if to_stdout else write_gcode(commands, output)
+    console = Console(stderr=to_stdout)
 
     summary = {
         "output": str(destination),
-        "commands": len(result.commands),
+        "commands": len(commands),
         "timeSeconds": result.total_time_s,
         "towMeters": result.total_tow_m,
         "layers": [asdict(metric) for metric in result.layers],
     }
+    if result.unscheduled_time_s is not None:
+        summary["unscheduledTimeSeconds"] = result.unscheduled_time_s
+    if compaction is not None:
+        summary["wireCompact"] = compaction_summary(compaction)
 
     if json_output:
-        echo_json(summary)
+        echo_json(summary, err=to_stdout)
         return
 
     console.print(f"[green]Wrote[/green] {summary['commands']} commands to {destination}")
+    if result.unscheduled_time_s is not None:
+        saved = result.unscheduled_time_s - result.total_time_s
+        console.print(
+            f"[cyan]Feed schedule[/cyan] {result.total_time_s:.1f}s "
+            f"(was {result.unscheduled_time_s:.1f}s, {saved:.1f}s saved)"
+        )
+    if compaction is not None:
+        console.print(
+            f"[cyan]Wire-compact[/cyan] saved {compaction.bytes_saved} bytes "
+            f"(~{compaction.link_seconds_saved():.2f}s of serial time at {DEFAULT_BAUD_RATE} baud)"
+        )
     if verbose:
         table = Table(title="Layer metrics", expand=False)
         table.add_column("#", justify="right")
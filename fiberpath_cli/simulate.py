@@ -6,6 +6,7 @@ from dataclasses import asdict
 from pathlib import Path
 
 import typer
+from fiberpath.config import MachineProfileError, load_machine_profile
 from fiberpath.gcode import ProgramReadError, read_program
 from fiberpath.simulation import SimulationError, simulate_program
 
@@ -13,12 +14,30 @@ from .output import echo_json
 
 GCODE_ARGUMENT = typer.Argument(..., exists=True, readable=True, file_okay=True, dir_okay=False)
 JSON_OPTION = typer.Option(False, "--json", help="Emit machine-readable JSON summary")
-
-
-def simulate_command(gcode_file: Path = GCODE_ARGUMENT, json_output: bool = JSON_OPTION) -> None:
+PROFILE_OPTION = typer.Option(
+    None,
+    "--profile",
+    exists=True,
+    dir_okay=False,
+    help=(
+        "Machine profile JSON; its timeCalibration, if fitted, calibrates the estimate "
+        "and its kinematics add an acceleration-aware one."
+    ),
+)
+
+
+def simulate_command(
+    gcode_file: Path = GCODE_ARGUMENT,
+    json_output: bool = JSON_OPTION,
+    profile_file: Path | None = PROFILE_OPTION,
+) -> None:
+    try:
+        profile = load_machine_profile(profile_file) if profile_file else None
+    except MachineProfileError as exc:
+        raise typer.BadParameter(str(exc)) from exc
     commands = Path(gcode_file).read_text(encoding="utf-8").splitlines()
     try:
-        result = simulate_program(read_program(commands))
+        result = simulate_program(read_program(commands), profile)
     except (SimulationError, ProgramReadError) as exc:
         typer.echo(f"Simulation failed: {exc}", err=True)
         raise typer.Exit(code=1) from exc
@@ -35,3 +54,9 @@ def simulate_command(gcode_file: Path = GCODE_ARGUMENT, json_output: bool = JSON
         f"  tow: {result.tow_length_mm / 1000.0:.3f} m"
         f"  avg feed: {result.average_feed_rate_mmpm:.0f} mm/min"
     )
+    if result.kinematics is not None:
+        estimate = result.kinematics
+        typer.echo(
+            f"  with acceleration: {estimate.time_s:.2f}s"
+            f" ({estimate.moves_below_feed} of {estimate.moves} moves below feed)"
+        )
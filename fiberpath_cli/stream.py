@@ -2,14 +2,53 @@
 
 from __future__ import annotations
 
+import inspect
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
 import typer
+from fiberpath.config import (
+    MachineProfileError,
+    WindFileError,
+    default_machine_profile,
+    load_machine_profile,
+    load_wind_definition,
+)
+from fiberpath.emulator import URL_SCHEME, register_url_handler
+from fiberpath.gcode import ProgramReadError
+from fiberpath.gcode.compact import CompactionStats, WireCompactOptions, compact_gcode
+from fiberpath.planning import PlanningError, PlanOptions, plan_wind
+from fiberpath.streaming import (
+    GcodeSource,
+    PlanStream,
+    SdOffload,
+    SdOptions,
+    SdProgress,
+    StreamTelemetry,
+    TelemetryTransport,
+    iter_commands,
+    sd_file_size,
+)
 from marlin_host import HostError, MarlinHost, SerialTransport
 
-from .output import echo_json
+from .output import compaction_summary, echo_json, telemetry_summary
 
-GCODE_ARGUMENT = typer.Argument(..., exists=True, readable=True, file_okay=True, dir_okay=False)
+GCODE_ARGUMENT = typer.Argument(
+    ...,
+    exists=True,
+    readable=True,
+    file_okay=True,
+    dir_okay=False,
+    allow_dash=True,
+    help="G-code file ('-' reads stdin), or a .wind definition to plan while it streams.",
+)
+PROFILE_OPTION = typer.Option(
+    None,
+    "--profile",
+    exists=True,
+    dir_okay=False,
+    help="Machine profile JSON to plan a .wind definition for (default: the bundled one).",
+)
 PROGRESS_INTERVAL = 25
 
 
@@ -19,7 +58,10 @@ def stream_command(
         None,
         "--port",
         "-p",
-        help="Serial port or pyserial URL (required unless --dry-run).",
+        help=(
+            "Serial port or pyserial URL (required unless --dry-run); "
+            f"{URL_SCHEME}:// streams to the built-in Marlin emulator."
+        ),
     ),
     baud_rate: int = typer.Option(250_000, "--baud-rate", "-b", help="Marlin baud rate."),
     response_timeout: float = typer.Option(
@@ -39,6 +81,35 @@ def stream_command(
         "--json",
         help="Emit final summary as JSON (progress lines suppressed).",
     ),
+    wire_compact: bool = typer.Option(
+        False,
+        "--wire-compact",
+        help="Re-serialize FiberPath G-code with unchanged modal axes omitted before sending.",
+    ),
+    wire_resolution: float = typer.Option(
+        0.001,
+        "--wire-resolution",
+        min=1e-6,
+        help="Machine resolution for --wire-compact (mm on the carriage, degrees on rotary axes).",
+    ),
+    sd: bool = typer.Option(
+        False,
+        "--sd",
+        help="Upload the program to the controller's SD card and print it from there.",
+    ),
+    sd_name: str = typer.Option(
+        "FIBERPTH", "--sd-name", help="8.3 file name stem on the SD card (upper case)."
+    ),
+    sd_chunk_lines: int | None = typer.Option(
+        None,
+        "--sd-chunk-lines",
+        min=1,
+        help="Upload in files of this many lines, each verified on its own.",
+    ),
+    sd_poll: float = typer.Option(
+        1.0, "--sd-poll", min=0.0, help="Seconds between SD progress polls (M27)."
+    ),
+    profile_file: Path | None = PROFILE_OPTION,
 ) -> None:
     """Stream the provided G-code file to a Marlin device.
 
@@ -46,36 +117,133 @@ def stream_command(
     handshake are handled by the marlin-host library. Press Ctrl+C to abort a live
     stream gracefully (it stops before the next line); for interactive pause/resume
     use the desktop GUI.
+
+    With --sd the program is written to the controller's SD card (M28/M29, the
+    size verified with M23) and printed from there (M23/M24), with progress
+    polled through M27; the link then carries no motion while the machine runs.
+
+    A G-code file, or stdin with '-', is read a line at a time as it streams,
+    after a pre-scan that counts its commands, so memory stays flat however long
+    the program is. A .wind definition is planned layer by layer while it
+    streams, so the first line is sent as soon as the definition validates.
+    (--sd and --wire-compact need the whole program, so they read or plan it in
+    full first; so does --dry-run for a definition.)
     """
     if not dry_run and port is None:
         raise typer.BadParameter("--port is required for live streaming", param_hint="--port")
+    sd_options: SdOptions | None = None
+    if sd:
+        try:
+            sd_options = SdOptions(
+                name=sd_name, chunk_lines=sd_chunk_lines, poll_interval_s=sd_poll
+            )
+        except ValueError as exc:
+            raise typer.BadParameter(str(exc), param_hint="--sd-name") from exc
 
-    program = (line.strip() for line in gcode_file.read_text(encoding="utf-8").splitlines())
-    commands = [line for line in program if line and not line.startswith(";")]
-    total = len(commands)
-    if total == 0:
+    plan_stream: PlanStream | None = None
+    source: GcodeSource | None = None
+    lines: Iterable[str]
+    if gcode_file.suffix == ".wind":
+        try:
+            definition = load_wind_definition(gcode_file)
+            profile = load_machine_profile(profile_file) if profile_file else None
+        except (WindFileError, MachineProfileError) as exc:
+            raise typer.BadParameter(str(exc)) from exc
+        plan_options = PlanOptions(profile=profile or default_machine_profile())
+        try:
+            if sd or wire_compact or dry_run:
+                lines = plan_wind(definition, plan_options).commands
+            else:
+                plan_stream = PlanStream(definition, plan_options)
+                lines = []
+        except PlanningError as exc:
+            typer.echo(f"Streaming failed: cannot plan {gcode_file.name}: {exc}", err=True)
+            raise typer.Exit(code=1) from exc
+    else:
+        try:
+            source = GcodeSource(gcode_file)
+        except (OSError, UnicodeDecodeError) as exc:
+            raise typer.BadParameter(f"cannot read {gcode_file}: {exc}") from exc
+        lines = source.lines()
+    compaction: CompactionStats | None = None
+    if wire_compact:
+        options = WireCompactOptions(
+            linear_resolution_mm=wire_resolution, rotary_resolution_deg=wire_resolution
+        )
+        try:
+            lines, compaction = compact_gcode(list(lines), options)
+        except ProgramReadError as exc:
+            typer.echo(f"Streaming failed: cannot wire-compact: {exc}", err=True)
+            raise typer.Exit(code=1) from exc
+        source = None  # stream the rewritten program
+    program: list[str] = []  # the whole program, when it is read up front
+    commands: Iterable[str]
+    if source is not None and not sd:
+        commands = source.commands()  # read as it streams
+        total = source.total
+    else:
+        commands = program = list(iter_commands(lines))
+        total = len(program)
+    if total == 0 and plan_stream is None:
+        if source is not None:
+            source.close()
         typer.echo("Streaming failed: G-code program contained no commands", err=True)
         raise typer.Exit(code=1)
 
     sent = 0
     aborted = False
     host: MarlinHost | None = None
+    telemetry: StreamTelemetry | None = None
+    offload: SdOffload | None = None
     try:
         if dry_run:
             for sent, command in enumerate(commands, start=1):
                 if not json_output:
                     typer.echo(f"[{sent}/{total}] (dry-run) {command}")
+        elif sd_options is not None:
+            assert port is not None  # guarded above
+            register_url_handler()
+            transport = TelemetryTransport(
+                SerialTransport(port, baud_rate, timeout=response_timeout)
+            )
+            host = MarlinHost(transport, reliable=True, idle_timeout=response_timeout)
+            host.connect()
+            telemetry = transport.telemetry = StreamTelemetry()
+            offload = SdOffload(host, program, sd_options)
+            sd_run = offload.run()
+            last: SdProgress | None = None
+            try:
+                for last in sd_run:
+                    sent = last.lines
+                    if not json_output and _should_print(sent, total, verbose=verbose):
+                        typer.echo(
+                            f"[{sent}/{total}] (sd {last.phase}, file {last.part}/{last.parts})"
+                        )
+            except KeyboardInterrupt:
+                _abort_offload(host, offload, sd_run, last)
+                aborted = True
+                if not json_output:
+                    typer.echo(f"\nAborted at {sent}/{total} (Ctrl+C).")
         else:
             assert port is not None  # guarded above
-            host = MarlinHost(
-                SerialTransport(port, baud_rate, timeout=response_timeout),
-                reliable=True,
-                idle_timeout=response_timeout,
+            register_url_handler()
+            transport = TelemetryTransport(
+                SerialTransport(port, baud_rate, timeout=response_timeout)
             )
+            host = MarlinHost(transport, reliable=True, idle_timeout=response_timeout)
             host.connect()
+            # Measure the stream, not the connect handshake.
+            telemetry = transport.telemetry = StreamTelemetry()
+            if plan_stream is not None:
+                progress_stream = plan_stream.stream(host)
+            elif source is not None:
+                progress_stream = source.stream(host)
+            else:
+                progress_stream = host.stream(commands)
             try:
-                for progress in host.stream(commands):
+                for progress in progress_stream:
                     sent = progress.commands_sent
+                    total = progress.total_commands  # grows while a definition is planned
                     if not json_output and _should_print(sent, total, verbose=verbose):
                         typer.echo(f"[{sent}/{total}] (live) {progress.command}")
             except KeyboardInterrupt:  # pragma: no cover - interactive abort
@@ -83,26 +251,81 @@ def stream_command(
                 aborted = True
                 if not json_output:
                     typer.echo(f"\nAborted at {sent}/{total} (Ctrl+C).")
-    except HostError as exc:
+    except (HostError, PlanningError) as exc:
         typer.echo(f"Streaming failed: {exc}", err=True)
         raise typer.Exit(code=1) from exc
     finally:
+        if plan_stream is not None:
+            plan_stream.close()
+        if source is not None:
+            source.close()
+        if telemetry is not None:
+            telemetry.finish()
         if host is not None:
             host.close()
 
-    summary = {
-        "status": "dry-run" if dry_run else ("aborted" if aborted else "live"),
+    live = "sd" if sd_options is not None else "live"
+    summary: dict[str, object] = {
+        "status": "dry-run" if dry_run else ("aborted" if aborted else live),
         "commands": sent,
         "total": total,
         "baudRate": baud_rate,
         "dryRun": dry_run,
     }
+    if compaction is not None:
+        summary["wireCompact"] = compaction_summary(compaction, baud_rate)
+    if sd_options is not None:
+        summary["sd"] = {
+            "files": offload.files if offload is not None else [],
+            "bytes": sd_file_size(program),
+        }
+    metrics = telemetry.snapshot() if telemetry is not None else None
+    if metrics is not None:
+        summary["telemetry"] = telemetry_summary(metrics)
     if json_output:
         echo_json(summary)
         return
 
     status = "Dry-run" if dry_run else ("Aborted" if aborted else "Streamed")
+    if sd_options is not None and not dry_run and not aborted:
+        status = "Printed from SD"
     typer.echo(f"{status} {sent}/{total} commands at {baud_rate} baud.")
+    if offload is not None:
+        typer.echo(f"SD card: {offload.size} bytes in {', '.join(offload.files)}.")
+    elif sd_options is not None:
+        typer.echo(f"SD card: {sd_file_size(program)} bytes.")
+    if metrics is not None:
+        latency = metrics.latency
+        typer.echo(
+            f"{metrics.mean_lines_per_s:.0f} lines/s; ok latency p50 {latency.p50_ms:.1f} ms, "
+            f"p99 {latency.p99_ms:.1f} ms, max {latency.max_ms:.1f} ms; "
+            f"{metrics.stalls} host stalls ({metrics.stall_s:.2f}s)."
+        )
+    if compaction is not None:
+        typer.echo(
+            f"Wire-compact saved {compaction.bytes_saved} bytes "
+            f"(~{compaction.link_seconds_saved(baud_rate):.2f}s of serial time)."
+        )
+
+
+def _abort_offload(
+    host: MarlinHost, offload: SdOffload, sd_run: Iterator[SdProgress], last: SdProgress | None
+) -> None:
+    """End an interrupted SD job before the port closes.
+
+    While ``M28`` is open the card stores every line, so nothing may be sent
+    until the upload's own ``M29`` (and ``M30`` of the partial file) has run.
+    """
+    offload.stop()
+    if inspect.getgeneratorstate(sd_run) == inspect.GEN_SUSPENDED:  # type: ignore[arg-type]
+        for _ in sd_run:  # the offload ends itself: M29 and M30, or M524
+            pass
+        return
+    # Ctrl+C landed inside the offload; its finally block has sent M29.
+    if last is None or last.phase == "upload":
+        host.send(f"M30 {offload.files[last.part - 1 if last is not None else 0]}")
+    else:
+        host.send("M524")
 
 
 def _should_print(sent: int, total: int, *, verbose: bool) -> bool:
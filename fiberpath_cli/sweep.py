@@ -0,0 +1,143 @@
+"""CLI sweep command: evaluate every combination of helical-layer settings."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import typer
+from fiberpath.config import (
+    MachineProfileError,
+    WindFileError,
+    default_machine_profile,
+    load_machine_profile,
+    load_wind_definition,
+)
+from fiberpath.planning import (
+    SWEEP_FIELDS,
+    SWEEP_RANKS,
+    PlanningError,
+    PlanOptions,
+    SweepResult,
+    parse_sweep_range,
+    sweep_layer,
+)
+from rich.console import Console
+from rich.table import Table
+
+from .output import echo_json
+
+WIND_FILE_ARGUMENT = typer.Argument(..., exists=True, readable=True, help="Input .wind file")
+VARY_OPTION = typer.Option(
+    ...,
+    "--vary",
+    "-s",
+    help=(
+        "FIELD=RANGE to sweep, repeatable; RANGE is start:stop[:step] or a,b,c. "
+        f"Fields: {', '.join(SWEEP_FIELDS)}."
+    ),
+)
+LAYER_OPTION = typer.Option(
+    None, "--layer", min=1, help="1-based index of the helical layer (default: the first)."
+)
+RANK_OPTION = typer.Option("time", "--rank", help=f"Rank by {', '.join(SWEEP_RANKS)}.")
+TOP_OPTION = typer.Option(20, "--top", min=0, help="Show the best N points (0: all).")
+CSV_OPTION = typer.Option(False, "--csv", help="Write the ranked points to stdout as CSV.")
+JSON_OPTION = typer.Option(
+    False,
+    "--json",
+    help="Emit machine-readable JSON instead of human-readable text.",
+)
+WORKERS_OPTION = typer.Option(
+    None, "--workers", "-j", min=1, help="Worker processes (default: the CPU count)."
+)
+PROFILE_OPTION = typer.Option(
+    None,
+    "--profile",
+    exists=True,
+    dir_okay=False,
+    help="Machine profile JSON; its timeCalibration, if fitted, calibrates the times.",
+)
+
+
+def sweep_command(
+    wind_file: Path = WIND_FILE_ARGUMENT,
+    vary: list[str] = VARY_OPTION,
+    layer: int | None = LAYER_OPTION,
+    rank: str = RANK_OPTION,
+    top: int = TOP_OPTION,
+    csv_output: bool = CSV_OPTION,
+    json_output: bool = JSON_OPTION,
+    workers: int | None = WORKERS_OPTION,
+    profile_file: Path | None = PROFILE_OPTION,
+) -> None:
+    """Plan every combination of the swept layer fields and rank the valid ones."""
+    try:
+        definition = load_wind_definition(wind_file)
+    except WindFileError as exc:  # pragma: no cover - CLI glue
+        raise typer.BadParameter(str(exc)) from exc
+    try:
+        profile = load_machine_profile(profile_file) if profile_file else default_machine_profile()
+    except MachineProfileError as exc:
+        raise typer.BadParameter(str(exc), param_hint="--profile") from exc
+
+    try:
+        result = sweep_layer(
+            definition,
+            _ranges(vary),
+            layer_index=layer,
+            options=PlanOptions(profile=profile),
+            rank_by=rank,
+            workers=workers,
+        )
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+    except PlanningError as exc:
+        typer.echo(f"Sweep failed: {exc}", err=True)
+        raise typer.Exit(code=1) from exc
+
+    limit = top or None
+    if csv_output:
+        result.write_csv(sys.stdout, limit)
+    elif json_output:
+        echo_json(result.to_json(limit))
+    else:
+        _print_table(result, limit)
+
+
+def _ranges(vary: list[str]) -> dict[str, list[float]]:
+    ranges: dict[str, list[float]] = {}
+    for spec in vary:
+        name, sep, text = spec.partition("=")
+        if not sep:
+            raise typer.BadParameter(f"expected FIELD=RANGE, got {spec!r}", param_hint="--vary")
+        try:
+            ranges[name.strip()] = parse_sweep_range(text)
+        except ValueError as exc:
+            raise typer.BadParameter(f"{name}: {exc}", param_hint="--vary") from exc
+    return ranges
+
+
+def _print_table(result: SweepResult, limit: int | None) -> None:
+    console = Console()
+    table = Table(title=f"Layer {result.layer_index} sweep, by {result.rank_by}", expand=False)
+    table.add_column("#", justify="right")
+    for name in result.fields:
+        table.add_column(name, justify="right")
+    table.add_column("Circuits", justify="right")
+    table.add_column("Time (s)", justify="right")
+    table.add_column("Tow (m)", justify="right")
+    for rank, point in enumerate(result.points[:limit], start=1):
+        table.add_row(
+            str(rank),
+            *(f"{point.values[name]:g}" for name in result.fields),
+            str(point.circuits),
+            f"{point.time_s:.1f}",
+            f"{point.tow_m:.3f}",
+        )
+    console.print(table)
+    console.print(
+        f"[cyan]Swept[/cyan] {result.candidates} candidates in {result.elapsed_s:.2f}s "
+        f"({result.candidates_per_s:.0f}/s): {result.pruned} pruned, "
+        f"{len(result.points)} valid"
+    )
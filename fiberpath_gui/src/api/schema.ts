@@ -4,6 +4,26 @@
  */
 
 export interface paths {
+    "/cache": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Cache Stats
+         * @description Occupancy and per-route hit rates of the compute-result cache, for tuning.
+         */
+        get: operations["cache_stats_cache_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/health": {
         parameters: {
             query?: never;
@@ -24,6 +44,26 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/machine/calibration": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get?: never;
+        put?: never;
+        /**
+         * Calibrate
+         * @description Fit a profile's time calibration to the recent jobs streamed on this port.
+         */
+        post: operations["calibrate_machine_calibration_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/machine/commands": {
         parameters: {
             query?: never;
@@ -99,7 +139,7 @@ export interface paths {
         put?: never;
         /**
          * Start Job
-         * @description Start streaming a G-code program on a background worker.
+         * @description Start streaming a G-code program (or offloading it to the SD card) on a worker.
          */
         post: operations["start_job_machine_jobs_post"];
         delete?: never;
@@ -188,6 +228,26 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/machine/metrics": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Metrics
+         * @description Streaming telemetry of the current job (or the last one, once it ended).
+         */
+        get: operations["metrics_machine_metrics_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/machine/ports": {
         parameters: {
             query?: never;
@@ -208,27 +268,35 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
-    "/plan": {
+    "/machine/queue": {
         parameters: {
             query?: never;
             header?: never;
             path?: never;
             cookie?: never;
         };
-        get?: never;
+        /**
+         * Get Queue
+         * @description The running job and the queued jobs, in the order they will start.
+         */
+        get: operations["get_queue_machine_queue_get"];
         put?: never;
         /**
-         * Plan
-         * @description Plan a wind from an in-memory definition and return the G-code program.
+         * Enqueue Job
+         * @description Validate and compile a program now and start it when its turn comes.
+         *
+         *     It starts at once when the machine is connected and idle (unless held), and
+         *     otherwise as soon as the jobs ahead of it complete. Cancel a queued job
+         *     through ``/jobs/{job_id}/cancel``.
          */
-        post: operations["plan_plan_post"];
+        post: operations["enqueue_job_machine_queue_post"];
         delete?: never;
         options?: never;
         head?: never;
         patch?: never;
         trace?: never;
     };
-    "/plot": {
+    "/machine/queue/{job_id}/start": {
         parameters: {
             query?: never;
             header?: never;
@@ -238,34 +306,41 @@ export interface paths {
         get?: never;
         put?: never;
         /**
-         * Plot
-         * @description Render an unwrapped 2D preview of a G-code program as a PNG.
+         * Start Queued Job
+         * @description Start a queued job now: release a held job, or run one out of turn.
          */
-        post: operations["plot_plot_post"];
+        post: operations["start_queued_job_machine_queue__job_id__start_post"];
         delete?: never;
         options?: never;
         head?: never;
         patch?: never;
         trace?: never;
     };
-    "/simulate": {
+    "/machines": {
         parameters: {
             query?: never;
             header?: never;
             path?: never;
             cookie?: never;
         };
-        get?: never;
+        /**
+         * List Machines
+         * @description Every registered machine with its connection and job state.
+         */
+        get: operations["list_machines_machines_get"];
         put?: never;
-        /** Simulate */
-        post: operations["simulate_simulate_post"];
+        /**
+         * Connect Machine
+         * @description Open a port as a pool member (409 when another member holds it).
+         */
+        post: operations["connect_machine_machines_post"];
         delete?: never;
         options?: never;
         head?: never;
         patch?: never;
         trace?: never;
     };
-    "/validate": {
+    "/machines/{machine_id}": {
         parameters: {
             query?: never;
             header?: never;
@@ -274,141 +349,596 @@ export interface paths {
         };
         get?: never;
         put?: never;
+        post?: never;
         /**
-         * Validate
-         * @description Validate a wind definition.
-         *
-         *     The body is schema-checked by pydantic (malformed -> 422). A full plan run
-         *     surfaces semantic errors (e.g. out-of-range wind angle) as PlanningError,
-         *     which the app maps to 400.
+         * Remove Machine
+         * @description Cancel the member's job, close its port and drop it from the pool.
          */
-        post: operations["validate_validate_post"];
-        delete?: never;
+        delete: operations["remove_machine_machines__machine_id__delete"];
         options?: never;
         head?: never;
         patch?: never;
         trace?: never;
     };
-}
-export type webhooks = Record<string, never>;
-export interface components {
-    schemas: {
+    "/machines/{machine_id}/calibration": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get?: never;
+        put?: never;
         /**
-         * ApiError
-         * @description Error envelope returned for 4xx responses (``{"detail": "..."}``).
+         * Calibrate
+         * @description Fit a profile's time calibration to the recent jobs streamed on this port.
          */
-        ApiError: {
-            /** Detail */
-            detail: string;
+        post: operations["calibrate_machines__machine_id__calibration_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/machines/{machine_id}/commands": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
         };
-        /** CommandRequest */
-        CommandRequest: {
-            /**
-             * Gcode
-             * @description A single G-code command to run manually.
-             */
-            gcode: string;
+        get?: never;
+        put?: never;
+        /**
+         * Send Command
+         * @description Run a single manual G-code command (rejected 409 while a job streams).
+         */
+        post: operations["send_command_machines__machine_id__commands_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/machines/{machine_id}/estop": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
         };
-        /** CommandResponse */
-        CommandResponse: {
-            /** Responses */
-            responses: string[];
+        get?: never;
+        put?: never;
+        /**
+         * Emergency Stop
+         * @description Issue #196 safety stop: write M112 out-of-band, bypassing the lock.
+         */
+        post: operations["emergency_stop_machines__machine_id__estop_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/machines/{machine_id}/jobs": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
         };
-        /** ConnectRequest */
-        ConnectRequest: {
-            /**
-             * Baud Rate
-             * @default 250000
-             */
-            baud_rate: number;
-            /** Port */
-            port: string;
-            /**
-             * Timeout
-             * @default 10
-             */
-            timeout: number;
+        get?: never;
+        put?: never;
+        /**
+         * Start Job
+         * @description Start streaming a G-code program (or offloading it to the SD card) on a worker.
+         */
+        post: operations["start_job_machines__machine_id__jobs_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/machines/{machine_id}/jobs/{job_id}": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
         };
         /**
-         * ConnectionInfoOut
-         * @description Connection banner for the #146 connection-info panel.
+         * Get Job
+         * @description Poll a job's status and the event log entries with ``seq > since``.
          */
-        ConnectionInfoOut: {
-            /** Baud Rate */
-            baud_rate: number;
-            /** Capabilities */
-            capabilities: {
-                [key: string]: boolean;
-            };
-            /** Firmware */
-            firmware: string;
-            /** Port */
-            port: string;
-            /** State */
-            state: string;
+        get: operations["get_job_machines__machine_id__jobs__job_id__get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/machines/{machine_id}/jobs/{job_id}/cancel": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
         };
-        /** GcodeRequest */
-        GcodeRequest: {
-            /**
-             * Gcode
-             * @description G-code program to process, newline separated.
-             */
-            gcode: string;
+        get?: never;
+        put?: never;
+        /**
+         * Cancel Job
+         * @description Stop a job gracefully; the connection stays open.
+         */
+        post: operations["cancel_job_machines__machine_id__jobs__job_id__cancel_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/machines/{machine_id}/jobs/{job_id}/pause": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
         };
-        /** HTTPValidationError */
-        HTTPValidationError: {
-            /** Detail */
-            detail?: components["schemas"]["ValidationError"][];
+        get?: never;
+        put?: never;
+        /**
+         * Pause Job
+         * @description Pause a streaming job before its next line (host-side).
+         */
+        post: operations["pause_job_machines__machine_id__jobs__job_id__pause_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/machines/{machine_id}/jobs/{job_id}/resume": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
         };
-        /** HelicalLayer */
-        HelicalLayer: {
-            /** Leadinmm */
-            leadInMM: number;
-            /** Leadoutdegrees */
-            leadOutDegrees: number;
-            /** Lockdegrees */
-            lockDegrees: number;
-            /** Patternnumber */
-            patternNumber: number;
-            /** Skipindex */
-            skipIndex: number;
+        get?: never;
+        put?: never;
+        /**
+         * Resume Job
+         * @description Resume a paused job.
+         */
+        post: operations["resume_job_machines__machine_id__jobs__job_id__resume_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/machines/{machine_id}/metrics": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Metrics
+         * @description Streaming telemetry of the current job (or the last one, once it ended).
+         */
+        get: operations["metrics_machines__machine_id__metrics_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/machines/{machine_id}/queue": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Get Queue
+         * @description The running job and the queued jobs, in the order they will start.
+         */
+        get: operations["get_queue_machines__machine_id__queue_get"];
+        put?: never;
+        /**
+         * Enqueue Job
+         * @description Validate and compile a program now and start it when its turn comes.
+         *
+         *     It starts at once when the machine is connected and idle (unless held), and
+         *     otherwise as soon as the jobs ahead of it complete. Cancel a queued job
+         *     through ``/jobs/{job_id}/cancel``.
+         */
+        post: operations["enqueue_job_machines__machine_id__queue_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/machines/{machine_id}/queue/{job_id}/start": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get?: never;
+        put?: never;
+        /**
+         * Start Queued Job
+         * @description Start a queued job now: release a held job, or run one out of turn.
+         */
+        post: operations["start_queued_job_machines__machine_id__queue__job_id__start_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/plan": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get?: never;
+        put?: never;
+        /**
+         * Plan
+         * @description Plan a wind from an in-memory definition and return the G-code program.
+         */
+        post: operations["plan_plan_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/plan/metrics": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get?: never;
+        put?: never;
+        /**
+         * Plan Metrics
+         * @description Compute a wind's time, tow and per-layer breakdown without generating G-code.
+         *
+         *     Same validation and metrics as ``/plan`` (to floating-point summation order),
+         *     at a small fraction of the cost; meant for live editing.
+         */
+        post: operations["plan_metrics_plan_metrics_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/plan/patterns": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get?: never;
+        put?: never;
+        /**
+         * Plan Patterns
+         * @description List the valid patternNumber/skipIndex/lockDegrees of a helical layer, fastest first.
+         *
+         *     Solved from the coverage arithmetic rather than by planning candidates, so it
+         *     answers in milliseconds; meant for the layer editor's suggestions.
+         */
+        post: operations["plan_patterns_plan_patterns_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/plot": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get?: never;
+        put?: never;
+        /**
+         * Plot
+         * @description Render an unwrapped 2D preview of a G-code program as a PNG.
+         */
+        post: operations["plot_plot_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/simulate": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get?: never;
+        put?: never;
+        /** Simulate */
+        post: operations["simulate_simulate_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/simulate/stream": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get?: never;
+        put?: never;
+        /**
+         * Analyze Stream Route
+         * @description Predict where streaming the program over the given link starves the controller.
+         */
+        post: operations["analyze_stream_route_simulate_stream_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/validate": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get?: never;
+        put?: never;
+        /**
+         * Validate
+         * @description Validate a wind definition.
+         *
+         *     The body is schema-checked by pydantic (malformed -> 422). A full plan run
+         *     surfaces semantic errors (e.g. out-of-range wind angle) as PlanningError,
+         *     which the app maps to 400.
+         */
+        post: operations["validate_validate_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+}
+export type webhooks = Record<string, never>;
+export interface components {
+    schemas: {
+        /**
+         * ApiError
+         * @description Error envelope returned for 4xx responses (``{"detail": "..."}``).
+         */
+        ApiError: {
+            /** Detail */
+            detail: string;
+        };
+        /**
+         * AxisLimits
+         * @description Motion limits of one axis, in its own units (mm for the carriage, degrees otherwise).
+         */
+        AxisLimits: {
             /**
-             * Skipinitialnearlock
-             * @default false
+             * Maxacceleration
+             * @description Units per second squared; None: unlimited.
              */
-            skipInitialNearLock: boolean;
-            /** Windangle */
-            windAngle: number;
+            maxAcceleration?: number | null;
             /**
-             * @description discriminator enum property added by openapi-typescript
-             * @enum {string}
+             * Maxvelocity
+             * @description Units per second; None: unlimited.
              */
-            windType: "helical";
+            maxVelocity?: number | null;
         };
-        /** HoopLayer */
-        HoopLayer: {
+        /**
+         * CacheNamespaceStatsOut
+         * @description Result-cache counters for one compute route.
+         */
+        CacheNamespaceStatsOut: {
+            /** Coalesced */
+            coalesced: number;
+            /** Hit Rate */
+            hit_rate: number;
+            /** Hits */
+            hits: number;
+            /** Misses */
+            misses: number;
+            /** Not Modified */
+            not_modified: number;
+        };
+        /**
+         * CacheStatsOut
+         * @description Occupancy and hit rates of the sidecar's compute-result cache.
+         */
+        CacheStatsOut: {
+            /** Bytes */
+            bytes: number;
+            /** Entries */
+            entries: number;
+            /** Evictions */
+            evictions: number;
+            /** Max Bytes */
+            max_bytes: number;
+            /** Max Entries */
+            max_entries: number;
+            /** Namespaces */
+            namespaces: {
+                [key: string]: components["schemas"]["CacheNamespaceStatsOut"];
+            };
+        };
+        /** CalibrationOut */
+        CalibrationOut: {
             /**
-             * Terminal
-             * @default false
+             * Jobs
+             * @description Completed jobs the fit used.
              */
-            terminal: boolean;
+            jobs: number;
+            /** @description The profile with its timeCalibration. */
+            profile: components["schemas"]["MachineProfile"];
+        };
+        /** CalibrationRequest */
+        CalibrationRequest: {
+            /** @description Profile to calibrate; the bundled marlin-xab profile by default. */
+            profile?: components["schemas"]["MachineProfile"] | null;
+        };
+        /** CommandRequest */
+        CommandRequest: {
             /**
-             * @description discriminator enum property added by openapi-typescript
-             * @enum {string}
+             * Gcode
+             * @description A single G-code command to run manually.
              */
-            windType: "hoop";
+            gcode: string;
         };
-        /**
-         * JobEventOut
-         * @description One entry from a job's monotonic event log.
-         */
-        JobEventOut: {
-            /** Action */
-            action?: string | null;
+        /** CommandResponse */
+        CommandResponse: {
+            /** Responses */
+            responses: string[];
+        };
+        /** ConnectRequest */
+        ConnectRequest: {
+            /**
+             * Baud Rate
+             * @default 250000
+             */
+            baud_rate: number;
+            /** Port */
+            port: string;
+            /**
+             * Reset
+             * @description Reset the controller on open (DTR). False attaches to a running controller, and follows an SD print that outlived a sidecar crash.
+             * @default true
+             */
+            reset: boolean;
+            /**
+             * Timeout
+             * @default 10
+             */
+            timeout: number;
+        };
+        /**
+         * ConnectionInfoOut
+         * @description Connection banner for the #146 connection-info panel.
+         */
+        ConnectionInfoOut: {
+            /** Baud Rate */
+            baud_rate: number;
+            /** Capabilities */
+            capabilities: {
+                [key: string]: boolean;
+            };
+            /** Firmware */
+            firmware: string;
+            /** Port */
+            port: string;
+            /** State */
+            state: string;
+        };
+        /** GcodeRequest */
+        GcodeRequest: {
+            /**
+             * Gcode
+             * @description G-code program to process, newline separated.
+             */
+            gcode: string;
+        };
+        /** HTTPValidationError */
+        HTTPValidationError: {
+            /** Detail */
+            detail?: components["schemas"]["ValidationError"][];
+        };
+        /** HelicalLayer */
+        HelicalLayer: {
+            /** Feedrate */
+            feedRate?: number | null;
+            /** Leadinmm */
+            leadInMM: number;
+            /** Leadoutdegrees */
+            leadOutDegrees: number;
+            /** Lockdegrees */
+            lockDegrees: number;
+            /** Patternnumber */
+            patternNumber: number;
+            /** Skipindex */
+            skipIndex: number;
+            /**
+             * Skipinitialnearlock
+             * @default false
+             */
+            skipInitialNearLock: boolean;
+            /** Windangle */
+            windAngle: number;
+            /**
+             * @description discriminator enum property added by openapi-typescript
+             * @enum {string}
+             */
+            windType: "helical";
+        };
+        /** HoopLayer */
+        HoopLayer: {
+            /** Feedrate */
+            feedRate?: number | null;
+            /**
+             * Terminal
+             * @default false
+             */
+            terminal: boolean;
+            /**
+             * @description discriminator enum property added by openapi-typescript
+             * @enum {string}
+             */
+            windType: "hoop";
+        };
+        /**
+         * JobEventOut
+         * @description One entry from a job's monotonic event log.
+         */
+        JobEventOut: {
+            /** Action */
+            action?: string | null;
             /** Command */
             command?: string | null;
             /** Message */
             message?: string | null;
+            /** @description The job's telemetry, on its terminal event. */
+            metrics?: components["schemas"]["StreamMetricsOut"] | null;
+            /**
+             * Phase
+             * @description SD mode: 'upload' or 'print'.
+             */
+            phase?: string | null;
             /** Sent */
             sent?: number | null;
             /** Seq */
@@ -426,8 +956,35 @@ export interface components {
             error?: string | null;
             /** Events */
             events: components["schemas"]["JobEventOut"][];
+            /**
+             * Hold
+             * @default false
+             */
+            hold: boolean;
             /** Id */
             id: string;
+            /**
+             * Mode
+             * @description 'stream', or 'sd' for an SD-card offload.
+             * @default stream
+             */
+            mode: string;
+            /**
+             * Phase
+             * @description SD mode: the phase of the latest progress.
+             */
+            phase?: string | null;
+            /**
+             * Planning
+             * @description The job's definition is still being planned.
+             * @default false
+             */
+            planning: boolean;
+            /**
+             * Priority
+             * @default 0
+             */
+            priority: number;
             /** Sent */
             sent: number;
             /** State */
@@ -435,6 +992,156 @@ export interface components {
             /** Total */
             total: number;
         };
+        /**
+         * KinematicEstimateOut
+         * @description Cycle time under the profile's axis limits, acceleration and junction deviation.
+         */
+        KinematicEstimateOut: {
+            /** Layers */
+            layers: components["schemas"]["LayerKinematicsOut"][];
+            /** Moves */
+            moves: number;
+            /** Movesbelowfeed */
+            movesBelowFeed: number;
+            /** Nominaltimeseconds */
+            nominalTimeSeconds: number;
+            /** Timeseconds */
+            timeSeconds: number;
+        };
+        /**
+         * LatencySummaryOut
+         * @description Send-to-``ok`` latency; percentiles are histogram bucket upper bounds.
+         */
+        LatencySummaryOut: {
+            /**
+             * Buckets
+             * @description Counts per LATENCY_BUCKETS_MS upper bound, then the overflow bucket.
+             */
+            buckets: number[];
+            /** Count */
+            count: number;
+            /** Max Ms */
+            max_ms: number;
+            /** Mean Ms */
+            mean_ms: number;
+            /** P50 Ms */
+            p50_ms: number;
+            /** P90 Ms */
+            p90_ms: number;
+            /** P99 Ms */
+            p99_ms: number;
+        };
+        /** LayerKinematicsOut */
+        LayerKinematicsOut: {
+            /** Index */
+            index: number;
+            /** Moves */
+            moves: number;
+            /** Nominaltimeseconds */
+            nominalTimeSeconds: number;
+            /** Timeseconds */
+            timeSeconds: number;
+        };
+        /** LayerLinkUsageOut */
+        LayerLinkUsageOut: {
+            /** Bytes */
+            bytes: number;
+            /** Index */
+            index: number;
+            /** Lines */
+            lines: number;
+            /** Linktimeseconds */
+            linkTimeSeconds: number;
+            /** Machinetimeseconds */
+            machineTimeSeconds: number;
+            /** Stallseconds */
+            stallSeconds: number;
+            /** Utilization */
+            utilization: number | null;
+        };
+        /**
+         * MachineKinematics
+         * @description Planner limits of the controller, as Marlin configures them.
+         *
+         *     Velocities and accelerations are per axis (Marlin's ``DEFAULT_MAX_FEEDRATE``
+         *     / ``DEFAULT_MAX_ACCELERATION``); ``accelerationMmS2`` is the path acceleration
+         *     (``DEFAULT_ACCELERATION``, ``M204 P``) and ``junctionDeviationMm`` sets the
+         *     cornering speed (``JUNCTION_DEVIATION_MM``).
+         */
+        MachineKinematics: {
+            /**
+             * Accelerationmms2
+             * @description Path acceleration along the surface, mm/s^2.
+             * @default 3000
+             */
+            accelerationMmS2: number;
+            carriage?: components["schemas"]["AxisLimits"];
+            deliveryHead?: components["schemas"]["AxisLimits"];
+            /**
+             * Junctiondeviationmm
+             * @description Junction deviation; 0 stops at every corner.
+             * @default 0.013
+             */
+            junctionDeviationMm: number;
+            mandrel?: components["schemas"]["AxisLimits"];
+        };
+        /** MachineMetricsOut */
+        MachineMetricsOut: {
+            /** Job Id */
+            job_id?: string | null;
+            /** Job State */
+            job_state?: string | null;
+            metrics?: components["schemas"]["StreamMetricsOut"] | null;
+        };
+        /**
+         * MachineProfile
+         * @description A versioned compatibility contract for a target winder/controller.
+         */
+        MachineProfile: {
+            axisMapping?: components["schemas"]["ProfileAxisMapping"];
+            /**
+             * Controller
+             * @description Controller/firmware family, e.g. 'marlin'.
+             */
+            controller: string;
+            /**
+             * Feedmode
+             * @description Feed-rate mode the controller must use (units per minute).
+             * @default G94
+             */
+            feedMode: string;
+            /**
+             * Id
+             * @description Stable slug identifying this profile, e.g. 'marlin-xab'.
+             */
+            id: string;
+            /** @description Axis velocity/acceleration and junction limits, if known. */
+            kinematics?: components["schemas"]["MachineKinematics"] | null;
+            /**
+             * Name
+             * @description Human-readable profile name.
+             */
+            name: string;
+            /**
+             * Profileversion
+             * @description Version of the machine-profile schema (1.x).
+             * @default 1.0
+             */
+            profileVersion: string;
+            /**
+             * Requiredgcodes
+             * @description G-code opcodes the planner emits; a compatible controller must support all.
+             */
+            requiredGcodes: string[];
+            /** @description Fitted cycle-time correction for this machine, if calibrated. */
+            timeCalibration?: components["schemas"]["TimeCalibration"] | null;
+            /**
+             * Units
+             * @description Coordinate units; FiberPath emits mm only, so the controller must use mm.
+             * @default mm
+             */
+            units: string;
+        };
         /** MandrelParameters */
         MandrelParameters: {
             /** Diameter */
@@ -444,6 +1151,92 @@ export interface components {
             /** Windlength */
             windLength: number;
         };
+        /** PatternSolutionOut */
+        PatternSolutionOut: {
+            /** Circuits */
+            circuits: number;
+            /** Lockdegrees */
+            lockDegrees: number;
+            /** Patternnumber */
+            patternNumber: number;
+            /** Patterns */
+            patterns: number;
+            /** Skipindex */
+            skipIndex: number;
+            /** Timeseconds */
+            timeSeconds: number;
+            /** Towmeters */
+            towMeters: number;
+        };
+        /**
+         * PatternSolutionsOut
+         * @description The valid coverage patterns of a helical layer, fastest first.
+         */
+        PatternSolutionsOut: {
+            /**
+             * Schemaversion
+             * @constant
+             */
+            schemaVersion: "1.0";
+            /** Solutions */
+            solutions: components["schemas"]["PatternSolutionOut"][];
+            /** Total */
+            total: number;
+        };
+        /**
+         * PatternSolveRequest
+         * @description A helical layer and the mandrel and tow it is wound with, as in a .wind file.
+         */
+        PatternSolveRequest: {
+            /**
+             * Default Feed Rate
+             * @description Used when the layer has no feedRate.
+             */
+            default_feed_rate: number;
+            /** @description Supplies the wind angle, leads and feed; its pattern fields are ignored. */
+            layer: components["schemas"]["HelicalLayer"];
+            /**
+             * Limit
+             * @description Return the fastest N solutions.
+             * @default 100
+             */
+            limit: number;
+            mandrel: components["schemas"]["MandrelParameters"];
+            /**
+             * Max Lock Degrees
+             * @default 720
+             */
+            max_lock_degrees: number;
+            tow: components["schemas"]["TowParameters"];
+        };
+        /**
+         * PlanDeltaOut
+         * @description The program as edits against a program the client already holds.
+         *
+         *     ``edits`` are ascending and non-overlapping in the base program's line
+         *     numbers; apply them last-to-first. Every range starts and ends on a layer
+         *     boundary.
+         */
+        PlanDeltaOut: {
+            /** Baseartifactid */
+            baseArtifactId: string;
+            /** Edits */
+            edits: components["schemas"]["PlanEditOut"][];
+        };
+        /**
+         * PlanEditOut
+         * @description Replace ``deleteCount`` lines of the base program from ``start`` with ``lines``.
+         */
+        PlanEditOut: {
+            /** Deletecount */
+            deleteCount: number;
+            /** Layerindex */
+            layerIndex: number;
+            /** Lines */
+            lines: string[];
+            /** Start */
+            start: number;
+        };
         /** PlanLayerOut */
         PlanLayerOut: {
             /** Commandcount */
@@ -463,135 +1256,1347 @@ export interface components {
             /** Windtype */
             windType: string;
         };
-        /** PlanResultOut */
-        PlanResultOut: {
-            /** Commandcount */
-            commandCount: number;
-            /** Gcode */
-            gcode: string;
-            /** Layers */
-            layers: components["schemas"]["PlanLayerOut"][];
-            /**
-             * Schemaversion
-             * @constant
-             */
-            schemaVersion: "1.0";
-            /** Timeseconds */
-            timeSeconds: number;
-            /** Towmeters */
-            towMeters: number;
+        /**
+         * PlanMetricsOut
+         * @description Totals and per-layer breakdown of a plan, without the program itself.
+         */
+        PlanMetricsOut: {
+            /** Layers */
+            layers: components["schemas"]["PlanLayerOut"][];
+            /**
+             * Schemaversion
+             * @constant
+             */
+            schemaVersion: "1.0";
+            /** Timeseconds */
+            timeSeconds: number;
+            /** Towmeters */
+            towMeters: number;
+        };
+        /** PlanResultOut */
+        PlanResultOut: {
+            /** Artifactid */
+            artifactId?: string | null;
+            /** Commandcount */
+            commandCount: number;
+            delta?: components["schemas"]["PlanDeltaOut"] | null;
+            /** Gcode */
+            gcode: string;
+            /** Layers */
+            layers: components["schemas"]["PlanLayerOut"][];
+            /**
+             * Schemaversion
+             * @constant
+             */
+            schemaVersion: "1.0";
+            /** Timeseconds */
+            timeSeconds: number;
+            /** Towmeters */
+            towMeters: number;
+        };
+        /** PoolConnectRequest */
+        PoolConnectRequest: {
+            /**
+             * Baud Rate
+             * @default 250000
+             */
+            baud_rate: number;
+            /**
+             * Machine Id
+             * @description Id to address the machine by; derived from the port when omitted.
+             */
+            machine_id?: string | null;
+            /** Port */
+            port: string;
+            /**
+             * Reset
+             * @description Reset the controller on open (DTR). False attaches to a running controller, and follows an SD print that outlived a sidecar crash.
+             * @default true
+             */
+            reset: boolean;
+            /**
+             * Timeout
+             * @default 10
+             */
+            timeout: number;
+        };
+        /** PoolConnectionOut */
+        PoolConnectionOut: {
+            /** Baud Rate */
+            baud_rate: number;
+            /** Capabilities */
+            capabilities: {
+                [key: string]: boolean;
+            };
+            /** Firmware */
+            firmware: string;
+            /** Machine Id */
+            machine_id: string;
+            /** Port */
+            port: string;
+            /** State */
+            state: string;
+        };
+        /** PoolMemberOut */
+        PoolMemberOut: {
+            /**
+             * Job Id
+             * @description The current (or last) job, if any.
+             */
+            job_id?: string | null;
+            /** Job State */
+            job_state?: string | null;
+            /** Machine Id */
+            machine_id: string;
+            /**
+             * Port
+             * @description None while the machine is disconnected.
+             */
+            port?: string | null;
+            /**
+             * Queued
+             * @description Jobs waiting in the machine's queue.
+             */
+            queued: number;
+            /** State */
+            state: string;
+        };
+        /**
+         * PortInfoOut
+         * @description One serial port discovered on the host.
+         */
+        PortInfoOut: {
+            /** Description */
+            description: string;
+            /** Hwid */
+            hwid: string;
+            /** Port */
+            port: string;
+        };
+        /**
+         * ProfileAxisMapping
+         * @description Logical winder axes mapped to G-code axis letters.
+         */
+        ProfileAxisMapping: {
+            /**
+             * Carriage
+             * @default X
+             */
+            carriage: string;
+            /**
+             * Deliveryhead
+             * @default B
+             */
+            deliveryHead: string;
+            /**
+             * Mandrel
+             * @default A
+             */
+            mandrel: string;
+        };
+        /** QueueJobRequest */
+        QueueJobRequest: {
+            /**
+             * Artifact Id
+             * @description artifactId of a program POST /plan returned recently. Returns 404 once the sidecar no longer holds it.
+             */
+            artifact_id?: string | null;
+            /** @description Wind definition to plan and stream instead of gcode. A streamed job starts while it is still being planned; its total grows until planning finishes. */
+            definition?: components["schemas"]["WindDefinition"] | null;
+            /**
+             * Gcode
+             * @description G-code program to stream, newline separated.
+             */
+            gcode?: string | null;
+            /**
+             * Hold
+             * @description Wait at the head of the queue until started explicitly.
+             * @default false
+             */
+            hold: boolean;
+            /**
+             * Path
+             * @description Absolute path of a G-code file (.gcode, .gco, .g or .nc) on the sidecar's host. The sidecar reads it itself, so the program does not travel in the request.
+             */
+            path?: string | null;
+            /**
+             * Priority
+             * @description Higher runs first; equal priorities run in queue order.
+             * @default 0
+             */
+            priority: number;
+            /** @description Validate the program against this profile: it must read under the profile's axis mapping and use only its requiredGcodes. A definition is planned for it. */
+            profile?: components["schemas"]["MachineProfile"] | null;
+            /** @description Offload the program to the SD card instead of streaming it. */
+            sd?: components["schemas"]["SdOptionsIn"] | null;
+        };
+        /** QueueOut */
+        QueueOut: {
+            /**
+             * Active
+             * @description The running job's id, if any.
+             */
+            active?: string | null;
+            /**
+             * Jobs
+             * @description Waiting jobs, in start order.
+             */
+            jobs: components["schemas"]["QueuedJobOut"][];
+        };
+        /** QueuedJobOut */
+        QueuedJobOut: {
+            /** Hold */
+            hold: boolean;
+            /** Job Id */
+            job_id: string;
+            /** Mode */
+            mode: string;
+            /**
+             * Position
+             * @description 1-based place in the queue; 0 once it has left it.
+             */
+            position: number;
+            /** Priority */
+            priority: number;
+            /** State */
+            state: string;
+            /** Total */
+            total: number;
+        };
+        /**
+         * SdOptionsIn
+         * @description SD-card offload: upload the program to the controller's card, then print it.
+         */
+        SdOptionsIn: {
+            /**
+             * Chunk Lines
+             * @description Lines per file; omit to upload one file.
+             */
+            chunk_lines?: number | null;
+            /**
+             * Name
+             * @description 8.3 file name stem; numbered parts use its first five characters.
+             * @default FIBERPTH
+             */
+            name: string;
+            /**
+             * Poll Interval S
+             * @description Seconds between M27 polls.
+             * @default 1
+             */
+            poll_interval_s: number;
+            /**
+             * Retries
+             * @description Re-uploads of a part whose size does not verify.
+             * @default 2
+             */
+            retries: number;
+        };
+        /** SimulateRequest */
+        SimulateRequest: {
+            /**
+             * Gcode
+             * @description G-code program to process, newline separated.
+             */
+            gcode: string;
+            /** @description Machine profile; its timeCalibration and kinematics refine the estimate. */
+            profile?: components["schemas"]["MachineProfile"] | null;
+        };
+        /** SimulationResultOut */
+        SimulationResultOut: {
+            /** Averagefeedratemmpm */
+            averageFeedRateMmpm: number;
+            /** Commandsexecuted */
+            commandsExecuted: number;
+            /** Estimatedtimeseconds */
+            estimatedTimeSeconds: number;
+            kinematics?: components["schemas"]["KinematicEstimateOut"] | null;
+            /** Moves */
+            moves: number;
+            /**
+             * Schemaversion
+             * @constant
+             */
+            schemaVersion: "1.0";
+            /** Totaldistancemm */
+            totalDistanceMm: number;
+            /** Towlengthmm */
+            towLengthMm: number;
+        };
+        /** SkipLayer */
+        SkipLayer: {
+            /** Feedrate */
+            feedRate?: number | null;
+            /** Mandrelrotation */
+            mandrelRotation: number;
+            /**
+             * @description discriminator enum property added by openapi-typescript
+             * @enum {string}
+             */
+            windType: "skip";
+        };
+        /**
+         * StallWindowOut
+         * @description Streamed lines (1-based, comments excluded) over which the buffer ran dry.
+         */
+        StallWindowOut: {
+            /** Firstline */
+            firstLine: number;
+            /** Lastline */
+            lastLine: number;
+            /** Layer */
+            layer: number;
+            /** Stallseconds */
+            stallSeconds: number;
+            /** Stalls */
+            stalls: number;
+            /** Startseconds */
+            startSeconds: number;
+        };
+        /**
+         * StartJobRequest
+         * @description A program to run: ``gcode``, a file ``path``, a plan ``artifact_id`` or a ``definition``.
+         */
+        StartJobRequest: {
+            /**
+             * Artifact Id
+             * @description artifactId of a program POST /plan returned recently. Returns 404 once the sidecar no longer holds it.
+             */
+            artifact_id?: string | null;
+            /** @description Wind definition to plan and stream instead of gcode. A streamed job starts while it is still being planned; its total grows until planning finishes. */
+            definition?: components["schemas"]["WindDefinition"] | null;
+            /**
+             * Gcode
+             * @description G-code program to stream, newline separated.
+             */
+            gcode?: string | null;
+            /**
+             * Path
+             * @description Absolute path of a G-code file (.gcode, .gco, .g or .nc) on the sidecar's host. The sidecar reads it itself, so the program does not travel in the request.
+             */
+            path?: string | null;
+            /** @description Validate the program against this profile: it must read under the profile's axis mapping and use only its requiredGcodes. A definition is planned for it. */
+            profile?: components["schemas"]["MachineProfile"] | null;
+            /** @description Offload the program to the SD card instead of streaming it. */
+            sd?: components["schemas"]["SdOptionsIn"] | null;
+        };
+        /** StartJobResponse */
+        StartJobResponse: {
+            /** Job Id */
+            job_id: string;
+            /** Total */
+            total: number;
+        };
+        /** StreamAnalysisOut */
+        StreamAnalysisOut: {
+            /** Bytes */
+            bytes: number;
+            /** Layers */
+            layers: components["schemas"]["LayerLinkUsageOut"][];
+            /** Lines */
+            lines: number;
+            /** Machinetimeseconds */
+            machineTimeSeconds: number;
+            /** Mediansegmentmm */
+            medianSegmentMm: number;
+            /** Minsustainablesegmentmm */
+            minSustainableSegmentMm: number;
+            /**
+             * Schemaversion
+             * @constant
+             */
+            schemaVersion: "1.0";
+            /** Stalltimeseconds */
+            stallTimeSeconds: number;
+            /** Stallwindows */
+            stallWindows: components["schemas"]["StallWindowOut"][];
+            /** Streamtimeseconds */
+            streamTimeSeconds: number;
+        };
+        /**
+         * StreamAnalysisRequest
+         * @description A program plus the serial link and controller buffer it will be streamed through.
+         */
+        StreamAnalysisRequest: {
+            /**
+             * Ack Latency S
+             * @description Per-line ack round trip beyond the line's own bytes.
+             * @default 0.002
+             */
+            ack_latency_s: number;
+            /**
+             * Baud Rate
+             * @default 250000
+             */
+            baud_rate: number;
+            /**
+             * Buffer Depth
+             * @description Planner blocks the controller buffers.
+             * @default 16
+             */
+            buffer_depth: number;
+            /**
+             * Framed
+             * @description Line-number + checksum framing.
+             * @default true
+             */
+            framed: boolean;
+            /**
+             * Gcode
+             * @description G-code program to process, newline separated.
+             */
+            gcode: string;
+        };
+        /**
+         * StreamMetricsOut
+         * @description Streaming telemetry for one job (see ``fiberpath.streaming.telemetry``).
+         */
+        StreamMetricsOut: {
+            /**
+             * Bytes Per S
+             * @description Acked bytes per second over the rolling window.
+             */
+            bytes_per_s: number;
+            /** Bytes Sent */
+            bytes_sent: number;
+            /** Elapsed S */
+            elapsed_s: number;
+            latency: components["schemas"]["LatencySummaryOut"];
+            /** Lines Acked */
+            lines_acked: number;
+            /**
+             * Lines Per S
+             * @description Acked lines per second over the rolling window.
+             */
+            lines_per_s: number;
+            /** Lines Sent */
+            lines_sent: number;
+            /** Lock Wait Max S */
+            lock_wait_max_s: number;
+            /** Lock Wait S */
+            lock_wait_s: number;
+            /** Longest Stall S */
+            longest_stall_s: number;
+            /** Mean Lines Per S */
+            mean_lines_per_s: number;
+            /** Paused S */
+            paused_s: number;
+            /** Stall S */
+            stall_s: number;
+            /**
+             * Stalls
+             * @description Host gaps with nothing in flight, outside pauses.
+             */
+            stalls: number;
+        };
+        /**
+         * TimeCalibration
+         * @description Correction terms fitted to a winder's measured cycle times.
+         *
+         *     The calibrated time of a motion is ``max(distance / feed, |mandrel| /
+         *     mandrelSpeedLimit) + moveOverhead``, plus ``turnaroundPenalty`` when the
+         *     carriage reverses direction (see :func:`fiberpath.planning.metrics.calibrated_move_time_s`).
+         *     All-default terms reproduce the nominal distance/feed estimate.
+         */
+        TimeCalibration: {
+            /**
+             * Mandrelspeedlimitdegpers
+             * @description Effective top mandrel speed; faster motions are slowed. None: unlimited.
+             */
+            mandrelSpeedLimitDegPerS?: number | null;
+            /**
+             * Moveoverheads
+             * @description Fixed time added to every motion (block setup, accel/decel of short moves).
+             * @default 0
+             */
+            moveOverheadS: number;
+            /**
+             * Rmsresiduals
+             * @default 0
+             */
+            rmsResidualS: number;
+            /**
+             * Samplelines
+             * @default 0
+             */
+            sampleLines: number;
+            /**
+             * Turnaroundpenaltys
+             * @description Extra time for each carriage reversal (deceleration to rest and back).
+             * @default 0
+             */
+            turnaroundPenaltyS: number;
+        };
+        /** TowParameters */
+        TowParameters: {
+            /** Thickness */
+            thickness: number;
+            /** Width */
+            width: number;
+        };
+        /** ValidateResponse */
+        ValidateResponse: {
+            /** Valid */
+            valid: boolean;
+        };
+        /** ValidationError */
+        ValidationError: {
+            /** Context */
+            ctx?: Record<string, never>;
+            /** Input */
+            input?: unknown;
+            /** Location */
+            loc: (string | number)[];
+            /** Message */
+            msg: string;
+            /** Error Type */
+            type: string;
+        };
+        /** WindDefinition */
+        WindDefinition: {
+            /** Defaultfeedrate */
+            defaultFeedRate: number;
+            /** Layers */
+            layers: (components["schemas"]["HoopLayer"] | components["schemas"]["HelicalLayer"] | components["schemas"]["SkipLayer"])[];
+            mandrelParameters: components["schemas"]["MandrelParameters"];
+            /**
+             * Schema Version
+             * @description Version of the .wind file format schema (1.x).
+             * @default 1.0
+             */
+            schemaVersion: string;
+            towParameters: components["schemas"]["TowParameters"];
+        };
+    };
+    responses: never;
+    parameters: never;
+    requestBodies: never;
+    headers: never;
+    pathItems: never;
+}
+export type $defs = Record<string, never>;
+export interface operations {
+    cache_stats_cache_get: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["CacheStatsOut"];
+                };
+            };
+        };
+    };
+    health_health_get: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": {
+                        [key: string]: string;
+                    };
+                };
+            };
+        };
+    };
+    calibrate_machine_calibration_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["CalibrationRequest"];
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["CalibrationOut"];
+                };
+            };
+            /** @description Input rejected by the compute engine. */
+            400: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ApiError"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    send_command_machine_commands_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["CommandRequest"];
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["CommandResponse"];
+                };
+            };
+            /** @description Input rejected by the compute engine. */
+            400: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ApiError"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    connect_machine_connection_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["ConnectRequest"];
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ConnectionInfoOut"];
+                };
+            };
+            /** @description Input rejected by the compute engine. */
+            400: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ApiError"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    disconnect_machine_connection_delete: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            204: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content?: never;
+            };
+        };
+    };
+    emergency_stop_machine_estop_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            204: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content?: never;
+            };
+        };
+    };
+    start_job_machine_jobs_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["StartJobRequest"];
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["StartJobResponse"];
+                };
+            };
+            /** @description Input rejected by the compute engine. */
+            400: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ApiError"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    get_job_machine_jobs__job_id__get: {
+        parameters: {
+            query?: {
+                since?: number;
+            };
+            header?: never;
+            path: {
+                job_id: string;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["JobStatusOut"];
+                };
+            };
+            /** @description Input rejected by the compute engine. */
+            400: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ApiError"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    cancel_job_machine_jobs__job_id__cancel_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: {
+                job_id: string;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["JobStatusOut"];
+                };
+            };
+            /** @description Input rejected by the compute engine. */
+            400: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ApiError"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    pause_job_machine_jobs__job_id__pause_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: {
+                job_id: string;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["JobStatusOut"];
+                };
+            };
+            /** @description Input rejected by the compute engine. */
+            400: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ApiError"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    resume_job_machine_jobs__job_id__resume_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: {
+                job_id: string;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["JobStatusOut"];
+                };
+            };
+            /** @description Input rejected by the compute engine. */
+            400: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ApiError"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    metrics_machine_metrics_get: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["MachineMetricsOut"];
+                };
+            };
+        };
+    };
+    list_ports_machine_ports_get: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["PortInfoOut"][];
+                };
+            };
+        };
+    };
+    get_queue_machine_queue_get: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["QueueOut"];
+                };
+            };
+        };
+    };
+    enqueue_job_machine_queue_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["QueueJobRequest"];
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["QueuedJobOut"];
+                };
+            };
+            /** @description Input rejected by the compute engine. */
+            400: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ApiError"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    start_queued_job_machine_queue__job_id__start_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: {
+                job_id: string;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["JobStatusOut"];
+                };
+            };
+            /** @description Input rejected by the compute engine. */
+            400: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ApiError"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    list_machines_machines_get: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["PoolMemberOut"][];
+                };
+            };
+        };
+    };
+    connect_machine_machines_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["PoolConnectRequest"];
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["PoolConnectionOut"];
+                };
+            };
+            /** @description Input rejected by the compute engine. */
+            400: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ApiError"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    remove_machine_machines__machine_id__delete: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: {
+                machine_id: string;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            204: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content?: never;
+            };
+            /** @description Input rejected by the compute engine. */
+            400: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ApiError"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    calibrate_machines__machine_id__calibration_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: {
+                machine_id: string;
+            };
+            cookie?: never;
         };
-        /**
-         * PortInfoOut
-         * @description One serial port discovered on the host.
-         */
-        PortInfoOut: {
-            /** Description */
-            description: string;
-            /** Hwid */
-            hwid: string;
-            /** Port */
-            port: string;
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["CalibrationRequest"];
+            };
         };
-        /** SimulationResultOut */
-        SimulationResultOut: {
-            /** Averagefeedratemmpm */
-            averageFeedRateMmpm: number;
-            /** Commandsexecuted */
-            commandsExecuted: number;
-            /** Estimatedtimeseconds */
-            estimatedTimeSeconds: number;
-            /** Moves */
-            moves: number;
-            /**
-             * Schemaversion
-             * @constant
-             */
-            schemaVersion: "1.0";
-            /** Totaldistancemm */
-            totalDistanceMm: number;
-            /** Towlengthmm */
-            towLengthMm: number;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["CalibrationOut"];
+                };
+            };
+            /** @description Input rejected by the compute engine. */
+            400: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ApiError"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
         };
-        /** SkipLayer */
-        SkipLayer: {
-            /** Mandrelrotation */
-            mandrelRotation: number;
-            /**
-             * @description discriminator enum property added by openapi-typescript
-             * @enum {string}
-             */
-            windType: "skip";
+    };
+    send_command_machines__machine_id__commands_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: {
+                machine_id: string;
+            };
+            cookie?: never;
         };
-        /** StartJobRequest */
-        StartJobRequest: {
-            /**
-             * Gcode
-             * @description G-code program to stream, newline separated.
-             */
-            gcode: string;
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["CommandRequest"];
+            };
         };
-        /** StartJobResponse */
-        StartJobResponse: {
-            /** Job Id */
-            job_id: string;
-            /** Total */
-            total: number;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["CommandResponse"];
+                };
+            };
+            /** @description Input rejected by the compute engine. */
+            400: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ApiError"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
         };
-        /** TowParameters */
-        TowParameters: {
-            /** Thickness */
-            thickness: number;
-            /** Width */
-            width: number;
+    };
+    emergency_stop_machines__machine_id__estop_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: {
+                machine_id: string;
+            };
+            cookie?: never;
         };
-        /** ValidateResponse */
-        ValidateResponse: {
-            /** Valid */
-            valid: boolean;
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            204: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content?: never;
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
         };
-        /** ValidationError */
-        ValidationError: {
-            /** Context */
-            ctx?: Record<string, never>;
-            /** Input */
-            input?: unknown;
-            /** Location */
-            loc: (string | number)[];
-            /** Message */
-            msg: string;
-            /** Error Type */
-            type: string;
+    };
+    start_job_machines__machine_id__jobs_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: {
+                machine_id: string;
+            };
+            cookie?: never;
         };
-        /** WindDefinition */
-        WindDefinition: {
-            /** Defaultfeedrate */
-            defaultFeedRate: number;
-            /** Layers */
-            layers: (components["schemas"]["HoopLayer"] | components["schemas"]["HelicalLayer"] | components["schemas"]["SkipLayer"])[];
-            mandrelParameters: components["schemas"]["MandrelParameters"];
-            /**
-             * Schema Version
-             * @description Version of the .wind file format schema (1.x).
-             * @default 1.0
-             */
-            schemaVersion: string;
-            towParameters: components["schemas"]["TowParameters"];
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["StartJobRequest"];
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["StartJobResponse"];
+                };
+            };
+            /** @description Input rejected by the compute engine. */
+            400: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ApiError"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
         };
     };
-    responses: never;
-    parameters: never;
-    requestBodies: never;
-    headers: never;
-    pathItems: never;
-}
-export type $defs = Record<string, never>;
-export interface operations {
-    health_health_get: {
+    get_job_machines__machine_id__jobs__job_id__get: {
         parameters: {
-            query?: never;
+            query?: {
+                since?: number;
+            };
             header?: never;
-            path?: never;
+            path: {
+                job_id: string;
+                machine_id: string;
+            };
             cookie?: never;
         };
         requestBody?: never;
@@ -602,25 +2607,40 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": {
-                        [key: string]: string;
-                    };
+                    "application/json": components["schemas"]["JobStatusOut"];
+                };
+            };
+            /** @description Input rejected by the compute engine. */
+            400: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ApiError"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
                 };
             };
         };
     };
-    send_command_machine_commands_post: {
+    cancel_job_machines__machine_id__jobs__job_id__cancel_post: {
         parameters: {
             query?: never;
             header?: never;
-            path?: never;
-            cookie?: never;
-        };
-        requestBody: {
-            content: {
-                "application/json": components["schemas"]["CommandRequest"];
+            path: {
+                job_id: string;
+                machine_id: string;
             };
+            cookie?: never;
         };
+        requestBody?: never;
         responses: {
             /** @description Successful Response */
             200: {
@@ -628,7 +2648,7 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["CommandResponse"];
+                    "application/json": components["schemas"]["JobStatusOut"];
                 };
             };
             /** @description Input rejected by the compute engine. */
@@ -651,18 +2671,17 @@ export interface operations {
             };
         };
     };
-    connect_machine_connection_post: {
+    pause_job_machines__machine_id__jobs__job_id__pause_post: {
         parameters: {
             query?: never;
             header?: never;
-            path?: never;
-            cookie?: never;
-        };
-        requestBody: {
-            content: {
-                "application/json": components["schemas"]["ConnectRequest"];
+            path: {
+                job_id: string;
+                machine_id: string;
             };
+            cookie?: never;
         };
+        requestBody?: never;
         responses: {
             /** @description Successful Response */
             200: {
@@ -670,7 +2689,7 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["ConnectionInfoOut"];
+                    "application/json": components["schemas"]["JobStatusOut"];
                 };
             };
             /** @description Input rejected by the compute engine. */
@@ -693,54 +2712,88 @@ export interface operations {
             };
         };
     };
-    disconnect_machine_connection_delete: {
+    resume_job_machines__machine_id__jobs__job_id__resume_post: {
         parameters: {
             query?: never;
             header?: never;
-            path?: never;
+            path: {
+                job_id: string;
+                machine_id: string;
+            };
             cookie?: never;
         };
         requestBody?: never;
         responses: {
             /** @description Successful Response */
-            204: {
+            200: {
                 headers: {
                     [name: string]: unknown;
                 };
-                content?: never;
+                content: {
+                    "application/json": components["schemas"]["JobStatusOut"];
+                };
+            };
+            /** @description Input rejected by the compute engine. */
+            400: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ApiError"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
             };
         };
     };
-    emergency_stop_machine_estop_post: {
+    metrics_machines__machine_id__metrics_get: {
         parameters: {
             query?: never;
             header?: never;
-            path?: never;
+            path: {
+                machine_id: string;
+            };
             cookie?: never;
         };
         requestBody?: never;
         responses: {
             /** @description Successful Response */
-            204: {
+            200: {
                 headers: {
                     [name: string]: unknown;
                 };
-                content?: never;
+                content: {
+                    "application/json": components["schemas"]["MachineMetricsOut"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
             };
         };
     };
-    start_job_machine_jobs_post: {
+    get_queue_machines__machine_id__queue_get: {
         parameters: {
             query?: never;
             header?: never;
-            path?: never;
-            cookie?: never;
-        };
-        requestBody: {
-            content: {
-                "application/json": components["schemas"]["StartJobRequest"];
+            path: {
+                machine_id: string;
             };
+            cookie?: never;
         };
+        requestBody?: never;
         responses: {
             /** @description Successful Response */
             200: {
@@ -748,16 +2801,7 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["StartJobResponse"];
-                };
-            };
-            /** @description Input rejected by the compute engine. */
-            400: {
-                headers: {
-                    [name: string]: unknown;
-                };
-                content: {
-                    "application/json": components["schemas"]["ApiError"];
+                    "application/json": components["schemas"]["QueueOut"];
                 };
             };
             /** @description Validation Error */
@@ -771,18 +2815,20 @@ export interface operations {
             };
         };
     };
-    get_job_machine_jobs__job_id__get: {
+    enqueue_job_machines__machine_id__queue_post: {
         parameters: {
-            query?: {
-                since?: number;
-            };
+            query?: never;
             header?: never;
             path: {
-                job_id: string;
+                machine_id: string;
             };
             cookie?: never;
         };
-        requestBody?: never;
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["QueueJobRequest"];
+            };
+        };
         responses: {
             /** @description Successful Response */
             200: {
@@ -790,7 +2836,7 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["JobStatusOut"];
+                    "application/json": components["schemas"]["QueuedJobOut"];
                 };
             };
             /** @description Input rejected by the compute engine. */
@@ -813,12 +2859,13 @@ export interface operations {
             };
         };
     };
-    cancel_job_machine_jobs__job_id__cancel_post: {
+    start_queued_job_machines__machine_id__queue__job_id__start_post: {
         parameters: {
             query?: never;
             header?: never;
             path: {
                 job_id: string;
+                machine_id: string;
             };
             cookie?: never;
         };
@@ -853,16 +2900,26 @@ export interface operations {
             };
         };
     };
-    pause_job_machine_jobs__job_id__pause_post: {
+    plan_plan_post: {
         parameters: {
-            query?: never;
-            header?: never;
-            path: {
-                job_id: string;
+            query?: {
+                /** @description artifactId of a program the client already holds. If the server still has it, the response carries `delta` (edits against that program) and an empty `gcode`. */
+                baseArtifactId?: string | null;
+            };
+            header?: {
+                /** @description Optional editor session key. A newer request to the same endpoint with the same key cancels this one (it then returns 409). */
+                "x-fiberpath-session"?: string | null;
+                /** @description ETag of a result the client already holds; a match returns 304. */
+                "if-none-match"?: string | null;
             };
+            path?: never;
             cookie?: never;
         };
-        requestBody?: never;
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["WindDefinition"];
+            };
+        };
         responses: {
             /** @description Successful Response */
             200: {
@@ -870,8 +2927,15 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["JobStatusOut"];
+                    "application/json": components["schemas"]["PlanResultOut"];
+                };
+            };
+            /** @description The client already holds this result (If-None-Match matched). */
+            304: {
+                headers: {
+                    [name: string]: unknown;
                 };
+                content?: never;
             };
             /** @description Input rejected by the compute engine. */
             400: {
@@ -882,6 +2946,15 @@ export interface operations {
                     "application/json": components["schemas"]["ApiError"];
                 };
             };
+            /** @description Plan cancelled: superseded or disconnected. */
+            409: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ApiError"];
+                };
+            };
             /** @description Validation Error */
             422: {
                 headers: {
@@ -893,16 +2966,23 @@ export interface operations {
             };
         };
     };
-    resume_job_machine_jobs__job_id__resume_post: {
+    plan_metrics_plan_metrics_post: {
         parameters: {
             query?: never;
-            header?: never;
-            path: {
-                job_id: string;
+            header?: {
+                /** @description Optional editor session key. A newer request to the same endpoint with the same key cancels this one (it then returns 409). */
+                "x-fiberpath-session"?: string | null;
+                /** @description ETag of a result the client already holds; a match returns 304. */
+                "if-none-match"?: string | null;
             };
+            path?: never;
             cookie?: never;
         };
-        requestBody?: never;
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["WindDefinition"];
+            };
+        };
         responses: {
             /** @description Successful Response */
             200: {
@@ -910,8 +2990,15 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["JobStatusOut"];
+                    "application/json": components["schemas"]["PlanMetricsOut"];
+                };
+            };
+            /** @description The client already holds this result (If-None-Match matched). */
+            304: {
+                headers: {
+                    [name: string]: unknown;
                 };
+                content?: never;
             };
             /** @description Input rejected by the compute engine. */
             400: {
@@ -922,6 +3009,15 @@ export interface operations {
                     "application/json": components["schemas"]["ApiError"];
                 };
             };
+            /** @description Plan cancelled: superseded or disconnected. */
+            409: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ApiError"];
+                };
+            };
             /** @description Validation Error */
             422: {
                 headers: {
@@ -933,14 +3029,21 @@ export interface operations {
             };
         };
     };
-    list_ports_machine_ports_get: {
+    plan_patterns_plan_patterns_post: {
         parameters: {
             query?: never;
-            header?: never;
+            header?: {
+                /** @description ETag of a result the client already holds; a match returns 304. */
+                "if-none-match"?: string | null;
+            };
             path?: never;
             cookie?: never;
         };
-        requestBody?: never;
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["PatternSolveRequest"];
+            };
+        };
         responses: {
             /** @description Successful Response */
             200: {
@@ -948,21 +3051,49 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["PortInfoOut"][];
+                    "application/json": components["schemas"]["PatternSolutionsOut"];
+                };
+            };
+            /** @description The client already holds this result (If-None-Match matched). */
+            304: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content?: never;
+            };
+            /** @description Input rejected by the compute engine. */
+            400: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ApiError"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
                 };
             };
         };
     };
-    plan_plan_post: {
+    plot_plot_post: {
         parameters: {
             query?: never;
-            header?: never;
+            header?: {
+                /** @description ETag of a result the client already holds; a match returns 304. */
+                "if-none-match"?: string | null;
+            };
             path?: never;
             cookie?: never;
         };
         requestBody: {
             content: {
-                "application/json": components["schemas"]["WindDefinition"];
+                "application/json": components["schemas"]["GcodeRequest"];
             };
         };
         responses: {
@@ -972,8 +3103,16 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["PlanResultOut"];
+                    "application/json": unknown;
+                    "image/png": unknown;
+                };
+            };
+            /** @description The client already holds this result (If-None-Match matched). */
+            304: {
+                headers: {
+                    [name: string]: unknown;
                 };
+                content?: never;
             };
             /** @description Input rejected by the compute engine. */
             400: {
@@ -995,16 +3134,19 @@ export interface operations {
             };
         };
     };
-    plot_plot_post: {
+    simulate_simulate_post: {
         parameters: {
             query?: never;
-            header?: never;
+            header?: {
+                /** @description ETag of a result the client already holds; a match returns 304. */
+                "if-none-match"?: string | null;
+            };
             path?: never;
             cookie?: never;
         };
         requestBody: {
             content: {
-                "application/json": components["schemas"]["GcodeRequest"];
+                "application/json": components["schemas"]["SimulateRequest"];
             };
         };
         responses: {
@@ -1014,9 +3156,15 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": unknown;
-                    "image/png": unknown;
+                    "application/json": components["schemas"]["SimulationResultOut"];
+                };
+            };
+            /** @description The client already holds this result (If-None-Match matched). */
+            304: {
+                headers: {
+                    [name: string]: unknown;
                 };
+                content?: never;
             };
             /** @description Input rejected by the compute engine. */
             400: {
@@ -1038,16 +3186,19 @@ export interface operations {
             };
         };
     };
-    simulate_simulate_post: {
+    analyze_stream_route_simulate_stream_post: {
         parameters: {
             query?: never;
-            header?: never;
+            header?: {
+                /** @description ETag of a result the client already holds; a match returns 304. */
+                "if-none-match"?: string | null;
+            };
             path?: never;
             cookie?: never;
         };
         requestBody: {
             content: {
-                "application/json": components["schemas"]["GcodeRequest"];
+                "application/json": components["schemas"]["StreamAnalysisRequest"];
             };
         };
         responses: {
@@ -1057,8 +3208,15 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["SimulationResultOut"];
+                    "application/json": components["schemas"]["StreamAnalysisOut"];
+                };
+            };
+            /** @description The client already holds this result (If-None-Match matched). */
+            304: {
+                headers: {
+                    [name: string]: unknown;
                 };
+                content?: never;
             };
             /** @description Input rejected by the compute engine. */
             400: {
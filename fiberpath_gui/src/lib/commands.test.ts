@@ -2,10 +2,13 @@ import { beforeEach, describe, expect, it, vi } from "vitest";
 import { invoke } from "@tauri-apps/api/core";
 import {
   planWind,
+  applyPlanDelta,
   plotDefinition,
+  resetPreviewBase,
   saveWindFile,
   loadWindFile,
   validateWindDefinition,
+  solvePatterns,
 } from "./commands";
 import { getApiClient } from "./apiClient";
 import { CommandError } from "./schemas";
@@ -28,6 +31,7 @@ const mockPost = vi.fn();
 beforeEach(() => {
   mockInvoke.mockReset();
   mockPost.mockReset();
+  resetPreviewBase();
   vi.mocked(getApiClient).mockResolvedValue({ POST: mockPost } as never);
 });
 
@@ -89,6 +93,83 @@ describe("commands", () => {
       });
       await expect(plotDefinition("{}", 3)).rejects.toBeInstanceOf(CommandError);
     });
+
+    it("sends the last artifact as the base and applies the returned delta", async () => {
+      const image = { data: new ArrayBuffer(1), error: undefined, response: { status: 200 } };
+      mockPost
+        .mockResolvedValueOnce({
+          data: { gcode: "G21\nG0 X1\nG0 X2", commandCount: 3, artifactId: "a1" },
+          error: undefined,
+          response: { status: 200 },
+        })
+        .mockResolvedValueOnce(image)
+        .mockResolvedValueOnce({
+          data: {
+            gcode: "",
+            commandCount: 3,
+            artifactId: "a2",
+            delta: {
+              baseArtifactId: "a1",
+              edits: [{ start: 2, deleteCount: 1, lines: ["G0 X9"], layerIndex: 2 }],
+            },
+          },
+          error: undefined,
+          response: { status: 200 },
+        })
+        .mockResolvedValueOnce(image);
+
+      await plotDefinition("{}", 3);
+      await plotDefinition("{}", 3);
+
+      expect(mockPost.mock.calls[2][1].params.query).toEqual({ baseArtifactId: "a1" });
+      expect(mockPost.mock.calls[3][1].body).toEqual({ gcode: "G21\nG0 X1\nG0 X9" });
+    });
+
+    it("refetches the full program when the delta base is stale", async () => {
+      const image = { data: new ArrayBuffer(1), error: undefined, response: { status: 200 } };
+      mockPost
+        .mockResolvedValueOnce({
+          data: { gcode: "G21", commandCount: 1, artifactId: "a1" },
+          error: undefined,
+          response: { status: 200 },
+        })
+        .mockResolvedValueOnce(image)
+        .mockResolvedValueOnce({
+          data: {
+            gcode: "",
+            commandCount: 2,
+            artifactId: "a2",
+            delta: { baseArtifactId: "other", edits: [] },
+          },
+          error: undefined,
+          response: { status: 200 },
+        })
+        .mockResolvedValueOnce({
+          data: { gcode: "G21\nG0 X1", commandCount: 2, artifactId: "a2" },
+          error: undefined,
+          response: { status: 200 },
+        })
+        .mockResolvedValueOnce(image);
+
+      await plotDefinition("{}", 3);
+      await plotDefinition("{}", 3);
+
+      expect(mockPost.mock.calls[3][1].params.query).toBeUndefined();
+      expect(mockPost.mock.calls[4][1].body).toEqual({ gcode: "G21\nG0 X1" });
+    });
+  });
+
+  describe("applyPlanDelta()", () => {
+    it("applies ascending edits against base line numbers", () => {
+      const lines = applyPlanDelta(["a", "b", "c", "d"], {
+        baseArtifactId: "x",
+        edits: [
+          { start: 0, deleteCount: 1, lines: ["A", "A2"] },
+          { start: 2, deleteCount: 2, lines: [] },
+        ],
+      });
+      expect(lines).toEqual(["A", "A2", "b"]);
+    });
   });
 
   describe("validateWindDefinition()", () => {
@@ -119,6 +200,57 @@ describe("commands", () => {
     });
   });
 
+  describe("solvePatterns()", () => {
+    const request = {
+      mandrel: { diameter: 50, windLength: 500 },
+      tow: { width: 8, thickness: 0.4 },
+      layer: {
+        windType: "helical" as const,
+        windAngle: 45,
+        patternNumber: 3,
+        skipIndex: 2,
+        lockDegrees: 540,
+        leadInMM: 25,
+        leadOutDegrees: 60,
+        skipInitialNearLock: false,
+      },
+      default_feed_rate: 6000,
+      max_lock_degrees: 720,
+      limit: 5,
+    };
+
+    it("POSTs /plan/patterns and returns the solutions", async () => {
+      const solution = {
+        patternNumber: 7,
+        skipIndex: 1,
+        lockDegrees: 128.57,
+        circuits: 14,
+        patterns: 2,
+        timeSeconds: 214.3,
+        towMeters: 21.4,
+      };
+      mockPost.mockResolvedValue({
+        data: { schemaVersion: "1.0", total: 292, solutions: [solution] },
+        error: undefined,
+        response: { status: 200 },
+      });
+
+      const result = await solvePatterns(request);
+
+      expect(result).toEqual({ total: 292, solutions: [solution] });
+      expect(mockPost).toHaveBeenCalledWith("/plan/patterns", { body: request });
+    });
+
+    it("throws CommandError when the layer cannot be wound", async () => {
+      mockPost.mockResolvedValue({
+        data: undefined,
+        error: { detail: "wind angle 95° must be between 1° and 89°" },
+        response: { status: 400 },
+      });
+      await expect(solvePatterns(request)).rejects.toBeInstanceOf(CommandError);
+    });
+  });
+
   describe("saveWindFile()", () => {
     it("resolves without error on success", async () => {
       mockInvoke.mockResolvedValue(undefined);
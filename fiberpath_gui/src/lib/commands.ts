@@ -2,6 +2,7 @@ import { getApiClient } from "./apiClient";
 import { invokeBackend } from "./tauri";
 import { withRetry } from "./retry";
 import { CommandError, ValidationError } from "./schemas";
+import type { components } from "../api/schema";
 
 /** Result of an export plan: the file written and how many commands it holds. */
 export interface PlanSummary {
@@ -69,6 +70,47 @@ export const planWind = withRetry(
   { maxAttempts: 2 },
 );
 
+/**
+ * Session key for live-preview plans. The sidecar cancels an in-flight plan when
+ * a newer one with the same key arrives (it returns 409), so debounced edits
+ * never queue up stale full-program plans behind the current one.
+ */
+const PREVIEW_PLAN_SESSION = "preview";
+
+/** Line-range edits against a program the client already holds (see `/plan` `delta`). */
+export interface PlanDelta {
+  baseArtifactId: string;
+  edits: { start: number; deleteCount: number; lines: string[] }[];
+}
+
+/**
+ * Rebuild a program from its base lines and a `/plan` delta. Edits are ascending
+ * and non-overlapping in base line numbers, so they are applied last-to-first.
+ */
+export function applyPlanDelta(baseLines: readonly string[], delta: PlanDelta): string[] {
+  const lines = baseLines.slice();
+  for (let i = delta.edits.length - 1; i >= 0; i -= 1) {
+    const edit = delta.edits[i];
+    lines.splice(edit.start, edit.deleteCount, ...edit.lines);
+  }
+  return lines;
+}
+
+function splitProgram(gcode: string): string[] {
+  return gcode === "" ? [] : gcode.split("\n");
+}
+
+/**
+ * The last preview program, kept as the delta base for the next preview so an
+ * edit only transfers (and parses) the layers it changed.
+ */
+let previewBase: { artifactId: string; lines: string[] } | null = null;
+
+/** Forget the preview delta base (e.g. when the sidecar restarts). */
+export function resetPreviewBase(): void {
+  previewBase = null;
+}
+
 /**
  * Plot an in-memory wind definition: plan it to G-code, then render a preview.
  * `visibleLayerCount` is already applied by the caller (it slices layers before
@@ -82,12 +124,42 @@ export const plotDefinition = withRetry(
   ): Promise<PlotPreviewPayload> => {
     const client = await getApiClient();
     try {
-      const plan = await client.POST("/plan", { body: JSON.parse(definitionJson) });
+      const body = JSON.parse(definitionJson);
+      const requestPlan = (baseArtifactId?: string) =>
+        client.POST("/plan", {
+          body,
+          params: {
+            header: { "x-fiberpath-session": PREVIEW_PLAN_SESSION },
+            query: baseArtifactId ? { baseArtifactId } : undefined,
+          },
+        });
+      const base = previewBase;
+      let plan = await requestPlan(base?.artifactId);
+      if (plan.response.status === 409) {
+        throw new CommandError("Plan superseded by a newer preview", "plan", plan.error);
+      }
       if (plan.error || !plan.data) {
         throw new CommandError("Failed to plan definition", "plan", plan.error);
       }
+      let lines: string[] | null = null;
+      const delta = plan.data.delta;
+      if (!delta) {
+        lines = splitProgram(plan.data.gcode);
+      } else if (base && delta.baseArtifactId === base.artifactId) {
+        lines = applyPlanDelta(base.lines, delta);
+      }
+      if (!lines || lines.length !== plan.data.commandCount) {
+        // The base went stale under us; fall back to the full program.
+        previewBase = null;
+        plan = await requestPlan();
+        if (plan.error || !plan.data) {
+          throw new CommandError("Failed to plan definition", "plan", plan.error);
+        }
+        lines = splitProgram(plan.data.gcode);
+      }
+      previewBase = plan.data.artifactId ? { artifactId: plan.data.artifactId, lines } : null;
       const plot = await client.POST("/plot", {
-        body: { gcode: plan.data.gcode },
+        body: { gcode: lines.join("\n") },
         parseAs: "arrayBuffer",
       });
       if (plot.error || !plot.data) {
@@ -136,6 +208,39 @@ export const validateWindDefinition = withRetry(
   { maxAttempts: 2 },
 );
 
+/** One valid patternNumber/skipIndex/lockDegrees for a helical layer (see `/plan/patterns`). */
+export type PatternSolution = components["schemas"]["PatternSolutionOut"];
+
+/** The request body of `/plan/patterns`: a helical layer and its mandrel and tow. */
+export type PatternSolveRequest = components["schemas"]["PatternSolveRequest"];
+
+/** The valid patterns of a layer, fastest first, and how many there are in all. */
+export interface PatternSuggestions {
+  total: number;
+  solutions: PatternSolution[];
+}
+
+/**
+ * List the valid pattern settings of a helical layer, fastest first. The sidecar
+ * solves them in closed form (milliseconds), so the editor can call this on demand.
+ */
+export const solvePatterns = withRetry(
+  async (request: PatternSolveRequest): Promise<PatternSuggestions> => {
+    const client = await getApiClient();
+    let response;
+    try {
+      response = await client.POST("/plan/patterns", { body: request });
+    } catch (error) {
+      throw new CommandError("Failed to solve helical patterns", "patterns", error);
+    }
+    if (response.error || !response.data) {
+      throw new CommandError("Failed to solve helical patterns", "patterns", response.error);
+    }
+    return { total: response.data.total, solutions: response.data.solutions };
+  },
+  { maxAttempts: 2 },
+);
+
 /**
  * Saves file content to disk through the Tauri file-system bridge (native).
  */
@@ -112,14 +112,20 @@ describe("marlin-api", () => {
   describe("startJob()", () => {
     it("POSTs /machine/jobs and returns job id + total", async () => {
       mockPost.mockResolvedValue(ok({ job_id: "abc", total: 42 }));
-      const result = await startJob("G1 X0\nG1 X1");
+      const result = await startJob({ gcode: "G1 X0\nG1 X1" });
       expect(result).toEqual({ job_id: "abc", total: 42 });
       expect(mockPost).toHaveBeenCalledWith("/machine/jobs", { body: { gcode: "G1 X0\nG1 X1" } });
     });
 
+    it("sends a file path instead of the program", async () => {
+      mockPost.mockResolvedValue(ok({ job_id: "abc", total: 42 }));
+      await startJob({ path: "/x.gcode" });
+      expect(mockPost).toHaveBeenCalledWith("/machine/jobs", { body: { path: "/x.gcode" } });
+    });
+
     it("throws CommandError on error", async () => {
       mockPost.mockResolvedValue(err(400));
-      await expect(startJob("G1")).rejects.toBeInstanceOf(CommandError);
+      await expect(startJob({ gcode: "G1" })).rejects.toBeInstanceOf(CommandError);
     });
   });
 
@@ -18,6 +18,8 @@ export type ConnectionInfo = components["schemas"]["ConnectionInfoOut"];
 export type JobStatus = components["schemas"]["JobStatusOut"];
 export type JobEvent = components["schemas"]["JobEventOut"];
 export type StartJobResult = components["schemas"]["StartJobResponse"];
+/** What a job runs: inline G-code, a file the sidecar reads itself, or a planned artifact. */
+export type JobProgram = { gcode: string } | { path: string } | { artifact_id: string };
 
 /** Enumerate the serial ports available on the host. */
 export async function listSerialPorts(): Promise<SerialPort[]> {
@@ -66,10 +68,14 @@ export async function sendCommand(gcode: string): Promise<string[]> {
   return response.data.responses;
 }
 
-/** Start streaming a G-code program; returns the job id and total command count. */
-export async function startJob(gcode: string): Promise<StartJobResult> {
+/**
+ * Start streaming a G-code program; returns the job id and total command count.
+ * Prefer `{ path }` for a file on disk: the sidecar runs on this host and reads
+ * it itself, so the program never crosses the loopback.
+ */
+export async function startJob(program: JobProgram): Promise<StartJobResult> {
   const client = await getApiClient();
-  const response = await client.POST("/machine/jobs", { body: { gcode } });
+  const response = await client.POST("/machine/jobs", { body: program });
   if (response.error || !response.data) {
     throw new CommandError("Failed to start job", "machine/jobs", response.error);
   }
@@ -384,6 +384,11 @@ describe("schemas", () => {
         expect(isRetryableError(error)).toBe(false);
       });
 
+      it("should not retry a superseded plan", () => {
+        const error = new CommandError("Plan superseded by a newer preview", "plan");
+        expect(isRetryableError(error)).toBe(false);
+      });
+
       it("should retry CommandError with IO message", () => {
         const error = new CommandError("Failed to read file", "load_wind_file");
         expect(isRetryableError(error)).toBe(true);
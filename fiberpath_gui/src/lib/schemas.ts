@@ -264,7 +264,13 @@ export function isRetryableError(error: unknown): boolean {
   if (error instanceof CommandError) {
     // Check if it's a validation vs IO error
     const message = error.message.toLowerCase();
-    return !message.includes("validation") && !message.includes("invalid");
+    // A superseded plan was cancelled on purpose; retrying it would cancel the
+    // newer request in turn.
+    return (
+      !message.includes("validation") &&
+      !message.includes("invalid") &&
+      !message.includes("superseded")
+    );
   }
 
   return true; // Default: retry unknown errors
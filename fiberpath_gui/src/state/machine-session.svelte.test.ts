@@ -22,13 +22,9 @@ vi.mock("../lib/marlin-api", () => ({
   cancelJob: vi.fn(() => Promise.resolve({ id: "job-1", state: "cancelled", cursor: 0, events: [] })),
   emergencyStop: vi.fn(() => Promise.resolve()),
 }));
-vi.mock("../lib/commands", () => ({
-  loadWindFile: vi.fn(() => Promise.resolve("G1 X0\nG1 X1")),
-}));
 vi.mock("@tauri-apps/plugin-dialog", () => ({ open: vi.fn() }));
 
 import * as marlin from "../lib/marlin-api";
-import { loadWindFile } from "../lib/commands";
 import { open } from "@tauri-apps/plugin-dialog";
 import { MachineSession } from "./machine-session.svelte";
 import { notifications } from "./notifications.svelte";
@@ -141,10 +137,9 @@ describe("MachineSession — streaming lifecycle", () => {
     expect(marlin.startJob).not.toHaveBeenCalled();
   });
 
-  it("startStream reads the file off disk and starts a job", async () => {
+  it("startStream hands the sidecar the file path", async () => {
     await startStreaming();
-    expect(loadWindFile).toHaveBeenCalledWith("/x.gcode");
-    expect(marlin.startJob).toHaveBeenCalledWith("G1 X0\nG1 X1");
+    expect(marlin.startJob).toHaveBeenCalledWith({ path: "/x.gcode" });
     expect(m.isStreaming).toBe(true);
     expect(m.progress).toEqual({ sent: 0, total: 100, currentCommand: "" });
   });
@@ -1,7 +1,6 @@
 import { open } from "@tauri-apps/plugin-dialog";
 import * as marlin from "../lib/marlin-api";
 import type { SerialPort, JobStatus } from "../lib/marlin-api";
-import { loadWindFile } from "../lib/commands";
 import { createStreamFeedback } from "../lib/streamFeedback";
 import { notifications } from "./notifications.svelte";
 import {
@@ -234,17 +233,10 @@ export class MachineSession {
 
   async startStream() {
     if (!this.filePath || !this.isConnected || this.isStreaming) return;
-    let gcode: string;
     try {
-      // Read the selected program off disk via the same fs bridge as wind files,
-      // then hand the G-code text to the API (the sidecar owns no file access).
-      gcode = await loadWindFile(this.filePath);
-    } catch (e) {
-      this.#feedback.streaming.startFailed(String(e));
-      return;
-    }
-    try {
-      const { job_id, total } = await marlin.startJob(gcode);
+      // The sidecar runs on this host: hand it the path and let it read the
+      // program itself rather than posting the whole file over the loopback.
+      const { job_id, total } = await marlin.startJob({ path: this.filePath });
       this.#jobId = job_id;
       this.#since = 0;
       this.isStreaming = true;
@@ -6,8 +6,10 @@
  */
 
 export type Defaultfeedrate = number;
+export type Feedrate = number | null;
 export type Terminal = boolean;
 export type Windtype = "hoop";
+export type Feedrate1 = number | null;
 export type Leadinmm = number;
 export type Leadoutdegrees = number;
 export type Lockdegrees = number;
@@ -16,6 +18,7 @@ export type Skipindex = number;
 export type Skipinitialnearlock = boolean;
 export type Windangle = number;
 export type Windtype1 = "helical";
+export type Feedrate2 = number | null;
 export type Mandrelrotation = number;
 export type Windtype2 = "skip";
 export type Layers = (HoopLayer | HelicalLayer | SkipLayer)[];
@@ -41,11 +44,13 @@ export interface WindDefinition {
   [k: string]: unknown;
 }
 export interface HoopLayer {
+  feedRate?: Feedrate;
   terminal?: Terminal;
   windType?: Windtype;
   [k: string]: unknown;
 }
 export interface HelicalLayer {
+  feedRate?: Feedrate1;
   leadInMM: Leadinmm;
   leadOutDegrees: Leadoutdegrees;
   lockDegrees: Lockdegrees;
@@ -57,6 +62,7 @@ export interface HelicalLayer {
   [k: string]: unknown;
 }
 export interface SkipLayer {
+  feedRate?: Feedrate2;
   mandrelRotation: Mandrelrotation;
   windType?: Windtype2;
   [k: string]: unknown;
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Batch planning throughput: one ``fiberpath plan`` process per file against ``plan_many``.
+
+Copies the example ``.wind`` files (or the paths given) ``--copies`` times into a
+temporary directory, then plans them all three ways: one ``fiberpath plan``
+subprocess per file (paying start-up, the schema build and the profile load
+each time), and :func:`~fiberpath.batch.plan_many` with each worker count in
+``--workers``. Reports files/s and the speed-up over the per-file loop. On a
+machine with N cores the speed-up should grow nearly linearly up to N workers.
+
+Usage:
+    python scripts/bench_batch.py [--copies 4] [--workers 1 2 4] [FILE ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from fiberpath.batch import plan_many
+
+ROOT_DIR = Path(__file__).parent.parent
+EXAMPLES_DIR = ROOT_DIR / "examples"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="*", type=Path, help=".wind files (default: examples)")
+    parser.add_argument("--copies", type=int, default=4, help="copies of each file to plan")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+
+    sources = args.files or sorted(EXAMPLES_DIR.rglob("*.wind"))
+    with tempfile.TemporaryDirectory() as root:
+        inputs = []
+        for copy in range(args.copies):
+            for index, source in enumerate(sources):
+                target = Path(root) / f"{copy}-{index}" / source.name
+                target.parent.mkdir()
+                shutil.copy(source, target)
+                inputs.append(target)
+
+        start = time.perf_counter()
+        for path in inputs:
+            subprocess.run(
+                [sys.executable, "-m", "fiberpath_cli.main", "plan", str(path), "-o", "-"],
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        baseline = time.perf_counter() - start
+        print(f"{'mode':<22} {'files':>5} {'seconds':>8} {'files/s':>8} {'speed-up':>8}")
+        print(
+            f"{'process per file':<22} {len(inputs):>5} {baseline:>8.2f} "
+            f"{len(inputs) / baseline:>8.2f} {1.0:>8.2f}"
+        )
+        for workers in args.workers:
+            start = time.perf_counter()
+            results = list(plan_many(inputs, workers=workers))
+            elapsed = time.perf_counter() - start
+            assert all(result.ok for result in results), [r.error for r in results if not r.ok]
+            label = f"plan_many x{workers}"
+            print(
+                f"{label:<22} {len(inputs):>5} {elapsed:>8.2f} "
+                f"{len(inputs) / elapsed:>8.2f} {baseline / elapsed:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
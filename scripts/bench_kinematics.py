@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Timing benchmark for the acceleration-aware cycle-time simulator.
+
+Plans every example ``.wind`` file (or the paths given on the command line) and
+reports the nominal and acceleration-aware cycle times under the given machine
+profile's kinematics (Marlin's defaults when the profile sets none), plus how
+long the estimate took. ``--synthetic N`` adds a program of N short zig-zag
+moves, the planner-throughput case.
+
+Usage:
+    python scripts/bench_kinematics.py [--profile PROFILE.json] [--synthetic 100000] [FILE ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+
+from fiberpath.config import (
+    MachineKinematics,
+    default_machine_profile,
+    load_machine_profile,
+    load_wind_definition,
+)
+from fiberpath.gcode import read_program
+from fiberpath.gcode.reader import HEADER_PREFIX
+from fiberpath.planning import plan_wind
+from fiberpath.planning.ir import Program
+from fiberpath.simulation import simulate_kinematics
+
+ROOT_DIR = Path(__file__).parent.parent
+EXAMPLES_DIR = ROOT_DIR / "examples"
+
+
+def _synthetic(moves: int) -> Program:
+    header = (
+        f'{HEADER_PREFIX}{{"mandrel":{{"diameter":50,"windLength":500}},'
+        f'"tow":{{"width":8,"thickness":0.4}}}}'
+    )
+    lines = [header, "G0 F6000"]
+    lines.extend(f"G0 X{step % 200} A{step * 7}" for step in range(moves))
+    return read_program(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="*", type=Path, help=".wind files (default: examples)")
+    parser.add_argument("--profile", type=Path, help="machine profile JSON")
+    parser.add_argument("--synthetic", type=int, default=100_000, help="0 to skip")
+    args = parser.parse_args()
+
+    profile = load_machine_profile(args.profile) if args.profile else default_machine_profile()
+    kinematics = profile.kinematics or MachineKinematics()
+    programs: list[tuple[str, Program]] = []
+    for path in args.files or sorted(EXAMPLES_DIR.rglob("*.wind")):
+        label = str(path.relative_to(ROOT_DIR) if path.is_relative_to(ROOT_DIR) else path)
+        programs.append((label, read_program(plan_wind(load_wind_definition(path)).commands)))
+    if args.synthetic:
+        programs.append((f"synthetic zig-zag x{args.synthetic}", _synthetic(args.synthetic)))
+
+    print(f"{'program':<48} {'moves':>7} {'nominal s':>10} {'accel s':>10} {'slow':>6} {'ms':>6}")
+    for label, program in programs:
+        start = time.perf_counter()
+        estimate = simulate_kinematics(program, kinematics)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(
+            f"{label:<48} {estimate.moves:>7} {estimate.nominal_time_s:>10.1f} "
+            f"{estimate.time_s:>10.1f} {estimate.moves_below_feed:>6} {elapsed_ms:>6.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
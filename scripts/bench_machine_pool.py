@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Multi-machine streaming benchmark: one sidecar pool driving N emulated winders.
+
+For each pool size, registers that many ``marlinemu://`` ports with a
+:class:`~fiberpath_api.pool.MachinePool`, starts the same program on every
+member at once and waits for all of them. Reports, per pool size, the slowest
+and mean member throughput (lines acked per active second) and the worst
+member's send-to-``ok`` latency percentiles, from each job's telemetry. A pool
+that isolates its members keeps these flat as winders are added, until the
+host runs out of cores.
+
+The program is a synthetic zig-zag; with the default ``--time-scale 0`` moves
+are instant and the numbers measure the link and host path alone.
+
+Usage:
+    python scripts/bench_machine_pool.py [--sizes 1 2 4 8] [--lines 2000]
+        [--time-scale 0] [--latency-ms 0.5] [--buffer-depth 16]
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from fiberpath.emulator import EmulatorConfig, emulator_url
+from fiberpath_api.pool import MachinePool
+
+TERMINAL = ("completed", "cancelled", "error")
+
+
+def _program(lines: int) -> str:
+    moves = "".join(f"G0 X{step % 200} A{step * 7}\n" for step in range(lines))
+    return f"G21\nG0 F6000\n{moves}"
+
+
+def _run(size: int, program: str, config: EmulatorConfig) -> list[dict[str, Any]]:
+    with tempfile.TemporaryDirectory() as root:
+        pool = MachinePool(root=Path(root))
+        try:
+            members = []
+            for index in range(size):
+                info = pool.connect(emulator_url(f"pool{index}", config), 250000, 10.0)
+                members.append(pool.get(str(info["machine_id"])))
+            for member in members:
+                member.start_job(program)
+            while any(member.summary()["job_state"] not in TERMINAL for member in members):
+                time.sleep(0.01)
+            return [member.metrics()["metrics"] for member in members]
+        finally:
+            pool.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--lines", type=int, default=2000)
+    parser.add_argument("--time-scale", type=float, default=0.0)
+    parser.add_argument("--latency-ms", type=float, default=0.5)
+    parser.add_argument("--buffer-depth", type=int, default=16)
+    args = parser.parse_args()
+
+    program = _program(args.lines)
+    config = EmulatorConfig(
+        line_latency_s=args.latency_ms / 1000.0,
+        buffer_depth=args.buffer_depth,
+        time_scale=args.time_scale,
+    )
+    print(
+        f"{'machines':>8} {'min lines/s':>11} {'mean lines/s':>12} "
+        f"{'worst p50 ms':>12} {'worst p99 ms':>12} {'lock wait ms':>12}"
+    )
+    for size in args.sizes:
+        metrics = _run(size, program, config)
+        rates = [entry["mean_lines_per_s"] for entry in metrics]
+        print(
+            f"{size:>8} {min(rates):>11.0f} {sum(rates) / len(rates):>12.0f} "
+            f"{max(entry['latency']['p50_ms'] for entry in metrics):>12.2f} "
+            f"{max(entry['latency']['p99_ms'] for entry in metrics):>12.2f} "
+            f"{max(entry['lock_wait_max_s'] for entry in metrics) * 1000:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
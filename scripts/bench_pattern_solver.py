@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Time to list every valid helical pattern of a layer with the closed-form solver.
+
+Solves the first helical layer of each example ``.wind`` file (or the paths
+given on the command line) with :func:`~fiberpath.planning.solve_patterns`, and
+compares it with validating and lowering the same grid of
+``patternNumber`` / ``skipIndex`` / ``lockDegrees`` candidates one by one --
+the trial-and-error search the solver replaces.
+
+Usage:
+    python scripts/bench_pattern_solver.py [--max-lock 720] [FILE ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+
+from fiberpath.config import load_wind_definition
+from fiberpath.config.schemas import HelicalLayer, WindDefinition
+from fiberpath.gcode.dialects import dialect_from_profile
+from fiberpath.planning import PlanningError, PlanOptions, solve_patterns
+from fiberpath.planning.planner import lower_layer
+
+ROOT_DIR = Path(__file__).parent.parent
+EXAMPLES_DIR = ROOT_DIR / "examples"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="*", type=Path, help=".wind files (default: examples)")
+    parser.add_argument("--max-lock", type=float, default=720.0, help="lockDegrees cap")
+    args = parser.parse_args()
+
+    print(f"{'program':<48} {'valid':>6} {'solve ms':>9} {'trial ms':>9} {'speedup':>8}")
+    for path in args.files or sorted(EXAMPLES_DIR.rglob("*.wind")):
+        definition = load_wind_definition(path)
+        found = _first_helical(definition)
+        if found is None:
+            continue
+        index, layer = found
+        start = time.perf_counter()
+        solutions = solve_patterns(
+            layer,
+            definition.mandrel_parameters,
+            definition.tow_parameters,
+            feed_rate=definition.default_feed_rate,
+            max_lock_degrees=args.max_lock,
+        )
+        solve_ms = (time.perf_counter() - start) * 1e3
+        circuits = solutions[0].circuits if solutions else 1
+        trial_ms = _trial_ms(definition, index, layer, circuits, args.max_lock)
+        label = str(path.relative_to(ROOT_DIR) if path.is_relative_to(ROOT_DIR) else path)
+        print(
+            f"{label:<48} {len(solutions):>6} {solve_ms:>9.1f} {trial_ms:>9.0f} "
+            f"{trial_ms / solve_ms:>7.0f}x"
+        )
+
+
+def _first_helical(definition: WindDefinition) -> tuple[int, HelicalLayer] | None:
+    for index, layer in enumerate(definition.layers, start=1):
+        if isinstance(layer, HelicalLayer):
+            return index, layer
+    return None
+
+
+def _trial_ms(
+    definition: WindDefinition, index: int, layer: HelicalLayer, circuits: int, max_lock: float
+) -> float:
+    """Validate and lower every half-slot lock of every pattern/skip, one candidate at a time."""
+    options = PlanOptions(metrics_only=True)
+    dialect = dialect_from_profile(options.profile)
+    start = time.perf_counter()
+    for pattern_number in range(1, circuits + 1):
+        for skip_index in range(1, max(pattern_number, 2)):
+            for k in range(1, int(max_lock * pattern_number / 180.0) + 1):
+                candidate = layer.model_copy(
+                    update={
+                        "pattern_number": pattern_number,
+                        "skip_index": skip_index,
+                        "lock_degrees": 180.0 * k / pattern_number,
+                    }
+                )
+                try:
+                    lower_layer(index, candidate, definition, options, dialect)
+                except PlanningError:
+                    pass
+    return (time.perf_counter() - start) * 1e3
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Time to the first streamed line: plan-then-stream against pipelined plan-to-stream.
+
+For every example ``.wind`` file (or the paths given on the command line),
+reports how long ``plan_wind`` takes to produce the whole program -- the time a
+plan-then-stream job leaves the machine idle -- and how long a
+:class:`~fiberpath.streaming.PlanStream` takes from construction (which
+validates the definition) to the controller's first ``ok``, streaming to a
+``marlinemu://`` port. The pipelined stream is stopped after ``--limit`` lines.
+
+Usage:
+    python scripts/bench_plan_stream.py [--limit 200] [--buffer 20000] [FILE ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+
+from fiberpath.config import load_wind_definition
+from fiberpath.emulator import EmulatorConfig, emulator_url, register_url_handler
+from fiberpath.planning import plan_wind
+from fiberpath.streaming import PlanStream
+from marlin_host import MarlinHost, SerialTransport
+
+ROOT_DIR = Path(__file__).parent.parent
+EXAMPLES_DIR = ROOT_DIR / "examples"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="*", type=Path, help=".wind files (default: examples)")
+    parser.add_argument("--limit", type=int, default=200, help="lines to stream per program")
+    parser.add_argument("--buffer", type=int, default=20_000, help="max buffered lines")
+    args = parser.parse_args()
+
+    register_url_handler()
+    url = emulator_url("bench", EmulatorConfig(time_scale=0.0))
+    print(f"{'program':<48} {'lines':>7} {'plan ms':>8} {'first ok ms':>11} {'peak buf':>8}")
+    for path in args.files or sorted(EXAMPLES_DIR.rglob("*.wind")):
+        definition = load_wind_definition(path)
+        start = time.perf_counter()
+        lines = len(plan_wind(definition).commands)
+        plan_ms = (time.perf_counter() - start) * 1000
+
+        host = MarlinHost(SerialTransport(url, timeout=10.0), reliable=True)
+        host.connect()
+        try:
+            start = time.perf_counter()
+            plan = PlanStream(definition, max_buffered_lines=args.buffer)
+            first_ms = 0.0
+            peak = 0
+            for progress in plan.stream(host):
+                if progress.commands_sent == 1:
+                    first_ms = (time.perf_counter() - start) * 1000
+                peak = max(peak, plan.buffered)
+                if progress.commands_sent >= args.limit:
+                    plan.stop()
+        finally:
+            host.close()
+        label = str(path.relative_to(ROOT_DIR) if path.is_relative_to(ROOT_DIR) else path)
+        print(f"{label:<48} {lines:>7} {plan_ms:>8.0f} {first_ms:>11.1f} {peak:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Peak memory of reading a G-code program for streaming: whole file against lazy source.
+
+For each program size, writes a synthetic program (a comment every tenth line)
+to a temporary file and measures, with :mod:`tracemalloc`, the peak memory of
+handing its commands to a stream the old way (``read_text().splitlines()``
+filtered into one list) and through a :class:`~fiberpath.streaming.GcodeSource`
+(a counting pre-scan, then slices of 256 commands read as they are consumed).
+The lazy source's peak should stay flat as the program grows.
+
+Usage:
+    python scripts/bench_stream_source.py [--sizes 10000 100000 1000000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+from fiberpath.streaming import GcodeSource, slice_commands
+
+
+def _eager(path: Path) -> int:
+    lines = [line.strip() for line in path.read_text(encoding="utf-8").splitlines()]
+    commands = [line for line in lines if line and not line.startswith(";")]
+    return sum(len(piece) for piece in slice_commands(commands))
+
+
+def _lazy(path: Path) -> int:
+    with GcodeSource(path) as source:
+        return sum(len(piece) for piece in slice_commands(source.commands()))
+
+
+def _measure(read: Callable[[Path], int], path: Path) -> tuple[int, float, float]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = read(path)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count, peak / 1e6, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"{'lines':>9} {'eager MB':>9} {'eager s':>8} {'lazy MB':>8} {'lazy s':>7}")
+    with tempfile.TemporaryDirectory() as root:
+        for size in args.sizes:
+            path = Path(root) / f"program-{size}.gcode"
+            with path.open("w", encoding="utf-8") as file:
+                for step in range(size):
+                    file.write(
+                        f"; pass {step}\n" if step % 10 == 0 else f"G0 X{step % 200} A{step}\n"
+                    )
+            eager_count, eager_mb, eager_s = _measure(_eager, path)
+            lazy_count, lazy_mb, lazy_s = _measure(_lazy, path)
+            assert eager_count == lazy_count
+            print(f"{size:>9} {eager_mb:>9.1f} {eager_s:>8.2f} {lazy_mb:>8.2f} {lazy_s:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""End-to-end streaming benchmark against the built-in Marlin emulator.
+
+Plans every example ``.wind`` file (or the paths given on the command line) and
+streams each program through the real host stack -- ``MarlinHost`` with
+reliable framing over ``SerialTransport`` -- to a ``marlinemu://`` port, then
+reports the achieved lines/s and the stall time the emulator measured (moments
+its planner buffer ran dry while motion was under way). No hardware needed.
+
+Moves execute in real time by default, so ``--limit`` caps the lines streamed
+per program; ``--time-scale 0`` makes moves instant and measures the link and
+host ceiling alone (every block then counts as a stall).
+
+Usage:
+    python scripts/bench_stream_throughput.py [--limit 500] [--time-scale 1.0]
+        [--baud-rate 250000] [--latency-ms 0.5] [--buffer-depth 16]
+        [--resend-every 0] [--busy-every 0] [--wire-compact] [FILE ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+
+from fiberpath.config import load_wind_definition
+from fiberpath.emulator import EmulatorConfig, emulator_url, get_emulator, register_url_handler
+from fiberpath.gcode.compact import DEFAULT_BAUD_RATE, WireCompactOptions, compact_gcode
+from fiberpath.planning import plan_wind
+from marlin_host import MarlinHost, SerialTransport
+
+ROOT_DIR = Path(__file__).parent.parent
+EXAMPLES_DIR = ROOT_DIR / "examples"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="*", type=Path, help=".wind files (default: examples)")
+    parser.add_argument("--limit", type=int, default=500, help="lines per program (0: all)")
+    parser.add_argument("--time-scale", type=float, default=1.0)
+    parser.add_argument("--baud-rate", type=int, default=DEFAULT_BAUD_RATE)
+    parser.add_argument("--latency-ms", type=float, default=0.5)
+    parser.add_argument("--buffer-depth", type=int, default=16)
+    parser.add_argument("--resend-every", type=int, default=0)
+    parser.add_argument("--busy-every", type=int, default=0)
+    parser.add_argument("--wire-compact", action="store_true")
+    args = parser.parse_args()
+
+    register_url_handler()
+    files = args.files or sorted(EXAMPLES_DIR.rglob("*.wind"))
+
+    print(
+        f"{'program':<48} {'lines':>6} {'wall s':>7} {'lines/s':>8} {'machine s':>9} "
+        f"{'stall s':>8} {'stalls':>6} {'resends':>7}"
+    )
+    for path in files:
+        definition = load_wind_definition(path)
+        commands = plan_wind(definition).commands
+        if args.wire_compact:
+            commands, _ = compact_gcode(commands, WireCompactOptions())
+        lines = [line for line in commands if line and not line.startswith(";")]
+        if args.limit:
+            lines = lines[: args.limit]
+        config = EmulatorConfig(
+            line_latency_s=args.latency_ms / 1000.0,
+            buffer_depth=args.buffer_depth,
+            time_scale=args.time_scale,
+            mandrel_diameter_mm=definition.mandrel_parameters.diameter,
+            resend_every=args.resend_every,
+            busy_every=args.busy_every,
+        )
+        host = MarlinHost(
+            SerialTransport(emulator_url("bench", config), args.baud_rate, timeout=10.0),
+            reliable=True,
+        )
+        try:
+            host.connect()
+            start = time.perf_counter()
+            for _ in host.stream(lines):
+                pass
+            elapsed = time.perf_counter() - start
+        finally:
+            host.close()
+        emulator = get_emulator("bench")
+        assert emulator is not None
+        stats = emulator.stats
+        label = str(path.relative_to(ROOT_DIR) if path.is_relative_to(ROOT_DIR) else path)
+        print(
+            f"{label:<48} {len(lines):>6} {elapsed:>7.2f} {len(lines) / elapsed:>8.0f} "
+            f"{stats.machine_s:>9.2f} {stats.stall_s:>8.3f} {stats.stalls:>6} "
+            f"{stats.resends_requested:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
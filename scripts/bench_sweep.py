@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Candidates per second for a parameter sweep over one helical layer.
+
+Sweeps ``windAngle``, ``patternNumber``, ``skipIndex`` and ``lockDegrees`` of
+the first helical layer of each example ``.wind`` file (or the paths given on
+the command line) with :func:`~fiberpath.planning.sweep_layer`, and compares
+the sweep's throughput with one metrics-only ``plan_wind`` of the whole
+definition per candidate -- the trial-and-error loop the sweep replaces.
+
+Usage:
+    python scripts/bench_sweep.py [--workers 1] [FILE ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import time
+from pathlib import Path
+
+from fiberpath.config import load_wind_definition
+from fiberpath.config.schemas import HelicalLayer, WindDefinition
+from fiberpath.planning import PlanningError, PlanOptions, parse_sweep_range, plan_wind, sweep_layer
+from pydantic import ValidationError
+
+ROOT_DIR = Path(__file__).parent.parent
+EXAMPLES_DIR = ROOT_DIR / "examples"
+
+RANGES = {
+    "windAngle": parse_sweep_range("20:70:1"),
+    "patternNumber": parse_sweep_range("1:8"),
+    "skipIndex": parse_sweep_range("1:7"),
+    "lockDegrees": parse_sweep_range("180:720:90"),
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="*", type=Path, help=".wind files (default: examples)")
+    parser.add_argument("--workers", type=int, default=1, help="sweep worker processes")
+    args = parser.parse_args()
+
+    print(f"{'program':<48} {'cands':>6} {'valid':>6} {'sweep/s':>9} {'plan/s':>8} {'speedup':>8}")
+    for path in args.files or sorted(EXAMPLES_DIR.rglob("*.wind")):
+        definition = load_wind_definition(path)
+        if not any(isinstance(layer, HelicalLayer) for layer in definition.layers):
+            continue
+        result = sweep_layer(definition, RANGES, workers=args.workers)
+        plan_rate = _plan_rate(definition, result.layer_index)
+        label = str(path.relative_to(ROOT_DIR) if path.is_relative_to(ROOT_DIR) else path)
+        print(
+            f"{label:<48} {result.candidates:>6} {len(result.points):>6} "
+            f"{result.candidates_per_s:>9.0f} {plan_rate:>8.0f} "
+            f"{result.candidates_per_s / plan_rate:>7.1f}x"
+        )
+
+
+def _plan_rate(definition: WindDefinition, index: int) -> float:
+    """Candidates per second planning each one as a whole definition."""
+    options = PlanOptions(metrics_only=True)
+    base = definition.layers[index - 1].model_dump(by_alias=True)
+    count = 0
+    start = time.perf_counter()
+    for values in itertools.product(*RANGES.values()):
+        count += 1
+        layers = list(definition.layers)
+        try:
+            layers[index - 1] = HelicalLayer.model_validate(
+                {**base, **dict(zip(RANGES, values, strict=True))}
+            )
+            plan_wind(definition.model_copy(update={"layers": layers}), options)
+        except (ValidationError, PlanningError):
+            pass
+    return count / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
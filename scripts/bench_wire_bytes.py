@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Bytes-per-line benchmark for the wire-compact G-code profile.
+
+Plans every example ``.wind`` file (or the paths given on the command line),
+then reports how many bytes the streamer would send per line for the canonical
+program and for its wire-compact rewrite, and the serial time that saves at the
+given baud rate (8N1 framing, excluding the host's line-number/checksum frame).
+
+Usage:
+    python scripts/bench_wire_bytes.py [--baud-rate 250000] [--resolution 0.001] [FILE ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+
+from fiberpath.config import load_wind_definition
+from fiberpath.gcode.compact import DEFAULT_BAUD_RATE, WireCompactOptions, compact_gcode
+from fiberpath.planning import plan_wind
+
+ROOT_DIR = Path(__file__).parent.parent
+EXAMPLES_DIR = ROOT_DIR / "examples"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="*", type=Path, help=".wind files (default: examples)")
+    parser.add_argument("--baud-rate", type=int, default=DEFAULT_BAUD_RATE)
+    parser.add_argument("--resolution", type=float, default=0.001)
+    args = parser.parse_args()
+
+    files = args.files or sorted(EXAMPLES_DIR.rglob("*.wind"))
+    options = WireCompactOptions(
+        linear_resolution_mm=args.resolution, rotary_resolution_deg=args.resolution
+    )
+
+    print(
+        f"{'program':<48} {'lines':>7} {'B/line':>7} {'compact':>7} {'saved':>6} "
+        f"{'link s':>7} {'ms':>6}"
+    )
+    for path in files:
+        result = plan_wind(load_wind_definition(path))
+        start = time.perf_counter()
+        _, stats = compact_gcode(result.commands, options)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        before = stats.bytes_before / max(stats.lines_before, 1)
+        after = stats.bytes_after / max(stats.lines_after, 1)
+        saved = stats.bytes_saved / max(stats.bytes_before, 1)
+        label = str(path.relative_to(ROOT_DIR) if path.is_relative_to(ROOT_DIR) else path)
+        print(
+            f"{label:<48} {stats.lines_before:>7} {before:>7.1f} {after:>7.1f} {saved:>6.0%} "
+            f"{stats.link_seconds_saved(args.baud_rate):>7.2f} {elapsed_ms:>6.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -79,6 +79,7 @@ def get_hidden_imports() -> list[str]:
         # CLI packages
         "fiberpath_cli",
         "fiberpath_cli.main",
+        "fiberpath_cli.analyze_stream",
         "fiberpath_cli.plan",
         "fiberpath_cli.plot",
         "fiberpath_cli.simulate",
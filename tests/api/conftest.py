@@ -0,0 +1,13 @@
+"""Shared fixtures for the API route tests."""
+
+from __future__ import annotations
+
+import pytest
+from fiberpath_api.cache import result_cache
+
+
+@pytest.fixture(autouse=True)
+def _fresh_result_cache() -> None:
+    # The result cache is a process-wide singleton; a result cached by one test
+    # must not answer (or skip the patched planner of) another.
+    result_cache.clear()
@@ -0,0 +1,73 @@
+"""Plan artifacts: chunking at layer boundaries and line-range deltas."""
+
+from __future__ import annotations
+
+from fiberpath.planning import LayerMetrics, PlanResult
+from fiberpath_api.artifacts import PlanArtifactStore, build_artifact, diff_artifacts
+
+
+def _result(*blocks: list[str]) -> PlanResult:
+    commands = ["; Parameters {}", "G21", "G0 X0 A0 B0", "G0 F6000"]
+    layers = []
+    for index, block in enumerate(blocks, start=1):
+        commands.append(f"; Layer {index} of {len(blocks)}: hoop")
+        commands.extend(block)
+        layers.append(
+            LayerMetrics(
+                index=index,
+                wind_type="hoop",
+                commands=len(block),
+                time_s=1.0,
+                cumulative_time_s=float(index),
+                tow_m=1.0,
+                cumulative_tow_m=float(index),
+                terminal=False,
+            )
+        )
+    return PlanResult(commands=commands, total_time_s=1.0, total_tow_m=1.0, layers=layers)
+
+
+def _apply(base: list[str], edits: list) -> list[str]:
+    lines = list(base)
+    for edit in reversed(edits):
+        lines[edit.start : edit.start + edit.delete_count] = edit.lines
+    return lines
+
+
+def test_identical_programs_share_an_id_and_have_no_edits() -> None:
+    a = build_artifact(_result(["G0 X1"], ["G0 X2"]))
+    b = build_artifact(_result(["G0 X1"], ["G0 X2"]))
+
+    assert a.artifact_id == b.artifact_id
+    assert diff_artifacts(a, b) == []
+
+
+def test_edit_replaces_only_the_changed_layer_block() -> None:
+    base = build_artifact(_result(["G0 X1"], ["G0 X2", "G0 X3"], ["G0 X4"]))
+    new = build_artifact(_result(["G0 X1"], ["G0 X9"], ["G0 X4"]))
+
+    edits = diff_artifacts(base, new)
+
+    assert [(e.start, e.delete_count, e.layer_index) for e in edits] == [(7, 2, 2)]
+    assert _apply(base.commands, edits) == new.commands
+
+
+def test_removed_layer_rewrites_summaries_and_drops_its_block() -> None:
+    base = build_artifact(_result(["G0 X1"], ["G0 X2"], ["G0 X3"]))
+    new = build_artifact(_result(["G0 X1"], ["G0 X3"]))
+
+    assert _apply(base.commands, diff_artifacts(base, new)) == new.commands
+
+
+def test_store_evicts_least_recently_used() -> None:
+    store = PlanArtifactStore(max_entries=2)
+    first = build_artifact(_result(["G0 X1"]))
+    second = build_artifact(_result(["G0 X2"]))
+    third = build_artifact(_result(["G0 X3"]))
+    store.put(first)
+    store.put(second)
+    assert store.get(first.artifact_id) is first  # refreshes first
+    store.put(third)
+
+    assert store.get(second.artifact_id) is None
+    assert store.get(first.artifact_id) is first
@@ -0,0 +1,200 @@
+"""Result cache: single-flight coalescing, LRU bounds and ETag/304 on the compute routes."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from fiberpath.planning import CancellationToken, PlanCancelledError
+from fiberpath_api.cache import ResultCache, cache_key, etag_matches, quote_etag
+from fiberpath_api.main import create_app
+
+ROOT = Path(__file__).resolve().parents[2]
+EXAMPLES = ROOT / "examples"
+
+
+def _example_body() -> dict:
+    src = (EXAMPLES / "simple_cylinder" / "input.wind").read_text(encoding="utf-8")
+    return json.loads(src)
+
+
+def test_concurrent_identical_requests_share_one_computation() -> None:
+    cache = ResultCache()
+    calls = 0
+
+    async def compute() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return "result"
+
+    async def scenario() -> list[str]:
+        return await asyncio.gather(
+            *(cache.get_or_compute("plan-k", compute, weight=len) for _ in range(3))
+        )
+
+    assert asyncio.run(scenario()) == ["result"] * 3
+    assert calls == 1
+    stats = cache.stats()["plan"]
+    assert (stats.misses, stats.coalesced, stats.hits) == (1, 2, 0)
+
+
+def test_joiners_retry_when_the_leader_is_cancelled() -> None:
+    cache = ResultCache()
+    calls = 0
+
+    async def compute() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        if calls == 1:
+            raise PlanCancelledError("superseded")
+        return "result"
+
+    async def scenario() -> tuple[object, ...]:
+        return tuple(
+            await asyncio.gather(
+                cache.get_or_compute("plan-k", compute, weight=len),
+                cache.get_or_compute("plan-k", compute, weight=len),
+                return_exceptions=True,
+            )
+        )
+
+    leader, joiner = asyncio.run(scenario())
+    assert isinstance(leader, PlanCancelledError)
+    assert joiner == "result"
+    assert calls == 2
+
+
+def test_joiner_stops_waiting_when_its_own_token_is_cancelled() -> None:
+    cache = ResultCache()
+    token = CancellationToken()
+
+    async def compute() -> str:
+        await asyncio.sleep(0.3)
+        return "result"
+
+    async def scenario() -> None:
+        leader = asyncio.ensure_future(cache.get_or_compute("plan-k", compute, weight=len))
+        await asyncio.sleep(0)
+        joiner = asyncio.ensure_future(
+            cache.get_or_compute("plan-k", compute, weight=len, cancel_token=token)
+        )
+        await asyncio.sleep(0.05)
+        token.cancel("superseded")
+        with pytest.raises(PlanCancelledError):
+            await joiner
+        assert not leader.done()
+        assert await leader == "result"
+
+    asyncio.run(scenario())
+
+
+def test_errors_are_not_cached() -> None:
+    cache = ResultCache()
+    outcomes = iter([ValueError("bad"), "result"])
+
+    async def compute() -> str:
+        outcome = next(outcomes)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    async def scenario() -> str:
+        with pytest.raises(ValueError):
+            await cache.get_or_compute("plan-k", compute, weight=len)
+        return await cache.get_or_compute("plan-k", compute, weight=len)
+
+    assert asyncio.run(scenario()) == "result"
+
+
+def test_lru_evicts_by_weight_and_skips_oversized_results() -> None:
+    cache = ResultCache(max_entries=8, max_bytes=10)
+
+    async def scenario() -> None:
+        for key, value in [("plot-a", b"aaaa"), ("plot-b", b"bbbb"), ("plot-c", b"cccc")]:
+
+            async def compute(value: bytes = value) -> bytes:
+                return value
+
+            await cache.get_or_compute(key, compute, weight=len)
+
+        async def huge() -> bytes:
+            return b"x" * 11
+
+        await cache.get_or_compute("plot-d", huge, weight=len)
+
+    asyncio.run(scenario())
+    assert (cache.entries, cache.bytes, cache.evictions) == (2, 8, 1)
+
+
+def test_etag_matching_accepts_lists_weak_tags_and_star() -> None:
+    key = cache_key("plan", "{}")
+    assert etag_matches(quote_etag(key), key)
+    assert etag_matches(f'"other", W/{quote_etag(key)}', key)
+    assert etag_matches("*", key)
+    assert not etag_matches('"other"', key)
+    assert not etag_matches(None, key)
+
+
+@pytest.mark.parametrize("path", ["/plan", "/plan/metrics"])
+def test_plan_routes_return_304_for_a_matching_etag(path: str) -> None:
+    client = TestClient(create_app())
+    first = client.post(path, json=_example_body())
+    etag = first.headers["etag"]
+
+    again = client.post(path, json=_example_body(), headers={"If-None-Match": etag})
+
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["etag"] == etag
+
+
+def test_etag_ignores_key_order_and_whitespace() -> None:
+    client = TestClient(create_app())
+    body = _example_body()
+    reordered = json.dumps(dict(reversed(list(body.items()))), indent=4)
+
+    first = client.post("/plan", json=body)
+    second = client.post("/plan", content=reordered, headers={"Content-Type": "application/json"})
+
+    assert first.headers["etag"] == second.headers["etag"]
+
+
+def test_repeated_simulate_and_plot_are_served_from_the_cache() -> None:
+    client = TestClient(create_app())
+    gcode = client.post("/plan", json=_example_body()).json()["gcode"]
+
+    for _ in range(2):
+        simulated = client.post("/simulate", json={"gcode": gcode})
+        plotted = client.post("/plot", json={"gcode": gcode})
+    not_modified = client.post(
+        "/plot", json={"gcode": gcode}, headers={"If-None-Match": plotted.headers["etag"]}
+    )
+
+    assert simulated.status_code == 200 and plotted.status_code == 200
+    assert not_modified.status_code == 304
+    stats = client.get("/cache").json()
+    assert stats["entries"] == 3
+    for namespace in ("simulate", "plot"):
+        assert stats["namespaces"][namespace]["hits"] == 1
+        assert stats["namespaces"][namespace]["misses"] == 1
+        assert stats["namespaces"][namespace]["hit_rate"] == pytest.approx(0.5)
+    assert stats["namespaces"]["plot"]["not_modified"] == 1
+
+
+def test_cached_plan_still_answers_deltas() -> None:
+    client = TestClient(create_app())
+    base = client.post("/plan", json=_example_body()).json()
+
+    again = client.post(
+        "/plan", json=_example_body(), params={"baseArtifactId": base["artifactId"]}
+    )
+
+    payload = again.json()
+    assert payload["delta"] == {"baseArtifactId": base["artifactId"], "edits": []}
+    assert payload["gcode"] == ""
+    assert client.get("/cache").json()["namespaces"]["plan"]["hits"] == 1
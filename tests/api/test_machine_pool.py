@@ -0,0 +1,202 @@
+"""Tests for the machine pool: several emulated winders behind one sidecar.
+
+Each test swaps the module-level pool for one rooted in ``tmp_path`` so the
+members' snapshots stay isolated, and connects ``marlinemu://`` ports so the real
+serial stack runs for every member.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from fiberpath_api.machine import MachineConflictError, MachineError, MachineService
+from fiberpath_api.main import create_app
+from fiberpath_api.pool import MachinePool, machine_id_for_port
+
+PROGRAM = "G21\nG0 F6000\n" + "".join(f"G0 X{step}\n" for step in range(1, 41))
+
+
+@pytest.fixture
+def pool(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[MachinePool]:
+    machines = MachinePool(root=tmp_path)
+    monkeypatch.setattr("fiberpath_api.routes.machines.pool", machines)
+    monkeypatch.setattr("fiberpath_api.routes.machine.pool", machines)
+    yield machines
+    machines.close()
+
+
+@pytest.fixture
+def client(pool: MachinePool) -> Iterator[TestClient]:
+    with TestClient(create_app()) as test_client:
+        yield test_client
+
+
+def _connect(client: TestClient, name: str, **extra: object) -> dict[str, object]:
+    response = client.post(
+        "/machines",
+        json={"port": f"marlinemu://{name}?time_scale=0", "timeout": 2.0, **extra},
+    )
+    assert response.status_code == 200, response.text
+    body: dict[str, object] = response.json()
+    return body
+
+
+def _wait_terminal(client: TestClient, machine_id: str, job_id: str) -> dict[str, object]:
+    last: dict[str, object] = {}
+    for _ in range(1000):
+        last = client.get(f"/machines/{machine_id}/jobs/{job_id}").json()
+        if last["state"] in ("completed", "cancelled", "error"):
+            return last
+        time.sleep(0.005)
+    raise AssertionError(f"job did not terminate: {last}")
+
+
+def test_machine_id_for_port() -> None:
+    assert machine_id_for_port("/dev/ttyACM0") == "ttyACM0"
+    assert machine_id_for_port("COM3") == "COM3"
+    assert machine_id_for_port("marlinemu://cell-2?time_scale=0") == "cell-2"
+
+
+def test_members_stream_concurrently(client: TestClient, pool: MachinePool) -> None:
+    first = _connect(client, "pool-a")
+    second = _connect(client, "pool-b", machine_id="winder-2")
+    assert first["machine_id"] == "pool-a"
+    assert second["machine_id"] == "winder-2"
+
+    jobs = {
+        machine_id: client.post(f"/machines/{machine_id}/jobs", json={"gcode": PROGRAM}).json()
+        for machine_id in ("pool-a", "winder-2")
+    }
+    for machine_id, job in jobs.items():
+        final = _wait_terminal(client, machine_id, job["job_id"])
+        assert final["state"] == "completed"
+        assert final["sent"] == 42
+
+    members = client.get("/machines").json()
+    assert [member["machine_id"] for member in members] == ["pool-a", "winder-2"]
+    assert all(member["job_state"] == "completed" for member in members)
+    assert pool.get("pool-a").summary()["port"] == "marlinemu://pool-a?time_scale=0"
+
+
+def test_job_ids_are_per_member(client: TestClient) -> None:
+    _connect(client, "pool-c")
+    job = client.post("/machines/pool-c/jobs", json={"gcode": PROGRAM}).json()
+    _wait_terminal(client, "pool-c", job["job_id"])
+    _connect(client, "pool-d")
+    assert client.get(f"/machines/pool-d/jobs/{job['job_id']}").status_code == 404
+
+
+def test_a_port_belongs_to_one_member(client: TestClient) -> None:
+    _connect(client, "pool-e")
+    response = client.post(
+        "/machines",
+        json={"port": "marlinemu://pool-e?time_scale=0", "timeout": 2.0, "machine_id": "other"},
+    )
+    assert response.status_code == 409
+
+
+def test_a_port_is_reserved_while_it_connects(
+    pool: MachinePool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    port = "marlinemu://pool-h?time_scale=0"
+    connecting, release = threading.Event(), threading.Event()
+    connect = MachineService.connect
+
+    def slow_connect(
+        self: MachineService, port: str, baud_rate: int, timeout: float, *, reset: bool = True
+    ) -> dict[str, object]:
+        connecting.set()
+        release.wait(5.0)
+        return connect(self, port, baud_rate, timeout, reset=reset)
+
+    monkeypatch.setattr(MachineService, "connect", slow_connect)
+    first = threading.Thread(target=pool.connect, args=(port, 250000, 2.0, "first"))
+    first.start()
+    try:
+        assert connecting.wait(5.0)
+        with pytest.raises(MachineConflictError, match="first"):
+            pool.connect(port, 250000, 2.0, "second")
+    finally:
+        release.set()
+        first.join(5.0)
+    assert [entry["machine_id"] for entry in pool.members()] == ["first"]
+    assert pool.get("first").port == port
+
+
+def test_a_failed_connect_releases_the_port(
+    pool: MachinePool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    port = "marlinemu://pool-i?time_scale=0"
+    connect = MachineService.connect
+
+    def failing_connect(
+        self: MachineService, port: str, baud_rate: int, timeout: float, *, reset: bool = True
+    ) -> dict[str, object]:
+        raise MachineError("no controller")
+
+    monkeypatch.setattr(MachineService, "connect", failing_connect)
+    with pytest.raises(MachineError, match="no controller"):
+        pool.connect(port, 250000, 2.0, "first")
+    assert pool.members() == []
+
+    monkeypatch.setattr(MachineService, "connect", connect)
+    assert pool.connect(port, 250000, 2.0, "second")["machine_id"] == "second"
+
+
+def test_the_default_machine_keeps_its_port(tmp_path: Path) -> None:
+    default = MachineService(state_path=tmp_path / "default" / "machine-job.json")
+    machines = MachinePool(root=tmp_path / "pool", default=default)
+    port = "marlinemu://pool-j?time_scale=0"
+    default.connect(port, 250000, 2.0)
+    try:
+        with pytest.raises(MachineConflictError, match="default machine"):
+            machines.connect(port, 250000, 2.0)
+        assert machines.members() == []
+    finally:
+        default.disconnect()
+
+
+def test_the_default_machine_stays_off_pool_ports(client: TestClient, pool: MachinePool) -> None:
+    body = {"port": "marlinemu://pool-k?time_scale=0", "timeout": 2.0}
+    _connect(client, "pool-k")
+    taken = client.post("/machine/connection", json=body)
+    assert taken.status_code == 409, taken.text
+
+    body["port"] = "marlinemu://pool-l?time_scale=0"
+    with pool.reserve(body["port"], "winder-3"):  # a member still connecting
+        reserved = client.post("/machine/connection", json=body)
+    assert reserved.status_code == 409, reserved.text
+    assert "winder-3" in reserved.json()["detail"]
+
+
+def test_unknown_machine_is_404(client: TestClient) -> None:
+    assert client.get("/machines/nope/queue").status_code == 404
+    assert client.delete("/machines/nope").status_code == 404
+
+
+def test_remove_disconnects_the_member(client: TestClient, pool: MachinePool) -> None:
+    _connect(client, "pool-f")
+    member = pool.get("pool-f")
+    assert client.delete("/machines/pool-f").status_code == 204
+    assert member.state == "disconnected"
+    assert client.get("/machines").json() == []
+
+
+def test_pool_restores_members_with_queued_jobs(tmp_path: Path) -> None:
+    machines = MachinePool(root=tmp_path)
+    machines.connect("marlinemu://pool-g?time_scale=0", 250000, 2.0)
+    member = machines.get("pool-g")
+    member.enqueue_job(PROGRAM, priority=0, hold=True, sd=None, profile=None)
+    machines.close()
+
+    restored = MachinePool(root=tmp_path)
+    summary = restored.members()
+    assert [entry["machine_id"] for entry in summary] == ["pool-g"]
+    assert summary[0]["state"] == "disconnected"
+    assert restored.get("pool-g").queue()["jobs"][0]["hold"] is True
+    assert (tmp_path / "pool-g").is_dir()
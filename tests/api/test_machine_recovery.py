@@ -1,4 +1,4 @@
-"""Crash-recovery tests for the machine service's orphaned-job snapshot.
+"""Crash-recovery tests for the machine service's orphaned-job journal.
 
 When the sidecar process dies mid-stream its in-memory job is lost and the OS
 releases the serial port (DTR resets the controller). A freshly started service
@@ -15,6 +15,7 @@ from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
+from fiberpath_api.journal import JobJournal, replay
 from fiberpath_api.machine import MachineNotFoundError, MachineService
 from marlin_host import FakeTransport
 
@@ -89,6 +90,70 @@ def test_recovered_counter_avoids_id_reuse(tmp_path: Path) -> None:
     assert svc._job_counter == 5
 
 
+def test_queued_jobs_survive_a_restart_held(tmp_path: Path) -> None:
+    state_path = tmp_path / "job.json"
+    first = MachineService(state_path=state_path)
+    first.enqueue_job("G1 X1\nG1 X2", priority=2)
+    first.enqueue_job("; note\nG1 X3")
+
+    svc = MachineService(state_path=state_path)
+
+    queue = svc.queue()["jobs"]
+    assert [(job["job_id"], job["total"], job["priority"], job["hold"]) for job in queue] == [  # type: ignore[union-attr]
+        ("job-1", 2, 2, True),
+        ("job-2", 1, 0, True),
+    ]
+    assert svc._job_counter == 2
+    svc.cancel_job("job-1")
+    svc.cancel_job("job-2")
+    assert not (tmp_path / "machine-queue.json").exists()
+    assert list((tmp_path / "machine-queue.d").iterdir()) == []
+
+
+def test_queue_index_holds_no_programs(tmp_path: Path) -> None:
+    # Programs are spooled once when queued; the index rewritten under the lock stays small.
+    state_path = tmp_path / "job.json"
+    svc = MachineService(state_path=state_path)
+    svc.enqueue_job("\n".join(f"G1 X{i}" for i in range(500)))
+    svc.enqueue_job("G1 X1")
+
+    index = json.loads((tmp_path / "machine-queue.json").read_text())
+    assert all("commands" not in entry for entry in index["jobs"])
+    assert len(list((tmp_path / "machine-queue.d").iterdir())) == 2
+    # A spool no queue entry refers to (a crash between writing and queueing) is pruned.
+    (tmp_path / "machine-queue.d" / "stray.json").write_text("[]")
+
+    restored = MachineService(state_path=state_path)
+    assert [job["total"] for job in restored.queue()["jobs"]] == [500, 1]  # type: ignore[index]
+    assert len(list((tmp_path / "machine-queue.d").iterdir())) == 2
+
+
+def test_enqueue_prepares_the_program_outside_the_lock(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # The streaming worker takes the lock on every acked line; compiling a queued
+    # program must not hold it.
+    svc = MachineService(state_path=tmp_path / "job.json")
+    compile_ = MachineService._compile
+    free: list[bool] = []
+
+    def try_lock() -> None:  # what the worker's progress callback would do
+        acquired = svc._lock.acquire(timeout=1.0)
+        free.append(acquired)
+        if acquired:
+            svc._lock.release()
+
+    def spy(gcode: str) -> tuple[list[str], str | None]:
+        worker = threading.Thread(target=try_lock)
+        worker.start()
+        worker.join()
+        return compile_(gcode)
+
+    monkeypatch.setattr(svc, "_compile", spy)
+    svc.enqueue_job("G1 X1")
+    assert free == [True]
+
+
 # --- persistence lifecycle (snapshot written while streaming, cleared after) ---
 
 
@@ -114,7 +179,9 @@ class _Responder:
 def svc(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[tuple[MachineService, Path]]:
     responder = _Responder()
 
-    def fake_serial(port: str, baud_rate: int = 250000, *, timeout: float = 2.0) -> FakeTransport:
+    def fake_serial(
+        port: str, baud_rate: int = 250000, *, timeout: float = 2.0, reset_on_open: bool = True
+    ) -> FakeTransport:
         return FakeTransport(responder=responder)
 
     monkeypatch.setattr("fiberpath_api.machine.SerialTransport", fake_serial)
@@ -139,9 +206,11 @@ def test_snapshot_written_while_streaming_and_cleared_on_complete(
     service.start_job("G1 X1\nG1 X2\nG1 X3")
     assert responder.reached.wait(timeout=5.0)
 
-    # A job is active -> the recovery snapshot exists and marks it streaming.
-    assert state_path.exists()
-    snap = json.loads(state_path.read_text())
+    # A job is active -> the recovery journal exists and marks it streaming.
+    journal = state_path.with_suffix(".journal")
+    assert journal.exists()
+    snap = replay(journal)
+    assert snap is not None
     assert snap["state"] == "streaming"
 
     responder.gate.set()  # let the job run to completion
@@ -152,5 +221,174 @@ def test_snapshot_written_while_streaming_and_cleared_on_complete(
         deadline.wait(0.05)
 
     assert service.get_job(service._job.id)["state"] == "completed"  # type: ignore[union-attr]
-    # Clean completion clears the snapshot, so a later restart won't orphan it.
-    assert not state_path.exists()
+    # Clean completion clears the journal, so a later restart won't orphan it.
+    assert not journal.exists()
+
+
+# --- journal ------------------------------------------------------------------
+
+
+def _start_journal(path: Path, **fields: object) -> JobJournal:
+    journal = JobJournal(path, sync_interval_s=0.0)
+    journal.start(
+        {"id": "job-3", "port": "COM3", "baud_rate": 250000, "sent": 0, "state": "streaming"}
+        | fields
+    )
+    return journal
+
+
+def test_journal_recovers_the_last_acknowledged_line(tmp_path: Path) -> None:
+    state_path = tmp_path / "job.json"
+    journal = _start_journal(state_path.with_suffix(".journal"), total=500)
+    for sent in range(1, 338):
+        journal.append({"sent": sent})
+    journal.append({"state": "paused"}, sync=True)
+    # The process dies here: the journal is never finished.
+
+    svc = MachineService(state_path=state_path)
+
+    status = svc.get_job("job-3")
+    assert status["state"] == "orphaned"
+    assert status["sent"] == 337
+    assert "337 of 500" in str(status["error"])
+    assert not state_path.with_suffix(".journal").exists()
+
+
+def test_journal_ignores_a_torn_tail(tmp_path: Path) -> None:
+    path = tmp_path / "job.journal"
+    journal = _start_journal(path, total=10)
+    journal.append({"sent": 4})
+    journal.append({"sent": 5})
+    with path.open("ab") as handle:
+        handle.write(bytes.fromhex("0000000c00"))  # half a frame header
+    state = replay(path)
+    assert state is not None
+    assert state["sent"] == 5
+
+    data = path.read_bytes()
+    path.write_bytes(data[:-9])  # the last record loses its final bytes
+    state = replay(path)
+    assert state is not None
+    assert state["sent"] == 4
+
+
+def test_journal_compacts_long_jobs(tmp_path: Path) -> None:
+    path = tmp_path / "job.journal"
+    journal = JobJournal(path, sync_interval_s=1.0, compact_records=100)
+    journal.start({"id": "job-1", "total": 1000, "sent": 0, "state": "streaming"})
+    for sent in range(1, 251):
+        journal.append({"sent": sent})
+    # 250 appends: compacted twice, then 50 more records.
+    assert path.stat().st_size < 60 * 20
+    assert replay(path) == {"id": "job-1", "total": 1000, "sent": 250, "state": "streaming"}
+
+
+def test_journal_finish_removes_it(tmp_path: Path) -> None:
+    path = tmp_path / "job.journal"
+    journal = _start_journal(path, total=3)
+    journal.append({"sent": 3})
+    journal.finish("completed")
+    assert not path.exists()
+    journal.append({"sent": 4})  # after finish: ignored, nothing recreated
+    assert not path.exists()
+
+
+# --- SD print surviving a crash -------------------------------------------------
+
+SD_LAYOUT = [["WIND001.GCO", 2, 20], ["WIND002.GCO", 2, 20]]
+
+
+class _Card:
+    """A controller printing WIND001.GCO from its card, left running by a dead sidecar."""
+
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+        self.printed: int | None = 10  # bytes read of the selected file; None when idle
+
+    def __call__(self, line: str) -> list[str]:
+        self.lines.append(line)
+        if "M115" in line:
+            return ["FIRMWARE_NAME:Marlin 2.1.2 (Fake)", "ok"]
+        if "M23 " in line:
+            name = line.split("M23 ", 1)[1].split("*")[0].strip()
+            return [f"File opened: {name} Size: 20", "File selected", "ok"]
+        if "M24" in line:
+            self.printed = 0
+        if "M27" in line:
+            if self.printed is None:
+                return ["Not SD printing", "ok"]
+            report = f"SD printing byte {self.printed}/20"
+            self.printed = self.printed + 10 if self.printed < 20 else None
+            return [report, "ok"]
+        return ["ok"]
+
+
+@pytest.fixture
+def card(monkeypatch: pytest.MonkeyPatch) -> Iterator[tuple[_Card, list[bool]]]:
+    device = _Card()
+    resets: list[bool] = []
+
+    def fake_serial(
+        port: str, baud_rate: int = 250000, *, timeout: float = 2.0, reset_on_open: bool = True
+    ) -> FakeTransport:
+        resets.append(reset_on_open)
+        return FakeTransport(responder=device)
+
+    monkeypatch.setattr("fiberpath_api.machine.SerialTransport", fake_serial)
+    yield device, resets
+
+
+def _orphan_sd_print(state_path: Path) -> None:
+    _start_journal(
+        state_path.with_suffix(".journal"),
+        total=4,
+        sent=1,
+        mode="sd",
+        phase="print",
+        sd={"name": "WIND", "chunk_lines": 2, "retries": 2, "poll_interval_s": 0.0},
+        sd_layout=SD_LAYOUT,
+    )
+
+
+def test_orphaned_sd_print_is_followed_after_a_connect_without_reset(
+    tmp_path: Path, card: tuple[_Card, list[bool]]
+) -> None:
+    device, resets = card
+    state_path = tmp_path / "job.json"
+    _orphan_sd_print(state_path)
+    svc = MachineService(state_path=state_path)
+    error = str(svc.get_job("job-3")["error"])
+    assert "still be printing it from its SD card" in error
+    assert "without a reset" in error
+    assert "end of the file it is printing" in error  # chunked: the next file waits
+
+    try:
+        svc.connect("COM3", 250000, 2.0, reset=False)
+        for _ in range(200):
+            status = svc.get_job("job-3")
+            if status["state"] not in ("streaming", "paused"):
+                break
+            threading.Event().wait(0.01)
+    finally:
+        svc.disconnect()
+
+    assert resets == [False]
+    assert (status["state"], status["sent"], status["phase"]) == ("completed", 4, "print")
+    selected = [line for line in device.lines if "M23" in line]
+    assert len(selected) == 1 and "WIND002.GCO" in selected[0]  # WIND001 is not restarted
+
+
+def test_orphaned_sd_print_is_left_alone_by_a_resetting_connect(
+    tmp_path: Path, card: tuple[_Card, list[bool]]
+) -> None:
+    device, resets = card
+    state_path = tmp_path / "job.json"
+    _orphan_sd_print(state_path)
+    svc = MachineService(state_path=state_path)
+    try:
+        svc.connect("COM3", 250000, 2.0)
+        assert svc.get_job("job-3")["state"] == "orphaned"
+    finally:
+        svc.disconnect()
+    assert resets == [True]
+    assert not any("M27" in line for line in device.lines)
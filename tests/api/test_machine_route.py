@@ -9,16 +9,22 @@ deterministically.
 
 from __future__ import annotations
 
+import os
 import queue
 import threading
 import time
 from collections.abc import Iterator
+from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
-from fiberpath_api.machine import machine
+from fiberpath.config import WindDefinition, default_machine_profile
+from fiberpath.emulator import get_emulator
+from fiberpath.planning import plan_wind
+from fiberpath.streaming import GcodeSource
+from fiberpath_api.machine import Job, machine
 from fiberpath_api.main import create_app
-from marlin_host import FakeTransport, PortInfo
+from marlin_host import FakeTransport, MarlinHost, PortInfo, StreamProgress
 
 PORT = "/dev/ttyFAKE"
 
@@ -72,6 +78,10 @@ def client(responder: Responder, monkeypatch: pytest.MonkeyPatch) -> Iterator[Te
     machine._thread = None
     machine._job_counter = 0
     machine._state = "disconnected"
+    machine._timings.clear()
+    machine._queue.clear()
+    machine._history.clear()
+    machine._persist_queue()
 
 
 def _connect(client: TestClient) -> dict[str, object]:
@@ -158,6 +168,77 @@ def test_job_streams_to_completion(client: TestClient) -> None:
     assert tail["cursor"] == final["cursor"]
 
 
+def test_terminal_event_and_metrics_route_report_telemetry(client: TestClient) -> None:
+    _connect(client)
+    idle = client.get("/machine/metrics")
+    assert idle.status_code == 200, idle.text
+    assert idle.json() == {"job_id": None, "job_state": None, "metrics": None}
+
+    job_id = client.post("/machine/jobs", json={"gcode": "G1 X1\nG1 X2\nG1 X3\n"}).json()["job_id"]
+    _wait_terminal(client, job_id)
+
+    events = client.get(f"/machine/jobs/{job_id}").json()["events"]
+    complete = events[-1]
+    assert complete["type"] == "complete"
+    assert all(event["metrics"] is None for event in events[:-1])
+    metrics = complete["metrics"]
+    assert metrics["lines_acked"] == 3
+    assert metrics["latency"]["count"] == 3
+    assert sum(metrics["latency"]["buckets"]) == 3
+
+    response = client.get("/machine/metrics")
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert (body["job_id"], body["job_state"]) == (job_id, "completed")
+    assert body["metrics"]["lines_sent"] == 3
+
+    # A manual command after the job is not timed into its telemetry.
+    assert client.post("/machine/commands", json={"gcode": "M114"}).status_code == 200
+    assert client.get("/machine/metrics").json() == body
+
+
+def test_calibration_fits_the_recorded_job(client: TestClient) -> None:
+    _connect(client)
+    before = client.post("/machine/calibration", json={})
+    assert before.status_code == 400, before.text
+
+    header = (
+        '; Parameters {"mandrel":{"diameter":50,"windLength":500},'
+        '"tow":{"width":8,"thickness":0.4}}'
+    )
+    moves = "".join(f"G0 X{step % 20} A{step * 10}\n" for step in range(300))
+    job_id = client.post("/machine/jobs", json={"gcode": f"{header}\nG0 F6000\n{moves}"}).json()[
+        "job_id"
+    ]
+    assert _wait_terminal(client, job_id)["state"] == "completed"
+
+    response = client.post("/machine/calibration", json={})
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["jobs"] == 1
+    assert body["profile"]["id"] == "marlin-xab"
+    calibration = body["profile"]["timeCalibration"]
+    assert calibration["sampleLines"] > 0
+    assert calibration["moveOverheadS"] >= 0.0
+
+
+def test_jobs_too_long_to_time_are_not_recorded(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("fiberpath_api.machine._TIMING_MAX_LINES", 100)
+    _connect(client)
+    header = (
+        '; Parameters {"mandrel":{"diameter":50,"windLength":500},'
+        '"tow":{"width":8,"thickness":0.4}}'
+    )
+    moves = "".join(f"G0 X{step % 20} A{step * 10}\n" for step in range(300))
+    job_id = client.post("/machine/jobs", json={"gcode": f"{header}\n{moves}"}).json()["job_id"]
+    assert _wait_terminal(client, job_id)["state"] == "completed"
+
+    assert machine._job is not None and machine._job.timed is None
+    assert client.post("/machine/calibration", json={}).status_code == 400
+
+
 def test_unknown_job_is_404(client: TestClient) -> None:
     _connect(client)
     response = client.get("/machine/jobs/job-999")
@@ -178,6 +259,18 @@ def test_command_rejected_while_streaming(client: TestClient, responder: Respond
     assert _wait_terminal(client, job_id)["state"] == "completed"
 
 
+def test_commands_are_refused_while_an_upload_is_paused(client: TestClient) -> None:
+    _connect(client)
+    # A paused upload: M28 is open, so a command would land in the card's file.
+    machine._job = Job(id="job-9", total=2, state="paused", mode="sd", phase="upload")
+    refused = client.post("/machine/commands", json={"gcode": "M114"})
+    assert refused.status_code == 409, refused.text
+    assert "SD card" in refused.json()["detail"]
+
+    machine._job.phase = "print"  # a paused print takes commands
+    assert client.post("/machine/commands", json={"gcode": "M114"}).status_code == 200
+
+
 def test_pause_and_resume(client: TestClient, responder: Responder) -> None:
     _connect(client)
     responder.gate.clear()
@@ -223,3 +316,361 @@ def test_disconnect_returns_204(client: TestClient) -> None:
     _connect(client)
     response = client.delete("/machine/connection")
     assert response.status_code == 204
+
+
+def test_job_streams_to_the_bundled_emulator() -> None:
+    """``marlinemu://`` ports reach the real serial stack, no patching needed."""
+    program = "G21\nG0 F6000\n" + "".join(f"G0 X{step}\n" for step in range(1, 21))
+    with TestClient(create_app()) as client:
+        try:
+            connected = client.post(
+                "/machine/connection",
+                json={"port": "marlinemu://api?time_scale=0", "baud_rate": 250000, "timeout": 2.0},
+            )
+            assert connected.status_code == 200, connected.text
+            assert "FiberPath emulator" in connected.json()["firmware"]
+
+            job_id = client.post("/machine/jobs", json={"gcode": program}).json()["job_id"]
+            final = _wait_terminal(client, job_id)
+        finally:
+            machine.disconnect()
+            machine._job = None
+            machine._thread = None
+            machine._job_counter = 0
+
+    assert final["state"] == "completed"
+    assert final["sent"] == 22
+
+
+def test_sd_job_uploads_then_prints_on_the_emulator() -> None:
+    program = "G21\nG0 F6000\n" + "".join(f"G0 X{step}\n" for step in range(1, 21))
+    with TestClient(create_app()) as client:
+        try:
+            connected = client.post(
+                "/machine/connection",
+                json={
+                    "port": "marlinemu://api-sd?time_scale=0",
+                    "baud_rate": 250000,
+                    "timeout": 2.0,
+                },
+            )
+            assert connected.status_code == 200, connected.text
+
+            start = client.post(
+                "/machine/jobs",
+                json={"gcode": program, "sd": {"chunk_lines": 10, "poll_interval_s": 0.0}},
+            )
+            assert start.status_code == 200, start.text
+            job_id = start.json()["job_id"]
+            final = _wait_terminal(client, job_id)
+            events = client.get(f"/machine/jobs/{job_id}").json()["events"]
+        finally:
+            machine.disconnect()
+            machine._job = None
+            machine._thread = None
+            machine._job_counter = 0
+
+    assert (final["state"], final["mode"], final["phase"]) == ("completed", "sd", "print")
+    assert final["sent"] == 22
+    phases = [event["phase"] for event in events if event["type"] == "progress"]
+    assert phases.index("print") == 22  # every line is uploaded before any is printed
+    emulator = get_emulator("api-sd")
+    assert emulator is not None
+    assert sorted(emulator.sd_files) == ["FIBER001.GCO", "FIBER002.GCO", "FIBER003.GCO"]
+
+
+HOOP_DEFINITION = {
+    "mandrelParameters": {"diameter": 40.0, "windLength": 120.0},
+    "towParameters": {"width": 6.0, "thickness": 0.5},
+    "defaultFeedRate": 6000.0,
+    "layers": [{"windType": "hoop", "terminal": False}],
+}
+
+
+def test_definition_job_is_planned_while_it_streams() -> None:
+    expected = [
+        line
+        for line in plan_wind(WindDefinition.model_validate(HOOP_DEFINITION)).commands
+        if not line.startswith(";")
+    ]
+    with TestClient(create_app()) as client:
+        try:
+            connected = client.post(
+                "/machine/connection",
+                json={"port": "marlinemu://api-plan?time_scale=0", "timeout": 2.0},
+            )
+            assert connected.status_code == 200, connected.text
+
+            start = client.post("/machine/jobs", json={"definition": HOOP_DEFINITION})
+            assert start.status_code == 200, start.text
+            final = _wait_terminal(client, start.json()["job_id"])
+        finally:
+            machine.disconnect()
+            machine._job = None
+            machine._thread = None
+            machine._job_counter = 0
+
+    assert (final["state"], final["planning"]) == ("completed", False)
+    assert final["sent"] == final["total"] == len(expected)
+
+
+def _lock_is_free() -> bool:
+    """Whether another thread (the streaming worker, say) could take the machine lock now."""
+    free: list[bool] = []
+
+    def attempt() -> None:
+        acquired = machine._lock.acquire(timeout=1.0)
+        free.append(acquired)
+        if acquired:
+            machine._lock.release()
+
+    worker = threading.Thread(target=attempt)
+    worker.start()
+    worker.join()
+    return free == [True]
+
+
+def test_definitions_are_planned_outside_the_lock(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _connect(client)
+    free: list[bool] = []
+    plan, prepare_planned = machine._plan, machine._prepare_planned
+
+    def spy_plan(definition: WindDefinition, profile: object) -> object:
+        free.append(_lock_is_free())
+        return plan(definition, profile)  # type: ignore[arg-type]
+
+    def spy_prepare_planned(definition: WindDefinition, profile: object) -> object:
+        free.append(_lock_is_free())
+        return prepare_planned(definition, profile)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(machine, "_plan", spy_plan)
+    monkeypatch.setattr(machine, "_prepare_planned", spy_prepare_planned)
+
+    queued = client.post("/machine/queue", json={"definition": HOOP_DEFINITION, "hold": True})
+    assert queued.status_code == 200, queued.text
+    started = client.post("/machine/jobs", json={"definition": HOOP_DEFINITION})
+    assert started.status_code == 200, started.text
+    assert _wait_terminal(client, started.json()["job_id"])["state"] == "completed"
+    assert free == [True, True]
+
+
+def test_job_needs_exactly_one_program(client: TestClient) -> None:
+    client.post("/machine/connection", json={"port": PORT})
+    assert client.post("/machine/jobs", json={}).status_code == 422
+    both = {"gcode": "G0 X1", "definition": HOOP_DEFINITION}
+    assert client.post("/machine/jobs", json=both).status_code == 422
+    both = {"path": "/tmp/program.gcode", "artifact_id": "abc"}
+    assert client.post("/machine/jobs", json=both).status_code == 422
+
+
+def test_job_reads_a_file_on_the_sidecar_host(client: TestClient, tmp_path: Path) -> None:
+    _connect(client)
+    program = tmp_path / "program.gcode"
+    program.write_text("; comment\nG21\nG1 X1\r\nG1 X2\n", encoding="utf-8")
+
+    start = client.post("/machine/jobs", json={"path": str(program)})
+    assert start.status_code == 200, start.text
+    assert start.json()["total"] == 3
+    final = _wait_terminal(client, start.json()["job_id"])
+    assert (final["state"], final["sent"]) == ("completed", 3)
+
+    missing = client.post("/machine/jobs", json={"path": str(tmp_path / "missing.gcode")})
+    assert missing.status_code == 400
+    assert "cannot read" in missing.json()["detail"]
+    relative = client.post("/machine/jobs", json={"path": "program.gcode"})
+    assert relative.status_code == 422
+
+
+def test_job_reads_only_regular_gcode_files(client: TestClient, tmp_path: Path) -> None:
+    _connect(client)
+    secret = tmp_path / "notes.txt"
+    secret.write_text("G1 X1\n", encoding="utf-8")
+    directory = tmp_path / "programs.gcode"
+    directory.mkdir()
+    rejected = [secret, directory]
+    if hasattr(os, "mkfifo"):  # a FIFO would block the read forever
+        fifo = tmp_path / "pipe.gcode"
+        os.mkfifo(fifo)
+        rejected += [fifo, Path("/dev/zero")]
+
+    for path in rejected:
+        response = client.post("/machine/jobs", json={"path": str(path)})
+        assert response.status_code == 400, path
+        assert "cannot read" in response.json()["detail"]
+        queued = client.post("/machine/queue", json={"path": str(path)})
+        assert queued.status_code == 400, path
+    assert client.get("/machine/queue").json()["jobs"] == []
+
+
+def test_job_runs_a_planned_artifact(client: TestClient) -> None:
+    _connect(client)
+    planned = client.post("/plan", json=HOOP_DEFINITION).json()
+    commands = [line for line in planned["gcode"].splitlines() if not line.startswith(";")]
+
+    start = client.post("/machine/queue", json={"artifact_id": planned["artifactId"]})
+    assert start.status_code == 200, start.text
+    assert start.json()["total"] == len(commands)
+    final = _wait_terminal(client, start.json()["job_id"])
+    assert (final["state"], final["sent"]) == ("completed", len(commands))
+
+    unknown = client.post("/machine/jobs", json={"artifact_id": "0" * 64})
+    assert unknown.status_code == 404
+    assert "plan it again" in unknown.json()["detail"]
+
+
+def test_invalid_definition_is_rejected(client: TestClient) -> None:
+    client.post("/machine/connection", json={"port": PORT})
+    broken = {
+        **HOOP_DEFINITION,
+        "layers": [{"windType": "hoop", "terminal": True}, {"windType": "hoop"}],
+    }
+    response = client.post("/machine/jobs", json={"definition": broken})
+    assert response.status_code == 400
+    assert "invalid definition" in response.json()["detail"]
+
+
+def test_sd_job_rejects_an_invalid_file_name(client: TestClient) -> None:
+    _connect(client)
+    response = client.post("/machine/jobs", json={"gcode": "G1 X1\n", "sd": {"name": "bad name"}})
+    assert response.status_code == 422, response.text
+
+
+def test_queue_runs_jobs_back_to_back_by_priority(client: TestClient, responder: Responder) -> None:
+    _connect(client)
+    responder.gate.clear()
+    first = client.post("/machine/queue", json={"gcode": "G1 X1\n"}).json()
+    assert (first["state"], first["position"]) == ("streaming", 0)  # idle machine: starts at once
+    responder.reached.get(timeout=2.0)
+    low = client.post("/machine/queue", json={"gcode": "G1 X2\nG1 X3\n"}).json()
+    high = client.post("/machine/queue", json={"gcode": "G1 X4\n", "priority": 5}).json()
+
+    queue = client.get("/machine/queue").json()
+    assert queue["active"] == first["job_id"]
+    assert [job["job_id"] for job in queue["jobs"]] == [high["job_id"], low["job_id"]]
+    assert [job["position"] for job in queue["jobs"]] == [1, 2]
+
+    responder.gate.set()
+    assert _wait_terminal(client, low["job_id"])["state"] == "completed"
+    for job_id in (first["job_id"], high["job_id"]):
+        assert client.get(f"/machine/jobs/{job_id}").json()["state"] == "completed"
+    assert client.get("/machine/queue").json() == {"active": None, "jobs": []}
+
+
+def test_held_job_waits_until_started(client: TestClient) -> None:
+    _connect(client)
+    held = client.post("/machine/queue", json={"gcode": "G1 X1\n", "hold": True}).json()
+    assert (held["state"], held["position"], held["hold"]) == ("queued", 1, True)
+    assert client.get(f"/machine/jobs/{held['job_id']}").json()["state"] == "queued"
+
+    started = client.post(f"/machine/queue/{held['job_id']}/start")
+    assert started.status_code == 200, started.text
+    assert _wait_terminal(client, held["job_id"])["state"] == "completed"
+
+
+def test_queue_stops_after_a_cancelled_job(client: TestClient, responder: Responder) -> None:
+    _connect(client)
+    responder.gate.clear()
+    running = client.post("/machine/queue", json={"gcode": "G1 X1\nG1 X2\n"}).json()
+    responder.reached.get(timeout=2.0)
+    waiting = client.post("/machine/queue", json={"gcode": "G1 X3\n"}).json()
+
+    client.post(f"/machine/jobs/{running['job_id']}/cancel")
+    responder.gate.set()
+    assert _wait_terminal(client, running["job_id"])["state"] == "cancelled"
+
+    queue = client.get("/machine/queue").json()
+    assert queue["active"] is None
+    assert [(job["job_id"], job["hold"]) for job in queue["jobs"]] == [(waiting["job_id"], True)]
+    cancelled = client.post(f"/machine/jobs/{waiting['job_id']}/cancel")
+    assert cancelled.json()["state"] == "cancelled"
+    assert client.get("/machine/queue").json()["jobs"] == []
+
+
+def test_only_the_running_job_can_be_paused_or_cancelled(
+    client: TestClient, responder: Responder
+) -> None:
+    _connect(client)
+    finished = client.post("/machine/jobs", json={"gcode": "G1 X1\n"}).json()
+    assert _wait_terminal(client, finished["job_id"])["state"] == "completed"
+    responder.gate.clear()
+    running = client.post("/machine/queue", json={"gcode": "G1 X1\nG1 X2\nG1 X3\n"}).json()
+    responder.reached.get(timeout=2.0)
+    held = client.post("/machine/queue", json={"gcode": "G1 X4\n", "hold": True}).json()
+
+    for job_id in (finished["job_id"], held["job_id"]):
+        for action in ("pause", "resume"):
+            response = client.post(f"/machine/jobs/{job_id}/{action}")
+            assert response.status_code == 409, response.text
+    cancelled = client.post(f"/machine/jobs/{finished['job_id']}/cancel")
+    assert cancelled.status_code == 409, cancelled.text
+    assert machine.state == "streaming"
+
+    responder.gate.set()
+    final = _wait_terminal(client, running["job_id"])
+    assert (final["state"], final["sent"]) == ("completed", 3)
+    assert client.get(f"/machine/jobs/{held['job_id']}").json()["state"] == "queued"
+
+
+def test_job_queued_while_disconnected_starts_on_connect(
+    client: TestClient, responder: Responder
+) -> None:
+    queued = client.post("/machine/queue", json={"gcode": "G1 X1\n"}).json()
+    held = client.post("/machine/queue", json={"gcode": "G1 X2\n", "hold": True}).json()
+    assert queued["state"] == "queued"
+
+    _connect(client)
+
+    assert client.get(f"/machine/jobs/{queued['job_id']}").json()["state"] != "queued"
+    assert _wait_terminal(client, queued["job_id"])["state"] == "completed"
+    # A held job still waits to be started explicitly.
+    queue = client.get("/machine/queue").json()
+    assert queue["active"] is None
+    assert [job["job_id"] for job in queue["jobs"]] == [held["job_id"]]
+
+
+def test_queued_programs_are_validated_up_front(client: TestClient) -> None:
+    profile = default_machine_profile().model_dump(mode="json", by_alias=True)
+    rejected = client.post("/machine/queue", json={"gcode": "G28\nG0 X1\n", "profile": profile})
+    assert rejected.status_code == 400, rejected.text
+    assert "G28" in rejected.json()["detail"]
+
+    header = '; Parameters {"mandrel":{"diameter":50}}'
+    broken = client.post("/machine/queue", json={"gcode": f"{header}\nG0 X1\n"})
+    assert broken.status_code == 400, broken.text
+    assert client.get("/machine/queue").json()["jobs"] == []
+
+
+def test_job_reads_a_line_source_once(client: TestClient, tmp_path: Path) -> None:
+    _connect(client)
+    program = tmp_path / "program.gcode"
+    program.write_text("; comment\nG21\n\n  G1 X1  \r\nG1 X2\n", encoding="utf-8")
+
+    with GcodeSource(program) as source:
+        job = machine.start_job(source.lines())
+
+    assert job["total"] == 3
+    final = _wait_terminal(client, str(job["job_id"]))
+    assert (final["state"], final["sent"]) == ("completed", 3)
+
+
+def test_started_programs_stream_in_slices(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _connect(client)
+    slices: list[int] = []
+    stream = MarlinHost.stream
+
+    def recording(host: MarlinHost, program: list[str]) -> Iterator[StreamProgress]:
+        slices.append(len(program))
+        return stream(host, program)
+
+    monkeypatch.setattr(MarlinHost, "stream", recording)
+    program = "".join(f"G1 X{step % 20}\n" for step in range(600))
+    job_id = client.post("/machine/jobs", json={"gcode": program}).json()["job_id"]
+
+    final = _wait_terminal(client, job_id)
+    assert (final["state"], final["sent"], final["total"]) == ("completed", 600, 600)
+    assert slices == [256, 256, 88]
+    assert machine._job is not None and machine._job.source is None
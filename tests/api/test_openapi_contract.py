@@ -6,7 +6,7 @@ import pytest
 from fiberpath_api.main import create_app
 
 
-@pytest.mark.parametrize("path", ["/plan", "/simulate", "/validate", "/plot"])
+@pytest.mark.parametrize("path", ["/plan", "/plan/patterns", "/simulate", "/validate", "/plot"])
 def test_compute_route_declares_400(path: str) -> None:
     """Each compute route documents the engine-validation 400 the GUI relies on."""
     spec = create_app().openapi()
@@ -1,10 +1,19 @@
 from __future__ import annotations
 
 import json
+import threading
+import time
 from pathlib import Path
 
+import httpx
+import pytest
 from fastapi.testclient import TestClient
+from fiberpath.config import WindDefinition
+from fiberpath.planning import PlanOptions
+from fiberpath.planning.planner import LayerBlock
+from fiberpath_api.artifacts import plan_artifacts
 from fiberpath_api.main import create_app
+from fiberpath_api.sessions import PlanSessions
 
 ROOT = Path(__file__).resolve().parents[2]
 EXAMPLES = ROOT / "examples"
@@ -53,6 +62,28 @@ def test_plan_returns_gcode_and_metrics() -> None:
     assert payload["layers"][0]["windType"]
 
 
+def test_plan_metrics_matches_plan_without_gcode() -> None:
+    client = TestClient(create_app())
+    full = client.post("/plan", json=_example_body()).json()
+    response = client.post("/plan/metrics", json=_example_body())
+
+    assert response.status_code == 200, response.text
+    payload = response.json()
+    assert "gcode" not in payload
+    assert payload["timeSeconds"] == pytest.approx(full["timeSeconds"], rel=1e-9)
+    assert payload["towMeters"] == pytest.approx(full["towMeters"], rel=1e-9)
+    assert [layer["commandCount"] for layer in payload["layers"]] == [
+        layer["commandCount"] for layer in full["layers"]
+    ]
+
+
+def test_plan_metrics_rejects_semantic_error() -> None:
+    client = TestClient(create_app())
+    response = client.post("/plan/metrics", json=_bad_helical_body())
+
+    assert response.status_code == 400, response.text
+
+
 def test_plan_rejects_semantic_error() -> None:
     """A body that parses but fails layer validation returns 400, not 500."""
     client = TestClient(create_app())
@@ -84,3 +115,189 @@ def test_validate_rejects_semantic_error() -> None:
 
     assert response.status_code == 400, response.text
     assert "wind angle" in response.json()["detail"].lower()
+
+
+def test_plan_is_superseded_by_newer_request_in_same_session(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A newer /plan with the same session key cancels the in-flight one (409)."""
+    from fiberpath.planning.planner import lower_layer as real_lower_layer
+
+    entered = threading.Event()
+    calls = 0
+
+    def fake_lower_layer(
+        index: int,
+        layer: object,
+        definition: WindDefinition,
+        options: PlanOptions,
+        dialect: object,
+    ) -> LayerBlock:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            # The stale plan: park until the newer request cancels its token.
+            entered.set()
+            assert options.cancel_token is not None
+            for _ in range(500):
+                options.cancel_token.raise_if_cancelled()
+                time.sleep(0.01)
+            raise AssertionError("first plan was never cancelled")
+        return real_lower_layer(index, layer, definition, options, dialect)  # type: ignore[arg-type]
+
+    monkeypatch.setattr("fiberpath.planning.incremental.lower_layer", fake_lower_layer)
+    client = TestClient(create_app())
+    headers = {"X-FiberPath-Session": "editor"}
+    stale: dict[str, object] = {}
+
+    def first() -> None:
+        stale["response"] = client.post("/plan", json=_example_body(), headers=headers)
+
+    worker = threading.Thread(target=first)
+    worker.start()
+    assert entered.wait(timeout=5.0)
+    current = client.post("/plan", json=_example_body(), headers=headers)
+    worker.join(timeout=5.0)
+
+    assert current.status_code == 200, current.text
+    response = stale["response"]
+    assert isinstance(response, httpx.Response)
+    assert response.status_code == 409, response.text
+    assert "superseded" in response.json()["detail"]
+
+
+def test_plan_sessions_only_cancel_within_the_same_key() -> None:
+    sessions = PlanSessions()
+    first = sessions.begin("a")
+    other = sessions.begin("b")
+    anonymous = sessions.begin(None)
+    second = sessions.begin("a")
+
+    assert first.cancelled
+    assert not other.cancelled
+    assert not anonymous.cancelled
+    assert not second.cancelled
+    sessions.end("a", first)  # a stale token never evicts the newer one
+    assert sessions.active("a") is second
+    sessions.end("a", second)
+    assert sessions.active("a") is None
+
+
+def test_session_plans_reuse_unchanged_layers() -> None:
+    from fiberpath_api.sessions import plan_sessions
+
+    client = TestClient(create_app())
+    headers = {"X-FiberPath-Session": "incremental-test"}
+    body = json.loads((EXAMPLES / "multi_layer" / "input.wind").read_text(encoding="utf-8"))
+    first = client.post("/plan", json=body, headers=headers)
+    assert first.status_code == 200, first.text
+
+    body["layers"][-1]["leadOutDegrees"] = 30.0  # edit only the last layer
+    second = client.post("/plan", json=body, headers=headers)
+    assert second.status_code == 200, second.text
+
+    planner = plan_sessions.planner("plan:incremental-test")
+    assert planner.last_stats.lowered == 1
+    assert planner.last_stats.reused == len(body["layers"]) - 1
+    expected = client.post("/plan", json=body).json()
+    assert second.json() == expected
+
+
+def _apply_delta(base: list[str], delta: dict) -> list[str]:
+    lines = list(base)
+    for edit in reversed(delta["edits"]):
+        lines[edit["start"] : edit["start"] + edit["deleteCount"]] = edit["lines"]
+    return lines
+
+
+def test_plan_returns_delta_against_a_known_base_artifact() -> None:
+    client = TestClient(create_app())
+    body = json.loads((EXAMPLES / "multi_layer" / "input.wind").read_text(encoding="utf-8"))
+    first = client.post("/plan", json=body).json()
+    assert first["delta"] is None
+    assert first["artifactId"]
+
+    body["layers"].insert(1, {"windType": "skip", "mandrelRotation": 45.0})
+    second = client.post("/plan", json=body, params={"baseArtifactId": first["artifactId"]}).json()
+    full = client.post("/plan", json=body).json()
+
+    assert second["gcode"] == ""
+    assert second["delta"]["baseArtifactId"] == first["artifactId"]
+    # The renumbered summaries and the new skip layer are resent; the large
+    # helical block (now layer 3) is not.
+    edits = second["delta"]["edits"]
+    assert {edit["layerIndex"] for edit in edits} == {1, 2}
+    assert sum(len(edit["lines"]) for edit in edits) < 10
+    rebuilt = _apply_delta(first["gcode"].split("\n"), second["delta"])
+    assert rebuilt == full["gcode"].split("\n")
+    assert len(rebuilt) == second["commandCount"]
+    assert second["artifactId"] == full["artifactId"]
+
+
+def test_cached_plans_keep_their_artifacts() -> None:
+    # The result cache outlives the artifact store; a cached response's
+    # artifactId must still resolve, or deltas and start-by-artifact break.
+    client = TestClient(create_app())
+    bodies = []
+    for feed in range(6):
+        body = _example_body()
+        body["defaultFeedRate"] = 3000 + feed
+        bodies.append(body)
+    first = client.post("/plan", json=bodies[0])
+    for body in bodies[1:]:
+        client.post("/plan", json=body)
+    assert plan_artifacts.get(first.json()["artifactId"]) is None  # evicted from the store
+
+    again = client.post("/plan", json=bodies[0], params={"baseArtifactId": "nope"}).json()
+    assert again["artifactId"] == first.json()["artifactId"]
+    assert plan_artifacts.get(again["artifactId"]) is not None
+
+    for body in bodies[1:]:
+        client.post("/plan", json=body)
+    etag = first.headers["ETag"]
+    assert client.post("/plan", json=bodies[0], headers={"If-None-Match": etag}).status_code == 304
+    assert plan_artifacts.get(again["artifactId"]) is not None
+
+
+def test_plan_with_unknown_base_returns_full_program() -> None:
+    client = TestClient(create_app())
+    response = client.post("/plan", json=_example_body(), params={"baseArtifactId": "nope"})
+
+    assert response.status_code == 200, response.text
+    payload = response.json()
+    assert payload["delta"] is None
+    assert payload["gcode"].startswith("; Parameters")
+
+
+def test_plan_patterns_lists_valid_patterns_fastest_first() -> None:
+    client = TestClient(create_app())
+    body = _bad_helical_body()
+    request = {
+        "mandrel": body["mandrelParameters"],
+        "tow": body["towParameters"],
+        "layer": {**body["layers"][0], "windAngle": 45.0},
+        "default_feed_rate": body["defaultFeedRate"],
+        "limit": 5,
+    }
+    response = client.post("/plan/patterns", json=request)
+
+    assert response.status_code == 200, response.text
+    payload = response.json()
+    assert payload["schemaVersion"] == "1.0"
+    assert payload["total"] > len(payload["solutions"]) == 5
+    times = [solution["timeSeconds"] for solution in payload["solutions"]]
+    assert times == sorted(times)
+    best = payload["solutions"][0]
+    layer = {
+        **request["layer"],
+        "patternNumber": best["patternNumber"],
+        "skipIndex": best["skipIndex"],
+        "lockDegrees": best["lockDegrees"],
+    }
+    metrics = client.post("/plan/metrics", json={**body, "layers": [layer]}).json()
+    assert metrics["timeSeconds"] == pytest.approx(best["timeSeconds"])
+
+    request["layer"]["windAngle"] = 95.0
+    response = client.post("/plan/patterns", json=request)
+    assert response.status_code == 400
+    assert "wind angle" in response.json()["detail"]
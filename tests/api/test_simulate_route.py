@@ -6,6 +6,7 @@ import json
 from pathlib import Path
 
 from fastapi.testclient import TestClient
+from fiberpath.config import MachineKinematics, default_machine_profile
 from fiberpath_api.main import create_app
 
 ROOT = Path(__file__).resolve().parents[2]
@@ -35,6 +36,27 @@ def test_simulate_from_gcode_body() -> None:
     assert payload["estimatedTimeSeconds"] > 0
 
 
+def test_simulate_with_profile_kinematics() -> None:
+    client = TestClient(create_app())
+    profile = default_machine_profile().model_copy(
+        update={"kinematics": MachineKinematics(accelerationMmS2=1000.0)}
+    )
+
+    plain = client.post("/simulate", json={"gcode": _PROGRAM})
+    response = client.post(
+        "/simulate",
+        json={"gcode": _PROGRAM, "profile": profile.model_dump(mode="json", by_alias=True)},
+    )
+
+    assert response.status_code == 200, response.text
+    assert plain.json()["kinematics"] is None
+    assert response.headers["etag"] != plain.headers["etag"]
+    kinematics = response.json()["kinematics"]
+    assert kinematics["moves"] == 3
+    assert kinematics["timeSeconds"] > kinematics["nominalTimeSeconds"]
+    assert kinematics["layers"] == []
+
+
 def test_simulate_rejects_empty_program() -> None:
     """An empty/whitespace program is a client error (400), not a 500."""
     client = TestClient(create_app())
@@ -55,3 +77,27 @@ def test_plan_simulate_roundtrip() -> None:
     sim = client.post("/simulate", json={"gcode": gcode})
     assert sim.status_code == 200, sim.text
     assert sim.json()["commandsExecuted"] > 0
+
+
+def test_stream_analysis_flags_a_starved_link() -> None:
+    client = TestClient(create_app())
+    short_moves = [f"G0 X{step / 10:g}" for step in range(1, 41)]
+    gcode = "\n".join([_PROGRAM.splitlines()[0], "G0 F6000", *short_moves])
+
+    response = client.post(
+        "/simulate/stream", json={"gcode": gcode, "baud_rate": 9600, "ack_latency_s": 0.0}
+    )
+
+    assert response.status_code == 200, response.text
+    payload = response.json()
+    assert payload["schemaVersion"] == "1.0"
+    assert payload["stallTimeSeconds"] > 0
+    assert payload["stallWindows"][0]["stalls"] > 0
+    assert payload["minSustainableSegmentMm"] > payload["medianSegmentMm"]
+
+    again = client.post(
+        "/simulate/stream",
+        json={"gcode": gcode, "baud_rate": 9600, "ack_latency_s": 0.0},
+        headers={"If-None-Match": response.headers["etag"]},
+    )
+    assert again.status_code == 304
@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
+from fiberpath.gcode import read_program
 from fiberpath_cli.main import app
 from typer.testing import CliRunner
 
@@ -78,3 +79,33 @@ def test_stream_command_json(tmp_path: Path) -> None:
     payload = json.loads(result.stdout)
     assert payload["dryRun"] is True
     assert payload["commands"] > 0
+
+
+def test_plan_command_wire_compact_reports_savings(tmp_path: Path) -> None:
+    runner = CliRunner()
+    output_file = tmp_path / "out.gcode"
+
+    result = runner.invoke(
+        app,
+        ["plan", str(SIMPLE_WIND), "--output", str(output_file), "--wire-compact", "--json"],
+    )
+
+    assert result.exit_code == 0, result.output
+    compaction = json.loads(result.stdout)["wireCompact"]
+    assert compaction["bytesSaved"] > 0
+    assert compaction["linkSecondsSaved"] > 0
+    assert read_program(output_file.read_text(encoding="utf-8").splitlines()).moves
+
+
+def test_analyze_stream_command_json(tmp_path: Path) -> None:
+    gcode_file = tmp_path / "program.gcode"
+    gcode_file.write_text("\n".join(SIM_PROGRAM) + "\n", encoding="utf-8")
+
+    runner = CliRunner()
+    result = runner.invoke(app, ["analyze-stream", str(gcode_file), "--json"])
+
+    assert result.exit_code == 0, result.output
+    payload = json.loads(result.stdout)
+    assert payload["stall_windows"] == []
+    assert payload["link"]["baud_rate"] == 250_000
+    assert payload["machine_time_s"] > 0
@@ -1,10 +1,22 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
+import pytest
+from fiberpath.config import load_wind_definition
+from fiberpath.emulator import get_emulator
+from fiberpath.planning import plan_wind
 from fiberpath_cli.main import app
 from typer.testing import CliRunner
 
+HOOP_WIND = {
+    "mandrelParameters": {"diameter": 40.0, "windLength": 120.0},
+    "towParameters": {"width": 6.0, "thickness": 0.5},
+    "defaultFeedRate": 6000.0,
+    "layers": [{"windType": "hoop", "terminal": False}],
+}
+
 
 def test_stream_command_dry_run(tmp_path: Path) -> None:
     gcode_file = tmp_path / "test.gcode"
@@ -15,3 +27,141 @@ def test_stream_command_dry_run(tmp_path: Path) -> None:
 
     assert result.exit_code == 0
     assert "Dry-run" in result.output
+
+
+def test_stream_command_wire_compact_drops_unchanged_axes(tmp_path: Path) -> None:
+    gcode_file = tmp_path / "test.gcode"
+    gcode_file.write_text(
+        '; Parameters {"mandrel":{"diameter":50,"windLength":500},'
+        '"tow":{"width":8,"thickness":0.4}}\n'
+        "G0 X1 A10.000001 B0\nG0 X2 A10 B0\n",
+        encoding="utf-8",
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(app, ["stream", str(gcode_file), "--dry-run", "--wire-compact"])
+
+    assert result.exit_code == 0, result.output
+    assert "(dry-run) G0 X2\n" in result.output
+    assert "Wire-compact saved" in result.output
+
+
+def test_stream_command_streams_to_the_emulator(tmp_path: Path) -> None:
+    gcode_file = tmp_path / "test.gcode"
+    gcode_file.write_text("; header\nG0 F6000\nG0 X1\nG0 X2\n", encoding="utf-8")
+
+    runner = CliRunner()
+    result = runner.invoke(
+        app, ["stream", str(gcode_file), "--port", "marlinemu://cli?time_scale=0", "--json"]
+    )
+
+    assert result.exit_code == 0, result.output
+    summary = json.loads(result.stdout)
+    assert (summary["status"], summary["commands"], summary["total"]) == ("live", 3, 3)
+    telemetry = summary["telemetry"]
+    assert telemetry["linesAcked"] == 3
+    assert telemetry["latencyMs"]["count"] == telemetry["linesAcked"]
+    assert sum(telemetry["latencyMs"]["buckets"]) == telemetry["latencyMs"]["count"]
+    assert telemetry["meanLinesPerSecond"] > 0
+
+
+def test_stream_command_prints_from_the_emulator_sd_card(tmp_path: Path) -> None:
+    gcode_file = tmp_path / "test.gcode"
+    gcode_file.write_text("; header\nG0 F6000\nG0 X1\nG0 X2\n", encoding="utf-8")
+
+    runner = CliRunner()
+    result = runner.invoke(
+        app,
+        [
+            "stream",
+            str(gcode_file),
+            "--port",
+            "marlinemu://cli-sd?time_scale=0",
+            "--sd",
+            "--sd-chunk-lines",
+            "2",
+            "--sd-poll",
+            "0",
+            "--json",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    summary = json.loads(result.stdout)
+    assert (summary["status"], summary["commands"], summary["total"]) == ("sd", 3, 3)
+    assert summary["sd"] == {"files": ["FIBER001.GCO", "FIBER002.GCO"], "bytes": 24}
+
+
+def test_stream_command_plans_a_wind_file_while_streaming(tmp_path: Path) -> None:
+    wind_file = tmp_path / "hoop.wind"
+    wind_file.write_text(json.dumps(HOOP_WIND), encoding="utf-8")
+    definition = load_wind_definition(wind_file)
+    expected = [line for line in plan_wind(definition).commands if not line.startswith(";")]
+
+    runner = CliRunner()
+    result = runner.invoke(
+        app, ["stream", str(wind_file), "--port", "marlinemu://cli-wind?time_scale=0", "--json"]
+    )
+
+    assert result.exit_code == 0, result.output
+    summary = json.loads(result.stdout)
+    assert (summary["status"], summary["commands"], summary["total"]) == (
+        "live",
+        len(expected),
+        len(expected),
+    )
+
+
+def test_stream_command_reads_stdin(tmp_path: Path) -> None:
+    runner = CliRunner()
+    result = runner.invoke(
+        app,
+        ["stream", "-", "--port", "marlinemu://cli-stdin?time_scale=0", "--json"],
+        input="; header\nG0 F6000\n\nG0 X1\nG0 X2\n",
+    )
+
+    assert result.exit_code == 0, result.output
+    summary = json.loads(result.stdout)
+    assert (summary["status"], summary["commands"], summary["total"]) == ("live", 3, 3)
+
+
+def test_plan_to_stdout_pipes_into_stream(tmp_path: Path) -> None:
+    wind_file = tmp_path / "hoop.wind"
+    wind_file.write_text(json.dumps(HOOP_WIND), encoding="utf-8")
+    runner = CliRunner()
+    planned = runner.invoke(app, ["plan", str(wind_file), "-o", "-", "--json"])
+    assert planned.exit_code == 0, planned.output
+    assert planned.stdout.startswith("; Parameters")
+    assert json.loads(planned.stderr)["output"] == "-"
+
+    result = runner.invoke(app, ["stream", "-", "--dry-run", "--json"], input=planned.stdout)
+
+    assert result.exit_code == 0, result.output
+    summary = json.loads(result.stdout)
+    expected = sum(1 for line in planned.stdout.splitlines() if not line.startswith(";"))
+    assert summary["total"] == summary["commands"] == expected
+    assert not (tmp_path / "-").exists()
+
+
+def test_ctrl_c_during_an_sd_upload_closes_the_file_first(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    gcode_file = tmp_path / "test.gcode"
+    gcode_file.write_text("G0 F6000\nG0 X1\nG0 X2\nG0 X3\n", encoding="utf-8")
+
+    def interrupt(sent: int, total: int, *, verbose: bool) -> bool:
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr("fiberpath_cli.stream._should_print", interrupt)
+    runner = CliRunner()
+    result = runner.invoke(
+        app,
+        ["stream", str(gcode_file), "--port", "marlinemu://cli-sd-abort?time_scale=0", "--sd"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Aborted at 1/4" in result.output
+    emulator = get_emulator("cli-sd-abort")
+    assert emulator is not None
+    # M29 closed the file before anything else was sent, and M30 removed it.
+    assert emulator.sd_files == {}
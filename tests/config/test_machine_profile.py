@@ -128,3 +128,35 @@ def load_profile_payload(payload: dict[str, object]) -> MachineProfile:
     from fiberpath.config.machine_profile import _validate
 
     return _validate(payload, "test payload")
+
+
+def test_time_calibration_is_optional_and_validated() -> None:
+    assert load_profile_payload(_base()).time_calibration is None
+    profile = load_profile_payload(
+        _base(
+            profileVersion="1.1",
+            timeCalibration={"moveOverheadS": 0.004, "mandrelSpeedLimitDegPerS": 90},
+        )
+    )
+    assert profile.time_calibration is not None
+    assert profile.time_calibration.move_overhead_s == 0.004
+    assert profile.time_calibration.turnaround_penalty_s == 0.0
+    with pytest.raises(MachineProfileError, match="failed validation"):
+        load_profile_payload(_base(timeCalibration={"moveOverheadS": -1.0}))
+
+
+def test_kinematics_are_optional_with_marlin_defaults() -> None:
+    assert load_profile_payload(_base()).kinematics is None
+    profile = load_profile_payload(
+        _base(
+            profileVersion="1.1",
+            kinematics={"mandrel": {"maxVelocity": 720, "maxAcceleration": 3600}},
+        )
+    )
+    assert profile.kinematics is not None
+    assert profile.kinematics.mandrel.max_velocity == 720
+    assert profile.kinematics.carriage.max_velocity is None
+    assert profile.kinematics.acceleration_mm_s2 == 3000.0
+    assert profile.kinematics.junction_deviation_mm == 0.013
+    with pytest.raises(MachineProfileError, match="failed validation"):
+        load_profile_payload(_base(kinematics={"carriage": {"maxAcceleration": 0}}))
@@ -0,0 +1,160 @@
+"""The virtual Marlin controller: timing model, fault injection and the real host stack."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+from fiberpath.emulator import (
+    EmulatorConfig,
+    MarlinEmulator,
+    PtyEmulator,
+    emulator_url,
+    get_emulator,
+    register_url_handler,
+)
+from marlin_host import HaltError, MarlinHost, SerialTransport, frame
+
+# 6000 mm/min: a 10 mm X move runs for 100 ms.
+PROGRAM = ["G21", "G90", "G0 F6000", *(f"G0 X{10 * step}" for step in range(1, 31))]
+
+
+def _drive(emulator: MarlinEmulator, lines: list[str]) -> list[float]:
+    """Send each line as soon as the previous ``ok`` is readable; return the ok times."""
+    acks: list[float] = []
+    now = 0.0
+    for line in lines:
+        emulator.receive(line, now)
+        while True:
+            due = emulator.next_ready_at()
+            assert due is not None, f"no reply to {line!r}"
+            now = due
+            replies = emulator.pop_ready(now)
+            if "ok" in replies:
+                acks.append(now)
+                break
+    return acks
+
+
+def test_full_planner_holds_the_ok_until_a_block_finishes() -> None:
+    emulator = MarlinEmulator(EmulatorConfig(line_latency_s=0.001, buffer_depth=4))
+
+    acks = _drive(emulator, PROGRAM)
+
+    moves = acks[3:]
+    # The first block starts at 4 ms; the next three queue behind it and each
+    # later ok waits for the oldest block to finish.
+    assert moves[3] == pytest.approx(0.007)
+    assert moves[4] == pytest.approx(0.004 + 0.1)
+    assert moves[-1] == pytest.approx(0.004 + 0.1 * (len(moves) - 4))
+    stats = emulator.stats
+    assert stats.motion_blocks == 30
+    assert stats.machine_s == pytest.approx(3.0)
+    assert stats.stalls == 0
+
+
+def test_slow_link_starves_short_moves() -> None:
+    # 1 mm moves run for 10 ms; each line takes 20 ms to process.
+    emulator = MarlinEmulator(EmulatorConfig(line_latency_s=0.02, buffer_depth=4))
+
+    _drive(emulator, ["G0 F6000", *(f"G0 X{step}" for step in range(1, 11))])
+
+    stats = emulator.stats
+    assert stats.stalls == 9
+    assert stats.stall_s == pytest.approx(9 * 0.01)
+
+
+def test_mandrel_diameter_times_the_a_word_over_the_surface() -> None:
+    emulator = MarlinEmulator(EmulatorConfig(mandrel_diameter_mm=100 / 3.141592653589793))
+
+    _drive(emulator, ["G0 F6000", "G0 A360"])
+
+    assert emulator.stats.machine_s == pytest.approx(1.0)
+
+
+def test_injected_checksum_failures_request_resends() -> None:
+    emulator = MarlinEmulator(EmulatorConfig(resend_every=3))
+    emulator.receive(frame(1, "G0 X1"), 0.0)
+    emulator.receive(frame(2, "G0 X2"), 1.0)
+    emulator.receive(frame(3, "G0 X3"), 2.0)
+
+    assert emulator.pop_ready(3.0) == [
+        "ok",
+        "ok",
+        "Error:checksum mismatch, Last Line: 2",
+        "Resend: 3",
+        "ok",
+    ]
+
+
+def test_out_of_sequence_line_numbers_are_rejected() -> None:
+    emulator = MarlinEmulator()
+    emulator.receive(frame(2, "G0 X1"), 0.0)
+
+    assert emulator.pop_ready(1.0)[:2] == [
+        "Error:Line Number is not Last Line Number+1, Last Line: 0",
+        "Resend: 1",
+    ]
+
+
+@pytest.fixture
+def url_handler() -> None:
+    register_url_handler()
+
+
+@pytest.mark.usefixtures("url_handler")
+def test_host_streams_through_resends_and_keepalives() -> None:
+    config = EmulatorConfig(time_scale=0.0, resend_every=4, busy_every=5)
+    host = MarlinHost(SerialTransport(emulator_url("resends", config), timeout=2.0), reliable=True)
+    try:
+        host.connect()
+        sent = [progress.command for progress in host.stream(PROGRAM)]
+    finally:
+        host.close()
+
+    assert sent == PROGRAM
+    emulator = get_emulator("resends")
+    assert emulator is not None
+    stats = emulator.stats
+    assert stats.commands == len(PROGRAM) + 1  # and the connect-time M115
+    assert stats.resends_requested > 0
+    assert stats.busy_sent > 0
+
+
+@pytest.mark.usefixtures("url_handler")
+def test_injected_halt_stops_the_host() -> None:
+    config = EmulatorConfig(time_scale=0.0, halt_after=10)
+    host = MarlinHost(SerialTransport(emulator_url("halt", config), timeout=2.0), reliable=True)
+    try:
+        host.connect()
+        with pytest.raises(HaltError):
+            for _ in host.stream(PROGRAM):
+                pass
+    finally:
+        host.close()
+
+    assert host.is_halted
+
+
+@pytest.mark.skipif(not hasattr(os, "openpty"), reason="pseudo-terminals are POSIX only")
+def test_pty_serves_a_port_any_host_can_open() -> None:
+    with PtyEmulator(EmulatorConfig(time_scale=0.0)) as pty:
+        host = MarlinHost(
+            SerialTransport(pty.path, timeout=2.0, reset_on_open=False), reliable=True
+        )
+        try:
+            host.connect()
+            sent = sum(1 for _ in host.stream(PROGRAM))
+        finally:
+            host.close()
+
+        assert sent == len(PROGRAM)
+        assert pty.emulator.stats.motion_blocks == 30
+
+
+def test_emulator_url_spells_out_only_changed_options() -> None:
+    assert emulator_url("bench") == "marlinemu://bench"
+    assert (
+        emulator_url("bench", EmulatorConfig(buffer_depth=8, busy_every=3))
+        == "marlinemu://bench?buffer_depth=8&busy_every=3"
+    )
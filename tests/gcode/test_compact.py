@@ -0,0 +1,105 @@
+"""Wire-compact serialization stays parseable and within the machine resolution."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from fiberpath.gcode import read_program
+from fiberpath.gcode.compact import (
+    CompactionStats,
+    WireCompactOptions,
+    compact_gcode,
+    compact_program,
+    wire_bytes,
+)
+from fiberpath.planning.helpers import Axis
+from fiberpath.planning.ir import Move, MoveKind, Program, ProgramMeta
+from fiberpath.simulation import simulate_program
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+GOLDEN = REPO_ROOT / "examples" / "multi_layer" / "expected.gcode"
+
+
+def _positions(program: Program) -> list[dict[Axis, float]]:
+    # Modal expansion: the full machine position after every motion line.
+    position: dict[Axis, float] = {}
+    positions = []
+    for move in program.moves:
+        if move.kind in {MoveKind.RAPID, MoveKind.SET_POSITION} and move.targets:
+            position = {**position, **move.targets}
+            if move.kind is MoveKind.RAPID:
+                positions.append(position)
+    return positions
+
+
+@pytest.mark.parametrize("resolution", [0.001, 0.01])
+def test_compact_output_parses_and_stays_within_resolution(resolution: float) -> None:
+    lines = GOLDEN.read_text(encoding="utf-8").splitlines()
+    options = WireCompactOptions(linear_resolution_mm=resolution, rotary_resolution_deg=resolution)
+
+    compacted, stats = compact_gcode(lines, options)
+
+    original = _positions(read_program(lines))
+    reread = _positions(read_program(compacted))
+    # Only RAPIDs that move nothing at the resolution are dropped.
+    assert len(reread) <= len(original)
+    expected = iter(original)
+    for position in reread:
+        reference = next(expected)
+        while any(abs(reference[a] - position[a]) > resolution / 2 + 1e-9 for a in position):
+            reference = next(expected)
+        assert position.keys() == reference.keys()
+    assert stats.bytes_saved > 0.2 * stats.bytes_before
+
+
+def test_compact_preserves_simulated_time_and_tow() -> None:
+    lines = GOLDEN.read_text(encoding="utf-8").splitlines()
+
+    compacted, _ = compact_gcode(lines)
+
+    before = simulate_program(read_program(lines))
+    after = simulate_program(read_program(compacted))
+    assert after.estimated_time_s == pytest.approx(before.estimated_time_s, rel=1e-4)
+    assert after.tow_length_mm == pytest.approx(before.tow_length_mm, rel=1e-4)
+
+
+def test_unchanged_axes_and_feeds_are_omitted() -> None:
+    axes = {Axis.CARRIAGE: 1.0, Axis.MANDREL: 98765.432101, Axis.DELIVERY_HEAD: -34.5}
+    program = Program(
+        meta=ProgramMeta(
+            mandrel_diameter=70.0, wind_length=100.0, tow_width=8.0, tow_thickness=0.5
+        ),
+        moves=[
+            Move(MoveKind.SET_FEED, feed=6000.0),
+            Move(MoveKind.RAPID, targets=axes),
+            Move(MoveKind.SET_FEED, feed=6000.0),
+            Move(MoveKind.RAPID, targets={**axes, Axis.CARRIAGE: 2.0}),
+            Move(MoveKind.RAPID, targets={**axes, Axis.CARRIAGE: 2.0004}),
+            Move(MoveKind.COMMENT, text="kept"),
+            Move(MoveKind.SET_POSITION, targets={Axis.MANDREL: 0.0}),
+            Move(MoveKind.RAPID, targets={**axes, Axis.CARRIAGE: 2.0}),
+        ],
+    )
+
+    moves = compact_program(program).moves
+
+    assert [(m.kind, m.targets) for m in moves] == [
+        (MoveKind.SET_FEED, {}),
+        (MoveKind.RAPID, {Axis.CARRIAGE: 1.0, Axis.MANDREL: 98765.432, Axis.DELIVERY_HEAD: -34.5}),
+        (MoveKind.RAPID, {Axis.CARRIAGE: 2.0}),
+        (MoveKind.COMMENT, {}),
+        (MoveKind.SET_POSITION, {Axis.MANDREL: 0.0}),
+        (MoveKind.RAPID, {Axis.MANDREL: 98765.432}),
+    ]
+
+
+def test_stats_count_streamed_bytes_and_link_time() -> None:
+    assert wire_bytes(["; comment", "", "G0 X1", "G0 A2.5"]) == (2, 14)
+    stats = CompactionStats(lines_before=2, lines_after=1, bytes_before=25_000, bytes_after=0)
+    assert stats.link_seconds_saved(250_000) == pytest.approx(1.0)
+
+
+def test_resolution_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        WireCompactOptions(rotary_resolution_deg=0.0)
@@ -0,0 +1,113 @@
+"""The compiled move renderer against the per-move reference formatting."""
+
+from __future__ import annotations
+
+import math
+import random
+
+import pytest
+from fiberpath.gcode.dialects import AxisMapping, MarlinDialect
+from fiberpath.gcode.serializer import compile_renderer, render_move, render_moves
+from fiberpath.math_utils import strip_precision
+from fiberpath.planning.helpers import Axis
+from fiberpath.planning.ir import Move, MoveKind
+
+_AXES = (Axis.CARRIAGE, Axis.MANDREL, Axis.DELIVERY_HEAD)
+
+# Values whose "%.6f" text exercises every stripping branch: integral, all-zero
+# decimals, negative zero, sub-resolution values rounding to (-)0, runs of
+# zeros in the integer part, and non-finite floats.
+_TRICKY = [
+    0.0,
+    -0.0,
+    1.0,
+    10.0,
+    100.5,
+    1000000.0,
+    0.5,
+    0.000001,
+    0.0000004,
+    -0.0000004,
+    -5.710593,
+    123.456789,
+    2.000010,
+    359.9999996,
+    1e20,
+    7,
+    math.inf,
+    -math.inf,
+    math.nan,
+]
+
+
+def _reference(move: Move, mapping: AxisMapping) -> str:
+    # The historical per-move rendering the compiled renderer must reproduce.
+    if move.kind is MoveKind.COMMENT:
+        return f"; {move.text}"
+    if move.kind is MoveKind.SET_FEED:
+        assert move.feed is not None
+        return f"G0 F{strip_precision(move.feed)}"
+    letters = {
+        Axis.CARRIAGE: mapping.carriage,
+        Axis.MANDREL: mapping.mandrel,
+        Axis.DELIVERY_HEAD: mapping.delivery_head,
+    }
+    opcode = "G92" if move.kind is MoveKind.SET_POSITION else "G0"
+    return " ".join(
+        [opcode, *(f"{letters[a]}{strip_precision(v)}" for a, v in move.targets.items())]
+    )
+
+
+def _moves(rng: random.Random, count: int) -> list[Move]:
+    moves = []
+    for index in range(count):
+        roll = rng.random()
+        if roll < 0.05:
+            moves.append(Move(MoveKind.COMMENT, text=f"Pattern: {index} 0.500000"))
+        elif roll < 0.1:
+            moves.append(Move(MoveKind.SET_FEED, feed=rng.choice([6000.0, 9000.5, 100])))
+        elif roll < 0.15:
+            axes = rng.sample(_AXES, rng.randint(1, 3))
+            moves.append(
+                Move(MoveKind.SET_POSITION, targets={a: rng.choice(_TRICKY) for a in axes})
+            )
+        else:
+            values = [rng.choice([*_TRICKY, rng.uniform(-1e4, 1e4)]) for _ in _AXES]
+            moves.append(Move(MoveKind.RAPID, targets=dict(zip(_AXES, values, strict=True))))
+    return moves
+
+
+@pytest.mark.parametrize(
+    "mapping",
+    [AxisMapping(), AxisMapping(carriage="Y", mandrel="Z", delivery_head="C")],
+    ids=["xab", "yzc"],
+)
+def test_bulk_render_matches_reference(mapping: AxisMapping) -> None:
+    moves = _moves(random.Random(20260119), 2000)
+
+    rendered = render_moves(moves, MarlinDialect(axis_mapping=mapping))
+
+    assert rendered == [_reference(move, mapping) for move in moves]
+
+
+def test_single_move_and_edge_kinds() -> None:
+    mapping = AxisMapping()
+    cases = [
+        Move(
+            MoveKind.RAPID, targets={Axis.CARRIAGE: 0.0, Axis.MANDREL: 0.0, Axis.DELIVERY_HEAD: 0.0}
+        ),
+        Move(MoveKind.RAPID, targets={Axis.DELIVERY_HEAD: -0.0, Axis.CARRIAGE: 10.0}),
+        Move(MoveKind.RAPID),
+        Move(MoveKind.SET_POSITION, targets={Axis.MANDREL: 0.0}),
+        Move(MoveKind.SET_FEED, feed=6000.0),
+        Move(MoveKind.COMMENT, text=""),
+        Move(MoveKind.COMMENT, text="G0 X1.000000 %s"),
+    ]
+    for move in cases:
+        assert render_move(move, mapping) == _reference(move, mapping)
+    assert render_moves([], MarlinDialect()) == []
+
+
+def test_renderer_is_compiled_once_per_mapping() -> None:
+    assert compile_renderer(AxisMapping()) is compile_renderer(AxisMapping())
+    assert compile_renderer(AxisMapping()) is not compile_renderer(AxisMapping(carriage="Y"))
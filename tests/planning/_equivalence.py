@@ -23,6 +23,7 @@ from fiberpath.planning.layer_strategies import dispatch_layer
 from fiberpath.planning.machine import WinderMachine
 from fiberpath.planning.metrics import nominal_metrics
 from fiberpath.planning.pattern import PatternSpec
+from fiberpath.planning.planner import PlanResult
 
 
 def helical_layer_moves(
@@ -280,3 +281,30 @@ def assert_metrics_equal(
         raise AssertionError(f"distance drift: {a.distance_mm} != {b.distance_mm}")
     if abs(a.time_s - b.time_s) > time_tol:
         raise AssertionError(f"time drift: {a.time_s} != {b.time_s}")
+
+
+def assert_plan_metrics_equal(full: PlanResult, fast: PlanResult, *, rel_tol: float = 1e-9) -> None:
+    """A metrics-only plan reports the full plan's totals and per-layer breakdown.
+
+    Per-layer command counts must match exactly; time and tow may differ only by
+    floating-point summation order (closed-form vs per-segment accumulation), so
+    they are compared relative to the plan's totals.
+    """
+    time_tol = rel_tol * max(full.total_time_s, 1.0)
+    tow_tol = rel_tol * max(full.total_tow_m, 1.0)
+    if len(full.layers) != len(fast.layers):
+        raise AssertionError(f"layer count {len(full.layers)} != {len(fast.layers)}")
+    if abs(full.total_time_s - fast.total_time_s) > time_tol:
+        raise AssertionError(f"time drift: {full.total_time_s} != {fast.total_time_s}")
+    if abs(full.total_tow_m - fast.total_tow_m) > tow_tol:
+        raise AssertionError(f"tow drift: {full.total_tow_m} != {fast.total_tow_m}")
+    for a, b in zip(full.layers, fast.layers, strict=True):
+        if (a.index, a.wind_type, a.terminal, a.commands) != (
+            b.index,
+            b.wind_type,
+            b.terminal,
+            b.commands,
+        ):
+            raise AssertionError(f"layer {a.index} shape differs: {a} != {b}")
+        if abs(a.time_s - b.time_s) > time_tol or abs(a.tow_m - b.tow_m) > tow_tol:
+            raise AssertionError(f"layer {a.index} metrics drift: {a} != {b}")
@@ -0,0 +1,88 @@
+"""Cooperative cancellation of in-flight plans (``PlanOptions.cancel_token``)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from fiberpath.config import load_wind_definition
+from fiberpath.config.schemas import HelicalLayer, MandrelParameters, TowParameters
+from fiberpath.planning import CancellationToken, PlanCancelledError, PlanOptions, plan_wind
+from fiberpath.planning.calculations import compute_helical_kinematics
+from fiberpath.planning.developed import build_helical_developed_path
+from fiberpath.planning.pattern import pattern_spec
+
+ROOT = Path(__file__).resolve().parents[2]
+
+_MANDREL = MandrelParameters.model_validate({"diameter": 40.0, "windLength": 120.0})
+_TOW = TowParameters.model_validate({"width": 6.0, "thickness": 0.5})
+_LAYER = HelicalLayer.model_validate(
+    {
+        "windAngle": 35.0,
+        "patternNumber": 3,
+        "skipIndex": 2,
+        "lockDegrees": 180.0,
+        "leadInMM": 4.0,
+        "leadOutDegrees": 12.0,
+    }
+)
+
+
+class _CancelAfter(CancellationToken):
+    """A token that trips itself after ``polls`` checks (a deterministic mid-plan cancel)."""
+
+    __slots__ = ("_remaining", "polls")
+
+    def __init__(self, polls: int) -> None:
+        super().__init__()
+        self._remaining = polls
+        self.polls = 0
+
+    def raise_if_cancelled(self) -> None:
+        self.polls += 1
+        self._remaining -= 1
+        if self._remaining < 0:
+            self.cancel("tripped")
+        super().raise_if_cancelled()
+
+
+def test_token_is_one_shot_and_keeps_first_reason() -> None:
+    token = CancellationToken()
+    assert not token.cancelled
+    token.raise_if_cancelled()  # no-op while unset
+    token.cancel("superseded")
+    token.cancel("disconnected")
+    assert token.cancelled
+    assert token.reason == "superseded"
+    with pytest.raises(PlanCancelledError, match="superseded"):
+        token.raise_if_cancelled()
+
+
+def test_pre_cancelled_token_stops_before_planning() -> None:
+    definition = load_wind_definition(ROOT / "examples" / "multi_layer" / "input.wind")
+    token = CancellationToken()
+    token.cancel()
+    with pytest.raises(PlanCancelledError):
+        plan_wind(definition, PlanOptions(cancel_token=token))
+
+
+def test_cancel_mid_plan_raises_between_circuits() -> None:
+    definition = load_wind_definition(ROOT / "examples" / "multi_layer" / "input.wind")
+    token = _CancelAfter(polls=3)
+    with pytest.raises(PlanCancelledError, match="tripped"):
+        plan_wind(definition, PlanOptions(cancel_token=token))
+    assert token.polls == 4
+
+
+def test_builder_polls_once_per_circuit() -> None:
+    kinematics = compute_helical_kinematics(_LAYER, _MANDREL, _TOW)
+    token = _CancelAfter(polls=10_000)
+    build_helical_developed_path(pattern_spec(_LAYER), kinematics, _MANDREL, cancel_token=token)
+    assert token.polls == kinematics.num_circuits
+
+
+def test_uncancelled_token_does_not_change_output() -> None:
+    definition = load_wind_definition(ROOT / "examples" / "multi_layer" / "input.wind")
+    baseline = plan_wind(definition)
+    with_token = plan_wind(definition, PlanOptions(cancel_token=CancellationToken()))
+    assert with_token.commands == baseline.commands
@@ -0,0 +1,119 @@
+"""Per-motion feed scheduling and per-layer feed overrides."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from fiberpath.config import MachineKinematics, default_machine_profile, load_wind_definition
+from fiberpath.gcode.reader import read_program
+from fiberpath.planning import PlanningError, PlanOptions, plan_wind
+from fiberpath.planning.helpers import Axis
+from fiberpath.planning.ir import Move, MoveKind
+from fiberpath.planning.metrics import surface_distance_mm
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+EXAMPLES = [
+    "examples/simple_cylinder/input.wind",
+    "examples/multi_layer/input.wind",
+    "examples/cone_reducer/input.wind",
+]
+
+KINEMATICS = MachineKinematics.model_validate(
+    {"carriage": {"maxVelocity": 300.0}, "mandrel": {"maxVelocity": 720.0}}
+)
+PROFILE = default_machine_profile().model_copy(update={"kinematics": KINEMATICS})
+SCHEDULED = PlanOptions(profile=PROFILE, schedule_feeds=True)
+
+
+def _rapids(moves: list[Move]) -> list[dict[Axis, float]]:
+    return [move.targets for move in moves if move.kind is MoveKind.RAPID]
+
+
+def _axis_speeds(moves: list[Move], diameter: float) -> list[tuple[float, float]]:
+    """(carriage mm/s, mandrel deg/s) of every surface motion at its feed."""
+    position = {Axis.CARRIAGE: 0.0, Axis.MANDREL: 0.0, Axis.DELIVERY_HEAD: 0.0}
+    feed = 0.0
+    speeds = []
+    for move in moves:
+        if move.kind is MoveKind.SET_FEED:
+            assert move.feed is not None
+            feed = move.feed
+        elif move.kind in (MoveKind.RAPID, MoveKind.SET_POSITION):
+            carriage = move.targets.get(Axis.CARRIAGE, position[Axis.CARRIAGE])
+            mandrel = move.targets.get(Axis.MANDREL, position[Axis.MANDREL])
+            carriage -= position[Axis.CARRIAGE]
+            mandrel -= position[Axis.MANDREL]
+            position.update(move.targets)
+            distance = surface_distance_mm(carriage, mandrel, 3.141592653589793 * diameter)
+            if move.kind is MoveKind.RAPID and distance > 0.0:
+                seconds = distance / feed * 60.0
+                speeds.append((abs(carriage) / seconds, abs(mandrel) / seconds))
+    return speeds
+
+
+@pytest.mark.parametrize("wind_rel", EXAMPLES)
+def test_scheduled_plan_keeps_the_path_within_the_axis_limits(wind_rel: str) -> None:
+    definition = load_wind_definition(REPO_ROOT / wind_rel)
+    diameter = definition.mandrel_parameters.diameter
+
+    plain = plan_wind(definition)
+    scheduled = plan_wind(definition, SCHEDULED)
+    moves = read_program(scheduled.commands).moves
+
+    assert _rapids(moves) == _rapids(read_program(plain.commands).moves)
+    speeds = _axis_speeds(moves, diameter)
+    # G-code rounding of the targets leaves a sliver above the limit.
+    assert max(carriage for carriage, _ in speeds) <= 300.0 * (1 + 1e-4)
+    assert max(mandrel for _, mandrel in speeds) <= 720.0 * (1 + 1e-4)
+    assert scheduled.unscheduled_time_s == pytest.approx(plain.total_time_s, rel=1e-12)
+    assert scheduled.total_time_s < plain.total_time_s
+
+
+def test_feed_changes_are_emitted_only_where_the_feed_changes() -> None:
+    definition = load_wind_definition(REPO_ROOT / "examples/multi_layer/input.wind")
+
+    moves = read_program(plan_wind(definition, SCHEDULED).commands).moves
+
+    feeds = [move.feed for move in moves if move.kind is MoveKind.SET_FEED]
+    assert all(before != after for before, after in zip(feeds, feeds[1:], strict=False))
+    assert len(feeds) < len(_rapids(moves)) / 100
+
+
+def test_metrics_only_scheduled_plan_matches_the_full_plan() -> None:
+    definition = load_wind_definition(REPO_ROOT / "examples/multi_layer/input.wind")
+
+    full = plan_wind(definition, SCHEDULED)
+    metrics = plan_wind(
+        definition, PlanOptions(profile=PROFILE, schedule_feeds=True, metrics_only=True)
+    )
+
+    assert metrics.commands == []
+    assert metrics.total_time_s == pytest.approx(full.total_time_s, rel=1e-12)
+    assert metrics.unscheduled_time_s == pytest.approx(full.unscheduled_time_s, rel=1e-12)
+
+
+def test_scheduling_needs_kinematics() -> None:
+    definition = load_wind_definition(REPO_ROOT / "examples/simple_cylinder/input.wind")
+
+    with pytest.raises(PlanningError, match="no kinematics"):
+        plan_wind(definition, PlanOptions(schedule_feeds=True))
+
+
+def test_layer_feed_override_sets_the_feed_for_that_layer_only() -> None:
+    definition = load_wind_definition(REPO_ROOT / "examples/multi_layer/input.wind")
+    layers = definition.model_dump(by_alias=True)["layers"]
+    layers[0] = {**layers[0], "feedRate": definition.default_feed_rate / 2}
+    slowed = definition.model_validate({**definition.model_dump(by_alias=True), "layers": layers})
+
+    plain = plan_wind(definition)
+    result = plan_wind(slowed)
+
+    assert result.layers[0].time_s == pytest.approx(2 * plain.layers[0].time_s)
+    assert result.layers[1].time_s == pytest.approx(plain.layers[1].time_s)
+    feeds = [line for line in result.commands if line.startswith("G0 F")]
+    assert feeds == [f"G0 F{definition.default_feed_rate:g}", "G0 F4500", "G0 F9000"]
+    assert plan_wind(slowed, PlanOptions(metrics_only=True)).total_time_s == pytest.approx(
+        result.total_time_s
+    )
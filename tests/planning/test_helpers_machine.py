@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import pytest
 from fiberpath.planning.helpers import Axis, interpolate_coordinates
-from fiberpath.planning.machine import WinderMachine
+from fiberpath.planning.machine import MetricsMachine, WinderMachine
+from fiberpath.planning.metrics import nominal_metrics
 
 BASE_START = {axis: 0.0 for axis in Axis}
 BASE_END = {
@@ -59,3 +60,48 @@ def test_machine_mandrel_accessors() -> None:
     assert machine.get_mandrel_diameter() == pytest.approx(42.0)
     machine.set_mandrel_diameter(50.0)
     assert machine.get_mandrel_diameter() == pytest.approx(50.0)
+
+
+def _drive(machine: WinderMachine) -> None:
+    machine.set_feed_rate(3000.0)
+    machine.move({Axis.CARRIAGE: 12.4, Axis.MANDREL: 90.0})
+    machine.move({Axis.DELIVERY_HEAD: -5.0})
+    machine.insert_comment("turnaround")
+    machine.move({Axis.MANDREL: 135.0})
+    machine.move({Axis.CARRIAGE: 0.3, Axis.MANDREL: 200.0})
+    machine.zero_axes(200.0)
+
+
+def test_metrics_machine_matches_recorded_moves() -> None:
+    full = WinderMachine(50.0)
+    _drive(full)
+    fast = MetricsMachine(50.0)
+    _drive(fast)
+
+    expected = nominal_metrics(full.get_moves(), 50.0)
+    assert fast.command_count == full.command_count
+    assert fast.metrics().move_count == expected.move_count
+    assert fast.metrics().time_s == pytest.approx(expected.time_s, rel=1e-12)
+    assert fast.metrics().distance_mm == pytest.approx(expected.distance_mm, rel=1e-12)
+
+
+def test_metrics_machine_charge_repeats_a_move() -> None:
+    once = MetricsMachine(50.0)
+    once.set_feed_rate(3000.0)
+    for step in range(1, 4):
+        once.travel(4.0 * step, 30.0 * step)
+    bulk = MetricsMachine(50.0)
+    bulk.set_feed_rate(3000.0)
+    bulk.charge(4.0, 30.0, 3)
+
+    assert bulk.command_count == once.command_count
+    assert bulk.metrics().distance_mm == pytest.approx(once.metrics().distance_mm)
+    assert bulk.metrics().move_count == once.metrics().move_count
+
+
+def test_metrics_machine_requires_feed_rate_and_records_no_moves() -> None:
+    machine = MetricsMachine(50.0)
+    with pytest.raises(RuntimeError):
+        machine.move({Axis.CARRIAGE: 1.0})
+    with pytest.raises(RuntimeError):
+        machine.get_moves()
@@ -0,0 +1,136 @@
+"""Incremental re-planning (``IncrementalPlanner``) against full ``plan_wind`` runs."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from fiberpath.config import WindDefinition
+from fiberpath.planning import (
+    CancellationToken,
+    IncrementalPlanner,
+    LayerValidationError,
+    PlanCancelledError,
+    PlanOptions,
+    plan_wind,
+)
+
+_HELICAL: dict[str, Any] = {
+    "windType": "helical",
+    "windAngle": 35.0,
+    "patternNumber": 3,
+    "skipIndex": 2,
+    "lockDegrees": 180.0,
+    "leadInMM": 4.0,
+    "leadOutDegrees": 12.0,
+}
+
+
+def _definition(**overrides: Any) -> WindDefinition:
+    raw: dict[str, Any] = {
+        "mandrelParameters": {"diameter": 40.0, "windLength": 120.0},
+        "towParameters": {"width": 6.0, "thickness": 0.5},
+        "defaultFeedRate": 6000.0,
+        "layers": [
+            {"windType": "hoop", "terminal": False},
+            _HELICAL,
+            {"windType": "skip", "mandrelRotation": 45.0},
+            {**_HELICAL, "windAngle": 45.0},
+        ],
+    }
+    raw.update(overrides)
+    return WindDefinition.model_validate(raw)
+
+
+def _with_layer(index: int, **changes: Any) -> WindDefinition:
+    layers = _definition().model_dump(by_alias=True)["layers"]
+    layers[index] = {**layers[index], **changes}
+    return _definition(layers=layers)
+
+
+@pytest.mark.parametrize("options", [PlanOptions(), PlanOptions(verbose=True)])
+def test_replan_matches_full_plan(options: PlanOptions) -> None:
+    definition = _definition()
+    planner = IncrementalPlanner(options)
+
+    result = planner.replan(definition)
+
+    expected = plan_wind(definition, options)
+    assert result.commands == expected.commands
+    assert result.layers == expected.layers
+    assert result.total_time_s == expected.total_time_s
+    assert planner.last_stats.lowered == 4
+
+
+def test_replan_relowers_only_the_edited_layer() -> None:
+    planner = IncrementalPlanner()
+    planner.replan(_definition())
+    edited = _with_layer(3, leadOutDegrees=20.0)
+
+    result = planner.replan(edited)
+
+    assert (planner.last_stats.lowered, planner.last_stats.reused) == (1, 3)
+    expected = plan_wind(edited)
+    assert result.commands == expected.commands
+    assert result.layers == expected.layers
+
+
+def test_replan_reuses_moved_layers_and_renumbers_summaries() -> None:
+    planner = IncrementalPlanner()
+    planner.replan(_definition())
+    layers = _definition().model_dump(by_alias=True)["layers"]
+    reordered = _definition(layers=[layers[1], layers[0], *layers[2:]])
+
+    result = planner.replan(reordered)
+
+    assert planner.last_stats.lowered == 0
+    assert result.commands == plan_wind(reordered).commands
+
+
+def test_layer_feed_override_reuses_the_other_layers() -> None:
+    planner = IncrementalPlanner()
+    planner.replan(_definition())
+    edited = _with_layer(1, feedRate=3000.0)
+
+    result = planner.replan(edited)
+
+    assert (planner.last_stats.lowered, planner.last_stats.reused) == (1, 3)
+    expected = plan_wind(edited)
+    assert result.commands == expected.commands
+    assert result.layers == expected.layers
+
+
+def test_shared_parameter_change_relowers_every_layer() -> None:
+    planner = IncrementalPlanner()
+    planner.replan(_definition())
+
+    planner.replan(_definition(defaultFeedRate=7000.0))
+
+    assert planner.last_stats.reused == 0
+
+
+def test_metrics_only_planner_matches_metrics_only_plan() -> None:
+    options = PlanOptions(metrics_only=True)
+    planner = IncrementalPlanner(options)
+    planner.replan(_definition())
+    edited = _with_layer(1, windAngle=65.0)
+
+    result = planner.replan(edited)
+
+    assert result.commands == []
+    assert result.layers == plan_wind(edited, options).layers
+
+
+def test_failed_or_cancelled_replan_keeps_the_cache() -> None:
+    planner = IncrementalPlanner()
+    planner.replan(_definition())
+
+    with pytest.raises(LayerValidationError):
+        planner.replan(_with_layer(3, windAngle=95.0))
+    token = CancellationToken()
+    token.cancel()
+    with pytest.raises(PlanCancelledError):
+        planner.replan(_with_layer(3, leadOutDegrees=20.0), cancel_token=token)
+
+    planner.replan(_definition())
+    assert planner.last_stats.lowered == 0
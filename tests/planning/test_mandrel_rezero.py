@@ -0,0 +1,102 @@
+"""Turnaround mandrel re-zeroing: shorter ``A`` words, the same physical motion."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from _equivalence import assert_metrics_equal, assert_plan_metrics_equal
+from fiberpath.config import load_wind_definition
+from fiberpath.gcode.reader import read_program
+from fiberpath.planning import PlanOptions, plan_wind
+from fiberpath.planning.helpers import Axis
+from fiberpath.planning.ir import Move, MoveKind
+from fiberpath.planning.machine import MetricsMachine, WinderMachine
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+EXAMPLES = [
+    "examples/simple_cylinder/input.wind",
+    "examples/multi_layer/input.wind",
+    "examples/cone_reducer/input.wind",
+]
+
+
+def _physical_path(moves: list[Move]) -> list[float]:
+    # Unwrap G92 frames: accumulate each RAPID's delta from the current frame.
+    frame = {Axis.CARRIAGE: 0.0, Axis.MANDREL: 0.0, Axis.DELIVERY_HEAD: 0.0}
+    physical = dict(frame)
+    path = []
+    for move in moves:
+        if move.kind is MoveKind.SET_POSITION:
+            frame.update(move.targets)
+        elif move.kind is MoveKind.RAPID:
+            for axis, value in move.targets.items():
+                physical[axis] += value - frame[axis]
+                frame[axis] = value
+            path.extend(physical.values())
+    return path
+
+
+def _max_mandrel_word(moves: list[Move]) -> float:
+    return max(
+        abs(move.targets[Axis.MANDREL])
+        for move in moves
+        if move.kind is MoveKind.RAPID and Axis.MANDREL in move.targets
+    )
+
+
+@pytest.mark.parametrize("wind_rel", EXAMPLES)
+def test_rezeroed_plan_moves_the_machine_identically(wind_rel: str) -> None:
+    definition = load_wind_definition(REPO_ROOT / wind_rel)
+    diameter = definition.mandrel_parameters.diameter
+
+    plain = read_program(plan_wind(definition).commands).moves
+    rezeroed = read_program(plan_wind(definition, PlanOptions(rezero_mandrel=True)).commands).moves
+
+    assert _physical_path(rezeroed) == pytest.approx(_physical_path(plain), abs=1e-5)
+    assert_metrics_equal(plain, rezeroed, diameter)
+    assert _max_mandrel_word(rezeroed) < _max_mandrel_word(plain)
+
+
+def test_helical_words_stay_within_a_pass_of_zero() -> None:
+    definition = load_wind_definition(REPO_ROOT / "examples/rocketry/AvBay(470mm)single.wind")
+
+    moves = read_program(plan_wind(definition, PlanOptions(rezero_mandrel=True)).commands).moves
+
+    assert _max_mandrel_word(moves) < 2500.0
+
+
+@pytest.mark.parametrize("wind_rel", EXAMPLES)
+def test_metrics_only_counts_rezero_lines(wind_rel: str) -> None:
+    definition = load_wind_definition(REPO_ROOT / wind_rel)
+
+    full = plan_wind(definition, PlanOptions(rezero_mandrel=True))
+    fast = plan_wind(definition, PlanOptions(rezero_mandrel=True, metrics_only=True))
+
+    assert_plan_metrics_equal(full, fast)
+
+
+def _drive(machine: WinderMachine) -> None:
+    machine.set_feed_rate(3000.0)
+    machine.move({Axis.MANDREL: 300.0})
+    machine.turnaround()
+    machine.move({Axis.MANDREL: 1000.0})
+    machine.turnaround()
+    machine.move({Axis.CARRIAGE: 1.0, Axis.MANDREL: 1090.0})
+
+
+def test_turnaround_rezeroes_only_past_a_full_turn() -> None:
+    full = WinderMachine(50.0, rezero_mandrel=True)
+    _drive(full)
+    fast = MetricsMachine(50.0, rezero_mandrel=True)
+    _drive(fast)
+
+    assert [(m.kind, m.targets.get(Axis.MANDREL)) for m in full.get_moves()[1:]] == [
+        (MoveKind.RAPID, 300.0),
+        (MoveKind.RAPID, 1000.0),
+        (MoveKind.SET_POSITION, 280.0),
+        (MoveKind.RAPID, 280.0),  # segmentation repeats the start
+        (MoveKind.RAPID, 370.0),
+    ]
+    assert fast.command_count == full.command_count
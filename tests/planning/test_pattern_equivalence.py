@@ -19,13 +19,14 @@ from _equivalence import (
     assert_hoop_geometry,
     assert_lean,
     assert_metrics_equal,
+    assert_plan_metrics_equal,
     helical_layer_moves,
     hoop_layer_moves,
 )
 from fiberpath.config import load_wind_definition
 from fiberpath.config.schemas import HelicalLayer, HoopLayer
 from fiberpath.gcode.reader import read_program
-from fiberpath.planning import plan_wind
+from fiberpath.planning import PlanOptions, plan_wind
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 
@@ -85,6 +86,49 @@ def test_new_lowering_matches_golden_metrics(wind_rel: str, golden_rel: str) ->
     assert_metrics_equal(old.moves, new.moves, definition.mandrel_parameters.diameter)
 
 
+# Every example part, including the cone (metrics-only has its own cone walk).
+ALL_EXAMPLES = sorted(
+    str(path.relative_to(REPO_ROOT)) for path in (REPO_ROOT / "examples").rglob("*.wind")
+)
+
+
+@pytest.mark.parametrize("wind_rel", ALL_EXAMPLES)
+def test_metrics_only_plan_matches_full_plan(wind_rel: str) -> None:
+    definition = load_wind_definition(REPO_ROOT / wind_rel)
+    full = plan_wind(definition)
+    fast = plan_wind(definition, PlanOptions(metrics_only=True))
+    assert fast.commands == []
+    assert_plan_metrics_equal(full, fast)
+
+
+def test_metrics_only_counts_verbose_commands() -> None:
+    definition = load_wind_definition(REPO_ROOT / "examples/multi_layer/input.wind")
+    full = plan_wind(definition, PlanOptions(verbose=True))
+    assert_plan_metrics_equal(
+        full, plan_wind(definition, PlanOptions(verbose=True, metrics_only=True))
+    )
+
+
+def test_metrics_only_matches_full_plan_without_initial_near_lock() -> None:
+    from fiberpath.config import WindDefinition
+
+    definition = WindDefinition.model_validate(
+        {
+            "mandrelParameters": {"diameter": 40.0, "windLength": 120.0},
+            "towParameters": {"width": 6.0, "thickness": 0.5},
+            "defaultFeedRate": 6000.0,
+            "layers": [
+                {"windType": "hoop", "terminal": False},
+                {**_LAYER.model_dump(by_alias=True), "skipInitialNearLock": True},
+                {"windType": "skip", "mandrelRotation": 45.0},
+                {"windType": "hoop", "terminal": True},
+            ],
+        }
+    )
+    full = plan_wind(definition)
+    assert_plan_metrics_equal(full, plan_wind(definition, PlanOptions(metrics_only=True)))
+
+
 # --- the harness must actually catch regressions (not be vacuous) ---
 
 _LAYER = HelicalLayer.model_validate(
@@ -152,3 +196,16 @@ def test_hoop_geometry_check_rejects_wrong_tow_width() -> None:
     moves = hoop_layer_moves(HoopLayer(terminal=False), mandrel, tow)
     with pytest.raises(AssertionError):
         assert_hoop_geometry(moves, mandrel.diameter, tow.width * 2.0)
+
+
+def test_plan_metrics_check_rejects_drifted_layer() -> None:
+    from dataclasses import replace
+
+    definition = load_wind_definition(REPO_ROOT / "examples/multi_layer/input.wind")
+    full = plan_wind(definition)
+    drifted = replace(
+        full,
+        layers=[replace(full.layers[0], time_s=full.layers[0].time_s + 1.0), *full.layers[1:]],
+    )
+    with pytest.raises(AssertionError):
+        assert_plan_metrics_equal(full, drifted)
@@ -0,0 +1,71 @@
+"""Layer-by-layer planning (``plan_chunks``) against full ``plan_wind`` runs."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from fiberpath.config import WindDefinition
+from fiberpath.planning import (
+    LayerValidationError,
+    PlanningError,
+    PlanOptions,
+    plan_chunks,
+    plan_wind,
+)
+
+_HELICAL: dict[str, Any] = {
+    "windType": "helical",
+    "windAngle": 35.0,
+    "patternNumber": 3,
+    "skipIndex": 2,
+    "lockDegrees": 180.0,
+    "leadInMM": 4.0,
+    "leadOutDegrees": 12.0,
+}
+
+
+def _definition(*layers: dict[str, Any]) -> WindDefinition:
+    return WindDefinition.model_validate(
+        {
+            "mandrelParameters": {"diameter": 40.0, "windLength": 120.0},
+            "towParameters": {"width": 6.0, "thickness": 0.5},
+            "defaultFeedRate": 6000.0,
+            "layers": list(layers)
+            or [
+                {"windType": "hoop", "terminal": False},
+                _HELICAL,
+                {"windType": "skip", "mandrelRotation": 45.0},
+                {**_HELICAL, "windAngle": 45.0, "feedRate": 3000.0},
+            ],
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "options", [PlanOptions(), PlanOptions(verbose=True), PlanOptions(rezero_mandrel=True)]
+)
+def test_chunks_concatenate_to_the_full_plan(options: PlanOptions) -> None:
+    definition = _definition()
+
+    chunks = list(plan_chunks(definition, options))
+
+    assert len(chunks) == 1 + len(definition.layers)
+    assert [line for chunk in chunks for line in chunk] == plan_wind(definition, options).commands
+
+
+def test_the_first_chunk_needs_no_layer() -> None:
+    head = next(plan_chunks(_definition()))
+    assert head[0].startswith("; Parameters")
+    assert "G0 X0 A0 B0" in head
+
+
+def test_every_layer_is_validated_before_the_first_chunk() -> None:
+    broken = {**_HELICAL, "windAngle": 0.5}
+    with pytest.raises(LayerValidationError):
+        plan_chunks(_definition({"windType": "hoop", "terminal": False}, broken))
+
+
+def test_metrics_only_has_nothing_to_stream() -> None:
+    with pytest.raises(PlanningError):
+        plan_chunks(_definition(), PlanOptions(metrics_only=True))
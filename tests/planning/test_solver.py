@@ -0,0 +1,140 @@
+"""Closed-form pattern solver: validity, completeness and predicted metrics."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from fiberpath.config import load_wind_definition
+from fiberpath.config.schemas import HelicalLayer, WindDefinition
+from fiberpath.gcode.dialects import dialect_from_profile
+from fiberpath.planning import LayerValidationError, PlanOptions, solve_patterns
+from fiberpath.planning.pattern import helical_spec
+from fiberpath.planning.planner import lower_layer
+from fiberpath.planning.solver import PatternSolution
+from fiberpath.planning.validators import _validate_coverage, validate_layer
+
+ROOT = Path(__file__).resolve().parents[2]
+EXAMPLES = ROOT / "examples"
+
+
+def _first_helical(name: str) -> tuple[WindDefinition, int, HelicalLayer]:
+    definition = load_wind_definition(EXAMPLES / name)
+    for index, layer in enumerate(definition.layers, start=1):
+        if isinstance(layer, HelicalLayer):
+            return definition, index, layer
+    raise AssertionError(f"{name} has no helical layer")
+
+
+def _solve(
+    definition: WindDefinition, layer: HelicalLayer, **kwargs: float
+) -> list[PatternSolution]:
+    return solve_patterns(
+        layer,
+        definition.mandrel_parameters,
+        definition.tow_parameters,
+        feed_rate=definition.default_feed_rate,
+        **kwargs,
+    )
+
+
+def _with_pattern(layer: HelicalLayer, solution: PatternSolution) -> HelicalLayer:
+    return layer.model_copy(
+        update={
+            "pattern_number": solution.pattern_number,
+            "skip_index": solution.skip_index,
+            "lock_degrees": solution.lock_degrees,
+        }
+    )
+
+
+def test_solutions_are_exactly_the_valid_grid() -> None:
+    definition, index, layer = _first_helical("multi_layer/input.wind")
+    solutions = _solve(definition, layer, max_lock_degrees=540.0)
+    circuits = solutions[0].circuits
+
+    # Brute force: every pattern/skip and every half-slot lock up to the cap.
+    accepted = set()
+    for pattern_number in range(1, circuits + 1):
+        for skip_index in range(1, pattern_number):
+            for k in range(1, 3 * pattern_number + 1):
+                candidate = layer.model_copy(
+                    update={
+                        "pattern_number": pattern_number,
+                        "skip_index": skip_index,
+                        "lock_degrees": 180.0 * k / pattern_number,
+                    }
+                )
+                try:
+                    validate_layer(
+                        index, candidate, definition.mandrel_parameters, definition.tow_parameters
+                    )
+                except LayerValidationError:
+                    continue
+                accepted.add((pattern_number, skip_index, k))
+
+    assert {
+        (s.pattern_number, s.skip_index, round(s.lock_degrees * s.pattern_number / 180.0))
+        for s in solutions
+    } == accepted
+    assert all(
+        s.circuits == circuits and s.patterns * s.pattern_number == circuits for s in solutions
+    )
+    keys = [(s.time_s, s.pattern_number, s.skip_index, s.lock_degrees) for s in solutions]
+    assert keys == sorted(keys)
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "multi_layer/input.wind",
+        "rocketry/AvBay(470mm)single.wind",
+        "cone_reducer/input.wind",
+    ],
+)
+def test_predicted_metrics_match_lowering(name: str) -> None:
+    definition, index, layer = _first_helical(name)
+    solutions = _solve(definition, layer)
+    options = PlanOptions(metrics_only=True)
+    dialect = dialect_from_profile(options.profile)
+
+    for solution in solutions[:: max(len(solutions) // 25, 1)]:
+        block = lower_layer(index, _with_pattern(layer, solution), definition, options, dialect)
+        assert solution.time_s == pytest.approx(block.metrics.time_s, rel=1e-9)
+        assert solution.tow_m == pytest.approx(block.metrics.distance_mm / 1000.0, rel=1e-9)
+
+
+def test_solver_rejects_an_unwindable_layer() -> None:
+    definition, _, layer = _first_helical("multi_layer/input.wind")
+    with pytest.raises(LayerValidationError, match="wind angle"):
+        _solve(definition, layer.model_copy(update={"wind_angle": 95.0}))
+    with pytest.raises(ValueError, match="max_lock_degrees"):
+        _solve(definition, layer, max_lock_degrees=0.0)
+
+
+def test_validator_accepts_lock_degrees_a_hair_under_a_slot() -> None:
+    # 2 * lockDegrees mod 360 lands a floating-point hair under a whole slot here.
+    _, _, layer = _first_helical("multi_layer/input.wind")
+    for pattern_number, k in ((7, 12), (42, 18)):
+        candidate = layer.model_copy(
+            update={
+                "pattern_number": pattern_number,
+                "skip_index": 1,
+                "lock_degrees": 180.0 * k / pattern_number,
+            }
+        )
+        _validate_coverage(1, helical_spec(candidate), pattern_number, 500.0)
+
+
+def test_nearest_lock_suggestions_are_valid() -> None:
+    _, _, layer = _first_helical("multi_layer/input.wind")
+    candidate = layer.model_copy(
+        update={"pattern_number": 4, "skip_index": 1, "lock_degrees": 1000.0}
+    )
+    with pytest.raises(LayerValidationError, match="Nearest valid") as excinfo:
+        _validate_coverage(1, helical_spec(candidate), 4, 500.0)
+    suggestions = str(excinfo.value).rpartition(": ")[2]
+    assert suggestions == "900°, 990°, 1080°"
+    for value in (900.0, 990.0, 1080.0):
+        valid = candidate.model_copy(update={"lock_degrees": value})
+        _validate_coverage(1, helical_spec(valid), 4, 500.0)
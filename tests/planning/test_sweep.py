@@ -0,0 +1,153 @@
+"""Parameter sweeps over a helical layer: pruning, totals, ranking and output."""
+
+from __future__ import annotations
+
+import io
+import json
+from pathlib import Path
+
+import pytest
+from fiberpath.config import load_wind_definition
+from fiberpath.config.schemas import WindDefinition
+from fiberpath.planning import (
+    LayerValidationError,
+    PlanOptions,
+    parse_sweep_range,
+    plan_wind,
+    sweep_layer,
+)
+from fiberpath.planning import sweep as sweep_module
+from fiberpath.planning.validators import validate_layer
+from fiberpath_cli.main import app
+from typer.testing import CliRunner
+
+ROOT = Path(__file__).resolve().parents[2]
+MULTI_LAYER = ROOT / "examples" / "multi_layer" / "input.wind"
+
+RANGES = {
+    "windAngle": parse_sweep_range("30:70:5"),
+    "patternNumber": parse_sweep_range("1:4"),
+    "skipIndex": parse_sweep_range("1:3"),
+    "lockDegrees": parse_sweep_range("180:720:90"),
+}
+
+
+@pytest.fixture(scope="module")
+def definition() -> WindDefinition:
+    return load_wind_definition(MULTI_LAYER)
+
+
+def _with_values(
+    definition: WindDefinition, index: int, values: dict[str, float]
+) -> WindDefinition:
+    layers = list(definition.layers)
+    layer = layers[index - 1].model_dump(by_alias=True)
+    layers[index - 1] = type(layers[index - 1]).model_validate({**layer, **values})
+    return definition.model_copy(update={"layers": layers})
+
+
+def test_parse_sweep_range() -> None:
+    assert parse_sweep_range("1:4") == [1.0, 2.0, 3.0, 4.0]
+    assert parse_sweep_range("20:21:0.25") == [20.0, 20.25, 20.5, 20.75, 21.0]
+    assert parse_sweep_range("180, 540") == [180.0, 540.0]
+    assert parse_sweep_range("20:60:0.1")[-1] == 60.0
+    with pytest.raises(ValueError, match="step"):
+        parse_sweep_range("1:4:0")
+
+
+def test_sweep_prunes_exactly_the_invalid_points(definition: WindDefinition) -> None:
+    result = sweep_layer(definition, RANGES, workers=1)
+
+    assert result.layer_index == 2  # the first helical layer
+    assert result.candidates == 9 * 4 * 3 * 7
+    assert result.pruned + len(result.points) == result.candidates
+    valid = {tuple(point.values.values()) for point in result.points}
+    for point in result.points:
+        layer = _with_values(definition, 2, point.values).layers[1]
+        validate_layer(2, layer, definition.mandrel_parameters, definition.tow_parameters)
+    # A pruned point is one the validators reject.
+    rejected = (45.0, 2, 2, 180.0)
+    assert rejected not in valid
+    with pytest.raises(LayerValidationError):
+        layer = _with_values(definition, 2, dict(zip(RANGES, rejected, strict=True))).layers[1]
+        validate_layer(2, layer, definition.mandrel_parameters, definition.tow_parameters)
+
+
+def test_sweep_totals_match_a_full_plan(definition: WindDefinition) -> None:
+    result = sweep_layer(definition, RANGES, workers=1)
+
+    for point in result.points[:3] + result.points[-2:]:
+        planned = plan_wind(_with_values(definition, 2, point.values))
+        assert point.time_s == pytest.approx(planned.total_time_s)
+        assert point.tow_m == pytest.approx(planned.total_tow_m)
+    times = [point.time_s for point in result.points]
+    assert times == sorted(times)
+
+
+def test_sweep_ranks_by_circuits(definition: WindDefinition) -> None:
+    result = sweep_layer(definition, RANGES, rank_by="circuits", workers=1)
+
+    keys = [(point.circuits, point.time_s) for point in result.points]
+    assert keys == sorted(keys)
+
+
+def test_sweep_pool_matches_serial(
+    definition: WindDefinition, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    serial = sweep_layer(definition, RANGES, workers=1)
+    monkeypatch.setattr(sweep_module, "_CHUNK_POINTS", 8)
+    pooled = sweep_layer(definition, RANGES, workers=2)
+
+    assert [point.to_json() for point in pooled.points] == [
+        point.to_json() for point in serial.points
+    ]
+
+
+def test_sweep_rejects_bad_requests(definition: WindDefinition) -> None:
+    with pytest.raises(ValueError, match="cannot sweep"):
+        sweep_layer(definition, {"mandrelDiameter": [1.0]})
+    with pytest.raises(ValueError, match="whole numbers"):
+        sweep_layer(definition, {"patternNumber": [1.5]})
+    with pytest.raises(ValueError, match="not a helical layer"):
+        sweep_layer(definition, {"windAngle": [45.0]}, layer_index=1)
+    with pytest.raises(ValueError, match="unknown rank"):
+        sweep_layer(definition, {"windAngle": [45.0]}, rank_by="speed")
+
+
+def test_sweep_csv(definition: WindDefinition) -> None:
+    result = sweep_layer(definition, RANGES, options=PlanOptions(), workers=1)
+    buffer = io.StringIO()
+    result.write_csv(buffer, limit=2)
+
+    rows = buffer.getvalue().splitlines()
+    assert (
+        rows[0]
+        == "rank,windAngle,patternNumber,skipIndex,lockDegrees,circuits,timeSeconds,towMeters"
+    )
+    assert len(rows) == 3
+    assert rows[1].startswith("1,")
+
+
+def test_sweep_command_json() -> None:
+    result = CliRunner().invoke(
+        app,
+        [
+            "sweep",
+            str(MULTI_LAYER),
+            "--vary",
+            "windAngle=40:60:10",
+            "--vary",
+            "patternNumber=1,2",
+            "--top",
+            "2",
+            "--json",
+            "-j",
+            "1",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    payload = json.loads(result.stdout)
+    assert payload["candidates"] == 6
+    assert len(payload["points"]) <= 2
+    assert {"windAngle", "patternNumber", "circuits", "timeSeconds"} <= set(payload["points"][0])
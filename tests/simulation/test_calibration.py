@@ -0,0 +1,75 @@
+"""Fitting a time calibration to acknowledgement times of streamed programs."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from fiberpath.config import TimeCalibration, load_wind_definition
+from fiberpath.gcode import read_line_moves
+from fiberpath.planning import plan_wind
+from fiberpath.planning.metrics import calibrated_move_time_s, move_timings
+from fiberpath.simulation import CalibrationError, TimingRecord, fit_time_calibration
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+CONE_WIND = REPO_ROOT / "examples" / "cone_reducer" / "input.wind"
+CYLINDER_WIND = REPO_ROOT / "examples" / "simple_cylinder" / "input.wind"
+
+
+def _streamed(path: Path, truth: TimeCalibration, buffer_depth: int = 16) -> TimingRecord:
+    """Acks from a machine that runs each line for its calibrated time behind a full buffer."""
+    program = plan_wind(load_wind_definition(path)).commands
+    header = program[0]
+    commands = [line for line in program if line and not line.startswith(";")]
+    meta, line_moves = read_line_moves([header, *commands])
+    timings = move_timings((move for moves in line_moves for move in moves), meta.mandrel_diameter)
+    finished: list[float] = []
+    clock = 0.0
+    for moves in line_moves[1:]:
+        for _ in moves:
+            timing = next(timings)
+            if timing is not None:
+                clock += calibrated_move_time_s(timing, truth)
+        finished.append(clock)
+    # A line is acked once the block buffer_depth lines ahead of it finishes.
+    acks = [finished[i - buffer_depth] if i >= buffer_depth else 0.0 for i in range(len(commands))]
+    return TimingRecord(header=header, commands=commands, ack_times_s=acks)
+
+
+def test_fit_recovers_overhead_and_turnaround_penalty() -> None:
+    truth = TimeCalibration(moveOverheadS=0.004, turnaroundPenaltyS=0.25)
+
+    fitted = fit_time_calibration([_streamed(CYLINDER_WIND, truth)])
+
+    assert fitted.move_overhead_s == pytest.approx(0.004, rel=1e-3)
+    assert fitted.turnaround_penalty_s == pytest.approx(0.25, rel=1e-3)
+    assert fitted.mandrel_speed_limit_deg_per_s is None
+    assert fitted.rms_residual_s < 1e-6
+    assert fitted.sample_lines > 0
+
+
+def test_fit_recovers_a_binding_mandrel_limit() -> None:
+    truth = TimeCalibration(
+        moveOverheadS=0.004, turnaroundPenaltyS=0.25, mandrelSpeedLimitDegPerS=60.0
+    )
+
+    fitted = fit_time_calibration([_streamed(CONE_WIND, truth, buffer_depth=8)])
+
+    assert fitted.mandrel_speed_limit_deg_per_s == pytest.approx(60.0, rel=1e-3)
+    assert fitted.move_overhead_s == pytest.approx(0.004, rel=1e-2)
+    assert fitted.turnaround_penalty_s == pytest.approx(0.25, rel=1e-2)
+
+
+def test_too_short_a_record_cannot_be_fitted() -> None:
+    record = _streamed(CYLINDER_WIND, TimeCalibration())
+    short = TimingRecord(record.header, record.commands[:100], record.ack_times_s[:100])
+
+    with pytest.raises(CalibrationError, match="at least 3 windows"):
+        fit_time_calibration([short])
+
+
+def test_ack_times_must_match_the_commands() -> None:
+    record = _streamed(CYLINDER_WIND, TimeCalibration())
+
+    with pytest.raises(CalibrationError, match="ack times"):
+        fit_time_calibration([TimingRecord(record.header, record.commands, [0.0])])
@@ -0,0 +1,101 @@
+"""Acceleration-aware cycle time under a profile's planner limits."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from fiberpath.config import MachineKinematics, load_wind_definition
+from fiberpath.gcode import read_program
+from fiberpath.planning import plan_wind
+from fiberpath.simulation import KinematicEstimate, SimulationError, simulate_kinematics
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+MULTI_LAYER_WIND = REPO_ROOT / "examples" / "multi_layer" / "input.wind"
+
+HEADER = (
+    '; Parameters {"mandrel":{"diameter":50,"windLength":500},"tow":{"width":8,"thickness":0.4}}'
+)
+# 1000 mm/s^2 to 100 mm/s (6000 mm/min) takes 0.1 s over 5 mm.
+KINEMATICS = MachineKinematics(accelerationMmS2=1000.0)
+
+
+def _estimate(*lines: str, kinematics: MachineKinematics = KINEMATICS) -> KinematicEstimate:
+    return simulate_kinematics(read_program([HEADER, "G0 F6000", *lines]), kinematics)
+
+
+def test_long_move_runs_a_trapezoid() -> None:
+    estimate = _estimate("G0 X100")
+
+    # Two 5 mm, 0.1 s ramps around 90 mm of cruise.
+    assert estimate.time_s == pytest.approx(1.1)
+    assert estimate.nominal_time_s == pytest.approx(1.0)
+    assert estimate.moves_below_feed == 0
+
+
+def test_short_move_runs_a_triangle_below_feed() -> None:
+    estimate = _estimate("G0 X1")
+
+    # Peak sqrt(a * L) = sqrt(1000) mm/s, reached and lost at 1000 mm/s^2.
+    assert estimate.time_s == pytest.approx(2 * 1000**0.5 / 1000)
+    assert estimate.moves_below_feed == 1
+
+
+def test_straight_junction_keeps_speed_and_reversal_stops() -> None:
+    straight = _estimate("G0 X50", "G0 X100")
+    reversal = _estimate("G0 X50", "G0 X0")
+
+    assert straight.time_s == pytest.approx(1.1)
+    assert reversal.time_s == pytest.approx(2 * 0.6)
+
+
+def test_set_position_synchronizes_the_planner() -> None:
+    estimate = _estimate("G0 X50", "G92 X0", "G0 X50")
+
+    assert estimate.time_s == pytest.approx(2 * 0.6)
+
+
+def test_axis_velocity_limit_caps_the_surface_speed() -> None:
+    # A pure mandrel move of 360 degrees limited to 180 deg/s: 2 s of cruise plus
+    # ramps, against the nominal 157 mm at 100 mm/s.
+    limited = MachineKinematics(accelerationMmS2=1e9, mandrel={"maxVelocity": 180.0})
+
+    estimate = _estimate("G0 A360", kinematics=limited)
+
+    assert estimate.time_s == pytest.approx(2.0, rel=1e-6)
+    assert estimate.nominal_time_s == pytest.approx(50 * 3.141592653589793 / 100)
+    assert estimate.moves_below_feed == 1
+
+
+def test_delivery_only_moves_cost_time() -> None:
+    # 90 degrees rest to rest at the feed's 100 deg/s: 0.1 s ramps over 5 degrees
+    # each and 80 degrees of cruise.
+    estimate = _estimate("G0 B90")
+
+    assert estimate.time_s == pytest.approx(1.0)
+    assert estimate.nominal_time_s == 0.0
+
+
+def test_layers_partition_the_estimate() -> None:
+    program = read_program(plan_wind(load_wind_definition(MULTI_LAYER_WIND)).commands)
+
+    estimate = simulate_kinematics(program, MachineKinematics())
+
+    assert [layer.index for layer in estimate.layers] == [1, 2]
+    assert sum(layer.moves for layer in estimate.layers) == estimate.moves
+    assert sum(layer.time_s for layer in estimate.layers) == pytest.approx(estimate.time_s)
+    assert estimate.time_s > estimate.nominal_time_s
+
+
+def test_large_programs_are_estimated() -> None:
+    lines = [f"G0 X{step % 200} A{step * 7}" for step in range(100_000)]
+
+    estimate = _estimate(*lines)
+
+    assert estimate.moves == 99_999  # the first line repeats the origin's X
+    assert estimate.time_s > estimate.nominal_time_s
+
+
+def test_motion_before_a_feed_is_rejected() -> None:
+    with pytest.raises(SimulationError, match="Feed rate"):
+        simulate_kinematics(read_program([HEADER, "G0 X1"]), KINEMATICS)
@@ -3,9 +3,14 @@ from __future__ import annotations
 from pathlib import Path
 
 import pytest
-from fiberpath.config import load_wind_definition
+from fiberpath.config import (
+    MachineKinematics,
+    TimeCalibration,
+    default_machine_profile,
+    load_wind_definition,
+)
 from fiberpath.gcode import ProgramReadError, read_program
-from fiberpath.planning import plan_wind
+from fiberpath.planning import PlanOptions, plan_wind
 from fiberpath.simulation import SimulationError, simulate_program
 from fiberpath_cli.main import app
 from typer.testing import CliRunner
@@ -59,6 +64,42 @@ def test_planner_and_simulator_time_agree_by_construction() -> None:
     assert sim.tow_length_mm / 1000.0 == pytest.approx(plan.total_tow_m, rel=1e-7)
 
 
+CALIBRATED = default_machine_profile().model_copy(
+    update={
+        "time_calibration": TimeCalibration(
+            moveOverheadS=0.01, turnaroundPenaltyS=0.5, mandrelSpeedLimitDegPerS=90.0
+        )
+    }
+)
+
+
+LIMITED = default_machine_profile().model_copy(
+    update={"kinematics": MachineKinematics(accelerationMmS2=1000.0)}
+)
+
+
+def test_calibrated_time_adds_overhead_limit_and_turnarounds() -> None:
+    program = read_program([*PROGRAM, "G0 X0"])
+
+    result = simulate_program(program, CALIBRATED)
+
+    # X10: 0.1 s; A180 twice: held to 90 deg/s, 2 s each; X0 reverses: 0.1 s + 0.5 s.
+    # Every motion also pays the 0.01 s overhead.
+    assert result.estimated_time_s == pytest.approx(0.1 + 2.0 + 2.0 + 0.6 + 4 * 0.01)
+    assert result.tow_length_mm == pytest.approx(simulate_program(program).tow_length_mm)
+
+
+def test_calibrated_planner_and_simulator_agree() -> None:
+    definition = load_wind_definition(MULTI_LAYER_WIND)
+    plan = plan_wind(definition, PlanOptions(profile=CALIBRATED))
+    metrics_only = plan_wind(definition, PlanOptions(profile=CALIBRATED, metrics_only=True))
+    sim = simulate_program(read_program(plan.commands), CALIBRATED)
+
+    assert plan.total_time_s > plan_wind(definition).total_time_s
+    assert metrics_only.total_time_s == pytest.approx(plan.total_time_s, rel=1e-12)
+    assert sim.estimated_time_s == pytest.approx(plan.total_time_s, rel=1e-7)
+
+
 def test_simulate_cli_outputs_summary(tmp_path: Path) -> None:
     gcode_file = tmp_path / "test.gcode"
     gcode_file.write_text("\n".join(PROGRAM) + "\n", encoding="utf-8")
@@ -69,3 +110,39 @@ def test_simulate_cli_outputs_summary(tmp_path: Path) -> None:
     assert result.exit_code == 0, result.output
     assert "Simulated" in result.output
     assert "1.67" in result.output
+
+
+def test_simulate_cli_reads_a_calibrated_profile(tmp_path: Path) -> None:
+    gcode_file = tmp_path / "test.gcode"
+    gcode_file.write_text("\n".join(PROGRAM) + "\n", encoding="utf-8")
+    profile_file = tmp_path / "profile.json"
+    profile_file.write_text(CALIBRATED.model_dump_json(by_alias=True), encoding="utf-8")
+
+    result = CliRunner().invoke(app, ["simulate", str(gcode_file), "--profile", str(profile_file)])
+
+    assert result.exit_code == 0, result.output
+    assert "4.13s" in result.output
+
+
+def test_kinematics_add_an_estimate_beside_the_nominal_time() -> None:
+    program = read_program(PROGRAM)
+
+    result = simulate_program(program, LIMITED)
+
+    assert simulate_program(program).kinematics is None
+    assert result.estimated_time_s == simulate_program(program).estimated_time_s
+    assert result.kinematics is not None
+    assert result.kinematics.nominal_time_s == pytest.approx(result.estimated_time_s)
+    assert result.kinematics.time_s > result.estimated_time_s
+
+
+def test_simulate_cli_reports_the_kinematic_estimate(tmp_path: Path) -> None:
+    gcode_file = tmp_path / "test.gcode"
+    gcode_file.write_text("\n".join(PROGRAM) + "\n", encoding="utf-8")
+    profile_file = tmp_path / "profile.json"
+    profile_file.write_text(LIMITED.model_dump_json(by_alias=True), encoding="utf-8")
+
+    result = CliRunner().invoke(app, ["simulate", str(gcode_file), "--profile", str(profile_file)])
+
+    assert result.exit_code == 0, result.output
+    assert "with acceleration:" in result.output
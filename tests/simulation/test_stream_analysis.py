@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from fiberpath.config import load_wind_definition
+from fiberpath.gcode import read_program
+from fiberpath.planning import plan_wind
+from fiberpath.simulation import LinkModel, analyze_stream, simulate_program
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+MULTI_LAYER_WIND = REPO_ROOT / "examples" / "multi_layer" / "input.wind"
+
+HEADER = (
+    '; Parameters {"mandrel":{"diameter":50,"windLength":500},"tow":{"width":8,"thickness":0.4}}'
+)
+PROLOGUE = [
+    "G21 ; millimeter units",
+    "G90 ; absolute positioning",
+    "G94 ; feed rate in units per minute",
+]
+# 6000 mm/min: each 0.1 mm step runs for 1 ms.
+STEPS = [f"G0 X{step / 10:g}" for step in range(1, 21)]
+SHORT_STEPS = [HEADER, "G0 F6000", "; Layer 1 of 1: helical", *STEPS]
+
+
+def _tx_s(line: str, baud_rate: int) -> float:
+    return (len(line) + 1) * 10 / baud_rate
+
+
+def test_short_moves_over_a_slow_link_stall_between_every_line() -> None:
+    link = LinkModel(baud_rate=9600, ack_latency_s=0.0, buffer_depth=4, framed=False)
+
+    result = analyze_stream(read_program(SHORT_STEPS), link)
+
+    # Each step arrives one link cycle after the last one finished its 1 ms run.
+    expected = sum(_tx_s(line, 9600) - 0.001 for line in STEPS[1:])
+    assert result.lines == len(PROLOGUE) + 1 + len(STEPS)
+    assert result.stall_time_s == pytest.approx(expected)
+    assert len(result.stall_windows) == 1
+    window = result.stall_windows[0]
+    assert (window.first_line, window.last_line, window.layer) == (6, 24, 1)
+    assert window.stalls == len(STEPS) - 1
+    (layer,) = result.layers
+    assert layer.utilization is not None and layer.utilization > 1
+    mean_tx = sum(_tx_s(line, 9600) for line in STEPS) / len(STEPS)
+    assert result.min_sustainable_segment_mm == pytest.approx(mean_tx * 100.0)
+    assert result.median_segment_mm == pytest.approx(0.1)
+
+
+def test_a_fast_link_keeps_the_buffer_full() -> None:
+    program = read_program(plan_wind(load_wind_definition(MULTI_LAYER_WIND)).commands)
+
+    result = analyze_stream(program, LinkModel(baud_rate=250_000, ack_latency_s=0.001))
+
+    assert result.machine_time_s == pytest.approx(simulate_program(program).estimated_time_s)
+    assert result.stall_windows == []
+    assert result.stream_time_s == pytest.approx(result.machine_time_s, abs=0.1)
+    assert [layer.index for layer in result.layers] == [1, 2]
+    assert sum(layer.lines for layer in result.layers) < result.lines
+
+
+def test_slow_acks_starve_the_segmented_helical_layer() -> None:
+    program = read_program(plan_wind(load_wind_definition(MULTI_LAYER_WIND)).commands)
+
+    result = analyze_stream(program, LinkModel(baud_rate=115_200, ack_latency_s=0.016))
+
+    hoop, helical = result.layers
+    assert hoop.stall_s == 0.0
+    assert helical.stall_s > 0.0
+    assert helical.utilization is not None and helical.utilization > 1
+    assert result.stream_time_s == pytest.approx(
+        result.machine_time_s + result.stall_time_s, rel=1e-3
+    )
+
+
+@pytest.mark.parametrize("kwargs", [{"baud_rate": 0}, {"ack_latency_s": -1.0}, {"buffer_depth": 0}])
+def test_link_model_rejects_nonsense(kwargs: dict[str, float]) -> None:
+    with pytest.raises(ValueError):
+        LinkModel(**kwargs)  # type: ignore[arg-type]
@@ -0,0 +1,95 @@
+"""Lazy G-code sources: pre-scanned totals, lazy filtering and sliced streaming."""
+
+from __future__ import annotations
+
+import io
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from fiberpath.emulator import EmulatorConfig, emulator_url, register_url_handler
+from fiberpath.streaming import GcodeSource, iter_commands, iter_lines, slice_commands
+from marlin_host import MarlinHost, SerialTransport
+
+PROGRAM = "; Parameters {}\nG21\n\n   \n; note\n  G0 X1  \r\nG0 X2\nG0 X3"
+
+
+@pytest.fixture
+def host(request: pytest.FixtureRequest) -> MarlinHost:
+    register_url_handler()
+    url = emulator_url(request.node.name, EmulatorConfig(time_scale=0.0))
+    host = MarlinHost(SerialTransport(url, timeout=2.0), reliable=True)
+    host.connect()
+    request.addfinalizer(host.close)
+    return host
+
+
+def test_iter_commands_matches_the_host_filter() -> None:
+    assert list(iter_commands(PROGRAM.splitlines())) == ["G21", "G0 X1", "G0 X2", "G0 X3"]
+
+
+@pytest.mark.parametrize("text", ["", "G21", "G21\n", "a\r\n\nb\n  \nc", "\n\n"])
+def test_iter_lines_matches_splitlines(text: str) -> None:
+    assert [line.rstrip("\r") for line in iter_lines(text)] == text.splitlines()
+
+
+def test_slice_commands_is_lazy() -> None:
+    consumed: list[int] = []
+
+    def numbers() -> Iterator[str]:
+        for number in range(5):
+            consumed.append(number)
+            yield str(number)
+
+    slices = slice_commands(numbers(), 2)
+    assert next(slices) == ["0", "1"]
+    assert consumed == [0, 1]
+    assert list(slices) == [["2", "3"], ["4"]]
+
+
+def test_file_source_counts_then_reads_lazily(tmp_path: Path) -> None:
+    path = tmp_path / "program.gcode"
+    path.write_text(PROGRAM, encoding="utf-8")
+
+    with GcodeSource(path) as source:
+        assert source.total == 4
+        assert source.name == "program.gcode"
+        assert list(source.commands()) == ["G21", "G0 X1", "G0 X2", "G0 X3"]
+        assert next(source.lines()) == "; Parameters {}"
+
+
+def test_stdin_source_is_spooled_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    stdin = io.TextIOWrapper(io.BytesIO(PROGRAM.encode()))
+    monkeypatch.setattr(sys, "stdin", stdin)
+
+    source = GcodeSource("-")
+    assert (source.name, source.total) == ("<stdin>", 4)
+    assert list(source.commands()) == list(source.commands())  # re-readable from the spool
+    source.close()
+
+
+def test_source_streams_in_slices(tmp_path: Path, host: MarlinHost) -> None:
+    path = tmp_path / "program.gcode"
+    path.write_text("G0 F6000\n" + "".join(f"G0 X{step}\n" for step in range(1, 10)))
+
+    with GcodeSource(path, slice_lines=4) as source:
+        progress = list(source.stream(host))
+
+    assert [p.commands_sent for p in progress] == list(range(1, 11))
+    assert {p.total_commands for p in progress} == {10}
+    assert progress[-1].command == "G0 X9"
+
+
+def test_stop_between_slices_ends_the_stream(tmp_path: Path, host: MarlinHost) -> None:
+    path = tmp_path / "program.gcode"
+    path.write_text("".join(f"G0 X{step}\n" for step in range(1, 13)))
+
+    with GcodeSource(path, slice_lines=4) as source:
+        sent = 0
+        for progress in source.stream(host):
+            sent = progress.commands_sent
+            if sent == 4:
+                source.stop()
+
+    assert sent == 4
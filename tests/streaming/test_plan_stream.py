@@ -0,0 +1,98 @@
+"""Pipelined plan-to-stream against the bundled emulator."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from fiberpath.config import WindDefinition
+from fiberpath.emulator import EmulatorConfig, emulator_url, get_emulator, register_url_handler
+from fiberpath.planning import LayerValidationError, plan_wind
+from fiberpath.streaming import PlanStream
+from marlin_host import MarlinHost, SerialTransport
+
+_HOOP: dict[str, Any] = {"windType": "hoop", "terminal": False}
+_HELICAL: dict[str, Any] = {
+    "windType": "helical",
+    "windAngle": 35.0,
+    "patternNumber": 3,
+    "skipIndex": 2,
+    "lockDegrees": 180.0,
+    "leadInMM": 4.0,
+    "leadOutDegrees": 12.0,
+}
+
+
+def _definition(*layers: dict[str, Any]) -> WindDefinition:
+    return WindDefinition.model_validate(
+        {
+            "mandrelParameters": {"diameter": 40.0, "windLength": 120.0},
+            "towParameters": {"width": 6.0, "thickness": 0.5},
+            "defaultFeedRate": 6000.0,
+            "layers": list(layers) or [_HOOP, {"windType": "skip", "mandrelRotation": 45.0}, _HOOP],
+        }
+    )
+
+
+def _commands(definition: WindDefinition) -> list[str]:
+    return [line for line in plan_wind(definition).commands if not line.startswith(";")]
+
+
+@pytest.fixture
+def host(request: pytest.FixtureRequest) -> MarlinHost:
+    register_url_handler()
+    url = emulator_url(request.node.name, EmulatorConfig(time_scale=0.0))
+    host = MarlinHost(SerialTransport(url, timeout=2.0), reliable=True)
+    host.connect()
+    request.addfinalizer(host.close)
+    return host
+
+
+def test_streams_the_planned_program(host: MarlinHost, request: pytest.FixtureRequest) -> None:
+    definition = _definition()
+    expected = _commands(definition)
+    plan = PlanStream(definition, max_buffered_lines=64, slice_lines=16)
+
+    progress = list(plan.stream(host))
+
+    assert [p.command for p in progress] == expected
+    assert [p.commands_sent for p in progress] == list(range(1, len(expected) + 1))
+    assert progress[-1].total_commands == len(expected)
+    assert not plan.planning
+    assert plan.header is not None and plan.header.startswith("; Parameters")
+    emulator = get_emulator(request.node.name)
+    assert emulator is not None
+    assert emulator.stats.commands >= len(expected)
+
+
+def test_planning_waits_for_the_stream() -> None:
+    definition = _definition()
+    plan = PlanStream(definition, max_buffered_lines=40, slice_lines=16)
+
+    received: list[str] = []
+    for commands in plan.lines():
+        assert len(commands) <= 16
+        assert plan.buffered <= 40
+        received.extend(commands)
+
+    assert received == _commands(definition)
+
+
+def test_invalid_definitions_fail_before_planning() -> None:
+    with pytest.raises(LayerValidationError):
+        PlanStream(_definition({**_HELICAL, "windAngle": 0.5}))
+
+
+def test_stop_ends_the_stream_and_the_planner(host: MarlinHost) -> None:
+    plan = PlanStream(_definition(), max_buffered_lines=32, slice_lines=8)
+
+    sent = 0
+    for progress in plan.stream(host):
+        sent = progress.commands_sent
+        if sent == 20:
+            plan.stop()
+
+    # The slice in flight finishes; the next one never starts.
+    assert 20 <= sent < 20 + 8
+    assert not plan.planning
+    assert plan.buffered == 0
@@ -0,0 +1,155 @@
+"""SD-card offload against the bundled emulator's in-memory card."""
+
+from __future__ import annotations
+
+import pytest
+from fiberpath.emulator import (
+    EmulatorConfig,
+    MarlinEmulator,
+    emulator_url,
+    get_emulator,
+    register_url_handler,
+)
+from fiberpath.streaming import SdError, SdOffload, SdOptions, sd_file_size
+from marlin_host import MarlinHost, SerialTransport
+
+PROGRAM = ["G21", "G90", "G0 F6000", *(f"G0 X{step % 40} A{step * 5}" for step in range(1, 101))]
+
+
+@pytest.fixture
+def host(request: pytest.FixtureRequest) -> MarlinHost:
+    register_url_handler()
+    url = emulator_url(request.node.name, EmulatorConfig(time_scale=0.0))
+    host = MarlinHost(SerialTransport(url, timeout=2.0), reliable=True)
+    host.connect()
+    request.addfinalizer(host.close)
+    return host
+
+
+def test_program_is_uploaded_verbatim_and_printed(
+    host: MarlinHost, request: pytest.FixtureRequest
+) -> None:
+    offload = SdOffload(host, PROGRAM, SdOptions(poll_interval_s=0.0))
+
+    progress = list(offload.run())
+
+    uploads = [p for p in progress if p.phase == "upload"]
+    assert [p.lines for p in uploads] == list(range(1, len(PROGRAM) + 1))
+    assert progress[-1].phase == "print"
+    assert progress[-1].lines == len(PROGRAM)
+    emulator = get_emulator(request.node.name)
+    assert emulator is not None
+    assert emulator.sd_files == {"FIBERPTH.GCO": PROGRAM}
+    assert emulator.stats.motion_blocks == 100
+    assert offload.size == sd_file_size(PROGRAM)
+
+
+def test_chunked_upload_prints_every_part(host: MarlinHost, request: pytest.FixtureRequest) -> None:
+    offload = SdOffload(host, PROGRAM, SdOptions(name="WIND", chunk_lines=40, poll_interval_s=0.0))
+
+    progress = list(offload.run())
+
+    assert offload.files == ["WIND001.GCO", "WIND002.GCO", "WIND003.GCO"]
+    assert {p.part for p in progress if p.phase == "print"} == {1, 2, 3}
+    emulator = get_emulator(request.node.name)
+    assert emulator is not None
+    card = emulator.sd_files
+    assert [line for name in offload.files for line in card[name]] == PROGRAM
+    assert emulator.stats.motion_blocks == 100
+
+
+def test_size_mismatch_is_retried_then_reported(
+    host: MarlinHost, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    offload = SdOffload(host, PROGRAM[:5], SdOptions(retries=1))
+    uploads: list[str] = []
+    original = host.send
+
+    def counting_send(command: str):  # type: ignore[no-untyped-def]
+        if command.startswith("M28"):
+            uploads.append(command)
+        return original(command)
+
+    monkeypatch.setattr(host, "send", counting_send)
+    # A card that always reports a byte short.
+    monkeypatch.setattr(offload, "_stored_size", lambda name: sd_file_size(PROGRAM[:5]) - 1)
+
+    with pytest.raises(SdError, match="expected"):
+        list(offload.upload())
+    assert len(uploads) == 2
+
+
+def test_stopping_an_upload_removes_the_partial_file(
+    host: MarlinHost, request: pytest.FixtureRequest
+) -> None:
+    offload = SdOffload(host, PROGRAM)
+
+    for progress in offload.run():
+        if progress.lines == 10:
+            offload.stop()
+
+    emulator = get_emulator(request.node.name)
+    assert emulator is not None
+    assert emulator.sd_files == {}
+
+
+def test_attached_offload_follows_a_print_it_did_not_start(
+    host: MarlinHost, request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    options = SdOptions(name="WIND", chunk_lines=40, poll_interval_s=0.0)
+    first = SdOffload(host, PROGRAM, options)
+    list(first.upload())
+    host.query("M23 WIND001.GCO")
+    host.send("M24")  # the previous host's print, still running
+
+    selected: list[str] = []
+    original = host.query
+
+    def recording_query(command: str):  # type: ignore[no-untyped-def]
+        if command.startswith("M23"):
+            selected.append(command)
+        return original(command)
+
+    monkeypatch.setattr(host, "query", recording_query)
+    attached = SdOffload.attach(host, first.layout, options)
+    progress = list(attached.follow(1))
+
+    assert attached.files == first.files
+    assert attached.size == first.size
+    assert selected == ["M23 WIND002.GCO", "M23 WIND003.GCO"]  # WIND001 is not restarted
+    assert [p.part for p in progress if p.lines in (40, 80)] == [1, 2]
+    assert progress[-1].lines == len(PROGRAM)
+    emulator = get_emulator(request.node.name)
+    assert emulator is not None
+    assert emulator.stats.motion_blocks == 100
+    with pytest.raises(ValueError, match="part"):
+        attached.follow(4)
+
+
+def test_emulator_pauses_and_aborts_an_sd_print() -> None:
+    # One planner slot and 100 ms moves: the card reader keeps pace with the machine.
+    emulator = MarlinEmulator(EmulatorConfig(line_latency_s=0.001, buffer_depth=1))
+    stored = ["G0 F6000", *(f"G0 X{10 * step}" for step in range(1, 21))]
+    for line in ["M28 JOB.GCO", *stored, "M29", "M23 JOB.GCO", "M24"]:
+        emulator.receive(line, 0.0)
+
+    emulator.receive("M27", 0.5)
+    # By 0.5 s the reader has fed the feed line and six moves (10 + 6 * 8 bytes).
+    assert f"SD printing byte 58/{sd_file_size(stored)}" in emulator.pop_ready(0.6)
+    emulator.receive("M25", 1.0)
+    emulator.receive("M27", 1.5)
+    assert "Not SD printing" in emulator.pop_ready(1.6)
+    blocks = emulator.stats.motion_blocks
+    assert 0 < blocks < 20
+
+    emulator.receive("M24", 2.0)
+    emulator.receive("M524", 2.0)
+    assert "echo:Print aborted" in emulator.pop_ready(3.0)
+    assert emulator.stats.motion_blocks <= blocks + 1
+
+
+def test_invalid_options_are_rejected() -> None:
+    with pytest.raises(ValueError, match="8 upper case"):
+        SdOptions(name="fiberpath")
+    with pytest.raises(ValueError, match="chunk_lines"):
+        SdOptions(chunk_lines=0)
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+from fiberpath.streaming import LATENCY_BUCKETS_MS, StreamTelemetry, TelemetryTransport
+from marlin_host import FakeTransport
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _exchange(telemetry: StreamTelemetry, clock: Clock, latency_s: float, gap_s: float) -> None:
+    telemetry.sent(10)
+    clock.now += latency_s
+    telemetry.acked()
+    clock.now += gap_s
+
+
+def test_latency_histogram_and_percentiles() -> None:
+    clock = Clock()
+    telemetry = StreamTelemetry(clock=clock)
+    for _ in range(98):
+        _exchange(telemetry, clock, 0.0015, 0.0)
+    _exchange(telemetry, clock, 0.030, 0.0)
+    _exchange(telemetry, clock, 6.0, 0.0)
+
+    latency = telemetry.snapshot().latency
+
+    assert latency.count == 100
+    assert latency.buckets[LATENCY_BUCKETS_MS.index(2.0)] == 98
+    assert latency.buckets[LATENCY_BUCKETS_MS.index(50.0)] == 1
+    assert latency.buckets[-1] == 1
+    assert (latency.p50_ms, latency.p90_ms, latency.p99_ms) == (2.0, 2.0, 50.0)
+    assert latency.max_ms == pytest.approx(6000.0)
+    assert latency.mean_ms == pytest.approx((98 * 1.5 + 30 + 6000) / 100)
+
+
+def test_gaps_with_nothing_in_flight_are_stalls_unless_paused() -> None:
+    clock = Clock()
+    telemetry = StreamTelemetry(clock=clock, stall_threshold_s=0.005)
+    _exchange(telemetry, clock, 0.001, 0.001)  # below the threshold
+    _exchange(telemetry, clock, 0.001, 0.050)  # the next send ends a stall
+    _exchange(telemetry, clock, 0.001, 0.0)
+    telemetry.pause()
+    clock.now += 2.0
+    telemetry.resume()
+    _exchange(telemetry, clock, 0.001, 0.0)  # resumed straight away: no stall
+
+    metrics = telemetry.snapshot()
+
+    assert metrics.stalls == 1
+    assert metrics.stall_s == pytest.approx(0.050)
+    assert metrics.paused_s == pytest.approx(2.0)
+    assert metrics.mean_lines_per_s == pytest.approx(4 / (metrics.elapsed_s - 2.0))
+
+
+def test_rolling_throughput_covers_only_the_window() -> None:
+    clock = Clock()
+    telemetry = StreamTelemetry(clock=clock, window_s=1.0)
+    for _ in range(100):  # 10 lines/s for 10 s
+        _exchange(telemetry, clock, 0.01, 0.09)
+    for _ in range(50):  # then 50 lines/s
+        _exchange(telemetry, clock, 0.01, 0.01)
+
+    metrics = telemetry.snapshot()
+
+    assert metrics.lines_per_s == pytest.approx(50.0)
+    assert metrics.bytes_per_s == pytest.approx(500.0)
+
+
+def test_finish_freezes_the_report() -> None:
+    clock = Clock()
+    telemetry = StreamTelemetry(clock=clock)
+    _exchange(telemetry, clock, 0.01, 0.0)
+    telemetry.finish()
+    clock.now += 60.0
+
+    assert telemetry.snapshot().elapsed_s == pytest.approx(0.01)
+
+
+def test_acquire_charges_the_wait_for_a_held_lock() -> None:
+    telemetry = StreamTelemetry()
+    lock = threading.Lock()
+    lock.acquire()
+    timer = threading.Timer(0.05, lock.release)
+    timer.start()
+    with telemetry.acquire(lock):
+        pass
+    timer.join()
+
+    metrics = telemetry.snapshot()
+    assert metrics.lock_wait_s >= 0.04
+    assert metrics.lock_wait_max_s == metrics.lock_wait_s
+
+
+def test_transport_times_lines_up_to_their_ok() -> None:
+    inner = FakeTransport(responder=lambda line: ["echo:busy: processing", "ok"])
+    transport = TelemetryTransport(inner)
+
+    transport.write_line("G0 X1")
+    assert transport.read_line() == "echo:busy: processing"
+    assert transport.telemetry.snapshot().lines_acked == 0
+    assert transport.read_line() == "ok"
+
+    metrics = transport.telemetry.snapshot()
+    assert (metrics.lines_sent, metrics.lines_acked, metrics.bytes_sent) == (1, 1, 6)
+    assert inner.written == ["G0 X1"]
@@ -0,0 +1,94 @@
+"""Batch plan/simulate/plot over several files, in process and on a process pool."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from fiberpath.batch import plan_many, plot_many, run_batch, simulate_many
+from fiberpath.config import load_wind_definition
+from fiberpath.planning import plan_wind
+from fiberpath_cli.main import app
+from typer.testing import CliRunner
+
+HOOP_WIND = {
+    "mandrelParameters": {"diameter": 40.0, "windLength": 120.0},
+    "towParameters": {"width": 6.0, "thickness": 0.5},
+    "defaultFeedRate": 6000.0,
+    "layers": [{"windType": "hoop", "terminal": False}],
+}
+
+
+@pytest.fixture
+def winds(tmp_path: Path) -> list[Path]:
+    paths = []
+    for name in ("a", "b"):
+        path = tmp_path / name / "input.wind"
+        path.parent.mkdir()
+        path.write_text(json.dumps(HOOP_WIND), encoding="utf-8")
+        paths.append(path)
+    broken = tmp_path / "broken.wind"
+    broken.write_text('{"layers": []}', encoding="utf-8")
+    return [*paths, broken]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_plan_many_continues_past_failures(winds: list[Path], workers: int) -> None:
+    results = sorted(plan_many(winds, workers=workers), key=lambda result: result.index)
+
+    assert [result.ok for result in results] == [True, True, False]
+    expected = plan_wind(load_wind_definition(winds[0])).commands
+    assert results[0].output == winds[0].with_suffix(".gcode")
+    assert results[0].output.read_text(encoding="utf-8").splitlines() == expected
+    assert results[0].summary["commands"] == len(expected)
+    assert results[2].output is None
+    assert results[2].error is not None and "WindFileError" in results[2].error
+
+
+def test_output_dir_keeps_inputs_apart(winds: list[Path], tmp_path: Path) -> None:
+    results = list(plan_many(winds[:2], workers=1, output_dir=tmp_path / "out"))
+
+    assert sorted(str(result.output) for result in results) == [
+        str(tmp_path / "out" / "a" / "input.gcode"),
+        str(tmp_path / "out" / "b" / "input.gcode"),
+    ]
+
+
+def test_simulate_and_plot_many(winds: list[Path], tmp_path: Path) -> None:
+    gcode = [result.output for result in plan_many(winds[:2], workers=1) if result.output]
+
+    simulated = list(simulate_many(gcode, workers=2))
+    assert all(result.ok and result.summary["moves"] > 0 for result in simulated)
+    plotted = list(plot_many(gcode, 0.5, workers=1, output_dir=tmp_path / "png"))
+    assert all(result.ok and result.output and result.output.exists() for result in plotted)
+
+
+def test_run_batch_rejects_unknown_tasks(winds: list[Path]) -> None:
+    with pytest.raises(ValueError, match="unknown batch task"):
+        run_batch("stream", winds, {})
+    with pytest.raises(ValueError, match="workers"):
+        plan_many(winds, workers=0)
+
+
+def test_batch_command_streams_json_lines_and_a_summary(winds: list[Path], tmp_path: Path) -> None:
+    summary_file = tmp_path / "summary.json"
+    result = CliRunner().invoke(
+        app,
+        [
+            "batch",
+            "plan",
+            str(tmp_path / "**" / "*.wind"),
+            "-j",
+            "2",
+            "--summary",
+            str(summary_file),
+        ],
+    )
+
+    assert result.exit_code == 1  # one file failed; the others were still planned
+    lines = [json.loads(line) for line in result.stdout.splitlines()]
+    assert sorted(line["ok"] for line in lines) == [False, True, True]
+    summary = json.loads(summary_file.read_text(encoding="utf-8"))
+    assert (summary["files"], summary["succeeded"], summary["failed"]) == (3, 2, 1)
+    assert summary["failures"][0]["path"] == str(winds[2])
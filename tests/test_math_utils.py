@@ -0,0 +1,81 @@
+"""Bulk and memoized number formatting against ``strip_precision``.
+
+``format_numbers`` must be byte-identical to ``strip_precision`` for every finite
+input. The property test draws seeded values from the families where a
+vectorized formatter can go wrong -- arbitrary bit patterns, every magnitude,
+values within a few ulps of a rounding tie, short decimals and signed zeros.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import struct
+
+import numpy as np
+import pytest
+from fiberpath.math_utils import format_number, format_numbers, strip_precision
+
+
+def _random_bits(rng: random.Random) -> float:
+    while True:
+        value: float = struct.unpack("<d", rng.getrandbits(64).to_bytes(8, "little"))[0]
+        if math.isfinite(value):
+            return value
+
+
+def _log_uniform(rng: random.Random) -> float:
+    return math.copysign(10 ** rng.uniform(-9, 11), rng.random() - 0.5)
+
+
+def _near_tie(rng: random.Random, digits: int) -> float:
+    # (k + 1/2) units of the last kept digit, nudged by a few ulps either way.
+    value = (rng.randint(0, 10**7) + 0.5) / 10**digits
+    for _ in range(rng.randint(0, 3)):
+        value = math.nextafter(value, math.inf if rng.random() < 0.5 else -math.inf)
+    return math.copysign(value, rng.random() - 0.5)
+
+
+def _short_decimal(rng: random.Random) -> float:
+    return round(rng.uniform(-2000.0, 2000.0), rng.randint(0, 8))
+
+
+_SPECIALS = [0.0, -0.0, 5e-324, -5e-324, 1e-7, -4e-7, 5e-7, 0.0078125, 1e9, -1e9, 4.5e15]
+
+
+def _draw(rng: random.Random, digits: int) -> float:
+    family = rng.randrange(5)
+    if family == 0:
+        return _random_bits(rng)
+    if family == 1:
+        return _log_uniform(rng)
+    if family == 2:
+        return _near_tie(rng, digits)
+    if family == 3:
+        return _short_decimal(rng)
+    return rng.choice(_SPECIALS)
+
+
+@pytest.mark.parametrize("seed", range(8))
+@pytest.mark.parametrize("digits", [6, 0, 3, 9])
+def test_format_numbers_matches_strip_precision(seed: int, digits: int) -> None:
+    rng = random.Random(seed * 100 + digits)
+    values = [_draw(rng, digits) for _ in range(5000)]
+
+    assert format_numbers(values, digits) == [strip_precision(v, digits) for v in values]
+    assert format_numbers(np.array(values), digits) == format_numbers(values, digits)
+
+
+def test_format_numbers_handles_empty_nonfinite_and_wide_digits() -> None:
+    values = [math.nan, math.inf, -math.inf, 1.25]
+
+    assert format_numbers([]) == []
+    assert format_numbers(values) == [strip_precision(v) for v in values]
+    assert format_numbers([1 / 3], digits=12) == [strip_precision(1 / 3, 12)]
+
+
+def test_format_number_memo_keeps_signed_zeros_apart() -> None:
+    assert format_number(-0.0) == "-0"
+    assert format_number(0.0) == "0"
+    assert format_number(-0.0) == "-0"
+    assert format_number(84.289407) == strip_precision(84.289407)
@@ -6,10 +6,11 @@ from pathlib import Path
 
 from fiberpath.config import load_wind_definition
 from fiberpath.gcode import read_program
-from fiberpath.planning import plan_wind
+from fiberpath.planning import PlanOptions, plan_wind
 from fiberpath.simulation import simulate_program
 from fiberpath.wire import (
     OUTPUT_SCHEMA_VERSION,
+    PlanMetricsOut,
     PlanResultOut,
     SimulationResultOut,
 )
@@ -49,6 +50,17 @@ def test_plan_result_out_maps_engine_dataclass_faithfully() -> None:
         assert wire_layer.terminal == engine_layer.terminal
 
 
+def test_plan_metrics_out_carries_metrics_without_program() -> None:
+    result = plan_wind(load_wind_definition(MULTI), PlanOptions(metrics_only=True))
+    wire = PlanMetricsOut.from_result(result)
+
+    assert wire.schemaVersion == OUTPUT_SCHEMA_VERSION
+    assert wire.timeSeconds == result.total_time_s
+    assert wire.towMeters == result.total_tow_m
+    assert [layer.commandCount for layer in wire.layers] == [m.commands for m in result.layers]
+    assert "gcode" not in wire.model_dump()
+
+
 def test_simulation_result_out_maps_engine_dataclass_faithfully() -> None:
     result = plan_wind(load_wind_definition(EXAMPLE))
     sim = simulate_program(read_program(result.commands))